@@ -1,8 +1,12 @@
+import ast
 import json
+import keyword
+import re
 import types
 import unittest.mock
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Set, Union
 
 import avro.schema
 import click
@@ -184,6 +188,320 @@ ASPECT_CLASSES: List[Type[_Aspect]] = [
     schema_class_file.write_text("\n".join(schema_classes_lines))
 
 
+SPLIT_PACKAGE = "_schema_classes"
+BASE_MODULE = "_base"
+NAMESPACE_PREFIX = "com.linkedin.pegasus2avro."
+
+lazy_schema_types_template = """
+import importlib
+from collections.abc import Mapping
+from typing import Tuple
+
+
+class _LazySchemaTypes(Mapping):
+    # Maps Avro type names to their generated classes. The namespace module of a
+    # class is only imported when the class is first looked up.
+
+    def __init__(self, class_modules: Dict[str, Tuple[str, str]]):
+        self._class_modules = class_modules
+
+    def __getitem__(self, name: str) -> type:
+        module_name, class_name = self._class_modules[name]
+        module = importlib.import_module(f"{{__package__}}.{{module_name}}")
+        return getattr(module, class_name)
+
+    def __iter__(self):
+        return iter(self._class_modules)
+
+    def __len__(self) -> int:
+        return len(self._class_modules)
+
+
+_SCHEMA_TYPES = _LazySchemaTypes({{
+{schema_types}
+}})
+
+_json_converter = avrojson.AvroJsonConverter(use_logical_types=False, schema_types=_SCHEMA_TYPES)
+avrojson.set_global_json_converter(_json_converter)
+"""
+
+facade_template = """
+# The generated classes live in one module per namespace, in the {split_package}
+# package. This module lazily imports them on first access, so that importing a
+# single class does not construct all of them.
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from typing import Type
+
+{type_checking_imports}
+
+    ASPECT_CLASSES: List[Type[_Aspect]]
+
+_SPLIT_PACKAGE = f"{{__name__.rpartition('.')[0]}}.{split_package}"
+
+# Maps each generated class to the module of its namespace.
+_CLASS_MODULES: Dict[str, str] = {{
+{class_modules}
+}}
+
+_ASPECT_CLASS_NAMES: List[str] = [
+{aspect_class_names}
+]
+
+# Other names that used to be defined in this module.
+_BASE_NAMES = {{
+{base_names}
+}}
+
+__all__ = sorted([*_CLASS_MODULES, "ASPECT_CLASSES"])
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name in _CLASS_MODULES:
+        module = importlib.import_module(f"{{_SPLIT_PACKAGE}}.{{_CLASS_MODULES[name]}}")
+        value = getattr(module, name)
+    elif name == "ASPECT_CLASSES":
+        value = [__getattr__(class_name) for class_name in _ASPECT_CLASS_NAMES]
+    elif name in _BASE_NAMES:
+        value = getattr(importlib.import_module(f"{{_SPLIT_PACKAGE}}.{base_module}"), name)
+    else:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    # Cache the value, so that later accesses do not go through __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({{*globals(), *_CLASS_MODULES, *_BASE_NAMES, "ASPECT_CLASSES"}})
+"""
+
+
+def _get_module_name(namespace: str) -> str:
+    if namespace.startswith(NAMESPACE_PREFIX):
+        namespace = namespace[len(NAMESPACE_PREFIX) :]
+    module_name = namespace.replace(".", "_") or "root"
+    if keyword.iskeyword(module_name) or module_name == BASE_MODULE:
+        module_name += "_"
+    return module_name
+
+
+def _get_bound_names(node: ast.stmt) -> List[str]:
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return [node.name]
+    elif isinstance(node, ast.Import):
+        return [(alias.asname or alias.name).split(".")[0] for alias in node.names]
+    elif isinstance(node, ast.ImportFrom):
+        return [alias.asname or alias.name for alias in node.names]
+    elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return [
+            name.id
+            for target in targets
+            for name in ast.walk(target)
+            if isinstance(name, ast.Name)
+        ]
+    return []
+
+
+def split_schema_classes(schema_class_file: Path) -> None:
+    """
+    Splits the schema_classes module that avrogen generates, which defines every
+    class in a single file, into one module per Avro namespace. The shared code at
+    the top of the file goes into a base module, and schema_classes itself becomes
+    a facade that imports the namespace modules on demand. Existing imports from
+    schema_classes keep working, but only load the namespaces that they use.
+    """
+
+    source = schema_class_file.read_text()
+    lines = source.splitlines(keepends=True)
+    nodes = ast.parse(source).body
+
+    def get_segment(i: int) -> str:
+        end = nodes[i + 1].lineno - 1 if i + 1 < len(nodes) else len(lines)
+        return "".join(lines[nodes[i].lineno - 1 : end])
+
+    # The schema types map every Avro type to its class. We use its fully qualified
+    # names to find the namespace of each class.
+    class_namespaces: Dict[str, str] = {}
+    schema_type_names: Dict[str, str] = {}
+    aspect_class_names: List[str] = []
+    for node in nodes:
+        if isinstance(node, ast.Assign) and _get_bound_names(node) == [
+            "__SCHEMA_TYPES"
+        ]:
+            assert isinstance(node.value, ast.Dict)
+            for key, value in zip(node.value.keys, node.value.values):
+                assert isinstance(key, ast.Constant) and isinstance(value, ast.Name)
+                type_name = str(key.value)
+                schema_type_names[type_name] = value.id
+                if "." in type_name:
+                    class_namespaces[value.id] = type_name.rpartition(".")[0]
+        elif isinstance(node, ast.AnnAssign) and _get_bound_names(node) == [
+            "ASPECT_CLASSES"
+        ]:
+            assert isinstance(node.value, ast.List)
+            aspect_class_names = [
+                name.id for name in node.value.elts if isinstance(name, ast.Name)
+            ]
+    assert class_namespaces, "Did not find the schema types in schema_classes.py"
+
+    class_indexes = [
+        i
+        for i, node in enumerate(nodes)
+        if isinstance(node, ast.ClassDef) and node.name in class_namespaces
+    ]
+    header = "".join(get_segment(i) for i in range(class_indexes[0]))
+    header_names: Set[str] = {
+        name for node in nodes[: class_indexes[0]] for name in _get_bound_names(node)
+    }
+    header_typing_names: Set[str] = {
+        name
+        for node in nodes[: class_indexes[0]]
+        if isinstance(node, ast.ImportFrom) and node.module == "typing"
+        for name in _get_bound_names(node)
+    }
+    header_defined_names: Set[str] = {
+        name
+        for node in nodes[: class_indexes[0]]
+        if not isinstance(node, (ast.Import, ast.ImportFrom))
+        for name in _get_bound_names(node)
+    }
+    header_imports = "".join(
+        get_segment(i)
+        for i in range(class_indexes[0])
+        if isinstance(nodes[i], (ast.Import, ast.ImportFrom))
+    ).strip()
+
+    # The base module lives one level down, next to the namespace modules.
+    schema_file_path = 'os.path.join(os.path.dirname(__file__), "schema.avsc")'
+    assert header.count(schema_file_path) == 1
+    header = header.replace(
+        schema_file_path,
+        'os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema.avsc")',
+    )
+
+    namespace_classes: Dict[str, List[str]] = defaultdict(list)
+    for i in class_indexes:
+        class_node = nodes[i]
+        assert isinstance(class_node, ast.ClassDef)
+        namespace_classes[class_namespaces[class_node.name]].append(get_segment(i))
+
+    module_names = {_get_module_name(namespace) for namespace in namespace_classes}
+    assert len(module_names) == len(namespace_classes), "Ambiguous module names"
+
+    split_dir = schema_class_file.parent / SPLIT_PACKAGE
+    split_dir.mkdir()
+    (split_dir / "__init__.py").write_text("# This file is intentionally empty.\n")
+
+    schema_types = "\n".join(
+        f"    {type_name!r}: ({_get_module_name(class_namespaces[class_name])!r}, {class_name!r}),"
+        for type_name, class_name in schema_type_names.items()
+    )
+    (split_dir / f"{BASE_MODULE}.py").write_text(
+        header.rstrip()
+        + "\n\n"
+        + lazy_schema_types_template.format(schema_types=schema_types)
+    )
+
+    class_name_pattern = re.compile(r"\b(\w+Class)\b")
+    for namespace, class_sources in namespace_classes.items():
+        module_source = "".join(class_sources)
+        module_tree = ast.parse(module_source)
+        used_names = {
+            node.id
+            for node in ast.walk(module_tree)
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+        }
+        # Other classes are only used at runtime inside of methods, so they can be
+        # imported at the end of the module, which avoids circular import issues.
+        # Annotations refer to classes by their name, and only need imports for
+        # type checking.
+        runtime_imports: Dict[str, Set[str]] = defaultdict(set)
+        type_checking_imports: Dict[str, Set[str]] = defaultdict(set)
+        for class_name in class_name_pattern.findall(module_source):
+            other_namespace = class_namespaces.get(class_name)
+            if other_namespace is None or other_namespace == namespace:
+                continue
+            other_module = _get_module_name(other_namespace)
+            if class_name in used_names:
+                runtime_imports[other_module].add(class_name)
+            else:
+                type_checking_imports[other_module].add(class_name)
+
+        base_imports = sorted(used_names & header_defined_names)
+        parts = [
+            header_imports,
+            f"from .{BASE_MODULE} import {', '.join(base_imports)}",
+        ]
+        if any(type_checking_imports.values()):
+            parts.append(
+                "from typing import TYPE_CHECKING\n\n"
+                "if TYPE_CHECKING:\n"
+                + "\n".join(
+                    f"    from .{module} import {', '.join(sorted(names))}"
+                    for module, names in sorted(type_checking_imports.items())
+                    if names
+                )
+            )
+        parts.append(module_source.rstrip())
+        parts.extend(
+            f"from .{module} import {', '.join(sorted(names))}"
+            for module, names in sorted(runtime_imports.items())
+        )
+        (split_dir / f"{_get_module_name(namespace)}.py").write_text(
+            "\n\n".join(parts) + "\n"
+        )
+
+    # Finally, replace schema_classes with the facade.
+    type_checking_imports_source = "\n".join(
+        [
+            f"    from .{SPLIT_PACKAGE}.{BASE_MODULE} import "
+            + ", ".join(
+                sorted(
+                    name
+                    for name in header_names - header_typing_names
+                    if not name.startswith("__")
+                )
+            )
+        ]
+        + [
+            f"    from .{SPLIT_PACKAGE}.{_get_module_name(namespace)} import "
+            + ", ".join(
+                sorted(
+                    class_name
+                    for class_name, class_namespace in class_namespaces.items()
+                    if class_namespace == namespace
+                )
+            )
+            for namespace in sorted(namespace_classes)
+        ]
+    )
+    base_names = sorted(
+        {name for name in header_names if not name.startswith("__")}
+        | {"_SCHEMA_TYPES", "_json_converter"}
+    )
+    schema_class_file.write_text(
+        facade_template.format(
+            split_package=SPLIT_PACKAGE,
+            base_module=BASE_MODULE,
+            type_checking_imports=type_checking_imports_source,
+            class_modules="\n".join(
+                f"    {class_name!r}: {_get_module_name(namespace)!r},"
+                for class_name, namespace in class_namespaces.items()
+            ),
+            aspect_class_names="\n".join(
+                f"    {class_name!r}," for class_name in aspect_class_names
+            ),
+            base_names="\n".join(f"    {name!r}," for name in base_names),
+        )
+    )
+
+
 @click.command()
 @click.argument(
     "schemas_path", type=click.Path(exists=True, file_okay=False), required=True
@@ -229,6 +547,7 @@ def generate(schemas_path: str, outdir: str) -> None:
         [schemas[aspect_file_stem] for aspect_file_stem in aspect_file_stems],
         Path(outdir) / "schema_classes.py",
     )
+    split_schema_classes(Path(outdir) / "schema_classes.py")
 
     # Save raw schema files in codegen as well.
     schema_save_dir = Path(outdir) / "schemas"
@@ -21,6 +21,7 @@ base_requirements = {
     "typing_extensions>=3.7.4.3 ;  python_version < '3.8'",
     "typing_extensions>=3.10.0.2 ;  python_version >= '3.8'",
     "mypy_extensions>=0.4.3",
+    "importlib_metadata>=4.0.0; python_version < '3.8'",
     # Actual dependencies.
     "typing-inspect",
     "pydantic>=1.5.1",
@@ -372,6 +373,8 @@ base_dev_requirements = {
     "pytest-docker>=0.10.3,<0.12",
     "deepdiff",
     "requests-mock",
+    # Optional, used by the fast serialization path of the REST emitter.
+    "orjson",
     "freezegun",
     "jsonpickle",
     "build",
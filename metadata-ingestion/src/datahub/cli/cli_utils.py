@@ -5,7 +5,17 @@ import os.path
 import sys
 import typing
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import click
 import requests
@@ -14,12 +24,14 @@ from pydantic import BaseModel, ValidationError
 from requests.models import Response
 from requests.sessions import Session
 
-from datahub.emitter.aspect import ASPECT_MAP, TIMESERIES_ASPECT_MAP
+from datahub.emitter.aspect import get_aspect_map, get_timeseries_aspect_map
 from datahub.emitter.request_helper import _make_curl_command
 from datahub.emitter.serialization_helper import post_json_transform
-from datahub.metadata.schema_classes import _Aspect
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
+if TYPE_CHECKING:
+    from datahub.metadata.schema_classes import _Aspect
+
 log = logging.getLogger(__name__)
 
 DEFAULT_GMS_HOST = "http://localhost:8080"
@@ -585,8 +597,8 @@ def post_entity(
     return response.status_code
 
 
-def _get_pydantic_class_from_aspect_name(aspect_name: str) -> Optional[Type[_Aspect]]:
-    return ASPECT_MAP.get(aspect_name)
+def _get_pydantic_class_from_aspect_name(aspect_name: str) -> Optional[Type["_Aspect"]]:
+    return get_aspect_map().get(aspect_name)
 
 
 def get_latest_timeseries_aspect_values(
@@ -616,16 +628,20 @@ def get_aspects_for_entity(
     aspects: List[str] = [],
     typed: bool = False,
     cached_session_host: Optional[Tuple[Session, str]] = None,
-) -> Dict[str, Union[dict, _Aspect]]:
+) -> Dict[str, Union[dict, "_Aspect"]]:
     # Process non-timeseries aspects
-    non_timeseries_aspects = [a for a in aspects if a not in TIMESERIES_ASPECT_MAP]
+    non_timeseries_aspects = [
+        a for a in aspects if a not in get_timeseries_aspect_map()
+    ]
     entity_response = get_entity(
         entity_urn, non_timeseries_aspects, cached_session_host
     )
     aspect_list: Dict[str, dict] = entity_response["aspects"]
 
     # Process timeseries aspects & append to aspect_list
-    timeseries_aspects: List[str] = [a for a in aspects if a in TIMESERIES_ASPECT_MAP]
+    timeseries_aspects: List[str] = [
+        a for a in aspects if a in get_timeseries_aspect_map()
+    ]
     for timeseries_aspect in timeseries_aspects:
         timeseries_response: Dict = get_latest_timeseries_aspect_values(
             entity_urn, timeseries_aspect, cached_session_host
@@ -641,7 +657,7 @@ def get_aspects_for_entity(
                 ts_aspect["value"] = json.loads(ts_aspect["value"])
                 aspect_list[timeseries_aspect] = ts_aspect
 
-    aspect_map: Dict[str, Union[dict, _Aspect]] = {}
+    aspect_map: Dict[str, Union[dict, "_Aspect"]] = {}
     for aspect_name, a in aspect_list.items():
         aspect_py_class: Optional[Type[Any]] = _get_pydantic_class_from_aspect_name(
             aspect_name
@@ -0,0 +1,59 @@
+import importlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import click
+
+logger = logging.getLogger(__name__)
+
+
+class LazyGroup(click.Group):
+    """
+    A click group whose subcommands are only imported when they are invoked.
+
+    Subcommands are registered as `name -> "module.path:attribute"`. Importing a
+    command module usually pulls in the generated schema classes, pydantic configs
+    and the plugin registries, so loading them on demand keeps commands like
+    `datahub version` fast. Listing the commands (e.g. for `--help`) does not
+    import anything, but formatting their help text does.
+
+    Subcommands listed in `optional_subcommands` come from optional packages. If
+    importing one of them fails, it is left out instead of failing the CLI.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        optional_subcommands: Iterable[str] = (),
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, str] = dict(lazy_subcommands or {})
+        self.optional_subcommands = set(optional_subcommands)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            try:
+                command = self._load_command(cmd_name)
+            except ImportError as e:
+                if cmd_name not in self.optional_subcommands:
+                    raise
+                logger.debug(f"Failed to load the optional {cmd_name} command: {e}")
+                del self.lazy_subcommands[cmd_name]
+                return None
+            self.add_command(command, cmd_name)
+            del self.lazy_subcommands[cmd_name]
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy command {cmd_name} must be a click command, but {module_name}.{attribute} is a {type(command)}"
+            )
+        return command
@@ -1,11 +1,39 @@
-from datahub.metadata.schema_classes import ASPECT_CLASSES
+"""
+Maps from aspect names to the generated aspect classes.
 
-ASPECT_MAP = {
-    AspectClass.get_aspect_name(): AspectClass for AspectClass in ASPECT_CLASSES
-}
+The maps are built on first use rather than at import time, so that importing this
+module (e.g. from the CLI) does not pull in the generated schema classes. Code that
+needs them can either call get_aspect_map() / get_timeseries_aspect_map(), or keep
+importing ASPECT_MAP and TIMESERIES_ASPECT_MAP, which are resolved lazily too.
+"""
+import functools
+from typing import TYPE_CHECKING, Any, Dict, Type
 
-TIMESERIES_ASPECT_MAP = {
-    name: klass
-    for name, klass in ASPECT_MAP.items()
-    if klass.get_aspect_type() == "timeseries"
-}
+if TYPE_CHECKING:
+    from datahub.metadata.schema_classes import _Aspect
+
+
+@functools.lru_cache(maxsize=None)
+def get_aspect_map() -> Dict[str, Type["_Aspect"]]:
+    from datahub.metadata.schema_classes import ASPECT_CLASSES
+
+    return {
+        AspectClass.get_aspect_name(): AspectClass for AspectClass in ASPECT_CLASSES
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_timeseries_aspect_map() -> Dict[str, Type["_Aspect"]]:
+    return {
+        name: klass
+        for name, klass in get_aspect_map().items()
+        if klass.get_aspect_type() == "timeseries"
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name == "ASPECT_MAP":
+        return get_aspect_map()
+    elif name == "TIMESERIES_ASPECT_MAP":
+        return get_timeseries_aspect_map()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 import logging
-from typing import Callable, Dict, Union
+import threading
+from typing import Any, Callable, Dict, Optional, Union
 
 import pydantic
 from confluent_kafka import SerializingProducer
@@ -28,6 +29,17 @@ DEFAULT_MCP_KAFKA_TOPIC = "MetadataChangeProposal_v1"
 MCE_KEY = "MetadataChangeEvent"
 MCP_KEY = "MetadataChangeProposal"
 
+_COMPRESSION_TYPES = {"none", "gzip", "snappy", "lz4", "zstd"}
+# Maps each tuning field to the librdkafka properties that it sets, including aliases.
+PRODUCER_TUNING_PROPERTIES = {
+    "linger_ms": ["linger.ms", "queue.buffering.max.ms"],
+    "batch_num_messages": ["batch.num.messages"],
+    "batch_size_bytes": ["batch.size"],
+    "compression_type": ["compression.type", "compression.codec"],
+}
+# How long to wait for deliveries when the local producer queue is full.
+_QUEUE_FULL_POLL_SEC = 0.1
+
 
 class KafkaEmitterConfig(ConfigModel):
     connection: KafkaProducerConnectionConfig = pydantic.Field(
@@ -47,12 +59,70 @@ class KafkaEmitterConfig(ConfigModel):
         },
     )
 
+    linger_ms: Optional[int] = pydantic.Field(
+        default=None,
+        ge=0,
+        le=900000,
+        description="Time to wait for more messages before sending a batch to the broker. Sets the linger.ms producer property.",
+    )
+    batch_num_messages: Optional[int] = pydantic.Field(
+        default=None,
+        ge=1,
+        le=1000000,
+        description="Maximum number of messages in a batch. Sets the batch.num.messages producer property.",
+    )
+    batch_size_bytes: Optional[int] = pydantic.Field(
+        default=None,
+        ge=1,
+        le=2147483647,
+        description="Maximum size of a batch in bytes. Sets the batch.size producer property.",
+    )
+    compression_type: Optional[str] = pydantic.Field(
+        default=None,
+        description=f"Compression codec for batches, one of {sorted(_COMPRESSION_TYPES)}. Sets the compression.type producer property.",
+    )
+    background_poll_interval_sec: Optional[float] = pydantic.Field(
+        default=None,
+        gt=0,
+        description="If set, delivery callbacks are served by a background thread that polls the producers at this interval, instead of polling on every emit.",
+    )
+
     @pydantic.validator("topic_routes")
     def validate_topic_routes(cls, v: Dict[str, str]) -> Dict[str, str]:
         assert MCE_KEY in v, f"topic_routes must contain a route for {MCE_KEY}"
         assert MCP_KEY in v, f"topic_routes must contain a route for {MCP_KEY}"
         return v
 
+    @pydantic.validator("compression_type")
+    def validate_compression_type(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            v = v.lower()
+            assert (
+                v in _COMPRESSION_TYPES
+            ), f"compression_type must be one of {sorted(_COMPRESSION_TYPES)}"
+        return v
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def validate_no_conflicting_producer_config(
+        cls, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        producer_config = values["connection"].producer_config
+        for field, properties in PRODUCER_TUNING_PROPERTIES.items():
+            conflicts = [prop for prop in properties if prop in producer_config]
+            if values.get(field) is not None and conflicts:
+                raise ValueError(
+                    f"{field} cannot be set together with connection.producer_config {conflicts}"
+                )
+        return values
+
+    def get_producer_tuning_config(self) -> Dict[str, Any]:
+        tuning_config: Dict[str, Any] = {}
+        for field, properties in PRODUCER_TUNING_PROPERTIES.items():
+            value = getattr(self, field)
+            if value is not None:
+                tuning_config[properties[0]] = value
+        return tuning_config
+
 
 class DatahubKafkaEmitter:
     def __init__(self, config: KafkaEmitterConfig):
@@ -92,12 +162,14 @@ class DatahubKafkaEmitter:
                 "bootstrap.servers": self.config.connection.bootstrap,
                 "key.serializer": StringSerializer("utf_8"),
                 "value.serializer": mce_avro_serializer,
+                **self.config.get_producer_tuning_config(),
                 **self.config.connection.producer_config,
             },
             MCP_KEY: {
                 "bootstrap.servers": self.config.connection.bootstrap,
                 "key.serializer": StringSerializer("utf_8"),
                 "value.serializer": mcp_avro_serializer,
+                **self.config.get_producer_tuning_config(),
                 **self.config.connection.producer_config,
             },
         }
@@ -105,6 +177,57 @@ class DatahubKafkaEmitter:
         self.producers = {
             key: SerializingProducer(value) for (key, value) in producers_config.items()
         }
+        self.max_queue_depths: Dict[str, int] = {key: 0 for key in self.producers}
+        self._max_queue_depths_lock = threading.Lock()
+
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+        if self.config.background_poll_interval_sec:
+            self._poll_thread = threading.Thread(
+                target=self._poll_in_background,
+                args=(self.config.background_poll_interval_sec,),
+                name="kafka-emitter-poll",
+                daemon=True,
+            )
+            self._poll_thread.start()
+
+    def _poll_in_background(self, interval_sec: float) -> None:
+        while not self._poll_stop.wait(interval_sec):
+            for key, producer in self.producers.items():
+                # Serves the delivery callbacks of all messages delivered since the last poll.
+                producer.poll(0)
+                self._sample_queue_depth(key, producer)
+
+    def _sample_queue_depth(self, key: str, producer: SerializingProducer) -> None:
+        depth = len(producer)
+        with self._max_queue_depths_lock:
+            self.max_queue_depths[key] = max(self.max_queue_depths[key], depth)
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """Returns the number of messages per topic that are waiting to be delivered"""
+        return {
+            self.config.topic_routes[key]: len(producer)
+            for key, producer in self.producers.items()
+        }
+
+    def _produce(self, producer_key: str, **kwargs: Any) -> None:
+        producer: SerializingProducer = self.producers[producer_key]
+        if self._poll_thread is None:
+            # Call poll to trigger any callbacks on success / failure of previous writes
+            producer.poll(0)
+            producer.produce(topic=self.config.topic_routes[producer_key], **kwargs)
+            self._sample_queue_depth(producer_key, producer)
+            return
+
+        while True:
+            try:
+                producer.produce(topic=self.config.topic_routes[producer_key], **kwargs)
+                self._sample_queue_depth(producer_key, producer)
+                return
+            except BufferError:
+                # Without per-emit polls, a burst of emits can fill up the local queue.
+                # Wait for some of the queued messages to be delivered.
+                producer.poll(_QUEUE_FULL_POLL_SEC)
 
     def emit(
         self,
@@ -125,11 +248,8 @@ class DatahubKafkaEmitter:
         mce: MetadataChangeEvent,
         callback: Callable[[Exception, str], None],
     ) -> None:
-        # Call poll to trigger any callbacks on success / failure of previous writes
-        producer: SerializingProducer = self.producers[MCE_KEY]
-        producer.poll(0)
-        producer.produce(
-            topic=self.config.topic_routes[MCE_KEY],
+        self._produce(
+            MCE_KEY,
             key=mce.proposedSnapshot.urn,
             value=mce,
             on_delivery=callback,
@@ -140,16 +260,21 @@ class DatahubKafkaEmitter:
         mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper],
         callback: Callable[[Exception, str], None],
     ) -> None:
-        # Call poll to trigger any callbacks on success / failure of previous writes
-        producer: SerializingProducer = self.producers[MCP_KEY]
-        producer.poll(0)
-        producer.produce(
-            topic=self.config.topic_routes[MCP_KEY],
+        self._produce(
+            MCP_KEY,
             key=mcp.entityUrn,
             value=mcp,
             on_delivery=callback,
         )
 
     def flush(self) -> None:
-        for producer in self.producers.values():
+        for key, producer in self.producers.items():
+            self._sample_queue_depth(key, producer)
             producer.flush()
+
+    def close(self) -> None:
+        if self._poll_thread:
+            self._poll_stop.set()
+            self._poll_thread.join()
+            self._poll_thread = None
+        self.flush()
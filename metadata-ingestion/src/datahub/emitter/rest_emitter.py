@@ -1,11 +1,23 @@
 import datetime
 import functools
+import gzip
 import json
 import logging
 import os
 from json.decoder import JSONDecodeError
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -15,7 +27,11 @@ from datahub.cli.cli_utils import get_system_auth
 from datahub.configuration.common import ConfigurationError, OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.request_helper import _make_curl_command
-from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.emitter.serialization_helper import (
+    fast_json_dumps,
+    pre_json_dumps,
+    pre_json_transform,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
@@ -24,6 +40,32 @@ from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
 
 logger = logging.getLogger(__name__)
 
+# Maps each kind of batchable item to its GMS batch endpoint and to the array
+# parameters of that endpoint. Every item contributes one element to each array.
+_BATCH_ENDPOINTS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "mce": ("/entities?action=batchIngest", ("entities", "systemMetadata")),
+    "mcp": ("/aspects?action=ingestProposalBatch", ("proposals",)),
+    "usage": ("/usageStats?action=batchIngest", ("buckets",)),
+}
+
+
+def _is_unknown_action(e: OperationalError) -> bool:
+    """Whether a request failed because GMS does not know the requested action."""
+    cause = e.__cause__
+    if not isinstance(cause, HTTPError) or cause.response is None:
+        return False
+    if cause.response.status_code == 404:
+        return True
+    message = str(e.info.get("message", "")).lower()
+    return (
+        cause.response.status_code == 400
+        and "action" in message
+        and any(
+            reason in message
+            for reason in ("not found", "not supported", "unsupported", "unknown")
+        )
+    )
+
 
 class DataHubRestEmitter:
     DEFAULT_CONNECT_TIMEOUT_SEC = 30  # 30 seconds should be plenty to connect
@@ -40,6 +82,10 @@ class DataHubRestEmitter:
     DEFAULT_RETRY_MAX_TIMES = int(
         os.getenv("DATAHUB_REST_EMITTER_DEFAULT_RETRY_MAX_TIMES", "3")
     )
+    DEFAULT_MAX_BATCH_PAYLOAD_BYTES = 4 * 1024 * 1024
+    # Payloads smaller than this are not worth the cost of compressing them.
+    GZIP_MIN_PAYLOAD_BYTES = 1024
+    GZIP_COMPRESS_LEVEL = 5
 
     _gms_server: str
     _token: Optional[str]
@@ -49,6 +95,8 @@ class DataHubRestEmitter:
     _retry_status_codes: List[int] = DEFAULT_RETRY_STATUS_CODES
     _retry_methods: List[str] = DEFAULT_RETRY_METHODS
     _retry_max_times: int = DEFAULT_RETRY_MAX_TIMES
+    _fast_serialization: bool = False
+    _gzip_payloads: bool = False
 
     def __init__(
         self,
@@ -63,6 +111,8 @@ class DataHubRestEmitter:
         ca_certificate_path: Optional[str] = None,
         server_telemetry_id: Optional[str] = None,
         disable_ssl_verification: bool = False,
+        fast_serialization: bool = False,
+        gzip_payloads: bool = False,
     ):
         self._gms_server = gms_server
         self._token = token
@@ -93,6 +143,11 @@ class DataHubRestEmitter:
         if disable_ssl_verification:
             self._session.verify = False
 
+        self._fast_serialization = fast_serialization
+        self._gzip_payloads = gzip_payloads
+        # The kinds of items whose batch endpoint is not supported by the server.
+        self._unsupported_batch_kinds: Set[str] = set()
+
         if connect_timeout_sec:
             self._connect_timeout_sec = connect_timeout_sec
 
@@ -199,6 +254,17 @@ class DataHubRestEmitter:
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
 
+        entity_obj, system_metadata_obj = self._get_mce_objs(mce)
+        snapshot = {
+            "entity": entity_obj,
+            "systemMetadata": system_metadata_obj,
+        }
+        payload = self._dumps(snapshot)
+
+        self._emit_generic(url, payload)
+
+    @staticmethod
+    def _get_mce_objs(mce: MetadataChangeEvent) -> Tuple[dict, dict]:
         raw_mce_obj = mce.proposedSnapshot.to_obj()
         mce_obj = pre_json_transform(raw_mce_obj)
         snapshot_fqn = (
@@ -210,21 +276,14 @@ class DataHubRestEmitter:
                 "lastObserved": mce.systemMetadata.lastObserved,
                 "runId": mce.systemMetadata.runId,
             }
-        snapshot = {
-            "entity": {"value": {snapshot_fqn: mce_obj}},
-            "systemMetadata": system_metadata_obj,
-        }
-        payload = json.dumps(snapshot)
-
-        self._emit_generic(url, payload)
+        return {"value": {snapshot_fqn: mce_obj}}, system_metadata_obj
 
     def emit_mcp(
         self, mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
     ) -> None:
         url = f"{self._gms_server}/aspects?action=ingestProposal"
 
-        mcp_obj = pre_json_transform(mcp.to_obj())
-        payload = json.dumps({"proposal": mcp_obj})
+        payload = self._dumps({"proposal": pre_json_transform(mcp.to_obj())})
 
         self._emit_generic(url, payload)
 
@@ -239,17 +298,162 @@ class DataHubRestEmitter:
                 usage_obj,
             ]
         }
-        payload = json.dumps(snapshot)
+        payload = self._dumps(snapshot)
         self._emit_generic(url, payload)
 
-    def _emit_generic(self, url: str, payload: str) -> None:
-        curl_command = _make_curl_command(self._session, "POST", url, payload)
-        logger.debug(
-            "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
-            curl_command,
+    def emit_batch(
+        self,
+        items: Sequence[
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposal,
+                MetadataChangeProposalWrapper,
+                UsageAggregation,
+            ]
+        ],
+        max_payload_bytes: int = DEFAULT_MAX_BATCH_PAYLOAD_BYTES,
+    ) -> List[Optional[Exception]]:
+        """Emits the items through the GMS batch endpoints.
+
+        Consecutive items of the same kind are packed into a single request, as
+        long as the request body stays under max_payload_bytes. Returns a list
+        aligned with items, holding None for every item that was written and the
+        error of the corresponding request otherwise. Failed items can be
+        re-emitted one by one with emit().
+
+        If the server does not support the batch endpoint of a kind of item, e.g.
+        an older GMS, later items of that kind are not sent in batches anymore, and
+        fail right away so that they are emitted one by one instead.
+        """
+        errors: List[Optional[Exception]] = [None] * len(items)
+        for kind, indices, url, payload in self._get_batch_requests(
+            items, max_payload_bytes, errors
+        ):
+            try:
+                self._emit_generic(url, payload)
+            except OperationalError as e:
+                if _is_unknown_action(e) and kind not in self._unsupported_batch_kinds:
+                    logger.warning(
+                        f"DataHub GMS does not support {url}, emitting these items one by one instead."
+                    )
+                    self._unsupported_batch_kinds.add(kind)
+                for index in indices:
+                    errors[index] = e
+        return errors
+
+    def _get_batch_requests(
+        self,
+        items: Sequence[
+            Union[
+                MetadataChangeEvent,
+                MetadataChangeProposal,
+                MetadataChangeProposalWrapper,
+                UsageAggregation,
+            ]
+        ],
+        max_payload_bytes: int,
+        errors: List[Optional[Exception]],
+    ) -> Iterable[Tuple[str, List[int], str, str]]:
+        batch_kind = ""
+        batch_indices: List[int] = []
+        batch_fragments: List[Tuple[str, ...]] = []
+        batch_bytes = 0
+
+        for index, item in enumerate(items):
+            try:
+                kind, fragments = self._get_batch_fragments(item)
+            except Exception as e:
+                # Items that cannot be serialized are reported without failing
+                # the rest of the batch.
+                errors[index] = e
+                continue
+            if kind in self._unsupported_batch_kinds:
+                errors[index] = OperationalError(
+                    "DataHub GMS does not support batches of these items",
+                    {"message": f"Unsupported endpoint {_BATCH_ENDPOINTS[kind][0]}"},
+                )
+                continue
+
+            # Account for the separator that joins each fragment to its array.
+            item_bytes = sum(
+                len(fragment.encode("utf-8")) + 2 for fragment in fragments
+            )
+            if batch_indices and (
+                kind != batch_kind or batch_bytes + item_bytes > max_payload_bytes
+            ):
+                yield self._make_batch_request(
+                    batch_kind, batch_indices, batch_fragments
+                )
+                batch_indices, batch_fragments, batch_bytes = [], [], 0
+
+            batch_kind = kind
+            batch_indices.append(index)
+            batch_fragments.append(fragments)
+            batch_bytes += item_bytes
+
+        if batch_indices:
+            yield self._make_batch_request(batch_kind, batch_indices, batch_fragments)
+
+    def _get_batch_fragments(
+        self,
+        item: Union[
+            MetadataChangeEvent,
+            MetadataChangeProposal,
+            MetadataChangeProposalWrapper,
+            UsageAggregation,
+        ],
+    ) -> Tuple[str, Tuple[str, ...]]:
+        if isinstance(item, UsageAggregation):
+            return "usage", (self._transform_and_dumps(item.to_obj()),)
+        elif isinstance(item, (MetadataChangeProposal, MetadataChangeProposalWrapper)):
+            return "mcp", (self._transform_and_dumps(item.to_obj()),)
+        else:
+            entity_obj, system_metadata_obj = self._get_mce_objs(item)
+            return "mce", (self._dumps(entity_obj), self._dumps(system_metadata_obj))
+
+    def _make_batch_request(
+        self, kind: str, indices: List[int], fragments: List[Tuple[str, ...]]
+    ) -> Tuple[str, List[int], str, str]:
+        path, params = _BATCH_ENDPOINTS[kind]
+        payload = (
+            "{"
+            + ", ".join(
+                f'"{param}": [' + ", ".join(f[i] for f in fragments) + "]"
+                for i, param in enumerate(params)
+            )
+            + "}"
         )
+        return kind, indices, f"{self._gms_server}{path}", payload
+
+    def _dumps(self, obj: Any) -> str:
+        if self._fast_serialization:
+            return fast_json_dumps(obj)
+        return json.dumps(obj)
+
+    def _transform_and_dumps(self, obj: Any) -> str:
+        if self._fast_serialization:
+            return pre_json_dumps(obj)
+        return json.dumps(pre_json_transform(obj))
+
+    def _emit_generic(self, url: str, payload: str) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            # Building the curl command is expensive for large payloads.
+            curl_command = _make_curl_command(self._session, "POST", url, payload)
+            logger.debug(
+                "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
+                curl_command,
+            )
+
+        # The fast serializer does not escape non-ASCII characters, and a str body
+        # would be encoded as Latin-1 by http.client, so always send UTF-8 bytes.
+        data = payload.encode("utf-8")
+        headers: Dict[str, str] = {}
+        if self._gzip_payloads and len(data) >= self.GZIP_MIN_PAYLOAD_BYTES:
+            data = gzip.compress(data, compresslevel=self.GZIP_COMPRESS_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+
         try:
-            response = self._session.post(url, data=payload)
+            response = self._session.post(url, data=data, headers=headers)
             response.raise_for_status()
         except HTTPError as e:
             try:
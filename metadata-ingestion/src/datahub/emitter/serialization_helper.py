@@ -1,15 +1,28 @@
-from collections import OrderedDict
+import json
 from typing import Any
 
+try:
+    import orjson
+
+    _orjson_available = True
+except ImportError:  # pragma: no cover
+    _orjson_available = False
+
+# Values of these types never need to be transformed, so we can skip the
+# isinstance checks for them. The exact type is used to avoid catching
+# subclasses like enums.
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
 
 def _json_transform(obj: Any, from_pattern: str, to_pattern: str) -> Any:
-    if isinstance(obj, (dict, OrderedDict)):
-        if len(obj.keys()) == 1:
-            key: str = list(obj.keys())[0]
-            value = obj[key]
+    if type(obj) in _PRIMITIVE_TYPES:
+        return obj
+    elif isinstance(obj, dict):
+        if len(obj) == 1:
+            key: str = next(iter(obj))
             if key.startswith(from_pattern):
                 new_key = key.replace(from_pattern, to_pattern, 1)
-                return {new_key: _json_transform(value, from_pattern, to_pattern)}
+                return {new_key: _json_transform(obj[key], from_pattern, to_pattern)}
 
         if "fieldDiscriminator" in obj:
             # Field discriminators are used for unions between primitive types.
@@ -17,7 +30,11 @@ def _json_transform(obj: Any, from_pattern: str, to_pattern: str) -> Any:
             return {field: _json_transform(obj[field], from_pattern, to_pattern)}
 
         new_obj: Any = {
-            key: _json_transform(value, from_pattern, to_pattern)
+            key: (
+                value
+                if type(value) in _PRIMITIVE_TYPES
+                else _json_transform(value, from_pattern, to_pattern)
+            )
             for key, value in obj.items()
             if value is not None
         }
@@ -43,3 +60,17 @@ def post_json_transform(obj: Any) -> Any:
     return _json_transform(
         obj, from_pattern="com.linkedin.", to_pattern="com.linkedin.pegasus2avro."
     )
+
+
+def fast_json_dumps(obj: Any) -> str:
+    """Encodes an already transformed object as compact JSON, using orjson when it is installed"""
+    if _orjson_available:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def pre_json_dumps(obj: Any) -> str:
+    """Equivalent to json.dumps(pre_json_transform(obj)), but produces compact output and uses the fast encoder"""
+    # The transform stays a separate pass: orjson only calls its default hook for
+    # types it cannot encode, which never includes the dicts that are rewritten.
+    return fast_json_dumps(pre_json_transform(obj))
@@ -1,27 +1,14 @@
+import importlib.util
 import logging
 import os
 import platform
 import sys
 
 import click
-import stackprinter
-from pydantic import ValidationError
 
 import datahub as datahub_package
-from datahub.cli.check_cli import check
-from datahub.cli.cli_utils import DATAHUB_CONFIG_PATH, write_datahub_config
-from datahub.cli.delete_cli import delete
-from datahub.cli.docker_cli import docker
-from datahub.cli.get_cli import get
-from datahub.cli.ingest_cli import ingest
-from datahub.cli.migrate import migrate
-from datahub.cli.put_cli import put
-from datahub.cli.telemetry import telemetry as telemetry_cli
-from datahub.cli.timeline_cli import timeline
-from datahub.configuration import SensitiveError
-from datahub.configuration.common import ConfigurationError
+from datahub.cli.lazy_group import LazyGroup
 from datahub.telemetry import telemetry
-from datahub.utilities.server_config_util import get_gms_config
 
 logger = logging.getLogger(__name__)
 
@@ -39,13 +26,39 @@ logging.basicConfig(format=BASE_LOGGING_FORMAT)
 
 MAX_CONTENT_WIDTH = 120
 
+# The subcommands are imported on demand, since most of them pull in the generated
+# schema classes and the plugin registries, which take a while to import.
+LAZY_SUBCOMMANDS = {
+    "check": "datahub.cli.check_cli:check",
+    "docker": "datahub.cli.docker_cli:docker",
+    "ingest": "datahub.cli.ingest_cli:ingest",
+    "delete": "datahub.cli.delete_cli:delete",
+    "get": "datahub.cli.get_cli:get",
+    "put": "datahub.cli.put_cli:put",
+    "telemetry": "datahub.cli.telemetry:telemetry",
+    "migrate": "datahub.cli.migrate:migrate",
+    "timeline": "datahub.cli.timeline_cli:timeline",
+}
+if importlib.util.find_spec("datahub_actions") is not None:
+    LAZY_SUBCOMMANDS["actions"] = "datahub_actions.cli.actions:actions"
+else:
+    # TODO: Increase the log level once this approach has been validated.
+    logger.debug(
+        "Failed to load datahub actions framework. Please confirm that the acryl-datahub-actions package has been installed from PyPi."
+    )
+
 
 @click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    # The actions framework is a separate package, which may be broken or
+    # incompatible with this version.
+    optional_subcommands=["actions"],
     context_settings=dict(
         # Avoid truncation of help text.
         # See https://github.com/pallets/click/issues/486.
         max_content_width=MAX_CONTENT_WIDTH,
-    )
+    ),
 )
 @click.option("--debug/--no-debug", default=False)
 @click.version_option(
@@ -106,6 +119,8 @@ def version() -> None:
 def init() -> None:
     """Configure which datahub instance to connect to"""
 
+    from datahub.cli.cli_utils import DATAHUB_CONFIG_PATH, write_datahub_config
+
     if os.path.isfile(DATAHUB_CONFIG_PATH):
         click.confirm(f"{DATAHUB_CONFIG_PATH} already exists. Overwrite?", abort=True)
 
@@ -123,26 +138,6 @@ def init() -> None:
     click.echo(f"Written to {DATAHUB_CONFIG_PATH}")
 
 
-datahub.add_command(check)
-datahub.add_command(docker)
-datahub.add_command(ingest)
-datahub.add_command(delete)
-datahub.add_command(get)
-datahub.add_command(put)
-datahub.add_command(telemetry_cli)
-datahub.add_command(migrate)
-datahub.add_command(timeline)
-try:
-    from datahub_actions.cli.actions import actions
-
-    datahub.add_command(actions)
-except ImportError:
-    # TODO: Increase the log level once this approach has been validated.
-    logger.debug(
-        "Failed to load datahub actions framework. Please confirm that the acryl-datahub-actions package has been installed from PyPi."
-    )
-
-
 def main(**kwargs):
     # This wrapper prevents click from suppressing errors.
     try:
@@ -154,6 +149,13 @@ def main(**kwargs):
         error.show()
         sys.exit(1)
     except Exception as exc:
+        import stackprinter
+        from pydantic import ValidationError
+
+        from datahub.configuration import SensitiveError
+        from datahub.configuration.common import ConfigurationError
+        from datahub.utilities.server_config_util import get_gms_config
+
         kwargs = {}
         sensitive_cause = SensitiveError.get_sensitive_cause(exc)
         if sensitive_cause:
@@ -1,8 +1,11 @@
 import json
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import pydantic
 from avro.schema import RecordSchema
@@ -35,6 +38,13 @@ telemetry_enabled = (
     os.environ.get("DATAHUB_TELEMETRY_ENABLED", "true").lower() == "true"
 )
 
+# Number of urns fetched by a single batch get request, when prefetching aspects.
+_ASPECT_BATCH_GET_SIZE = 100
+# Number of batch get requests that are sent concurrently when prefetching aspects.
+_ASPECT_BATCH_GET_WORKERS = 4
+# Maximum number of prefetched aspects that are kept until they are read.
+_ASPECT_CACHE_MAX_SIZE = 10_000
+
 
 class DatahubClientConfig(ConfigModel):
     """Configuration class for holding connectivity to datahub gms"""
@@ -70,6 +80,12 @@ class DataHubGraph(DatahubRestEmitter):
             extra_headers=self.config.extra_headers,
             ca_certificate_path=self.config.ca_certificate_path,
         )
+        # Aspects fetched by prefetch_aspects, keyed by (urn, aspect name). None means
+        # that the entity does not have the aspect on the server.
+        self._aspect_cache: "OrderedDict[Tuple[str, str], Optional[dict]]" = (
+            OrderedDict()
+        )
+        self._aspect_cache_lock = threading.Lock()
         self.test_connection()
         if not telemetry_enabled:
             self.server_id = "missing"
@@ -162,6 +178,11 @@ class DataHubGraph(DatahubRestEmitter):
         :rtype: Optional[Aspect]
         :raises HttpError: if the HTTP response is not a 200 or a 404
         """
+        if version == 0:
+            cached, aspect_obj = self._pop_cached_aspect(entity_urn, aspect)
+            if cached:
+                return aspect_type.from_obj(aspect_obj) if aspect_obj else None
+
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -189,6 +210,97 @@ class DataHubGraph(DatahubRestEmitter):
                 f"Failed to find {aspect_type_name} in response {response_json}"
             )
 
+    def prefetch_aspects(
+        self, entity_urns: Iterable[str], aspect_type: Type[Aspect]
+    ) -> None:
+        """
+        Fetch the latest version of an aspect for many entities at once, so that the
+        following get_aspect_v2 calls for these entities are served from memory.
+
+        The urns are fetched with a few concurrent batch get requests. Each prefetched
+        aspect is handed out once, by the next get_aspect_v2 call for its entity, and
+        only a bounded number of them is kept around. If a batch get request fails,
+        the aspects of its entities are fetched one by one when they are read instead.
+
+        :param Iterable[str] entity_urns: The urns of the entities
+        :param Type[Aspect] aspect_type: The type class of the aspect to fetch (e.g. datahub.metadata.schema_classes.OwnershipClass)
+        """
+        aspect_name = aspect_type.get_aspect_name()
+        with self._aspect_cache_lock:
+            urns = [
+                urn
+                for urn in dict.fromkeys(entity_urns)
+                if (urn, aspect_name) not in self._aspect_cache
+            ]
+        batches = [
+            urns[i : i + _ASPECT_BATCH_GET_SIZE]
+            for i in range(0, len(urns), _ASPECT_BATCH_GET_SIZE)
+        ]
+        if len(batches) <= 1:
+            for batch in batches:
+                self._prefetch_aspect_batch(batch, aspect_name)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(batches), _ASPECT_BATCH_GET_WORKERS)
+        ) as executor:
+            for batch in batches:
+                executor.submit(self._prefetch_aspect_batch, batch, aspect_name)
+
+    def _prefetch_aspect_batch(self, entity_urns: List[str], aspect_name: str) -> None:
+        try:
+            aspects = self._batch_get_aspect(entity_urns, aspect_name)
+        except Exception as e:
+            logger.debug(
+                f"Failed to prefetch {aspect_name} for {len(entity_urns)} entities, "
+                f"they will be fetched one by one instead: {e}"
+            )
+            return
+
+        with self._aspect_cache_lock:
+            for urn in entity_urns:
+                self._aspect_cache[(urn, aspect_name)] = aspects.get(urn)
+                self._aspect_cache.move_to_end((urn, aspect_name))
+            while len(self._aspect_cache) > _ASPECT_CACHE_MAX_SIZE:
+                self._aspect_cache.popitem(last=False)
+
+    def _batch_get_aspect(
+        self, entity_urns: List[str], aspect_name: str
+    ) -> Dict[str, dict]:
+        ids = ",".join(Urn.url_encode(urn) for urn in entity_urns)
+        response_json = self._get_generic(
+            f"{self._gms_server}/entitiesV2?ids=List({ids})&aspects=List({aspect_name})"
+        )
+
+        aspects: Dict[str, dict] = {}
+        for urn, entity in response_json.get("results", {}).items():
+            aspect_json = entity.get("aspects", {}).get(aspect_name)
+            if aspect_json:
+                # need to apply a transform to the response to match rest.li and avro serialization
+                aspects[urn] = post_json_transform(aspect_json)["value"]
+        return aspects
+
+    def discard_prefetched_aspect(
+        self, entity_urn: str, aspect_type: Type[Aspect]
+    ) -> None:
+        """
+        Drop the prefetched aspect of an entity, if it was not read yet, so that the next
+        get_aspect_v2 call for it goes to the server.
+
+        :param str entity_urn: The urn of the entity
+        :param Type[Aspect] aspect_type: The type class of the prefetched aspect
+        """
+        self._pop_cached_aspect(entity_urn, aspect_type.get_aspect_name())
+
+    def _pop_cached_aspect(
+        self, entity_urn: str, aspect_name: str
+    ) -> Tuple[bool, Optional[dict]]:
+        with self._aspect_cache_lock:
+            key = (entity_urn, aspect_name)
+            if key not in self._aspect_cache:
+                return False, None
+            return True, self._aspect_cache.pop(key)
+
     def get_config(self) -> Dict[str, Any]:
         return self._get_generic(f"{self.config.server}/config")
 
@@ -1,8 +1,10 @@
+import functools
 import itertools
 import logging
 import os
 import platform
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, cast
@@ -18,19 +20,26 @@ from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnv
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, WriteCallback
-from datahub.ingestion.api.source import Extractor, Source
+from datahub.ingestion.api.source import Extractor, Source, WorkUnit
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
 )
 from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
+from datahub.ingestion.run.workunit_processor import ParallelWorkUnitProcessor
 from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
+from datahub.ingestion.transformer.base_transformer import (
+    SERVER_ASPECT_PREFETCH_SIZE,
+    BaseTransformer,
+)
 from datahub.ingestion.transformer.transform_registry import transform_registry
 from datahub.metadata.schema_classes import MetadataChangeProposalClass
 from datahub.telemetry import stats, telemetry
+from datahub.utilities.chunked_iter import chunked_iter
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 
 logger = logging.getLogger(__name__)
@@ -146,6 +155,7 @@ class Pipeline:
         self.num_intermediate_workunits = 0
         self.last_time_printed = int(time.time())
         self.cli_report = CliReport()
+        self._sink_lock = threading.Lock()
 
         try:
             self.ctx = PipelineContext(
@@ -337,6 +347,7 @@ class Pipeline:
         self.final_status = "unknown"
         self._notify_reporters_on_ingestion_start()
         callback = None
+        processor: Optional[ParallelWorkUnitProcessor] = None
         try:
             callback = (
                 LoggingCallback()
@@ -345,34 +356,36 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
-            for wu in itertools.islice(
-                self.source.get_workunits(),
-                self.preview_workunits if self.preview_mode else None,
+            parallel_config = self.config.parallel_processing
+            if parallel_config.enabled:
+                processor = ParallelWorkUnitProcessor(
+                    process_fn=functools.partial(
+                        self._process_workunit, callback=callback
+                    ),
+                    max_workers=parallel_config.max_workers,
+                    max_pending_workunits=parallel_config.max_pending_workunits,
+                )
+            for wu in self._prefetch_server_aspects(
+                itertools.islice(
+                    self.source.get_workunits(),
+                    self.preview_workunits if self.preview_mode else None,
+                )
             ):
                 try:
                     if self._time_to_print():
-                        self.pretty_print_summary(currently_running=True)
+                        # Workers update the sink report while holding the sink lock.
+                        with self._sink_lock:
+                            self.pretty_print_summary(currently_running=True)
                 except Exception as e:
                     logger.warning("Failed to print summary", e)
 
-                if not self.dry_run:
-                    self.sink.handle_work_unit_start(wu)
-                try:
-                    record_envelopes = self.extractor.get_records(wu)
-                    for record_envelope in self.transform(record_envelopes):
-                        if not self.dry_run:
-                            self.sink.write_record_async(record_envelope, callback)
-
-                except RuntimeError:
-                    raise
-                except SystemExit:
-                    raise
-                except Exception as e:
-                    logger.error("Failed to process some records. Continuing.", e)
-
-                self.extractor.close()
-                if not self.dry_run:
-                    self.sink.handle_work_unit_end(wu)
+                if processor:
+                    processor.submit(wu)
+                else:
+                    self._process_workunit(wu, callback)
+            if processor:
+                # All workunits must be processed before the transformers see the end of the stream.
+                processor.close()
             self.source.close()
             # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
             for record_envelope in self.transform(
@@ -393,14 +406,67 @@ class Pipeline:
             self.final_status = "completed"
         except (SystemExit, RuntimeError) as e:
             self.final_status = "cancelled"
-            logger.error("Caught error", e)
+            logger.error("Caught error", exc_info=e)
             raise
         finally:
+            if processor:
+                processor.abort()
             if callback and hasattr(callback, "close"):
                 callback.close()  # type: ignore
 
             self._notify_reporters_on_ingestion_completion()
 
+    def _prefetch_server_aspects(
+        self, workunits: Iterable[WorkUnit]
+    ) -> Iterable[WorkUnit]:
+        """
+        Lets the transformers that read aspects from the server (e.g. with PATCH
+        semantics) fetch them in bulk for the upcoming workunits, since each call to
+        transform only sees the records of a single workunit.
+        """
+        transformers = [
+            transformer
+            for transformer in self.transformers
+            if isinstance(transformer, BaseTransformer)
+            and transformer.get_server_aspect_graph() is not None
+        ]
+        if not transformers:
+            yield from workunits
+            return
+
+        for batch in chunked_iter(workunits, SERVER_ASPECT_PREFETCH_SIZE):
+            records = [wu.metadata for wu in batch if isinstance(wu, MetadataWorkUnit)]
+            for transformer in transformers:
+                transformer.prefetch_server_aspects(records)
+            yield from batch
+
+    def _process_workunit(self, wu: WorkUnit, callback: WriteCallback) -> None:
+        with self._sink_lock:
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+        try:
+            record_envelopes = self.transform(self.extractor.get_records(wu))
+            if self.config.parallel_processing.enabled:
+                # Extract and transform on the worker thread, but write to the sink
+                # from one thread at a time, since sinks need not be thread safe.
+                record_envelopes = list(record_envelopes)
+            with self._sink_lock:
+                for record_envelope in record_envelopes:
+                    if not self.dry_run:
+                        self.sink.write_record_async(record_envelope, callback)
+
+        except RuntimeError:
+            raise
+        except SystemExit:
+            raise
+        except Exception as e:
+            logger.error("Failed to process some records. Continuing.", e)
+
+        self.extractor.close()
+        with self._sink_lock:
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
@@ -37,6 +37,29 @@ class FailureLoggingConfig(ConfigModel):
     log_config: Optional[FileSinkConfig] = None
 
 
+class ParallelProcessingConfig(ConfigModel):
+    enabled: bool = Field(
+        False,
+        description="When enabled, workunits are extracted and transformed on a pool of worker threads. "
+        "This only speeds up transformers that wait on I/O, such as lookups in DataHub; CPU-bound work is "
+        "still serialized by the Python GIL. Workunits for the same entity are always processed in order. "
+        "Transformers must be thread safe.",
+    )
+    max_workers: int = Field(
+        4, description="Number of threads that extract and transform workunits."
+    )
+    max_pending_workunits: int = Field(
+        1000,
+        description="Maximum number of workunits waiting to be processed, after which the source is paused.",
+    )
+
+    @validator("max_workers", "max_pending_workunits")
+    def must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+
 class PipelineConfig(ConfigModel):
     # Once support for discriminated unions gets merged into Pydantic, we can
     # simplify this configuration and validation.
@@ -50,6 +73,7 @@ class PipelineConfig(ConfigModel):
     datahub_api: Optional[DataHubGraphConfig] = None
     pipeline_name: Optional[str] = None
     failure_log: FailureLoggingConfig = FailureLoggingConfig()
+    parallel_processing: ParallelProcessingConfig = ParallelProcessingConfig()
 
     _raw_dict: Optional[
         dict
@@ -0,0 +1,126 @@
+import logging
+import queue
+import threading
+from typing import Callable, List, Optional
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.source import WorkUnit
+from datahub.ingestion.api.workunit import MetadataWorkUnit, UsageStatsWorkUnit
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
+
+logger = logging.getLogger(__name__)
+
+# How often a blocked producer checks whether a worker has failed.
+_POLL_INTERVAL_SEC = 0.5
+
+
+def get_workunit_urn(workunit: WorkUnit) -> Optional[str]:
+    if isinstance(workunit, MetadataWorkUnit):
+        if isinstance(workunit.metadata, MetadataChangeEvent):
+            return workunit.metadata.proposedSnapshot.urn
+        elif isinstance(
+            workunit.metadata, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+        ):
+            return workunit.metadata.entityUrn
+    elif isinstance(workunit, UsageStatsWorkUnit):
+        return workunit.usageStats.resource
+    return None
+
+
+class ParallelWorkUnitProcessor:
+    """
+    Processes workunits on a pool of worker threads.
+
+    Since the threads share the GIL, this only helps when process_fn mostly waits on
+    I/O, such as transformers that look up metadata in DataHub.
+
+    Every entity urn is always assigned to the same worker, so workunits for the same
+    entity are processed in the order in which the source produced them. Each worker
+    has a bounded queue, and submitting blocks while the queue is full, which applies
+    back-pressure to the source.
+
+    Exceptions that escape process_fn are fatal: they stop the pool and are re-raised
+    to the producer by the next call to submit or close.
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[WorkUnit], None],
+        max_workers: int,
+        max_pending_workunits: int,
+    ) -> None:
+        self.process_fn = process_fn
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._queues: List["queue.Queue[Optional[WorkUnit]]"] = [
+            queue.Queue(maxsize=max(1, max_pending_workunits // max_workers))
+            for _ in range(max_workers)
+        ]
+        self._workers = [
+            threading.Thread(
+                target=self._work,
+                args=(work_queue,),
+                name=f"workunit-processor-{i}",
+                daemon=True,
+            )
+            for i, work_queue in enumerate(self._queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _work(self, work_queue: "queue.Queue[Optional[WorkUnit]]") -> None:
+        while not self._stop.is_set():
+            try:
+                workunit = work_queue.get(timeout=_POLL_INTERVAL_SEC)
+            except queue.Empty:
+                continue
+            if workunit is None:
+                return
+            try:
+                self.process_fn(workunit)
+            except BaseException as e:
+                logger.error(f"Failed to process workunit {workunit.id}", exc_info=e)
+                with self._error_lock:
+                    if self._error is None:
+                        self._error = e
+                self._stop.set()
+                return
+
+    def _put(
+        self, work_queue: "queue.Queue[Optional[WorkUnit]]", item: Optional[WorkUnit]
+    ) -> None:
+        while not self._stop.is_set():
+            try:
+                work_queue.put(item, timeout=_POLL_INTERVAL_SEC)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, workunit: WorkUnit) -> None:
+        self._raise_if_failed()
+        key = get_workunit_urn(workunit) or workunit.id
+        self._put(self._queues[hash(key) % len(self._queues)], workunit)
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """Waits until all submitted workunits have been processed."""
+        for work_queue in self._queues:
+            self._put(work_queue, None)
+        for worker in self._workers:
+            while worker.is_alive():
+                worker.join(timeout=_POLL_INTERVAL_SEC)
+                if self._stop.is_set():
+                    break
+        self._raise_if_failed()
+
+    def abort(self) -> None:
+        """Stops the workers without waiting for pending workunits to be processed."""
+        self._stop.set()
@@ -1,7 +1,16 @@
-from dataclasses import dataclass
-from typing import Optional, Union
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Union
 
-from datahub.emitter.kafka_emitter import DatahubKafkaEmitter, KafkaEmitterConfig
+import pydantic
+
+from datahub.emitter.kafka_emitter import (
+    MCE_KEY,
+    MCP_KEY,
+    PRODUCER_TUNING_PROPERTIES,
+    DatahubKafkaEmitter,
+    KafkaEmitterConfig,
+)
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
@@ -10,12 +19,48 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import MetadataChangeProposalClass
+from datahub.utilities.latency_histogram import LatencyHistogram
+
+# Producer settings that are applied in high throughput mode, unless they are configured explicitly.
+_HIGH_THROUGHPUT_DEFAULTS = {
+    "linger_ms": 100,
+    "batch_num_messages": 10000,
+    "compression_type": "lz4",
+    "background_poll_interval_sec": 0.1,
+}
 
 
 class KafkaSinkConfig(KafkaEmitterConfig):
-    # This extra layer of indirection exists in case we need to add extra
-    # config options to the sink config.
-    pass
+    high_throughput: bool = pydantic.Field(
+        default=False,
+        description="When enabled, messages are no longer flushed after every workunit, delivery callbacks are served by a background thread, "
+        f"and the producers batch and compress messages. Unless configured explicitly, this sets {_HIGH_THROUGHPUT_DEFAULTS}.",
+    )
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def apply_high_throughput_defaults(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        if values["high_throughput"]:
+            producer_config = values["connection"].producer_config
+            for field_name, default in _HIGH_THROUGHPUT_DEFAULTS.items():
+                properties = PRODUCER_TUNING_PROPERTIES.get(field_name, [])
+                if values.get(field_name) is None and not any(
+                    prop in producer_config for prop in properties
+                ):
+                    values[field_name] = default
+        return values
+
+
+@dataclass
+class KafkaSinkReport(SinkReport):
+    producer_queue_depth: Dict[str, int] = field(default_factory=dict)
+    max_producer_queue_depth: Dict[str, int] = field(default_factory=dict)
+    delivery_latency: Dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def report_delivery_latency(self, topic: str, latency_sec: float) -> None:
+        histogram = self.delivery_latency.get(topic)
+        if histogram is None:
+            histogram = self.delivery_latency.setdefault(topic, LatencyHistogram())
+        histogram.record(latency_sec)
 
 
 @dataclass
@@ -23,6 +68,8 @@ class _KafkaCallback:
     reporter: SinkReport
     record_envelope: RecordEnvelope
     write_callback: WriteCallback
+    topic: Optional[str] = None
+    start_time: float = field(default_factory=time.perf_counter)
 
     def kafka_callback(self, err: Optional[Exception], msg: str) -> None:
         if err is not None:
@@ -31,11 +78,15 @@ class _KafkaCallback:
                 self.record_envelope, err, {"error": err, "msg": msg}
             )
         else:
+            if self.topic and isinstance(self.reporter, KafkaSinkReport):
+                self.reporter.report_delivery_latency(
+                    self.topic, time.perf_counter() - self.start_time
+                )
             self.reporter.report_record_written(self.record_envelope)
             self.write_callback.on_success(self.record_envelope, {"msg": msg})
 
 
-class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
+class DatahubKafkaSink(Sink[KafkaSinkConfig, KafkaSinkReport]):
     emitter: DatahubKafkaEmitter
 
     def __post_init__(self):
@@ -45,7 +96,16 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
         pass
 
     def handle_work_unit_end(self, workunit: WorkUnit) -> None:
-        self.emitter.flush()
+        if not self.config.high_throughput:
+            self.emitter.flush()
+
+    def get_report(self) -> KafkaSinkReport:
+        self.report.producer_queue_depth = self.emitter.get_queue_depths()
+        self.report.max_producer_queue_depth = {
+            self.config.topic_routes[key]: depth
+            for key, depth in self.emitter.max_queue_depths.items()
+        }
+        return self.report
 
     def write_record_async(
         self,
@@ -63,7 +123,10 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             self.emitter.emit_mce_async(
                 record,
                 callback=_KafkaCallback(
-                    self.report, record_envelope, write_callback
+                    self.report,
+                    record_envelope,
+                    write_callback,
+                    topic=self.config.topic_routes[MCE_KEY],
                 ).kafka_callback,
             )
         elif isinstance(
@@ -72,7 +135,10 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             self.emitter.emit_mcp_async(
                 record,
                 callback=_KafkaCallback(
-                    self.report, record_envelope, write_callback
+                    self.report,
+                    record_envelope,
+                    write_callback,
+                    topic=self.config.topic_routes[MCP_KEY],
                 ).kafka_callback,
             )
         else:
@@ -81,4 +147,4 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             )
 
     def close(self) -> None:
-        self.emitter.flush()
+        self.emitter.close()
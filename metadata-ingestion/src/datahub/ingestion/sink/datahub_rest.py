@@ -2,12 +2,16 @@ import concurrent.futures
 import contextlib
 import functools
 import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import auto
 from threading import BoundedSemaphore
-from typing import Union, cast
+from typing import List, Optional, Union, cast
+
+import pydantic
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -34,17 +38,48 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    ASYNC_BATCH = auto()
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
     max_pending_requests: int = 1000
     mode: SyncOrAsync = SyncOrAsync.ASYNC
+    fast_serialization: bool = pydantic.Field(
+        default=False,
+        description="Serialize payloads into compact JSON, using orjson if it is installed.",
+    )
+    gzip_payloads: bool = pydantic.Field(
+        default=False,
+        description="Compress request bodies with gzip. Requires GMS (or a proxy in front of it) to accept gzip-encoded requests.",
+    )
+
+    # The following are only used when mode is ASYNC_BATCH.
+    max_batch_records: int = pydantic.Field(
+        default=100,
+        description="Maximum number of records to send to GMS in a single request.",
+    )
+    max_batch_bytes: int = pydantic.Field(
+        default=DatahubRestEmitter.DEFAULT_MAX_BATCH_PAYLOAD_BYTES,
+        description="Maximum size of the body of a single batch request, in bytes.",
+    )
+    max_batch_linger_sec: float = pydantic.Field(
+        default=1.0,
+        description="Maximum time a record waits for its batch to fill up before the batch is sent anyway.",
+    )
+
+    @pydantic.validator("max_batch_records", "max_batch_bytes")
+    def batch_bounds_must_be_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("batch bounds must be positive")
+        return v
 
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    batches_written: int = 0
+    records_retried_individually: int = 0
 
     def compute_stats(self) -> None:
         super().compute_stats()
@@ -53,6 +88,14 @@ class DataHubRestSinkReport(SinkReport):
         pass
 
 
+@dataclass
+class _PendingWrite:
+    record_envelope: RecordEnvelope
+    write_callback: WriteCallback
+    # Whether the success or failure of the write was already reported.
+    handled: bool = False
+
+
 class BoundedExecutor:
     """BoundedExecutor behaves as a ThreadPoolExecutor which will block on
     calls to submit() once the limit given as "bound" work items are queued for
@@ -99,6 +142,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             extra_headers=self.config.extra_headers,
             ca_certificate_path=self.config.ca_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            fast_serialization=self.config.fast_serialization,
+            gzip_payloads=self.config.gzip_payloads,
         )
         try:
             gms_config = self.emitter.test_connection()
@@ -122,6 +167,19 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             bound=self.config.max_pending_requests,
         )
 
+        self._batch: List[_PendingWrite] = []
+        self._batch_started_at: Optional[float] = None
+        self._batch_lock = threading.Lock()
+        self._batch_linger_stop = threading.Event()
+        self._batch_linger_thread: Optional[threading.Thread] = None
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._batch_linger_thread = threading.Thread(
+                target=self._flush_lingering_batches,
+                name="datahub-rest-sink-linger",
+                daemon=True,
+            )
+            self._batch_linger_thread.start()
+
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
             mwu: MetadataWorkUnit = cast(MetadataWorkUnit, workunit)
@@ -146,38 +204,133 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             e = future.exception()
             if not e:
                 start_time, end_time = future.result()
-                self.report.report_record_written(record_envelope)
-                self.report.report_write_latency(end_time - start_time)
-                write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
-                        )
-                        e.info["message"] = e.info.get("message", "").split("\n")[0][
-                            :200
-                        ]
-
-                # Include information about the entity that failed.
-                record = record_envelope.record
-                if isinstance(record, MetadataChangeProposalWrapper):
-                    entity_id = record.entityUrn
-                    e.info["id"] = entity_id
-                elif isinstance(record, MetadataChangeEvent):
-                    entity_id = record.proposedSnapshot.urn
-                    e.info["id"] = entity_id
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
-                else:
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
+                self._handle_write_success(
+                    record_envelope, write_callback, end_time - start_time
+                )
             else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                self._handle_write_failure(record_envelope, write_callback, e)
+
+    def _handle_write_success(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        latency: timedelta,
+    ) -> None:
+        self.report.report_record_written(record_envelope)
+        self.report.report_write_latency(latency)
+        write_callback.on_success(record_envelope, {})
+
+    def _handle_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in e.info:
+                with contextlib.suppress(Exception):
+                    e.info["stackTrace"] = "\n".join(
+                        e.info["stackTrace"].split("\n")[:3]
+                    )
+                    e.info["message"] = e.info.get("message", "").split("\n")[0][:200]
+
+            # Include information about the entity that failed.
+            record = record_envelope.record
+            if isinstance(record, MetadataChangeProposalWrapper):
+                entity_id = record.entityUrn
+                e.info["id"] = entity_id
+            elif isinstance(record, MetadataChangeEvent):
+                entity_id = record.proposedSnapshot.urn
+                e.info["id"] = entity_id
+
+            if not self.treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": e.info})
+            else:
+                self.report.report_warning({"warning": e.message, "info": e.info})
+            write_callback.on_failure(record_envelope, e, e.info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
+
+    def _emit_batch(self, batch: List[_PendingWrite]) -> None:
+        start_time = time.perf_counter()
+        errors = self.emitter.emit_batch(
+            [pending.record_envelope.record for pending in batch],
+            max_payload_bytes=self.config.max_batch_bytes,
+        )
+        batch_latency = timedelta(seconds=time.perf_counter() - start_time)
+        self.report.batches_written += 1
+
+        for pending, error in zip(batch, errors):
+            self.report.pending_requests -= 1
+            pending.handled = True
+            if error is None:
+                self._handle_write_success(
+                    pending.record_envelope, pending.write_callback, batch_latency
+                )
+                continue
+
+            # Only the records whose batch request failed are retried, one at a
+            # time, so that failures are attributed to the offending record.
+            self.report.records_retried_individually += 1
+            try:
+                start, end = self.emitter.emit(pending.record_envelope.record)
+            except Exception as e:
+                self._handle_write_failure(
+                    pending.record_envelope, pending.write_callback, e
+                )
+            else:
+                self._handle_write_success(
+                    pending.record_envelope, pending.write_callback, end - start
+                )
+
+    def _submit_batch(self, batch: List[_PendingWrite]) -> None:
+        future = self.executor.submit(self._emit_batch, batch)
+        future.add_done_callback(functools.partial(self._batch_done_callback, batch))
+
+    def _batch_done_callback(
+        self, batch: List[_PendingWrite], future: concurrent.futures.Future
+    ) -> None:
+        # _emit_batch reports every record itself, so we only need to handle
+        # the records it did not get to, if the batch never ran or crashed
+        # unexpectedly, e.g. because a write callback raised.
+        e = (
+            OperationalError("future was cancelled")
+            if future.cancelled()
+            else future.exception()
+        )
+        if e is not None:
+            unhandled = [pending for pending in batch if not pending.handled]
+            logger.error(
+                f"Failed to write batch of {len(batch)} records, {len(unhandled)} of which were not reported: {e}"
+            )
+            self.report.pending_requests -= len(unhandled)
+            for pending in unhandled:
+                pending.handled = True
+                self._handle_write_failure(
+                    pending.record_envelope, pending.write_callback, e
+                )
+
+    def _take_batch(self, only_if_lingering: bool = False) -> List[_PendingWrite]:
+        with self._batch_lock:
+            if only_if_lingering and (
+                self._batch_started_at is None
+                or time.monotonic() - self._batch_started_at
+                < self.config.max_batch_linger_sec
+            ):
+                return []
+            batch, self._batch = self._batch, []
+            self._batch_started_at = None
+            return batch
+
+    def _flush_lingering_batches(self) -> None:
+        poll_interval = max(min(self.config.max_batch_linger_sec / 2, 1.0), 0.01)
+        while not self._batch_linger_stop.wait(poll_interval):
+            batch = self._take_batch(only_if_lingering=True)
+            if batch:
+                self._submit_batch(batch)
 
     def write_record_async(
         self,
@@ -192,7 +345,21 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            full_batch: List[_PendingWrite] = []
+            with self._batch_lock:
+                if not self._batch:
+                    self._batch_started_at = time.monotonic()
+                self._batch.append(_PendingWrite(record_envelope, write_callback))
+                self.report.pending_requests += 1
+                if len(self._batch) >= self.config.max_batch_records:
+                    full_batch, self._batch = self._batch, []
+                    self._batch_started_at = None
+            if full_batch:
+                # Submitting may block on max_pending_requests, so it must
+                # happen outside of the lock.
+                self._submit_batch(full_batch)
+        elif self.config.mode == SyncOrAsync.ASYNC:
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
@@ -209,6 +376,12 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
     def close(self):
+        if self._batch_linger_thread is not None:
+            self._batch_linger_stop.set()
+            self._batch_linger_thread.join()
+            batch = self._take_batch()
+            if batch:
+                self._submit_batch(batch)
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
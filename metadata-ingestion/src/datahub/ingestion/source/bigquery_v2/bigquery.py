@@ -1,14 +1,20 @@
 import atexit
+import collections
+import dataclasses
 import logging
 import os
 import re
+import time
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Optional, Tuple, Type, Union, cast
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
 
 import pydantic
+from google.api_core.exceptions import GoogleAPICallError, TooManyRequests
 from google.cloud import bigquery
-from google.cloud.bigquery.table import TableListItem
+from google.cloud.bigquery.table import Row, TableListItem
 
 from datahub.emitter.mce_builder import (
     make_container_urn,
@@ -50,7 +56,9 @@ from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     BigQueryDataDictionary,
     BigqueryDataset,
     BigqueryProject,
+    BigqueryRegionMetadata,
     BigqueryTable,
+    BigqueryTableSummary,
     BigqueryView,
 )
 from datahub.ingestion.source.bigquery_v2.lineage import BigqueryLineageExtractor
@@ -104,6 +112,66 @@ logger: logging.Logger = logging.getLogger(__name__)
 # See https://cloud.google.com/bigquery/docs/table-snapshots-intro.
 SNAPSHOT_TABLE_REGEX = re.compile(r"^(.+)@(\d{13})$")
 
+# How often, and after how long, the metadata of a dataset is fetched again when a
+# BigQuery quota or rate limit was exceeded.
+_MAX_QUOTA_RETRIES = 3
+_QUOTA_RETRY_DELAY_SEC = 5.0
+
+
+def _is_quota_exceeded(e: Exception) -> bool:
+    if isinstance(e, TooManyRequests):
+        return True
+    if isinstance(e, GoogleAPICallError):
+        return any(
+            error.get("reason") in ("quotaExceeded", "rateLimitExceeded")
+            for error in e.errors
+            if isinstance(error, dict)
+        )
+    return False
+
+
+@dataclass
+class _ProjectProgress:
+    """Tracks the datasets of a project whose metadata is being fetched."""
+
+    max_concurrent_datasets: int
+    listing: bool = True
+    listed: bool = False
+    in_flight: int = 0
+    # The datasets still to fetch, with the number of attempts made so far and the
+    # time.monotonic() before which they must not be fetched.
+    pending: Deque[Tuple[BigqueryDataset, int, float]] = dataclasses.field(
+        default_factory=collections.deque
+    )
+    # The metadata of the datasets that are fetched for their whole region.
+    region_metadata: List[BigqueryRegionMetadata] = dataclasses.field(
+        default_factory=list
+    )
+
+    def is_done(self) -> bool:
+        return not self.listing and not self.pending and self.in_flight == 0
+
+    def get_region_metadata(
+        self, dataset_name: str
+    ) -> Optional[BigqueryRegionMetadata]:
+        for region_metadata in self.region_metadata:
+            if region_metadata.is_fetched(dataset_name):
+                return region_metadata
+        return None
+
+    def release_dataset_metadata(self, dataset_name: str) -> None:
+        region_metadata = self.get_region_metadata(dataset_name)
+        if region_metadata:
+            region_metadata.release(dataset_name)
+
+
+@dataclass
+class _FetchedDataset:
+    columns: Optional[Dict[str, List[BigqueryColumn]]] = None
+    fetched_columns: bool = False
+    dropped_tables: List[str] = dataclasses.field(default_factory=list)
+    extraction_sec: float = 0
+
 
 # We can't use close as it is not called if the ingestion is not successful
 def cleanup(config: BigQueryV2Config) -> None:
@@ -191,8 +259,11 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
 
         # Currently caching using instance variables
         # TODO - rewrite cache for readability or use out of the box solution
-        self.db_tables: Dict[str, Dict[str, List[BigqueryTable]]] = {}
-        self.db_views: Dict[str, Dict[str, List[BigqueryView]]] = {}
+        # The tables of each project, for usage and profiling, and the names of the
+        # views of each project, for usage. Column data is only kept in
+        # schema_columns while the schemas of a dataset are emitted.
+        self.db_tables: Dict[str, Dict[str, List[BigqueryTableSummary]]] = {}
+        self.db_views: Dict[str, Dict[str, List[str]]] = {}
 
         self.schema_columns: Dict[
             Tuple[str, str], Optional[Dict[str, List[BigqueryColumn]]]
@@ -437,13 +508,13 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         conn: bigquery.Client = self.get_bigquery_client()
         self.add_config_to_report()
 
-        projects: List[BigqueryProject] = BigQueryDataDictionary.get_projects(conn)
-        for project_id in projects:
-            if not self.config.project_id_pattern.allowed(project_id.id):
-                self.report.report_dropped(project_id.id)
+        projects: List[BigqueryProject] = []
+        for project in BigQueryDataDictionary.get_projects(conn):
+            if not self.config.project_id_pattern.allowed(project.id):
+                self.report.report_dropped(project.id)
                 continue
-            logger.info(f"Processing project: {project_id.id}")
-            yield from self._process_project(conn, project_id)
+            projects.append(project)
+        yield from self._process_projects(conn, projects)
 
         if self.config.profiling.enabled:
             yield from self.profiler.get_workunits(self.db_tables)
@@ -451,66 +522,220 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         # Clean up stale entities if configured.
         yield from self.stale_entity_removal_handler.gen_removed_entity_workunits()
 
-    def _process_project(
-        self, conn: bigquery.Client, bigquery_project: BigqueryProject
+    def _process_projects(
+        self, conn: bigquery.Client, projects: List[BigqueryProject]
     ) -> Iterable[MetadataWorkUnit]:
-        project_id = bigquery_project.id
-
-        self.db_tables[project_id] = {}
-        self.db_views[project_id] = {}
-
-        database_workunits = self.gen_project_id_containers(project_id)
-
-        for wu in database_workunits:
-            self.report.report_workunit(wu)
-            yield wu
+        # The datasets of a few projects at a time are listed and fetched in a thread
+        # pool, and their workunits are generated here as each dataset completes.
+        # Only the worker threads talk to BigQuery; the state of the source and the
+        # report are only updated on this thread.
+        max_workers = self.config.max_metadata_extraction_workers
+        projects_to_open: Deque[BigqueryProject] = collections.deque(projects)
+        open_projects: Dict[str, _ProjectProgress] = {}
+        futures: Dict[Future, Tuple[str, Optional[BigqueryDataset], int]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while projects_to_open or open_projects:
+                while projects_to_open and len(open_projects) < max_workers:
+                    project = projects_to_open.popleft()
+                    logger.info(f"Processing project: {project.id}")
+                    self.db_tables[project.id] = {}
+                    self.db_views[project.id] = {}
+                    yield from self.gen_project_id_containers(project.id)
+
+                    open_projects[project.id] = _ProjectProgress(
+                        max_concurrent_datasets=self.config.max_concurrent_datasets_per_project
+                    )
+                    listing = executor.submit(self._list_datasets, conn, project.id)
+                    futures[listing] = (project.id, None, 0)
+
+                # Earlier projects get to start their datasets first.
+                now = time.monotonic()
+                next_retry_time: Optional[float] = None
+                for project_id, progress in open_projects.items():
+                    while (
+                        progress.pending
+                        and progress.in_flight < progress.max_concurrent_datasets
+                        and len(futures) < 2 * max_workers
+                    ):
+                        pending_dataset, attempt, not_before = progress.pending[0]
+                        if not_before > now:
+                            # The project is backing off after exceeding a quota.
+                            if next_retry_time is None or not_before < next_retry_time:
+                                next_retry_time = not_before
+                            break
+                        progress.pending.popleft()
+                        progress.in_flight += 1
+                        fetch = executor.submit(
+                            self._fetch_dataset_metadata,
+                            conn,
+                            project_id,
+                            pending_dataset,
+                            progress.get_region_metadata(pending_dataset.name),
+                        )
+                        futures[fetch] = (project_id, pending_dataset, attempt)
 
+                retry_delay_sec = (
+                    max(0.0, next_retry_time - time.monotonic())
+                    if next_retry_time is not None
+                    else None
+                )
+                if futures:
+                    done, _ = wait(
+                        futures, timeout=retry_delay_sec, return_when=FIRST_COMPLETED
+                    )
+                    # In submission order, so that a single worker keeps the order of
+                    # a sequential run.
+                    for future in [f for f in futures if f in done]:
+                        project_id, dataset, attempt = futures.pop(future)
+                        progress = open_projects[project_id]
+                        if dataset is None:
+                            self._add_datasets_to_fetch(project_id, progress, future)
+                        else:
+                            progress.in_flight -= 1
+                            yield from self._process_fetched_dataset(
+                                conn, project_id, progress, dataset, attempt, future
+                            )
+                elif retry_delay_sec is not None:
+                    # Nothing else to do until a backed off dataset can be retried.
+                    time.sleep(retry_delay_sec)
+
+                for project_id, progress in list(open_projects.items()):
+                    if progress.is_done():
+                        del open_projects[project_id]
+                        if progress.listed:
+                            yield from self._gen_usage_workunits(project_id)
+                        # Only profiling still needs the tables of the project.
+                        del self.db_views[project_id]
+                        if not self.config.profiling.enabled:
+                            del self.db_tables[project_id]
+
+    def _add_datasets_to_fetch(
+        self,
+        project_id: str,
+        progress: "_ProjectProgress",
+        future: "Future[Tuple[List[BigqueryDataset], List[BigqueryRegionMetadata]]]",
+    ) -> None:
+        progress.listing = False
         try:
-            bigquery_project.datasets = (
-                BigQueryDataDictionary.get_datasets_for_project_id(conn, project_id)
-            )
+            datasets, progress.region_metadata = future.result()
         except Exception as e:
+            self.report.report_failure(
+                project_id,
+                f"Unable to get datasets for project {project_id}, skipping. The error was: {e}",
+            )
             logger.error(
                 f"Unable to get datasets for project {project_id}, skipping. The error was: {e}"
             )
-            return None
-
-        for bigquery_dataset in bigquery_project.datasets:
+            return
 
+        progress.listed = True
+        if progress.region_metadata:
+            # In the order of the rows of the region-level queries, so that only the
+            # metadata of a few datasets is read ahead.
+            datasets = sorted(datasets, key=lambda dataset: dataset.name)
+        for bigquery_dataset in datasets:
             if not self.config.dataset_pattern.allowed(bigquery_dataset.name):
                 self.report.report_dropped(f"{bigquery_dataset.name}.*")
                 continue
-            try:
-                yield from self._process_schema(conn, project_id, bigquery_dataset)
-            except Exception as e:
-                logger.error(
-                    f"Unable to get tables for dataset {bigquery_dataset.name} in project {project_id}, skipping. The error was: {e}"
-                )
-                continue
+            progress.pending.append((bigquery_dataset, 0, 0.0))
 
-        if self.config.include_usage_statistics:
-            logger.info(f"Generate usage for {project_id}")
-            tables: Dict[str, List[str]] = {}
+    def _process_fetched_dataset(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        progress: "_ProjectProgress",
+        bigquery_dataset: BigqueryDataset,
+        attempt: int,
+        future: "Future[_FetchedDataset]",
+    ) -> Iterable[MetadataWorkUnit]:
+        dataset_name = bigquery_dataset.name
+        try:
+            fetched = future.result()
+        except Exception as e:
+            if attempt < _MAX_QUOTA_RETRIES and _is_quota_exceeded(e):
+                # Back off: retry the dataset later, with fewer concurrent datasets
+                # for this project.
+                progress.max_concurrent_datasets = max(
+                    1, progress.max_concurrent_datasets // 2
+                )
+                progress.pending.appendleft(
+                    (
+                        bigquery_dataset,
+                        attempt + 1,
+                        time.monotonic() + _QUOTA_RETRY_DELAY_SEC * (attempt + 1),
+                    )
+                )
+                self.report.num_metadata_extraction_quota_retries += 1
+                logger.warning(
+                    f"Exceeded a BigQuery quota while getting tables for dataset {dataset_name} in project {project_id}, retrying. The error was: {e}"
+                )
+                return
 
-            for dataset in self.db_tables[project_id]:
-                tables[dataset] = [
-                    table.name for table in self.db_tables[project_id][dataset]
-                ]
+            progress.release_dataset_metadata(dataset_name)
+            for wu in self.gen_dataset_containers(dataset_name, project_id):
+                self.report.report_workunit(wu)
+                yield wu
+            self.report.report_failure(
+                f"{project_id}.{dataset_name}",
+                f"Unable to get tables for dataset {dataset_name} in project {project_id}, skipping. The error was: {e}",
+            )
+            logger.error(
+                f"Unable to get tables for dataset {dataset_name} in project {project_id}, skipping. The error was: {e}"
+            )
+            return
 
-            for dataset in self.db_views[project_id]:
-                if not tables[dataset]:
-                    tables[dataset] = [
-                        table.name for table in self.db_views[project_id][dataset]
-                    ]
-                else:
-                    tables[dataset].extend(
-                        [table.name for table in self.db_views[project_id][dataset]]
-                    )
+        progress.release_dataset_metadata(dataset_name)
+        for table_name in fetched.dropped_tables:
+            self.report.report_dropped(table_name)
+        self.report.metadata_extraction_sec[f"{project_id}.{dataset_name}"] = round(
+            fetched.extraction_sec, 2
+        )
+        if fetched.fetched_columns:
+            self.schema_columns[(project_id, dataset_name)] = fetched.columns
 
-            yield from self.usage_extractor.generate_usage_for_project(
-                project_id, tables
+        try:
+            yield from self._process_schema(conn, project_id, bigquery_dataset)
+        except Exception as e:
+            self.report.report_failure(
+                f"{project_id}.{dataset_name}",
+                f"Unable to get tables for dataset {dataset_name} in project {project_id}, skipping. The error was: {e}",
+            )
+            logger.error(
+                f"Unable to get tables for dataset {dataset_name} in project {project_id}, skipping. The error was: {e}"
             )
 
+        # The schemas were emitted, so only keep what usage and profiling need.
+        self.schema_columns.pop((project_id, dataset_name), None)
+        if self.config.include_tables:
+            self.db_tables[project_id][dataset_name] = [
+                BigqueryTableSummary.from_table(table)
+                for table in bigquery_dataset.tables
+            ]
+        if self.config.include_views:
+            self.db_views[project_id][dataset_name] = [
+                view.name for view in bigquery_dataset.views
+            ]
+        bigquery_dataset.tables = []
+        bigquery_dataset.views = []
+
+    def _gen_usage_workunits(self, project_id: str) -> Iterable[MetadataWorkUnit]:
+        if not self.config.include_usage_statistics:
+            return
+
+        logger.info(f"Generate usage for {project_id}")
+        tables: Dict[str, List[str]] = {}
+
+        for dataset in self.db_tables[project_id]:
+            tables[dataset] = [
+                table.name for table in self.db_tables[project_id][dataset]
+            ]
+
+        for dataset in self.db_views[project_id]:
+            tables.setdefault(dataset, []).extend(self.db_views[project_id][dataset])
+
+        yield from self.usage_extractor.generate_usage_for_project(project_id, tables)
+
     def _process_schema(
         self, conn: bigquery.Client, project_id: str, bigquery_dataset: BigqueryDataset
     ) -> Iterable[MetadataWorkUnit]:
@@ -525,17 +750,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             yield wu
 
         if self.config.include_tables:
-            bigquery_dataset.tables = self.get_tables_for_dataset(
-                conn, project_id, dataset_name
-            )
             for table in bigquery_dataset.tables:
                 yield from self._process_table(conn, table, project_id, dataset_name)
 
         if self.config.include_views:
-            bigquery_dataset.views = self.get_views_for_dataset(
-                conn, project_id, dataset_name
-            )
-
             for view in bigquery_dataset.views:
                 yield from self._process_view(conn, view, project_id, dataset_name)
 
@@ -880,150 +1098,214 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
     def get_report(self) -> BigQueryV2Report:
         return self.report
 
-    def get_tables_for_dataset(
+    def _list_datasets(
+        self, conn: bigquery.Client, project_id: str
+    ) -> Tuple[List[BigqueryDataset], List[BigqueryRegionMetadata]]:
+        """
+        Lists the datasets of a project and, if information_schema_regions is set,
+        the allowed datasets in those regions, whose metadata is then read for the
+        whole region as it is fetched. This runs on the worker threads, so it must not
+        modify the state of the source or the report.
+        """
+        datasets = BigQueryDataDictionary.get_datasets_for_project_id(conn, project_id)
+
+        region_metadata: List[BigqueryRegionMetadata] = []
+        for region in self.config.information_schema_regions or []:
+            try:
+                region_metadata.append(
+                    BigqueryRegionMetadata(
+                        conn, project_id, region, self.config.dataset_pattern
+                    )
+                )
+            except Exception as e:
+                # The datasets of this region are queried one by one instead.
+                logger.warning(
+                    f"Unable to get metadata for region {region} in project {project_id}, falling back to per dataset queries. The error was: {e}"
+                )
+        return datasets, region_metadata
+
+    def _fetch_dataset_metadata(
         self,
         conn: bigquery.Client,
         project_id: str,
-        dataset_name: str,
-    ) -> List[BigqueryTable]:
-
-        bigquery_tables: Optional[List[BigqueryTable]] = (
-            self.db_tables[project_id].get(dataset_name)
-            if project_id in self.db_tables
-            else []
+        bigquery_dataset: BigqueryDataset,
+        region_metadata: Optional[BigqueryRegionMetadata] = None,
+    ) -> "_FetchedDataset":
+        """
+        Gets the tables, views and columns of a dataset, from region_metadata where
+        they are fetched for the whole region. This runs on the worker threads, so it
+        must not modify the state of the source or the report.
+        """
+        dataset_name = bigquery_dataset.name
+        dataset_metadata = (
+            region_metadata.get(dataset_name) if region_metadata else None
         )
+        fetched = _FetchedDataset()
+        with PerfTimer() as timer:
+            if self.config.include_tables:
+                bigquery_dataset.tables = self._fetch_tables_for_dataset(
+                    conn,
+                    project_id,
+                    dataset_name,
+                    fetched.dropped_tables,
+                    dataset_metadata.tables if dataset_metadata else None,
+                )
+            if self.config.include_views:
+                bigquery_dataset.views = (
+                    dataset_metadata.views
+                    if dataset_metadata
+                    else BigQueryDataDictionary.get_views_for_dataset(
+                        conn, project_id, dataset_name
+                    )
+                )
+            fetched.extraction_sec = timer.elapsed_seconds()
+
+        # Only get the columns if any table or view of the dataset will be processed.
+        if any(
+            self.config.table_pattern.allowed(
+                BigqueryTableIdentifier(
+                    project_id, dataset_name, table.name
+                ).raw_table_name()
+            )
+            for table in bigquery_dataset.tables
+        ) or any(
+            self.config.view_pattern.allowed(
+                BigqueryTableIdentifier(
+                    project_id, dataset_name, view.name
+                ).raw_table_name()
+            )
+            for view in bigquery_dataset.views
+        ):
+            if dataset_metadata and dataset_metadata.columns is not None:
+                fetched.columns = dataset_metadata.columns
+            else:
+                fetched.columns = BigQueryDataDictionary.get_columns_for_dataset(
+                    conn, project_id=project_id, dataset_name=dataset_name
+                )
+            fetched.fetched_columns = True
+        return fetched
 
+    def _fetch_tables_for_dataset(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        dataset_name: str,
+        dropped_tables: List[str],
+        region_tables: Optional[Dict[str, Row]] = None,
+    ) -> List[BigqueryTable]:
         # In bigquery there is no way to query all tables in a Project id
-        if not bigquery_tables:
-            with PerfTimer() as timer:
-                bigquery_tables = []
-                table_count: int = 0
-                table_items: Dict[str, TableListItem] = {}
-                # Dict to store sharded table and the last seen max shard id
-                sharded_tables: Dict[str, TableListItem] = defaultdict()
-                # Partitions view throw exception if we try to query partition info for too many tables
-                # so we have to limit the number of tables we query partition info.
-                # The conn.list_tables returns table infos that information_schema doesn't contain and this
-                # way we can merge that info with the queried one.
-                # https://cloud.google.com/bigquery/docs/information-schema-partitions
-                for table in conn.list_tables(f"{project_id}.{dataset_name}"):
-                    table_identifier = BigqueryTableIdentifier(
+        bigquery_tables: List[BigqueryTable] = []
+        table_count: int = 0
+        table_items: Dict[str, TableListItem] = {}
+        # Dict to store sharded table and the last seen max shard id
+        sharded_tables: Dict[str, TableListItem] = defaultdict()
+        # Partitions view throw exception if we try to query partition info for too many tables
+        # so we have to limit the number of tables we query partition info.
+        # The conn.list_tables returns table infos that information_schema doesn't contain and this
+        # way we can merge that info with the queried one.
+        # https://cloud.google.com/bigquery/docs/information-schema-partitions
+        for table in conn.list_tables(f"{project_id}.{dataset_name}"):
+            table_identifier = BigqueryTableIdentifier(
+                project_id=project_id,
+                dataset=dataset_name,
+                table=table.table_id,
+            )
+
+            _, shard = BigqueryTableIdentifier.get_table_and_shard(
+                table_identifier.raw_table_name()
+            )
+            table_name = table_identifier.get_table_name().split(".")[-1]
+
+            # For sharded tables we only process the latest shard
+            # which has the highest date in the table name.
+            # Sharded tables look like: table_20220120
+            # We only has one special case where the table name is a date
+            # in this case we merge all these tables under dataset name as table name.
+            # For example some_dataset.20220110 will be turned to some_dataset.some_dataset
+            # It seems like there are some bigquery user who uses this way the tables.
+            if shard:
+                if not sharded_tables.get(table_identifier.get_table_name()):
+                    # When table is only a shard we use dataset_name as table_name
+                    sharded_tables[table_name] = table
+                    continue
+                else:
+                    stored_table_identifier = BigqueryTableIdentifier(
                         project_id=project_id,
                         dataset=dataset_name,
-                        table=table.table_id,
+                        table=sharded_tables[table_name].table_id,
                     )
-
-                    _, shard = BigqueryTableIdentifier.get_table_and_shard(
-                        table_identifier.raw_table_name()
+                    (_, stored_shard,) = BigqueryTableIdentifier.get_table_and_shard(
+                        stored_table_identifier.raw_table_name()
                     )
+                    # When table is none, we use dataset_name as table_name
                     table_name = table_identifier.get_table_name().split(".")[-1]
+                    assert stored_shard
+                    if stored_shard < shard:
+                        sharded_tables[table_name] = table
+                    continue
+            else:
+                table_count = table_count + 1
+                table_items[table.table_id] = table
 
-                    # For sharded tables we only process the latest shard
-                    # which has the highest date in the table name.
-                    # Sharded tables look like: table_20220120
-                    # We only has one special case where the table name is a date
-                    # in this case we merge all these tables under dataset name as table name.
-                    # For example some_dataset.20220110 will be turned to some_dataset.some_dataset
-                    # It seems like there are some bigquery user who uses this way the tables.
-                    if shard:
-                        if not sharded_tables.get(table_identifier.get_table_name()):
-                            # When table is only a shard we use dataset_name as table_name
-                            sharded_tables[table_name] = table
-                            continue
-                        else:
-                            stored_table_identifier = BigqueryTableIdentifier(
-                                project_id=project_id,
-                                dataset=dataset_name,
-                                table=sharded_tables[table_name].table_id,
-                            )
-                            (
-                                _,
-                                stored_shard,
-                            ) = BigqueryTableIdentifier.get_table_and_shard(
-                                stored_table_identifier.raw_table_name()
-                            )
-                            # When table is none, we use dataset_name as table_name
-                            table_name = table_identifier.get_table_name().split(".")[
-                                -1
-                            ]
-                            assert stored_shard
-                            if stored_shard < shard:
-                                sharded_tables[table_name] = table
-                            continue
-                    else:
-                        table_count = table_count + 1
-                        table_items[table.table_id] = table
-
-                    if str(table_identifier).startswith(
-                        self.config.temp_table_dataset_prefix
-                    ):
-                        logger.debug(
-                            f"Dropping temporary table {table_identifier.table}"
-                        )
-                        self.report.report_dropped(table_identifier.raw_table_name())
-                        continue
-
-                    if (
-                        table_count % self.config.number_of_datasets_process_in_batch
-                        == 0
-                    ):
-                        bigquery_tables.extend(
-                            BigQueryDataDictionary.get_tables_for_dataset(
-                                conn, project_id, dataset_name, table_items
-                            )
-                        )
-                        table_items.clear()
-
-                # Sharded tables don't have partition keys, so it is safe to add to the list as
-                # it should not affect the number of tables will be touched in the partitions system view.
-                # Because we have the batched query of get_tables_for_dataset to makes sure
-                # we won't hit too many tables queried with partitions system view.
-                # The key in the map is the actual underlying table name and not the friendly name and
-                # that's why we need to get the actual table names and not the normalized ones.
-                table_items.update(
-                    {value.table_id: value for value in sharded_tables.values()}
-                )
+            if str(table_identifier).startswith(self.config.temp_table_dataset_prefix):
+                logger.debug(f"Dropping temporary table {table_identifier.table}")
+                dropped_tables.append(table_identifier.raw_table_name())
+                continue
 
-                if table_items:
-                    bigquery_tables.extend(
-                        BigQueryDataDictionary.get_tables_for_dataset(
-                            conn, project_id, dataset_name, table_items
-                        )
+            if table_count % self.config.number_of_datasets_process_in_batch == 0:
+                bigquery_tables.extend(
+                    self._get_tables_for_items(
+                        conn, project_id, dataset_name, table_items, region_tables
                     )
+                )
+                table_items.clear()
+
+        # Sharded tables don't have partition keys, so it is safe to add to the list as
+        # it should not affect the number of tables will be touched in the partitions system view.
+        # Because we have the batched query of get_tables_for_dataset to makes sure
+        # we won't hit too many tables queried with partitions system view.
+        # The key in the map is the actual underlying table name and not the friendly name and
+        # that's why we need to get the actual table names and not the normalized ones.
+        table_items.update({value.table_id: value for value in sharded_tables.values()})
+
+        if table_items:
+            bigquery_tables.extend(
+                self._get_tables_for_items(
+                    conn, project_id, dataset_name, table_items, region_tables
+                )
+            )
 
-                self.db_tables[project_id][dataset_name] = bigquery_tables
-
-                self.report.metadata_extraction_sec[
-                    f"{project_id}.{dataset_name}"
-                ] = round(timer.elapsed_seconds(), 2)
-
-                return bigquery_tables
-
-        # Some schema may not have any table
-        return (
-            self.db_tables[project_id].get(dataset_name, [])
-            if project_id in self.db_tables
-            else []
-        )
+        return bigquery_tables
 
-    def get_views_for_dataset(
+    def _get_tables_for_items(
         self,
         conn: bigquery.Client,
         project_id: str,
         dataset_name: str,
-    ) -> List[BigqueryView]:
-
-        views = self.db_views.get(project_id)
-
-        # get all views for database failed,
-        # falling back to get views for schema
-        if not views:
-            return BigQueryDataDictionary.get_views_for_dataset(
-                conn, project_id, dataset_name
+        table_items: Dict[str, TableListItem],
+        region_tables: Optional[Dict[str, Row]],
+    ) -> List[BigqueryTable]:
+        if region_tables is None:
+            return BigQueryDataDictionary.get_tables_for_dataset(
+                conn, project_id, dataset_name, table_items
             )
 
-        # Some schema may not have any table
-        return views.get(dataset_name, [])
+        # Tables that were created after the region was queried are skipped, like
+        # they are by the per dataset query.
+        tables = [
+            BigQueryDataDictionary.table_from_row(region_tables[name], table_item)
+            for name, table_item in table_items.items()
+            if name in region_tables
+        ]
+        # The latest partition ids are only available per dataset.
+        partitioned_tables = [table.name for table in tables if table.num_partitions]
+        if partitioned_tables:
+            max_partition_ids = BigQueryDataDictionary.get_max_partition_ids(
+                conn, project_id, dataset_name, partitioned_tables
+            )
+            for table in tables:
+                table.max_partition_id = max_partition_ids.get(table.name)
+        return tables
 
     def get_columns_for_table(
         self, conn: bigquery.Client, table_identifier: BigqueryTableIdentifier
@@ -57,6 +57,23 @@ class BigQueryV2Config(BigQueryConfig):
         description="Number of table queried in batch when getting metadata. This is a low leve config propert which should be touched with care. This restriction needed because we query partitions system view which throws error if we try to touch too many tables.",
     )
 
+    max_metadata_extraction_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker threads that get the datasets, tables, views and columns of projects and datasets concurrently. Workunits are generated as each dataset completes, so with more than one worker their order can differ between runs.",
+    )
+
+    max_concurrent_datasets_per_project: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of datasets of a single project whose metadata is fetched concurrently, to stay within the per-project quotas of BigQuery. It is halved for a project whenever one of its datasets exceeds a quota, and that dataset is retried.",
+    )
+
+    information_schema_regions: Optional[List[str]] = Field(
+        default=None,
+        description="Regions of the datasets, e.g. `us`, `eu` or `europe-west2`. If set, the tables, views and columns of all datasets of a project in these regions are fetched with a few queries against the region-level INFORMATION_SCHEMA views, instead of a few queries per dataset. Datasets in other regions are still queried one by one, and the latest partition ids are still queried per dataset, only for datasets with partitioned tables.",
+    )
+
     # The inheritance hierarchy is wonky here, but these options need modifications.
     project_id: Optional[str] = Field(
         default=None,
@@ -8,6 +8,10 @@ import pydantic
 
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
 from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.sql_parser_cache import (
+    SQLParseCacheReport,
+    get_sql_parse_cache_report,
+)
 
 
 @dataclass
@@ -29,6 +33,7 @@ class BigQueryV2Report(SQLSourceReport):
     usage_extraction_sec: Dict[str, float] = field(default_factory=dict)
     usage_failed_extraction: LossyList[str] = field(default_factory=LossyList)
     metadata_extraction_sec: Dict[str, float] = field(default_factory=dict)
+    num_metadata_extraction_quota_retries: int = 0
     include_table_lineage: Optional[bool] = None
     use_date_sharded_audit_log_tables: Optional[bool] = None
     log_page_size: Optional[pydantic.PositiveInt] = None
@@ -60,3 +65,8 @@ class BigQueryV2Report(SQLSourceReport):
     operation_types_stat: Counter[str] = dataclasses.field(
         default_factory=collections.Counter
     )
+    sql_parser_cache: Optional[SQLParseCacheReport] = None
+
+    def compute_stats(self) -> None:
+        self.sql_parser_cache = get_sql_parse_cache_report()
+        return super().compute_stats()
@@ -1,12 +1,21 @@
+import itertools
 import logging
+import re
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from google.cloud import bigquery
-from google.cloud.bigquery.table import RowIterator, TableListItem, TimePartitioning
-
+from google.cloud.bigquery.table import (
+    Row,
+    RowIterator,
+    TableListItem,
+    TimePartitioning,
+)
+
+from datahub.configuration.common import AllowDenyPattern
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import BigqueryTableIdentifier
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -44,11 +53,58 @@ class BigqueryTable:
     columns: List[BigqueryColumn] = field(default_factory=list)
 
 
+@dataclass
+class BigqueryTableSummary:
+    """
+    The parts of a table that profiling needs. Tables are only kept as summaries once
+    their schema was emitted, to not hold the columns of every table until profiling.
+    """
+
+    __slots__ = (
+        "name",
+        "last_altered",
+        "size_in_bytes",
+        "rows_count",
+        "time_partitioning",
+        "max_partition_id",
+        "max_shard_id",
+        "partition_column",
+        "column_count",
+    )
+
+    name: str
+    last_altered: Optional[datetime]
+    size_in_bytes: int
+    rows_count: int
+    time_partitioning: Optional[TimePartitioning]
+    max_partition_id: Optional[str]
+    max_shard_id: Optional[str]
+    partition_column: Optional[str]
+    column_count: int
+
+    @classmethod
+    def from_table(cls, table: BigqueryTable) -> "BigqueryTableSummary":
+        return cls(
+            name=table.name,
+            last_altered=table.last_altered,
+            size_in_bytes=table.size_in_bytes,
+            rows_count=table.rows_count,
+            time_partitioning=table.time_partitioning,
+            max_partition_id=table.max_partition_id,
+            max_shard_id=table.max_shard_id,
+            partition_column=next(
+                (column.name for column in table.columns if column.is_partition_column),
+                None,
+            ),
+            column_count=len(table.columns),
+        )
+
+
 @dataclass
 class BigqueryView:
     name: str
     created: datetime
-    last_altered: datetime
+    last_altered: Optional[datetime]
     comment: str
     ddl: str
     columns: List[BigqueryColumn] = field(default_factory=list)
@@ -65,6 +121,18 @@ class BigqueryDataset:
     views: List[BigqueryView] = field(default_factory=list)
 
 
+@dataclass
+class BigqueryDatasetMetadata:
+    """
+    The metadata of a dataset, as returned by the region-level INFORMATION_SCHEMA views.
+    Columns is None if they couldn't be fetched for the whole region.
+    """
+
+    tables: Dict[str, Row] = field(default_factory=dict)
+    views: List[BigqueryView] = field(default_factory=list)
+    columns: Optional[Dict[str, List[BigqueryColumn]]] = None
+
+
 @dataclass
 class BigqueryProject:
     id: str
@@ -169,6 +237,123 @@ order by
   table_name ASC
 """
 
+    max_partition_ids_for_dataset: str = """
+select
+  table_name,
+  max(partition_id) as max_partition_id
+from
+  `{project_id}`.`{dataset_name}`.INFORMATION_SCHEMA.PARTITIONS
+where
+  partition_id not in ('__NULL__', '__UNPARTITIONED__', '__STREAMING_UNPARTITIONED__')
+  and table_name in ({table_filter})
+group by
+  table_name
+"""
+
+    # https://cloud.google.com/bigquery/docs/information-schema-intro#region_qualifier
+    # The region-level views cover all datasets of a project in a region. The
+    # PARTITIONS view is only available per dataset, so the sizes and number of
+    # partitions are taken from TABLE_STORAGE instead. The rows of the tables, views
+    # and columns are ordered by dataset, so that they can be read one dataset at a
+    # time, and dataset_filter restricts them to the datasets that dataset_pattern
+    # might allow, if any.
+    datasets_for_region: str = """
+select
+  schema_name
+from
+  `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.SCHEMATA s
+where
+  true{dataset_filter}
+"""
+
+    tables_for_region: str = """
+SELECT
+  t.table_catalog as table_catalog,
+  t.table_schema as table_schema,
+  t.table_name as table_name,
+  t.table_type as table_type,
+  t.creation_time as created,
+  UNIX_MILLIS(ts.storage_last_modified_time) as last_altered,
+  tos.OPTION_VALUE as comment,
+  is_insertable_into,
+  ddl,
+  ts.total_rows as row_count,
+  ts.total_logical_bytes as bytes,
+  ts.total_partitions as num_partitions,
+  CAST(NULL as STRING) as max_partition_id,
+  ts.active_logical_bytes as active_billable_bytes,
+  ts.long_term_logical_bytes as long_term_billable_bytes
+FROM
+  `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLES t
+  left join `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLE_STORAGE as ts on t.table_catalog = ts.table_catalog
+  and t.table_schema = ts.table_schema
+  and t.TABLE_NAME = ts.TABLE_NAME
+  and not ts.deleted
+  left join `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLE_OPTIONS as tos on t.table_catalog = tos.table_catalog
+  and t.table_schema = tos.table_schema
+  and t.TABLE_NAME = tos.TABLE_NAME
+  and tos.OPTION_NAME = "description"
+WHERE
+  table_type in ('BASE TABLE', 'EXTERNAL TABLE'){dataset_filter}
+order by
+  table_schema ASC,
+  table_name ASC
+"""
+
+    views_for_region: str = """
+SELECT
+  t.table_catalog as table_catalog,
+  t.table_schema as table_schema,
+  t.table_name as table_name,
+  t.table_type as table_type,
+  t.creation_time as created,
+  ts.storage_last_modified_time as last_altered,
+  tos.OPTION_VALUE as comment,
+  is_insertable_into,
+  ddl as view_definition
+FROM
+  `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLES t
+  left join `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLE_STORAGE as ts on t.table_catalog = ts.table_catalog
+  and t.table_schema = ts.table_schema
+  and t.TABLE_NAME = ts.TABLE_NAME
+  and not ts.deleted
+  left join `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.TABLE_OPTIONS as tos on t.table_catalog = tos.table_catalog
+  and t.table_schema = tos.table_schema
+  and t.TABLE_NAME = tos.TABLE_NAME
+  and tos.OPTION_NAME = "description"
+WHERE
+  table_type in ('VIEW MATERIALIZED', 'VIEW'){dataset_filter}
+order by
+  table_schema ASC,
+  table_name ASC
+"""
+
+    columns_for_region: str = """
+select
+  c.table_catalog as table_catalog,
+  c.table_schema as table_schema,
+  c.table_name as table_name,
+  c.column_name as column_name,
+  c.ordinal_position as ordinal_position,
+  cfp.field_path as field_path,
+  c.is_nullable as is_nullable,
+  c.data_type as data_type,
+  description as comment,
+  c.is_hidden as is_hidden,
+  c.is_partitioning_column as is_partitioning_column
+from
+  `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.COLUMNS c
+  join `{project_id}`.`region-{region}`.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS as cfp on cfp.table_catalog = c.table_catalog
+  and cfp.table_schema = c.table_schema
+  and cfp.table_name = c.table_name
+  and cfp.column_name = c.column_name
+WHERE
+  true{dataset_filter}
+ORDER BY
+  table_schema,
+  table_name,
+  ordinal_position"""
+
     columns_for_dataset: str = """
 select
   c.table_catalog as table_catalog,
@@ -279,40 +464,60 @@ class BigQueryDataDictionary:
         # Some property we want to capture only available from the TableListItem we get from an earlier query of
         # the list of tables.
         return [
-            BigqueryTable(
-                name=table.table_name,
-                created=table.created,
-                last_altered=datetime.fromtimestamp(
-                    table.last_altered / 1000, tz=timezone.utc
-                )
-                if table.last_altered
-                else None,
-                size_in_bytes=table.bytes,
-                rows_count=table.row_count,
-                comment=table.comment,
-                ddl=table.ddl,
-                expires=tables[table.table_name].expires if tables else None,
-                labels=tables[table.table_name].labels if tables else None,
-                time_partitioning=tables[table.table_name].time_partitioning
-                if tables
-                else None,
-                clustering_fields=tables[table.table_name].clustering_fields
-                if tables
-                else None,
-                max_partition_id=table.max_partition_id,
-                max_shard_id=BigqueryTableIdentifier.get_table_and_shard(
-                    table.table_name
-                )[1]
-                if len(BigqueryTableIdentifier.get_table_and_shard(table.table_name))
-                == 2
-                else None,
-                num_partitions=table.num_partitions,
-                active_billable_bytes=table.active_billable_bytes,
-                long_term_billable_bytes=table.long_term_billable_bytes,
+            BigQueryDataDictionary.table_from_row(
+                table, tables[table.table_name] if tables else None
             )
             for table in cur
         ]
 
+    @staticmethod
+    def table_from_row(
+        table: Row, table_item: Optional[TableListItem]
+    ) -> BigqueryTable:
+        return BigqueryTable(
+            name=table.table_name,
+            created=table.created,
+            last_altered=datetime.fromtimestamp(
+                table.last_altered / 1000, tz=timezone.utc
+            )
+            if table.last_altered
+            else None,
+            size_in_bytes=table.bytes,
+            rows_count=table.row_count,
+            comment=table.comment,
+            ddl=table.ddl,
+            expires=table_item.expires if table_item else None,
+            labels=table_item.labels if table_item else None,
+            time_partitioning=table_item.time_partitioning if table_item else None,
+            clustering_fields=table_item.clustering_fields if table_item else None,
+            max_partition_id=table.max_partition_id,
+            max_shard_id=BigqueryTableIdentifier.get_table_and_shard(table.table_name)[
+                1
+            ]
+            if len(BigqueryTableIdentifier.get_table_and_shard(table.table_name)) == 2
+            else None,
+            num_partitions=table.num_partitions,
+            active_billable_bytes=table.active_billable_bytes,
+            long_term_billable_bytes=table.long_term_billable_bytes,
+        )
+
+    @staticmethod
+    def get_max_partition_ids(
+        conn: bigquery.Client,
+        project_id: str,
+        dataset_name: str,
+        table_names: List[str],
+    ) -> Dict[str, str]:
+        cur = BigQueryDataDictionary.get_query_result(
+            conn,
+            BigqueryQuery.max_partition_ids_for_dataset.format(
+                project_id=project_id,
+                dataset_name=dataset_name,
+                table_filter=", ".join(f"'{table}'" for table in table_names),
+            ),
+        )
+        return {row.table_name: row.max_partition_id for row in cur}
+
     @staticmethod
     def get_views_for_dataset(
         conn: bigquery.Client, project_id: str, dataset_name: str
@@ -355,15 +560,7 @@ class BigQueryDataDictionary:
 
         for column in cur:
             columns[column.table_name].append(
-                BigqueryColumn(
-                    name=column.column_name,
-                    ordinal_position=column.ordinal_position,
-                    field_path=column.field_path,
-                    is_nullable=column.is_nullable == "YES",
-                    data_type=column.data_type,
-                    comment=column.comment,
-                    is_partition_column=column.is_partitioning_column == "YES",
-                )
+                BigQueryDataDictionary.column_from_row(column)
             )
 
         return columns
@@ -378,15 +575,236 @@ class BigQueryDataDictionary:
             BigqueryQuery.columns_for_table.format(table_identifier=table_identifier),
         )
 
-        return [
-            BigqueryColumn(
-                name=column.column_name,
-                ordinal_position=column.ordinal_position,
-                is_nullable=column.is_nullable == "YES",
-                field_path=column.field_path,
-                data_type=column.data_type,
-                comment=column.comment,
-                is_partition_column=column.is_partitioning_column == "YES",
+        return [BigQueryDataDictionary.column_from_row(column) for column in cur]
+
+    @staticmethod
+    def column_from_row(column: Row) -> BigqueryColumn:
+        return BigqueryColumn(
+            name=column.column_name,
+            ordinal_position=column.ordinal_position,
+            field_path=column.field_path,
+            is_nullable=column.is_nullable == "YES",
+            data_type=column.data_type,
+            comment=column.comment,
+            is_partition_column=column.is_partitioning_column == "YES",
+        )
+
+
+def _get_dataset_prefixes(dataset_pattern: AllowDenyPattern) -> Optional[List[str]]:
+    """
+    Returns the literal prefixes of the allow patterns of dataset_pattern, which all
+    allowed datasets start with, or None if an allow pattern has no literal prefix.
+    """
+    prefixes: List[str] = []
+    for allow_pattern in dataset_pattern.allow:
+        if "|" in allow_pattern:
+            return None
+        allow_pattern = allow_pattern[1:] if allow_pattern[:1] == "^" else allow_pattern
+        prefix = re.split(r"[^A-Za-z0-9_-]", allow_pattern, maxsplit=1)[0]
+        if allow_pattern[len(prefix) : len(prefix) + 1] in ("?", "*", "{"):
+            # The last character of the prefix is optional.
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+        prefixes.append(prefix)
+    return prefixes
+
+
+def _get_dataset_filter(column: str, dataset_pattern: AllowDenyPattern) -> str:
+    prefixes = _get_dataset_prefixes(dataset_pattern)
+    if not prefixes:
+        return ""
+    if dataset_pattern.ignoreCase:
+        column = f"lower({column})"
+        prefixes = [prefix.lower() for prefix in prefixes]
+    return "\n  and ({})".format(
+        " or ".join(f"starts_with({column}, '{prefix}')" for prefix in prefixes)
+    )
+
+
+class _RegionRows:
+    """
+    The rows of a region-level query, which are ordered by dataset. Rows are only
+    read, one page at a time, up to the dataset that is asked for, and the rows of
+    the allowed datasets that were read ahead are kept until they are asked for.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        get_rows: Callable[[], Iterable[Row]],
+        is_allowed: Callable[[str], bool],
+    ) -> None:
+        self.name = name
+        self._get_rows = get_rows
+        self._is_allowed = is_allowed
+        self._groups: Optional[Iterator[Tuple[str, Iterator[Row]]]] = None
+        self._buffer: Dict[str, List[Row]] = {}
+        self._last_dataset: Optional[str] = None
+        self._ordered = True
+        self._done = False
+        self.failed = False
+
+    def pop(self, dataset_name: str) -> Optional[List[Row]]:
+        """
+        Returns the rows of a dataset, or None if they couldn't be read. The rows of
+        a dataset are only returned once.
+        """
+        try:
+            if self._groups is None and not self._done:
+                self._groups = itertools.groupby(
+                    self._get_rows(), key=lambda row: row.table_schema
+                )
+            while self._groups is not None and (
+                not self._ordered
+                or self._last_dataset is None
+                or self._last_dataset < dataset_name
+            ):
+                group = next(self._groups, None)
+                if group is None:
+                    self._groups = None
+                    self._done = True
+                    break
+                key, rows = group
+                dataset_rows = list(rows)
+                if self._last_dataset is not None and key < self._last_dataset:
+                    # Not ordered as expected, so all remaining rows are read.
+                    logger.warning(
+                        f"{self.name} of dataset {key} are not in the expected order, reading all remaining rows."
+                    )
+                    self._ordered = False
+                else:
+                    self._last_dataset = key
+                if self._is_allowed(key):
+                    self._buffer.setdefault(key, []).extend(dataset_rows)
+        except Exception as e:
+            logger.warning(
+                f"Unable to read {self.name.lower()} of the region, falling back to per dataset queries. The error was: {e}"
             )
-            for column in cur
-        ]
+            self._groups = None
+            self._done = True
+            self.failed = True
+
+        if dataset_name in self._buffer:
+            return self._buffer.pop(dataset_name)
+        if self.failed and (
+            self._last_dataset is None or self._last_dataset < dataset_name
+        ):
+            return None
+        return []
+
+
+class BigqueryRegionMetadata:
+    """
+    The tables, views and columns of the datasets of a project in a region, from a
+    few queries against the region-level INFORMATION_SCHEMA views instead of a few
+    queries per dataset. The rows of these queries are ordered by dataset and are
+    read as the metadata of each dataset is asked for, so while the datasets are
+    fetched in about the same order, only the metadata of a few datasets is kept in
+    memory. Only the datasets allowed by dataset_pattern are kept, and their literal
+    prefixes are pushed down into the queries where possible.
+
+    The metadata of a dataset is asked for by the worker threads, and is kept until
+    it is released, so that it can be asked for again when fetching it is retried.
+    """
+
+    def __init__(
+        self,
+        conn: bigquery.Client,
+        project_id: str,
+        region: str,
+        dataset_pattern: AllowDenyPattern,
+    ) -> None:
+        def get_rows(query: str, column: str) -> Callable[[], Iterable[Row]]:
+            return lambda: BigQueryDataDictionary.get_query_result(
+                conn,
+                query.format(
+                    project_id=project_id,
+                    region=region,
+                    dataset_filter=_get_dataset_filter(column, dataset_pattern),
+                ),
+            )
+
+        self.datasets: Set[str] = {
+            row.schema_name
+            for row in BigQueryDataDictionary.get_query_result(
+                conn,
+                BigqueryQuery.datasets_for_region.format(
+                    project_id=project_id,
+                    region=region,
+                    dataset_filter=_get_dataset_filter(
+                        "s.schema_name", dataset_pattern
+                    ),
+                ),
+            )
+            if dataset_pattern.allowed(row.schema_name)
+        }
+        self._tables = _RegionRows(
+            "Tables",
+            get_rows(BigqueryQuery.tables_for_region, "t.table_schema"),
+            self.is_fetched,
+        )
+        self._views = _RegionRows(
+            "Views",
+            get_rows(BigqueryQuery.views_for_region, "t.table_schema"),
+            self.is_fetched,
+        )
+        self._columns = _RegionRows(
+            "Columns",
+            get_rows(BigqueryQuery.columns_for_region, "c.table_schema"),
+            self.is_fetched,
+        )
+        self._metadata: Dict[str, Optional[BigqueryDatasetMetadata]] = {}
+        self._lock = threading.Lock()
+
+    def is_fetched(self, dataset_name: str) -> bool:
+        return dataset_name in self.datasets
+
+    def get(self, dataset_name: str) -> Optional[BigqueryDatasetMetadata]:
+        """
+        Returns the metadata of a dataset, or None if the dataset is not in the
+        region or its tables or views couldn't be read for the whole region.
+        """
+        if not self.is_fetched(dataset_name):
+            return None
+        with self._lock:
+            if dataset_name not in self._metadata:
+                tables = self._tables.pop(dataset_name)
+                views = self._views.pop(dataset_name)
+                columns = self._columns.pop(dataset_name)
+                self._metadata[dataset_name] = (
+                    BigqueryDatasetMetadata(
+                        tables={table.table_name: table for table in tables},
+                        views=[
+                            BigqueryView(
+                                name=view.table_name,
+                                created=view.created,
+                                last_altered=view.last_altered,
+                                comment=view.comment,
+                                ddl=view.view_definition,
+                            )
+                            for view in views
+                        ],
+                        columns=_group_columns_by_table(columns)
+                        if columns is not None
+                        else None,
+                    )
+                    if tables is not None and views is not None
+                    else None
+                )
+            return self._metadata[dataset_name]
+
+    def release(self, dataset_name: str) -> None:
+        """Forgets the metadata of a dataset once it was fetched."""
+        with self._lock:
+            self._metadata.pop(dataset_name, None)
+            self.datasets.discard(dataset_name)
+
+
+def _group_columns_by_table(columns: List[Row]) -> Dict[str, List[BigqueryColumn]]:
+    columns_by_table: Dict[str, List[BigqueryColumn]] = {}
+    for column in columns:
+        columns_by_table.setdefault(column.table_name, []).append(
+            BigQueryDataDictionary.column_from_row(column)
+        )
+    return columns_by_table
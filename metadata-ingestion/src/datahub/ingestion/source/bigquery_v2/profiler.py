@@ -13,10 +13,7 @@ from datahub.ingestion.api.common import WorkUnit
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import BigqueryTableIdentifier
 from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Config
 from datahub.ingestion.source.bigquery_v2.bigquery_report import BigQueryV2Report
-from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
-    BigqueryColumn,
-    BigqueryTable,
-)
+from datahub.ingestion.source.bigquery_v2.bigquery_schema import BigqueryTableSummary
 from datahub.ingestion.source.ge_data_profiler import (
     DatahubGEProfiler,
     GEProfilerRequest,
@@ -29,7 +26,7 @@ logger = logging.getLogger(__name__)
 
 @dataclasses.dataclass
 class BigqueryProfilerRequest(GEProfilerRequest):
-    table: BigqueryTable
+    table: BigqueryTableSummary
     profile_table_level_only: bool = False
 
 
@@ -67,7 +64,7 @@ class BigqueryProfiler:
         self,
         project: str,
         schema: str,
-        table: BigqueryTable,
+        table: BigqueryTableSummary,
         partition_datetime: Optional[datetime.datetime],
     ) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -83,13 +80,8 @@ class BigqueryProfiler:
             partition_where_clause: str
 
             if not table.time_partitioning:
-                partition_column: Optional[BigqueryColumn] = None
-                for column in table.columns:
-                    if column.is_partition_column:
-                        partition_column = column
-                        break
-                if partition_column:
-                    partition_where_clause = f"{partition_column.name} >= {partition}"
+                if table.partition_column:
+                    partition_where_clause = f"{table.partition_column} >= {partition}"
                 else:
                     logger.warning(
                         f"Partitioned table {table.name} without partiton column"
@@ -154,7 +146,7 @@ WHERE
         return None, None
 
     def get_workunits(
-        self, tables: Dict[str, Dict[str, List[BigqueryTable]]]
+        self, tables: Dict[str, Dict[str, List[BigqueryTableSummary]]]
     ) -> Iterable[WorkUnit]:
 
         # Otherwise, if column level profiling is enabled, use  GE profiler.
@@ -206,7 +198,7 @@ WHERE
                 yield wu
 
     def get_bigquery_profile_request(
-        self, project: str, dataset: str, table: BigqueryTable
+        self, project: str, dataset: str, table: BigqueryTableSummary
     ) -> Optional[BigqueryProfilerRequest]:
         skip_profiling = False
         profile_table_level_only = self.config.profiling.profile_table_level_only
@@ -225,7 +217,7 @@ WHERE
             else:
                 skip_profiling = True
 
-        if not table.columns:
+        if not table.column_count:
             skip_profiling = True
 
         if skip_profiling:
@@ -354,7 +346,7 @@ WHERE
         for request in table_level_profile_requests:
             profile = DatasetProfile(
                 timestampMillis=int(datetime.datetime.now().timestamp() * 1000),
-                columnCount=len(request.table.columns),
+                columnCount=request.table.column_count,
                 rowCount=request.table.rows_count,
                 sizeInBytes=request.table.size_in_bytes,
             )
@@ -1,9 +1,7 @@
-import collections
 import logging
 import textwrap
 import time
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Any, Dict, Iterable, List, MutableMapping, Optional, Set, Union, cast
 
 import cachetools
@@ -32,7 +30,10 @@ from datahub.ingestion.source.bigquery_v2.common import (
     BQ_DATETIME_FORMAT,
     _make_gcp_logging_client,
 )
-from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
+from datahub.ingestion.source.usage.usage_common import (
+    GenericAggregatedDataset,
+    UsageAggregator,
+)
 from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
 from datahub.utilities.delayed_iter import delayed_iter
 from datahub.utilities.perf_timer import PerfTimer
@@ -171,9 +172,9 @@ class BigQueryUsageExtractor:
     def generate_usage_for_project(
         self, project_id: str, tables: Dict[str, List[str]]
     ) -> Iterable[MetadataWorkUnit]:
-        aggregated_info: Dict[
-            datetime, Dict[BigQueryTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+        aggregator: UsageAggregator[BigQueryTableRef] = UsageAggregator(
+            self.config.usage, user_email_pattern=self.config.usage.user_email_pattern
+        )
 
         parsed_bigquery_log_events: Iterable[
             Union[ReadEvent, QueryEvent, MetadataWorkUnit]
@@ -222,31 +223,23 @@ class BigQueryUsageExtractor:
                             yield operational_wu
                             self.report.num_operational_stats_workunits_emitted += 1
                     if event.read_event:
-                        aggregated_info = self._aggregate_enriched_read_events(
-                            aggregated_info, event, tables
-                        )
+                        self._aggregate_enriched_read_events(aggregator, event, tables)
                         num_aggregated += 1
                 logger.info(f"Total number of events aggregated = {num_aggregated}.")
-                bucket_level_stats: str = "\n\t" + "\n\t".join(
-                    [
-                        f'bucket:{db.strftime("%m-%d-%Y:%H:%M:%S")}, size={len(ads)}'
-                        for db, ads in aggregated_info.items()
-                    ]
-                )
-                logger.debug(
-                    f"Number of buckets created = {len(aggregated_info)}. Per-bucket details:{bucket_level_stats}"
-                )
+                logger.debug(f"Number of aggregates created = {len(aggregator)}.")
 
                 self.report.usage_extraction_sec[project_id] = round(
                     timer.elapsed_seconds(), 2
                 )
 
-                yield from self.get_workunits(aggregated_info)
+                yield from self.get_workunits(aggregator)
             except Exception as e:
                 self.report.usage_failed_extraction.append(project_id)
                 logger.error(
                     f"Error getting usage for project {project_id} due to error {e}"
                 )
+            finally:
+                aggregator.close()
 
     def _get_bigquery_log_entries_via_exported_bigquery_audit_metadata(
         self, client: BigQueryClient
@@ -747,12 +740,12 @@ class BigQueryUsageExtractor:
 
     def _aggregate_enriched_read_events(
         self,
-        datasets: Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]],
+        aggregator: UsageAggregator[BigQueryTableRef],
         event: AuditEvent,
         tables: Dict[str, List[str]],
-    ) -> Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]:
+    ) -> None:
         if not event.read_event:
-            return datasets
+            return
 
         floored_ts = get_time_bucket(
             event.read_event.timestamp, self.config.bucket_duration
@@ -765,7 +758,7 @@ class BigQueryUsageExtractor:
                 not in tables[resource.table_identifier.dataset]
             ):
                 logger.debug(f"Skipping non existing {resource} from usage")
-                return datasets
+                return
         except Exception as e:
             self.report.report_warning(
                 str(event.read_event.resource), f"Failed to clean up resource, {e}"
@@ -773,40 +766,30 @@ class BigQueryUsageExtractor:
             logger.warning(
                 f"Failed to process event {str(event.read_event.resource)}", e
             )
-            return datasets
+            return
 
         if resource.is_temporary_table([self.config.temp_table_dataset_prefix]):
             logger.debug(f"Dropping temporary table {resource}")
             self.report.report_dropped(str(resource))
-            return datasets
+            return
 
-        agg_bucket = datasets[floored_ts].setdefault(
+        aggregator.aggregate_event(
+            floored_ts,
             resource,
-            AggregatedDataset(
-                bucket_start_time=floored_ts,
-                resource=resource,
-                user_email_pattern=self.config.usage.user_email_pattern,
-            ),
-        )
-
-        agg_bucket.add_read_entry(
             event.read_event.actor_email,
             event.query_event.query if event.query_event else None,
             event.read_event.fieldsRead,
         )
 
-        return datasets
-
     def get_workunits(
-        self, aggregated_info: Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]
+        self, aggregator: UsageAggregator[BigQueryTableRef]
     ) -> Iterable[MetadataWorkUnit]:
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
-                wu = self._make_usage_stat(aggregate)
-                self.report.report_workunit(wu)
-                yield wu
-                self.report.num_usage_workunits_emitted += 1
+        for aggregate in aggregator.get_aggregated_datasets():
+            wu = self._make_usage_stat(aggregate)
+            self.report.report_workunit(wu)
+            yield wu
+            self.report.num_usage_workunits_emitted += 1
 
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
@@ -1,12 +1,16 @@
+import collections
 import datetime
+import itertools
 import json
 import logging
 import os.path
 import pathlib
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import auto
 from io import BufferedReader
-from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import ijson
 from pydantic import validator
@@ -40,9 +44,17 @@ logger = logging.getLogger(__name__)
 class FileReadMode(ConfigEnum):
     STREAM = auto()
     BATCH = auto()
+    JSONL = auto()
     AUTO = auto()
 
 
+_JSONL_FILE_EXTENSIONS = {".jsonl", ".ndjson"}
+
+_GenericRecord = Union[
+    MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass
+]
+
+
 class FileSourceConfig(ConfigModel):
     filename: Optional[str] = Field(
         None, description="[deprecated in favor or `path`] The file to ingest."
@@ -54,7 +66,20 @@ class FileSourceConfig(ConfigModel):
         ".json",
         description="When providing a folder to use to read files, set this field to control file extensions that you want the source to process. * is a special value that means process every file regardless of extension",
     )
-    read_mode: FileReadMode = FileReadMode.AUTO
+    read_mode: FileReadMode = Field(
+        FileReadMode.AUTO,
+        description="How to read the files. BATCH loads a whole JSON array into memory, STREAM reads a JSON array one record at a time and JSONL reads one JSON record per line. AUTO uses JSONL for .jsonl and .ndjson files, and otherwise STREAM for files larger than 100MB and BATCH for smaller files.",
+    )
+    deserialize_workers: int = Field(
+        1,
+        ge=1,
+        description="Number of processes that deserialize records in parallel. Values greater than 1 are useful for very large files, where deserialization is the bottleneck.",
+    )
+    deserialize_chunk_size: int = Field(
+        1000,
+        ge=1,
+        description="Number of records that are sent to a deserialization process at a time when `deserialize_workers` is greater than 1. At most two chunks per worker are held in memory.",
+    )
     aspect: Optional[str] = Field(
         default=None,
         description="Set to an aspect to only read this aspect for ingestion.",
@@ -78,6 +103,35 @@ class FileSourceConfig(ConfigModel):
         return v
 
 
+def _deserialize_record(i: int, obj: Any) -> _GenericRecord:
+    if isinstance(obj, (str, bytes)):
+        obj = json.loads(obj)
+    item: _GenericRecord
+    if "proposedSnapshot" in obj:
+        item = MetadataChangeEvent.from_obj(obj)
+    elif "aspect" in obj:
+        item = MetadataChangeProposal.from_obj(obj)
+    else:
+        item = UsageAggregationClass.from_obj(obj)
+    if not item.validate():
+        raise ValueError(f"failed to parse: {obj} (index {i})")
+    return item
+
+
+def _deserialize_chunk(
+    chunk: List[Tuple[int, Any]]
+) -> Tuple[List[Tuple[int, Optional[_GenericRecord], Optional[str]]], float]:
+    # Runs in a worker process, so errors are returned rather than reported.
+    start_time = time.perf_counter()
+    results: List[Tuple[int, Optional[_GenericRecord], Optional[str]]] = []
+    for i, obj in chunk:
+        try:
+            results.append((i, _deserialize_record(i, obj), None))
+        except Exception as e:
+            results.append((i, None, str(e)))
+    return results, time.perf_counter() - start_time
+
+
 @dataclass
 class FileSourceReport(SourceReport):
     total_num_files: int = 0
@@ -166,6 +220,7 @@ class GenericFileSource(TestableSource):
         self.config = config
         self.report = FileSourceReport()
         self.fp: Optional[BufferedReader] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     @classmethod
     def create(cls, config_dict, ctx):
@@ -219,17 +274,30 @@ class GenericFileSource(TestableSource):
     def close(self):
         if self.fp:
             self.fp.close()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def _iterate_file(self, path: str) -> Iterable[Tuple[int, Any]]:
+        """
+        Yields the records of the file with their index.
+
+        In JSONL mode, the lines are yielded as raw bytes, so that parsing them can be
+        left to the deserialization processes and a malformed line only fails its own
+        record.
+        """
         self.report.current_file_name = path
         self.report.current_file_size = os.path.getsize(path)
         if self.config.read_mode == FileReadMode.AUTO:
-            file_read_mode = (
-                FileReadMode.BATCH
-                if self.report.current_file_size
+            if pathlib.Path(path).suffix.lower() in _JSONL_FILE_EXTENSIONS:
+                file_read_mode = FileReadMode.JSONL
+            elif (
+                self.report.current_file_size
                 < self.config._minsize_for_streaming_mode_in_bytes
-                else FileReadMode.STREAM
-            )
+            ):
+                file_read_mode = FileReadMode.BATCH
+            else:
+                file_read_mode = FileReadMode.STREAM
             logger.info(f"Reading file {path} in {file_read_mode} mode")
         else:
             file_read_mode = self.config.read_mode
@@ -249,18 +317,21 @@ class GenericFileSource(TestableSource):
             for i, obj in enumerate(obj_list):
                 yield i, obj
                 self.report.current_file_elements_read += 1
+        elif file_read_mode == FileReadMode.JSONL:
+            # Progress is tracked by bytes read, so the lines are never counted upfront.
+            self.fp = open(path, "rb")
+            self.report.current_file_elements_read = 0
+            for i, line in enumerate(self.fp):
+                self.report.current_file_bytes_read = self.fp.tell()
+                if not line.strip():
+                    continue
+                self.report.current_file_elements_read += 1
+                yield i, line
         else:
+            # Progress is tracked by bytes read, so the file is read in a single pass
+            # rather than counting the elements upfront.
             self.fp = open(path, "rb")
-            count_start_time = datetime.datetime.now()
-            parse_stream = ijson.parse(self.fp, use_float=True)
-            total_elements = 0
-            for row in ijson.items(parse_stream, "item", use_float=True):
-                total_elements += 1
-            count_end_time = datetime.datetime.now()
-            self.report.add_count_time(count_end_time - count_start_time)
-            self.report.current_file_num_elements = total_elements
             self.report.current_file_elements_read = 0
-            self.fp.seek(0)
             parse_start_time = datetime.datetime.now()
             parse_stream = ijson.parse(self.fp, use_float=True)
             rows_yielded = 0
@@ -269,6 +340,7 @@ class GenericFileSource(TestableSource):
                 self.report.add_parse_time(parse_end_time - parse_start_time)
                 rows_yielded += 1
                 self.report.current_file_elements_read += 1
+                self.report.current_file_bytes_read = self.fp.tell()
                 yield rows_yielded, row
                 parse_start_time = datetime.datetime.now()
 
@@ -279,38 +351,57 @@ class GenericFileSource(TestableSource):
 
     def iterate_mce_file(self, path: str) -> Iterator[MetadataChangeEvent]:
         for i, obj in self._iterate_file(path):
+            if isinstance(obj, bytes):
+                obj = json.loads(obj)
             mce: MetadataChangeEvent = MetadataChangeEvent.from_obj(obj)
             yield mce
 
     def iterate_generic_file(
         self,
         path: str,
-    ) -> Iterator[
-        Tuple[
-            int,
-            Union[MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass],
-        ]
-    ]:
+    ) -> Iterator[Tuple[int, _GenericRecord]]:
+        if self.config.deserialize_workers > 1:
+            yield from self._iterate_generic_file_in_parallel(path)
+            return
+
         for i, obj in self._iterate_file(path):
-            item: Union[
-                MetadataChangeEvent, MetadataChangeProposal, UsageAggregationClass
-            ]
             try:
                 deserialize_start_time = datetime.datetime.now()
-                if "proposedSnapshot" in obj:
-                    item = MetadataChangeEvent.from_obj(obj)
-                elif "aspect" in obj:
-                    item = MetadataChangeProposal.from_obj(obj)
-                else:
-                    item = UsageAggregationClass.from_obj(obj)
-                if not item.validate():
-                    raise ValueError(f"failed to parse: {obj} (index {i})")
+                item = _deserialize_record(i, obj)
                 deserialize_duration = datetime.datetime.now() - deserialize_start_time
                 self.report.add_deserialize_time(deserialize_duration)
                 yield i, item
             except Exception as e:
                 self.report.report_failure(f"path-{i}", str(e))
 
+    def _iterate_generic_file_in_parallel(
+        self, path: str
+    ) -> Iterator[Tuple[int, _GenericRecord]]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.deserialize_workers
+            )
+        # Bounds the number of records in memory, while keeping every worker busy.
+        max_pending_chunks = 2 * self.config.deserialize_workers
+        pending: Deque[Future] = collections.deque()
+
+        records = iter(self._iterate_file(path))
+        while True:
+            chunk = list(itertools.islice(records, self.config.deserialize_chunk_size))
+            if chunk:
+                pending.append(self._executor.submit(_deserialize_chunk, chunk))
+            if pending and (len(pending) >= max_pending_chunks or not chunk):
+                # Chunks are collected in order, so records keep the order of the file.
+                results, duration = pending.popleft().result()
+                self.report.add_deserialize_time(datetime.timedelta(seconds=duration))
+                for i, item, error in results:
+                    if item is not None:
+                        yield i, item
+                    else:
+                        self.report.report_failure(f"path-{i}", str(error))
+            elif not chunk:
+                return
+
     @staticmethod
     def test_connection(config_dict: dict) -> TestConnectionReport:
         config = FileSourceConfig.parse_obj(config_dict)
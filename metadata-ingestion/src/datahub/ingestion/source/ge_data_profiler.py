@@ -1,10 +1,10 @@
-import collections
 import concurrent.futures
 import contextlib
 import dataclasses
 import functools
 import logging
 import threading
+import time
 import traceback
 import unittest.mock
 import uuid
@@ -35,12 +35,17 @@ from datahub.ingestion.source.profiling.common import (
     Cardinality,
     _convert_to_cardinality,
 )
+from datahub.ingestion.source.profiling.single_scan import (
+    ColumnMetric,
+    SingleScanProfiler,
+)
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
 from datahub.metadata.schema_classes import (
     DatasetFieldProfileClass,
     DatasetProfileClass,
     HistogramClass,
     PartitionSpecClass,
+    PartitionTypeClass,
     QuantileClass,
     ValueFrequencyClass,
 )
@@ -55,6 +60,8 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 
+_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
 # The reason for this wacky structure is quite fun. GE basically assumes that
 # the config structures were generated directly from YML and further assumes that
 # they can be `deepcopy`'d without issue. The SQLAlchemy engine and connection
@@ -226,6 +233,21 @@ def _run_with_query_combiner(
     return inner
 
 
+_NUMERIC_TYPES = [
+    ProfilerDataType.INT,
+    ProfilerDataType.FLOAT,
+    ProfilerDataType.NUMERIC,
+]
+
+
+def _convert_single_scan_value(metric: ColumnMetric, value: Any) -> Any:
+    # Mirrors the conversions of the corresponding GE dataset methods, except that
+    # an undefined stdev, e.g. of a single value, is left out rather than 0.0.
+    if metric == ColumnMetric.STDEV:
+        return float(value) if value is not None else None
+    return convert_to_json_serializable(value)
+
+
 @dataclasses.dataclass
 class _SingleColumnSpec:
     column: str
@@ -248,6 +270,14 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
     query_combiner: SQLAlchemyQueryCombiner
 
+    # The column metrics that were computed up front by the single-scan profiler.
+    column_metrics: Dict[str, Dict[ColumnMetric, Any]] = dataclasses.field(
+        default_factory=dict
+    )
+    # The number of rows of the sample that the single-scan profiler scanned, if it
+    # scanned a sample rather than the whole table.
+    sampled_row_count: Optional[int] = None
+
     def _get_columns_to_profile(self) -> List[str]:
         if self.config.profile_table_level_only:
             return []
@@ -320,6 +350,14 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
 
         column_spec.cardinality = _convert_to_cardinality(unique_count, pct_unique)
 
+    def _get_column_metric(
+        self, column: str, metric: ColumnMetric, compute: Callable[[str], Any]
+    ) -> Any:
+        metrics = self.column_metrics.get(column, {})
+        if metric in metrics:
+            return metrics[metric]
+        return compute(column)
+
     @_run_with_query_combiner
     def _get_dataset_rows(self, dataset_profile: DatasetProfileClass) -> None:
         dataset_profile.rowCount = self.dataset.get_row_count()
@@ -329,21 +367,33 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         self, column_profile: DatasetFieldProfileClass, column: str
     ) -> None:
         if self.config.include_field_min_value:
-            column_profile.min = str(self.dataset.get_column_min(column))
+            column_profile.min = str(
+                self._get_column_metric(
+                    column, ColumnMetric.MIN, self.dataset.get_column_min
+                )
+            )
 
     @_run_with_query_combiner
     def _get_dataset_column_max(
         self, column_profile: DatasetFieldProfileClass, column: str
     ) -> None:
         if self.config.include_field_max_value:
-            column_profile.max = str(self.dataset.get_column_max(column))
+            column_profile.max = str(
+                self._get_column_metric(
+                    column, ColumnMetric.MAX, self.dataset.get_column_max
+                )
+            )
 
     @_run_with_query_combiner
     def _get_dataset_column_mean(
         self, column_profile: DatasetFieldProfileClass, column: str
     ) -> None:
         if self.config.include_field_mean_value:
-            column_profile.mean = str(self.dataset.get_column_mean(column))
+            column_profile.mean = str(
+                self._get_column_metric(
+                    column, ColumnMetric.MEAN, self.dataset.get_column_mean
+                )
+            )
 
     @_run_with_query_combiner
     def _get_dataset_column_median(
@@ -352,7 +402,11 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if not self.config.include_field_median_value:
             return
         try:
-            column_profile.median = str(self.dataset.get_column_median(column))
+            column_profile.median = str(
+                self._get_column_metric(
+                    column, ColumnMetric.MEDIAN, self.dataset.get_column_median
+                )
+            )
         except Exception as e:
             logger.debug(
                 f"Caught exception while attempting to get column median for column {column}. {e}"
@@ -369,7 +423,11 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if not self.config.include_field_stddev_value:
             return
         try:
-            column_profile.stdev = str(self.dataset.get_column_stdev(column))
+            stdev = self._get_column_metric(
+                column, ColumnMetric.STDEV, self.dataset.get_column_stdev
+            )
+            if stdev is not None:
+                column_profile.stdev = str(stdev)
         except Exception as e:
             logger.debug(
                 f"Caught exception while attempting to get column stddev for column {column}. {e}"
@@ -385,6 +443,15 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
     ) -> None:
         if not self.config.include_field_quantiles:
             return
+        quantile_values = self.column_metrics.get(column, {}).get(
+            ColumnMetric.QUANTILES
+        )
+        if quantile_values is not None:
+            column_profile.quantiles = [
+                QuantileClass(quantile=str(quantile), value=str(value))
+                for quantile, value in zip(_QUANTILES, quantile_values)
+            ]
+            return
         try:
             # FIXME: Eventually we'd like to switch to using the quantile method directly.
             # However, that method seems to be throwing an error in some cases whereas
@@ -392,14 +459,13 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
             # values = dataset.get_column_quantiles(column, tuple(quantiles))
 
             self.dataset.set_config_value("interactive_evaluation", True)
-            quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
 
             res = self.dataset.expect_column_quantile_values_to_be_between(
                 column,
                 allow_relative_error=True,
                 quantile_ranges={
-                    "quantiles": quantiles,
-                    "value_ranges": [[None, None]] * len(quantiles),
+                    "quantiles": _QUANTILES,
+                    "value_ranges": [[None, None]] * len(_QUANTILES),
                 },
             ).result
             if "observed_value" in res:
@@ -478,6 +544,128 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
                 str(v) for v in res["partial_unexpected_list"]
             ]
 
+    def _run_single_scan(
+        self,
+        profile: DatasetProfileClass,
+        columns_profiling_queue: List[_SingleColumnSpec],
+    ) -> bool:
+        """
+        Computes the row count and the cardinality of all columns in a single scan,
+        along with the min, max, mean and stdev of the columns that have them. The
+        medians and quantiles depend on the cardinality, so they take one more scan.
+        Returns False if the first scan failed.
+        """
+        profiler = SingleScanProfiler(
+            self.dataset.engine,
+            self.dataset._table,
+            sample_percentage=self.config.sample_percentage,
+        )
+        if (
+            self.config.sample_percentage is not None
+            and not profiler.is_sampling_supported()
+        ):
+            self.report.report_warning(
+                "Profiling - Unable to sample table", self.dataset_name
+            )
+
+        def metrics_if_supported(
+            *metrics: Tuple[ColumnMetric, bool]
+        ) -> List[ColumnMetric]:
+            return [
+                metric
+                for metric, enabled in metrics
+                if enabled and profiler.supports(metric)
+            ]
+
+        scan_metrics: Dict[str, List[ColumnMetric]] = {}
+        for column_spec in columns_profiling_queue:
+            metrics = [ColumnMetric.NONNULL_COUNT, ColumnMetric.UNIQUE_COUNT]
+            if column_spec.type_ in _NUMERIC_TYPES:
+                metrics += metrics_if_supported(
+                    (ColumnMetric.MIN, self.config.include_field_min_value),
+                    (ColumnMetric.MAX, self.config.include_field_max_value),
+                    (ColumnMetric.MEAN, self.config.include_field_mean_value),
+                    (
+                        ColumnMetric.STDEV,
+                        self.config.include_field_stddev_value
+                        and column_spec.type_ == ProfilerDataType.INT,
+                    ),
+                )
+            elif column_spec.type_ == ProfilerDataType.DATETIME:
+                metrics += metrics_if_supported(
+                    (ColumnMetric.MIN, self.config.include_field_min_value),
+                    (ColumnMetric.MAX, self.config.include_field_max_value),
+                )
+            scan_metrics[column_spec.column] = metrics
+
+        try:
+            result = profiler.compute(scan_metrics)
+        except Exception as e:
+            logger.debug(
+                f"Caught exception while attempting to profile {self.dataset_name} in a single scan. {e}"
+            )
+            self.report.report_warning(
+                "Profiling - Unable to profile in a single scan", self.dataset_name
+            )
+            return False
+
+        if profiler.is_sampled():
+            # The profile still has the row count of the whole table, and says that
+            # its column metrics were computed over a sample.
+            self.sampled_row_count = result.row_count
+            self._get_dataset_rows(profile)
+            if profile.partitionSpec is None:
+                profile.partitionSpec = PartitionSpecClass(
+                    type=PartitionTypeClass.QUERY,
+                    partition=f"TABLESAMPLE SYSTEM ({self.config.sample_percentage})",
+                )
+        else:
+            profile.rowCount = result.row_count
+        for column_spec in columns_profiling_queue:
+            column_metrics = result.column_metrics[column_spec.column]
+            nonnull_count = int(column_metrics.pop(ColumnMetric.NONNULL_COUNT) or 0)
+            unique_count = int(column_metrics.pop(ColumnMetric.UNIQUE_COUNT) or 0)
+            column_spec.nonnull_count = nonnull_count
+            column_spec.unique_count = unique_count
+            column_spec.cardinality = _convert_to_cardinality(
+                unique_count,
+                float(unique_count) / nonnull_count if nonnull_count > 0 else None,
+            )
+            self.column_metrics[column_spec.column] = {
+                metric: _convert_single_scan_value(metric, value)
+                for metric, value in column_metrics.items()
+            }
+
+        # Only numeric columns of known, non-unique cardinality have these.
+        ordered_metrics: Dict[str, List[ColumnMetric]] = {}
+        for column_spec in columns_profiling_queue:
+            if column_spec.type_ in _NUMERIC_TYPES and column_spec.cardinality not in [
+                None,
+                Cardinality.NONE,
+                Cardinality.UNIQUE,
+            ]:
+                metrics = metrics_if_supported(
+                    (ColumnMetric.MEDIAN, self.config.include_field_median_value),
+                    (ColumnMetric.QUANTILES, self.config.include_field_quantiles),
+                )
+                if metrics:
+                    ordered_metrics[column_spec.column] = metrics
+        if ordered_metrics:
+            try:
+                result = profiler.compute(ordered_metrics, quantiles=_QUANTILES)
+                for column, column_metrics in result.column_metrics.items():
+                    self.column_metrics[column].update(
+                        (metric, _convert_single_scan_value(metric, value))
+                        for metric, value in column_metrics.items()
+                    )
+            except Exception as e:
+                # The medians and quantiles are computed separately instead.
+                logger.debug(
+                    f"Caught exception while attempting to get medians and quantiles of {self.dataset_name} in a single scan. {e}"
+                )
+
+        return True
+
     def generate_dataset_profile(  # noqa: C901 (complexity)
         self,
     ) -> DatasetProfileClass:
@@ -489,7 +677,9 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if self.partition:
             profile.partitionSpec = PartitionSpecClass(partition=self.partition)
         profile.fieldProfiles = []
-        self._get_dataset_rows(profile)
+        single_scan = self.config.single_scan_enabled
+        if not single_scan:
+            self._get_dataset_rows(profile)
 
         all_columns = self.dataset.get_table_columns()
         profile.columnCount = len(all_columns)
@@ -508,13 +698,28 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
                 columns_profiling_queue.append(column_spec)
 
                 self._get_column_type(column_spec, column)
-                self._get_column_cardinality(column_spec, column)
+                if not single_scan:
+                    self._get_column_cardinality(column_spec, column)
 
         logger.debug(f"profiling {self.dataset_name}: flushing stage 2 queries")
         self.query_combiner.flush()
 
+        if single_scan:
+            if not self._run_single_scan(profile, columns_profiling_queue):
+                # Fall back to separate queries for each column.
+                self._get_dataset_rows(profile)
+                for column_spec in columns_profiling_queue:
+                    self._get_column_cardinality(column_spec, column_spec.column)
+            self.query_combiner.flush()
+
         assert profile.rowCount is not None
-        row_count: int = profile.rowCount
+        # The null counts are relative to the rows that the non-null counts were
+        # computed over.
+        row_count: int = (
+            self.sampled_row_count
+            if self.sampled_row_count is not None
+            else profile.rowCount
+        )
 
         for column_spec in columns_profiling_queue:
             column = column_spec.column
@@ -632,6 +837,146 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         return profile
 
 
+@dataclasses.dataclass
+class _ProfileTask:
+    request: GEProfilerRequest
+    # These are set by the worker thread that profiles the table. conn is the
+    # connection that ran the latest query of the task, which is not necessarily
+    # the one the task started with.
+    started_at: Optional[float] = None
+    conn: Optional[Connection] = None
+    timed_out: bool = False
+
+
+class _ProfileTimedOutError(Exception):
+    pass
+
+
+# How often to check for profiles that exceed the per-table timeout.
+_TIMEOUT_CHECK_INTERVAL_SECONDS = 1.0
+# How long to wait for the profiles that timed out to stop when the session closes.
+_TIMED_OUT_PROFILE_JOIN_SECONDS = 30.0
+
+# The task that the current worker thread is profiling.
+_current_task = threading.local()
+
+
+def _track_task_query(conn: Connection, *args: Any) -> None:
+    # Called before every query of the profiler's engine, on the thread that runs it.
+    task: Optional[_ProfileTask] = getattr(_current_task, "task", None)
+    if task is None:
+        return
+    if task.timed_out:
+        # The profile was given up on, so it must not run any more queries.
+        raise _ProfileTimedOutError(f"Profiling {task.request.pretty_name} timed out")
+    task.conn = conn
+
+
+class ProfilingSession:
+    """
+    Profiles tables in a thread pool as their requests are submitted, so that
+    profiling can overlap with the rest of the ingestion. Profiles are returned as
+    soon as they are done, rather than in the order of the requests, and profiles
+    that exceed profile_table_timeout_seconds are skipped.
+
+    Use DatahubGEProfiler.profiling_session() to create one.
+    """
+
+    def __init__(
+        self,
+        profiler: "DatahubGEProfiler",
+        executor: concurrent.futures.ThreadPoolExecutor,
+        query_combiner: SQLAlchemyQueryCombiner,
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ):
+        self.profiler = profiler
+        self.num_requests = 0
+        self._executor = executor
+        self._query_combiner = query_combiner
+        self._platform = platform
+        self._profiler_args = profiler_args
+        self._timeout = profiler.config.profile_table_timeout_seconds
+        self._tasks: Dict[concurrent.futures.Future, _ProfileTask] = {}
+        self._timed_out_tasks: Dict[concurrent.futures.Future, _ProfileTask] = {}
+
+    def submit(self, request: GEProfilerRequest) -> None:
+        task = _ProfileTask(request)
+        future = self._executor.submit(
+            self.profiler._generate_profile_for_task,
+            self._query_combiner,
+            task,
+            platform=self._platform,
+            profiler_args=self._profiler_args,
+        )
+        self._tasks[future] = task
+        self.num_requests += 1
+
+    def get_completed_profiles(
+        self, wait: bool = False
+    ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        """
+        Yields the profiles that are done. If wait is set, yields them as they complete
+        until all submitted requests are done.
+        """
+        while self._tasks:
+            done, _ = concurrent.futures.wait(
+                self._tasks,
+                timeout=(_TIMEOUT_CHECK_INTERVAL_SECONDS if self._timeout else None)
+                if wait
+                else 0,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                task = self._tasks.pop(future)
+                yield task.request, future.result()
+            self._check_timeouts()
+            if not wait and not done:
+                break
+
+    def _check_timeouts(self) -> None:
+        if self._timeout is None:
+            return
+        now = time.perf_counter()
+        for future, task in list(self._tasks.items()):
+            if (
+                not future.done()
+                and task.started_at is not None
+                and now - task.started_at > self._timeout
+            ):
+                del self._tasks[future]
+                task.timed_out = True
+                self._timed_out_tasks[future] = task
+                self.profiler.report.report_warning(
+                    task.request.pretty_name,
+                    f"Profiling timed out after {self._timeout} seconds",
+                )
+                self.profiler._cancel_query(task)
+
+    def close(self) -> None:
+        for future in self._tasks:
+            future.cancel()
+        concurrent.futures.wait(self._tasks)
+        self._tasks = {}
+        # The profiles that timed out cannot run any more queries, so they should stop
+        # soon. They still use the query combiner and the patches of the session, so
+        # wait for them before those are undone, but not forever, in case their
+        # current query cannot be cancelled.
+        _, still_running = concurrent.futures.wait(
+            self._timed_out_tasks, timeout=_TIMED_OUT_PROFILE_JOIN_SECONDS
+        )
+        if still_running:
+            logger.warning(
+                f"Not waiting for {len(still_running)} profile(s) that timed out and are still running: "
+                + ", ".join(
+                    self._timed_out_tasks[future].request.pretty_name
+                    for future in still_running
+                )
+            )
+        self._timed_out_tasks = {}
+        self._executor.shutdown(wait=not still_running)
+
+
 @dataclasses.dataclass
 class GEContext:
     data_context: BaseDataContext
@@ -672,8 +1017,10 @@ class DatahubGEProfiler:
         self.platform = platform
 
     @contextlib.contextmanager
-    def _ge_context(self) -> Iterator[GEContext]:
+    def _ge_context(self, task: Optional["_ProfileTask"] = None) -> Iterator[GEContext]:
         with self.base_engine.connect() as conn:
+            if task is not None:
+                task.conn = conn
             data_context = BaseDataContext(
                 project_config=DataContextConfig(
                     # The datasource will be added via add_datasource().
@@ -715,78 +1062,95 @@ class DatahubGEProfiler:
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
     ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
-        with PerfTimer() as timer, concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers
-        ) as async_executor, SQLAlchemyQueryCombiner(
+        max_workers = max(1, min(max_workers, len(requests)))
+        logger.info(
+            f"Will profile {len(requests)} table(s) with {max_workers} worker(s) - this may take a while"
+        )
+        with self.profiling_session(
+            max_workers, platform=platform, profiler_args=profiler_args
+        ) as session:
+            for request in requests:
+                session.submit(request)
+            yield from session.get_completed_profiles(wait=True)
+
+    @contextlib.contextmanager
+    def profiling_session(
+        self,
+        max_workers: int,
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ) -> Iterator["ProfilingSession"]:
+        with PerfTimer() as timer, SQLAlchemyQueryCombiner(
             enabled=self.config.query_combiner_enabled,
             catch_exceptions=self.config.catch_exceptions,
             is_single_row_query_method=_is_single_row_query_method,
             serial_execution_fallback_enabled=True,
-        ).activate() as query_combiner:
-            max_workers = min(max_workers, len(requests))
-            logger.info(
-                f"Will profile {len(requests)} table(s) with {max_workers} worker(s) - this may take a while"
+        ).activate() as query_combiner, self._track_task_queries(), unittest.mock.patch(
+            "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset.get_column_unique_count",
+            get_column_unique_count_patch,
+        ), unittest.mock.patch(
+            "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
+            _get_column_quantiles_bigquery_patch,
+        ):
+            session = ProfilingSession(
+                self,
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers),
+                query_combiner,
+                platform=platform,
+                profiler_args=profiler_args,
             )
-            with unittest.mock.patch(
-                "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset.get_column_unique_count",
-                get_column_unique_count_patch,
-            ):
-                with unittest.mock.patch(
-                    "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
-                    _get_column_quantiles_bigquery_patch,
-                ):
-                    async_profiles = collections.deque(
-                        async_executor.submit(
-                            self._generate_profile_from_request,
-                            query_combiner,
-                            request,
-                            platform=platform,
-                            profiler_args=profiler_args,
-                        )
-                        for request in requests
-                    )
+            try:
+                yield session
+            finally:
+                # The workers must be done before the patches above are undone.
+                session.close()
 
-                    # Avoid using as_completed so that the results are yielded in the
-                    # same order as the requests.
-                    # for async_profile in concurrent.futures.as_completed(async_profiles):
-                    while len(async_profiles) > 0:
-                        async_profile = async_profiles.popleft()
-                        yield async_profile.result()
+            self.report.report_from_query_combiner(query_combiner.report)
+            if session.num_requests == 0:
+                return
 
-                    total_time_taken = timer.elapsed_seconds()
+            total_time_taken = timer.elapsed_seconds()
 
-                    logger.info(
-                        f"Profiling {len(requests)} table(s) finished in {total_time_taken:.3f} seconds"
-                    )
+            logger.info(
+                f"Profiling {session.num_requests} table(s) finished in {total_time_taken:.3f} seconds"
+            )
 
-                    time_percentiles: Dict[str, float] = {}
+            time_percentiles: Dict[str, float] = {}
 
-                    if len(self.times_taken) > 0:
-                        percentiles = [50, 75, 95, 99]
-                        percentile_values = stats.calculate_percentiles(
-                            self.times_taken, percentiles
-                        )
+            if len(self.times_taken) > 0:
+                percentiles = [50, 75, 95, 99]
+                percentile_values = stats.calculate_percentiles(
+                    self.times_taken, percentiles
+                )
 
-                        time_percentiles = {
-                            f"table_time_taken_p{percentile}": stats.discretize(
-                                percentile_values[percentile]
-                            )
-                            for percentile in percentiles
-                        }
-
-                    telemetry.telemetry_instance.ping(
-                        "sql_profiling_summary",
-                        # bucket by taking floor of log of time taken
-                        {
-                            "total_time_taken": stats.discretize(total_time_taken),
-                            "count": stats.discretize(len(self.times_taken)),
-                            "total_row_count": stats.discretize(self.total_row_count),
-                            "platform": self.platform,
-                            **time_percentiles,
-                        },
+                time_percentiles = {
+                    f"table_time_taken_p{percentile}": stats.discretize(
+                        percentile_values[percentile]
                     )
+                    for percentile in percentiles
+                }
+
+            telemetry.telemetry_instance.ping(
+                "sql_profiling_summary",
+                # bucket by taking floor of log of time taken
+                {
+                    "total_time_taken": stats.discretize(total_time_taken),
+                    "count": stats.discretize(len(self.times_taken)),
+                    "total_row_count": stats.discretize(self.total_row_count),
+                    "platform": self.platform,
+                    **time_percentiles,
+                },
+            )
 
-                    self.report.report_from_query_combiner(query_combiner.report)
+    @contextlib.contextmanager
+    def _track_task_queries(self) -> Iterator[None]:
+        sa.event.listen(self.base_engine, "before_cursor_execute", _track_task_query)
+        try:
+            yield
+        finally:
+            sa.event.remove(
+                self.base_engine, "before_cursor_execute", _track_task_query
+            )
 
     def _is_legacy_ge_temp_table_creation(self) -> bool:
         legacy_ge_bq_temp_table_creation: bool = False
@@ -798,20 +1162,46 @@ class DatahubGEProfiler:
 
         return legacy_ge_bq_temp_table_creation
 
-    def _generate_profile_from_request(
+    def _generate_profile_for_task(
         self,
         query_combiner: SQLAlchemyQueryCombiner,
-        request: GEProfilerRequest,
+        task: "_ProfileTask",
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
-    ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
-        return request, self._generate_single_profile(
-            query_combiner=query_combiner,
-            pretty_name=request.pretty_name,
-            platform=platform,
-            profiler_args=profiler_args,
-            **request.batch_kwargs,
-        )
+    ) -> Optional[DatasetProfileClass]:
+        task.started_at = time.perf_counter()
+        _current_task.task = task
+        try:
+            return self._generate_single_profile(
+                query_combiner=query_combiner,
+                pretty_name=task.request.pretty_name,
+                platform=platform,
+                profiler_args=profiler_args,
+                task=task,
+                **task.request.batch_kwargs,
+            )
+        finally:
+            _current_task.task = None
+
+    def _cancel_query(self, task: "_ProfileTask") -> None:
+        # Cancels the query on the connection that ran it, which is tracked by
+        # _track_task_query. Best effort, since not every DB-API driver can cancel a
+        # running query.
+        if task.conn is None:
+            return
+        try:
+            dbapi_connection = task.conn.connection.connection
+            cancel = getattr(dbapi_connection, "cancel", None)
+            if cancel is None:
+                logger.debug(
+                    f"Unable to cancel profiling of {task.request.pretty_name}: not supported by the driver"
+                )
+                return
+            cancel()
+        except Exception as e:
+            logger.debug(
+                f"Unable to cancel profiling of {task.request.pretty_name}: {e}"
+            )
 
     def _drop_bigquery_temp_table(self, bigquery_temp_table: str) -> None:
         try:
@@ -843,6 +1233,7 @@ class DatahubGEProfiler:
         custom_sql: Optional[str] = None,
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
+        task: Optional["_ProfileTask"] = None,
         **kwargs: Any,
     ) -> Optional[DatasetProfileClass]:
         logger.debug(
@@ -899,7 +1290,7 @@ class DatahubGEProfiler:
         if custom_sql is not None:
             ge_config["query"] = custom_sql
 
-        with self._ge_context() as ge_context, PerfTimer() as timer:
+        with self._ge_context(task) as ge_context, PerfTimer() as timer:
             try:
                 logger.info(f"Profiling {pretty_name}")
 
@@ -929,12 +1320,18 @@ class DatahubGEProfiler:
 
                 return profile
             except Exception as e:
+                if task is not None and task.timed_out:
+                    # The timeout was already reported.
+                    logger.debug(f"Profiling {pretty_name} stopped after timeout: {e}")
+                    return None
                 if not self.config.catch_exceptions:
                     raise e
                 logger.exception(f"Encountered exception while profiling {pretty_name}")
                 self.report.report_failure(pretty_name, f"Profiling exception {e}")
                 return None
             finally:
+                # The temporary tables are dropped even if the profile timed out.
+                _current_task.task = None
                 if self.base_engine.engine.name == "trino":
                     self._drop_trino_temp_table(batch)
                 elif bigquery_temp_table:
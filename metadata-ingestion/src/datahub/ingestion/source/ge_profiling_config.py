@@ -106,6 +106,11 @@ class GEProfilingConfig(ConfigModel):
         default=5 * (os.cpu_count() or 4),
         description="Number of worker threads to use for profiling. Set to 1 to disable.",
     )
+    profile_table_timeout_seconds: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum time in seconds to spend on profiling a single table. Profiles that take longer are reported as a warning and skipped, and their running query is cancelled if the database driver supports it. By default, there is no limit.",
+    )
 
     # The query combiner enables us to combine multiple queries into a single query,
     # reducing the number of round-trips to the database and speeding up profiling.
@@ -114,6 +119,17 @@ class GEProfilingConfig(ConfigModel):
         description="*This feature is still experimental and can be disabled if it causes issues.* Reduces the total number of queries issued and speeds up profiling by dynamically combining SQL queries where possible.",
     )
 
+    single_scan_enabled: bool = Field(
+        default=False,
+        description="*This feature is still experimental.* Computes the row count and the null counts, unique counts, min, max, mean and standard deviation of all columns of a table with a single aggregate query, and their medians and quantiles with one more, instead of with separate queries for each column. Distinct value frequencies, histograms and sample values are still computed for each column separately, as are metrics that the platform does not support in an aggregate query.",
+    )
+    sample_percentage: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=100,
+        description="Requires `single_scan_enabled`. Computes the metrics of the single-scan queries (null and unique counts, min, max, mean, standard deviation and, where the platform supports them in an aggregate query, medians and quantiles) over a `TABLESAMPLE SYSTEM` sample of roughly this percentage of each table, rather than the whole table. Their counts describe the sample and are not scaled up. Only these queries are sampled: the row count of the profile is still that of the whole table, and histograms, distinct value frequencies, sample values and the metrics that are computed separately for each column still scan the whole table. Sampled profiles have a partition spec of type `QUERY` that describes the sample. Supported on postgres, snowflake, trino, presto and mssql; other platforms profile the whole table.",
+    )
+
     # Hidden option - used for debugging purposes.
     catch_exceptions: bool = Field(default=True, description="")
 
@@ -127,6 +143,14 @@ class GEProfilingConfig(ConfigModel):
         description="For partitioned datasets profile only the partition which matches the datetime or profile the latest one if not set. Only Bigquery supports this.",
     )
 
+    @pydantic.validator("sample_percentage")
+    def sample_percentage_requires_single_scan(
+        cls, v: Optional[float], values: Dict[str, Any]
+    ) -> Optional[float]:
+        if v is not None and not values.get("single_scan_enabled"):
+            raise ValueError("sample_percentage requires single_scan_enabled")
+        return v
+
     @pydantic.root_validator()
     def ensure_field_level_settings_are_normalized(
         cls: "GEProfilingConfig", values: Dict[str, Any]
@@ -64,6 +64,10 @@ from datahub.metadata.schema_classes import (
     SubTypesClass,
 )
 from datahub.utilities.sql_parser import SQLParser
+from datahub.utilities.sql_parser_cache import (
+    SQLParseCacheReport,
+    get_sql_parse_cache_report,
+)
 
 if sys.version_info >= (3, 7):
     import lkml
@@ -258,6 +262,7 @@ class LookMLSourceReport(SourceReport):
     views_discovered: int = 0
     views_dropped: List[str] = dataclass_field(default_factory=list)
     _looker_api: Optional[LookerAPI] = None
+    sql_parser_cache: Optional[SQLParseCacheReport] = None
 
     def report_models_scanned(self) -> None:
         self.models_discovered += 1
@@ -274,6 +279,7 @@ class LookMLSourceReport(SourceReport):
     def compute_stats(self) -> None:
         if self._looker_api:
             self.api_stats = self._looker_api.compute_stats()
+        self.sql_parser_cache = get_sql_parse_cache_report()
         return super().compute_stats()
 
 
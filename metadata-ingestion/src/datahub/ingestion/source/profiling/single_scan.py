@@ -0,0 +1,218 @@
+import dataclasses
+import logging
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.expression import ColumnElement
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ColumnMetric(Enum):
+    NONNULL_COUNT = "nonnull_count"
+    UNIQUE_COUNT = "unique_count"
+    MIN = "min"
+    MAX = "max"
+    MEAN = "mean"
+    STDEV = "stdev"
+    MEDIAN = "median"
+    # Computes the quantiles passed to SingleScanProfiler.compute(), as a list.
+    QUANTILES = "quantiles"
+
+
+# Dialects that support an ordered-set aggregate like
+# `percentile_disc(0.5) WITHIN GROUP (ORDER BY column)`.
+_ORDERED_SET_AGGREGATE_DIALECTS = {"postgresql", "snowflake", "oracle"}
+_APPROX_PERCENTILE_DIALECTS = {"trino", "presto", "awsathena"}
+
+# Dialects that support `FROM table TABLESAMPLE SYSTEM (percentage)`.
+TABLESAMPLE_DIALECTS = {"postgresql", "snowflake", "trino", "presto", "mssql"}
+
+# Very wide tables are split over a few queries, to stay clear of the limits that
+# some databases have on the number of expressions in a query.
+_MAX_EXPRESSIONS_PER_QUERY = 500
+
+_ROW_COUNT_LABEL = "row_count"
+
+
+@dataclasses.dataclass
+class SingleScanResult:
+    row_count: int
+    column_metrics: Dict[str, Dict[ColumnMetric, Any]]
+
+
+class SingleScanProfiler:
+    """
+    Computes column metrics with aggregate queries that cover all the columns of a
+    table at once, rather than with one query for each metric of each column. Unless
+    the table is very wide, every call to compute() is a single scan of the table.
+
+    If a sample percentage is given and the dialect supports it, the table is scanned
+    with a `TABLESAMPLE SYSTEM` clause, so that the row count and all metrics are
+    computed over the sample. Only the queries of this class are sampled.
+
+    Metric values are returned as they come from the database driver.
+    """
+
+    def __init__(
+        self,
+        conn: Union[Engine, Connection],
+        table: Any,
+        sample_percentage: Optional[float] = None,
+    ):
+        self.conn = conn
+        self.table = table
+        self.dialect = conn.dialect.name.lower()
+        self.sample_percentage = sample_percentage
+
+    def is_sampling_supported(self) -> bool:
+        return isinstance(self.table, sa.Table) and self.dialect in TABLESAMPLE_DIALECTS
+
+    def is_sampled(self) -> bool:
+        return self.sample_percentage is not None and self.is_sampling_supported()
+
+    def supports(self, metric: ColumnMetric) -> bool:
+        return bool(self._get_expressions("column", metric, [0.5]))
+
+    def compute(
+        self,
+        metrics: Mapping[str, Sequence[ColumnMetric]],
+        quantiles: Sequence[float] = (),
+    ) -> SingleScanResult:
+        expressions: List[Tuple[str, ColumnMetric, List[ColumnElement]]] = []
+        for column, requested_metrics in metrics.items():
+            for metric in requested_metrics:
+                exprs = self._get_expressions(column, metric, quantiles)
+                if not exprs:
+                    raise ValueError(
+                        f"The {metric.value} metric is not supported on {self.dialect}"
+                    )
+                expressions.append((column, metric, exprs))
+
+        row_count: Optional[int] = None
+        column_metrics: Dict[str, Dict[ColumnMetric, Any]] = {
+            column: {} for column in metrics
+        }
+        for batch in self._batch_expressions(expressions):
+            labeled: List[ColumnElement] = [sa.func.count().label(_ROW_COUNT_LABEL)]
+            for i, (_, _, exprs) in enumerate(batch):
+                labeled.extend(
+                    expr.label(f"metric_{i}_{j}") for j, expr in enumerate(exprs)
+                )
+            query = sa.select(labeled).select_from(self._get_from_clause())
+            row = self.conn.execute(query).fetchone()
+
+            row_count = int(row[_ROW_COUNT_LABEL] or 0)
+            for i, (column, metric, exprs) in enumerate(batch):
+                values = [row[f"metric_{i}_{j}"] for j in range(len(exprs))]
+                column_metrics[column][metric] = self._get_metric_value(metric, values)
+
+        if row_count is None:
+            # There were no column metrics to compute.
+            row_count = int(
+                self.conn.execute(
+                    sa.select([sa.func.count()]).select_from(self._get_from_clause())
+                ).scalar()
+                or 0
+            )
+        return SingleScanResult(row_count, column_metrics)
+
+    @staticmethod
+    def _get_metric_value(metric: ColumnMetric, values: List[Any]) -> Any:
+        if metric == ColumnMetric.QUANTILES:
+            return values
+        elif metric == ColumnMetric.MEDIAN and len(values) == 3:
+            # Like GE, the median of an odd number of values is the middle value
+            # itself, and that of an even number is the average of the two middle
+            # values, as a float.
+            nonnull_count, middle_value, average = values
+            if not nonnull_count or nonnull_count % 2 == 1:
+                return middle_value
+            return float(average)
+        return values[0]
+
+    @staticmethod
+    def _batch_expressions(
+        expressions: List[Tuple[str, ColumnMetric, List[ColumnElement]]]
+    ) -> List[List[Tuple[str, ColumnMetric, List[ColumnElement]]]]:
+        batches: List[List[Tuple[str, ColumnMetric, List[ColumnElement]]]] = []
+        batch_size = 0
+        for item in expressions:
+            if not batches or batch_size + len(item[2]) > _MAX_EXPRESSIONS_PER_QUERY:
+                batches.append([])
+                batch_size = 0
+            batches[-1].append(item)
+            batch_size += len(item[2])
+        return batches
+
+    def _get_from_clause(self) -> Any:
+        if not self.is_sampled():
+            return self.table
+        return sa.tablesample(
+            self.table,
+            sa.func.system(sa.literal_column(repr(float(self.sample_percentage)))),
+        )
+
+    def _get_expressions(  # noqa: C901
+        self, column: str, metric: ColumnMetric, quantiles: Sequence[float]
+    ) -> List[ColumnElement]:
+        col = sa.column(column)
+        quoted_column = self.conn.dialect.identifier_preparer.quote(column)
+
+        if metric == ColumnMetric.NONNULL_COUNT:
+            return [sa.func.count(col)]
+        elif metric == ColumnMetric.UNIQUE_COUNT:
+            # These match the approximations that the GE profiler uses.
+            if self.dialect == "redshift":
+                return [
+                    sa.literal_column(f"APPROXIMATE count(distinct {quoted_column})")
+                ]
+            elif self.dialect in {"bigquery", "snowflake"}:
+                return [sa.func.APPROX_COUNT_DISTINCT(col)]
+            return [sa.func.count(sa.func.distinct(col))]
+        elif metric == ColumnMetric.MIN:
+            return [sa.func.min(col)]
+        elif metric == ColumnMetric.MAX:
+            return [sa.func.max(col)]
+        elif metric == ColumnMetric.MEAN:
+            # column * 1.0 is needed for a correct average in MSSQL.
+            return [sa.func.avg(col * 1.0)]
+        elif metric == ColumnMetric.STDEV:
+            if self.dialect == "sqlite":
+                return []
+            elif self.dialect == "mssql":
+                return [sa.func.stdev(col)]
+            return [sa.func.stddev_samp(col)]
+        elif metric == ColumnMetric.MEDIAN:
+            if self.dialect in _ORDERED_SET_AGGREGATE_DIALECTS:
+                # Which one is the median depends on the parity of the count.
+                return [
+                    sa.func.count(col),
+                    sa.func.percentile_disc(0.5).within_group(col),
+                    sa.func.percentile_cont(0.5).within_group(col),
+                ]
+            elif self.dialect in _APPROX_PERCENTILE_DIALECTS:
+                return [sa.func.approx_percentile(col, 0.5)]
+            return []
+        elif metric == ColumnMetric.QUANTILES:
+            if self.dialect in _ORDERED_SET_AGGREGATE_DIALECTS:
+                # Snowflake has a precision issue in percentile_disc without rounding.
+                return [
+                    sa.func.percentile_disc(round(quantile, 10)).within_group(col)
+                    for quantile in quantiles
+                ]
+            elif self.dialect in _APPROX_PERCENTILE_DIALECTS:
+                return [
+                    sa.func.approx_percentile(col, quantile) for quantile in quantiles
+                ]
+            elif self.dialect == "bigquery":
+                return [
+                    sa.literal_column(
+                        f"approx_quantiles({quoted_column}, 100)[OFFSET({round(quantile * 100)})]"
+                    )
+                    for quantile in quantiles
+                ]
+            return []
+        raise ValueError(f"Unknown metric {metric}")
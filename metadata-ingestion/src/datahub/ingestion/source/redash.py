@@ -41,6 +41,10 @@ from datahub.metadata.schema_classes import (
 )
 from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.sql_parser import SQLParser
+from datahub.utilities.sql_parser_cache import (
+    SQLParseCacheReport,
+    get_sql_parse_cache_report,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -296,6 +300,7 @@ class RedashSourceReport(SourceReport):
     max_page_dashboards: Optional[int] = field(default=None)
     api_page_limit: Optional[float] = field(default=None)
     timing: Dict[str, int] = field(default_factory=dict)
+    sql_parser_cache: Optional[SQLParseCacheReport] = None
 
     def report_item_scanned(self) -> None:
         self.items_scanned += 1
@@ -303,6 +308,10 @@ class RedashSourceReport(SourceReport):
     def report_dropped(self, item: str) -> None:
         self.filtered.append(item)
 
+    def compute_stats(self) -> None:
+        self.sql_parser_cache = get_sql_parse_cache_report()
+        return super().compute_stats()
+
 
 @platform_name("Redash")
 @config_class(RedashConfig)
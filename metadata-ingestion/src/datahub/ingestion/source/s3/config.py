@@ -58,7 +58,12 @@ class DataLakeSourceConfig(PlatformSourceConfigBase, EnvBasedSourceConfigBase):
 
     max_rows: int = Field(
         default=100,
-        description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
+        description="Maximum number of rows to use when inferring schemas for TSV, CSV and JSON files.",
+    )
+    max_bytes: Optional[int] = Field(
+        default=10 * 1024 * 1024,
+        gt=0,
+        description="Maximum number of bytes to read from each JSON file when inferring its schema. Records are streamed from the file, so only the bytes that are needed are downloaded. If a single record is larger than this, e.g. a file that contains one large JSON object, its schema is inferred from the part that was read. Set to `null` to read whole files.",
     )
 
     _rename_path_spec_to_plural = pydantic_renamed_field(
@@ -1,11 +1,15 @@
+import itertools
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
+import ijson
 import jsonlines as jsl
-import ujson
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
-from datahub.ingestion.source.schema_inference.object import construct_schema
+from datahub.ingestion.source.schema_inference.object import (
+    SchemaDescription,
+    construct_schema,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     BooleanTypeClass,
@@ -32,20 +36,60 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
 logger = logging.getLogger(__name__)
 
 
+class _BoundedReader:
+    """
+    Reads a file up to a maximum number of bytes, so that records can be streamed
+    from large files, e.g. from S3, without downloading more than needed.
+    """
+
+    def __init__(self, file: IO[bytes], max_bytes: Optional[int]):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+
+    @property
+    def limit_reached(self) -> bool:
+        return self.max_bytes is not None and self.bytes_read >= self.max_bytes
+
+    def read(self, size: int = -1) -> bytes:
+        if self.max_bytes is not None:
+            remaining = self.max_bytes - self.bytes_read
+            if remaining <= 0:
+                return b""
+            size = remaining if size < 0 else min(size, remaining)
+        data = self.file.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        for line in self.file:
+            if self.limit_reached:
+                return
+            self.bytes_read += len(line)
+            yield line
+
+
 class JsonInferrer(SchemaInferenceBase):
+    """
+    Infers the schema of a file that contains either JSON, e.g. a single object or an
+    array of objects, or JSON lines. Records are streamed from the file, and the schema
+    is inferred from the first max_rows of them, or from the records in the first
+    max_bytes of the file. A record that is cut off by max_bytes is inferred from
+    the part that was read.
+    """
+
+    def __init__(self, max_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+
     def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
         try:
-            datastore = ujson.load(file)
-        except ujson.JSONDecodeError as e:
+            schema = self._construct_schema(self._iter_records(file))
+        except ijson.JSONError as e:
             logger.info(f"Got ValueError: {e}. Retry with jsonlines")
             file.seek(0)
-            reader = jsl.Reader(file)
-            datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
-
-        if not isinstance(datastore, list):
-            datastore = [datastore]
+            schema = self._construct_schema(self._iter_json_lines(file))
 
-        schema = construct_schema(datastore, delimiter=".")
         fields: List[SchemaField] = []
 
         for schema_field in sorted(schema.values(), key=lambda x: x["delimited_name"]):
@@ -66,3 +110,50 @@ class JsonInferrer(SchemaInferenceBase):
             fields.append(field)
 
         return fields
+
+    def _construct_schema(
+        self, records: Iterable[Any]
+    ) -> Dict[Tuple[str, ...], SchemaDescription]:
+        documents = (record for record in records if isinstance(record, dict))
+        return construct_schema(
+            itertools.islice(documents, self.max_rows), delimiter="."
+        )
+
+    def _iter_records(self, file: IO[bytes]) -> Iterator[Any]:
+        # Streams the top-level values of the file, or the items of a top-level array.
+        reader = _BoundedReader(file, self.max_bytes)
+        builder: Optional[ijson.ObjectBuilder] = None
+        depth = 0
+        in_top_level_array = False
+        try:
+            for _, event, value in ijson.parse(
+                reader, multiple_values=True, use_float=True
+            ):
+                if builder is None:
+                    if depth == 0 and event == "start_array" and not in_top_level_array:
+                        in_top_level_array = True
+                        continue
+                    if in_top_level_array and event == "end_array":
+                        in_top_level_array = False
+                        continue
+                    builder = ijson.ObjectBuilder()
+
+                builder.event(event, value)
+                if event in {"start_map", "start_array"}:
+                    depth += 1
+                elif event in {"end_map", "end_array"}:
+                    depth -= 1
+                if depth == 0:
+                    yield builder.value
+                    builder = None
+        except ijson.IncompleteJSONError:
+            if not reader.limit_reached:
+                raise
+            # The record that was cut off.
+            if builder is not None:
+                yield builder.value
+
+    def _iter_json_lines(self, file: IO[bytes]) -> Iterator[Any]:
+        reader = jsl.Reader(_BoundedReader(file, self.max_bytes))
+        # A line that is cut off by max_bytes is skipped as invalid.
+        yield from reader.iter(type=dict, skip_invalid=True)
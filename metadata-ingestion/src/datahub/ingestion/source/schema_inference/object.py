@@ -1,5 +1,15 @@
 from collections import Counter
-from typing import Any, Counter as CounterType, Dict, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mypy_extensions import TypedDict
 
@@ -80,33 +90,54 @@ def is_nullable_collection(
     return any(is_field_nullable(doc, field_path) for doc in collection)
 
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+class PartialSchema:
     """
-    Construct (infer) a schema from a collection of documents.
-
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
-
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
+    A schema that is inferred incrementally, one document at a time, so that
+    collections can be streamed rather than held in memory. Each document is only
+    traversed once: along with the types of its fields, we record which fields are
+    never null or missing in it, so a field is nullable if that is not the case for
+    every document. Partial schemas of separate parts of a collection, e.g. computed
+    in parallel, can be combined with merge().
     """
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
-
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
+    def __init__(self) -> None:
+        self.fields: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        self.document_count = 0
+        # The number of documents in which each field is never null or missing.
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
+
+    def add_document(self, doc: Dict[str, Any]) -> None:
+        self.document_count += 1
+        self._non_nullable_counts.update(self._append_to_schema(doc, ()))
+
+    def add_documents(self, collection: Iterable[Dict[str, Any]]) -> "PartialSchema":
+        for document in collection:
+            self.add_document(document)
+        return self
+
+    def merge(self, other: "PartialSchema") -> "PartialSchema":
+        for field_path, description in other.fields.items():
+            if field_path not in self.fields:
+                self.fields[field_path] = {
+                    "types": Counter(description["types"]),
+                    "count": description["count"],
+                }
+            else:
+                self.fields[field_path]["types"].update(description["types"])
+                self.fields[field_path]["count"] += description["count"]
+        self.document_count += other.document_count
+        self._non_nullable_counts.update(other._non_nullable_counts)
+        return self
+
+    def _append_to_schema(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> Set[Tuple[str, ...]]:
         """
         Recursively update the schema with a document, which may/may not contain nested fields.
 
+        Returns the paths of the fields of the document, relative to the document, that
+        are never null or missing in it.
+
         Parameters
         ----------
             doc:
@@ -115,55 +146,99 @@ def construct_schema(
                 prefix of fields that the document is under, pass an empty tuple when initializing
         """
 
+        non_nullable: Set[Tuple[str, ...]] = set()
         for key, value in doc.items():
             new_parent_prefix = parent_prefix + (key,)
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                non_nullable.update(
+                    (key,) + field_path
+                    for field_path in self._append_to_schema(value, new_parent_prefix)
+                )
             # if array of values, check what types are within
             if isinstance(value, list):
+                # nested fields are only non-nullable if they are in every member
+                nested_non_nullable: Optional[Set[Tuple[str, ...]]] = (
+                    None if value else set()
+                )
                 for item in value:
                     # if dictionary, add it as a nested object
                     if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+                        item_non_nullable = self._append_to_schema(
+                            item, new_parent_prefix
+                        )
+                    else:
+                        item_non_nullable = set()
+                    if nested_non_nullable is None:
+                        nested_non_nullable = item_non_nullable
+                    else:
+                        nested_non_nullable &= item_non_nullable
+                non_nullable.update(
+                    (key,) + field_path for field_path in nested_non_nullable or ()
+                )
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                non_nullable.add((key,))
+                if new_parent_prefix not in self.fields:
+                    self.fields[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
 
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
-
-    for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+                    self.fields[new_parent_prefix]["types"].update({type(value): 1})
+                    self.fields[new_parent_prefix]["count"] += 1
+
+        return non_nullable
+
+    def to_schema(self, delimiter: str) -> Dict[Tuple[str, ...], SchemaDescription]:
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path, description in self.fields.items():
+            field_types = description["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": description["types"],
+                "count": description["count"],
+                "nullable": self._non_nullable_counts[field_path] < self.document_count,
+                "delimited_name": delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over, which is only iterated over once.
+        delimiter:
+            string to concatenate field names by
+    """
+
+    return PartialSchema().add_documents(collection).to_schema(delimiter)
@@ -29,6 +29,17 @@ class SnowflakeV2Config(SnowflakeConfig, SnowflakeUsageConfig):
         description="If enabled, populates the snowflake technical schema and descriptions.",
     )
 
+    max_metadata_extraction_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker threads, each with its own Snowflake connection, that get the columns and constraints of schemas concurrently. Workunits are still generated in the same order as with a single worker.",
+    )
+
+    incremental_schema_extraction: bool = Field(
+        default=False,
+        description="If enabled together with stateful ingestion, the schema metadata of tables whose LAST_ALTERED is before the start of the last successful run is not emitted again, and their constraints, and unless they are profiled their columns, are not queried. Views are always emitted. All schemas are extracted again if the patterns or other config that affects which schemas are emitted or the datahub version changed, if some schema metadata could not be extracted in the last run, or with `stateful_ingestion.ignore_old_state`. Not supported together with transformers, which would no longer apply to the tables that are not emitted again; all schemas are extracted in that case.",
+    )
+
     check_role_grants: bool = Field(
         default=False,
         description="Not supported",
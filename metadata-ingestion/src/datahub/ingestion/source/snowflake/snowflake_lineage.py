@@ -1,10 +1,23 @@
 import json
 import logging
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+import sys
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
-from pydantic.error_wrappers import ValidationError
 from snowflake.connector import SnowflakeConnection
 
 import datahub.emitter.mce_builder as builder
@@ -12,9 +25,6 @@ from datahub.ingestion.source.aws.s3_util import make_s3_urn
 from datahub.ingestion.source.snowflake.snowflake_config import SnowflakeV2Config
 from datahub.ingestion.source.snowflake.snowflake_query import SnowflakeQuery
 from datahub.ingestion.source.snowflake.snowflake_report import SnowflakeV2Report
-from datahub.ingestion.source.snowflake.snowflake_usage_v2 import (
-    SnowflakeColumnReference,
-)
 from datahub.ingestion.source.snowflake.snowflake_utils import (
     SnowflakeCommonMixin,
     SnowflakeQueryMixin,
@@ -30,111 +40,144 @@ from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class SnowflakeColumnWithLineage(SnowflakeColumnReference):
-    directSourceColumns: Optional[List[SnowflakeColumnReference]] = None
 
-
-@dataclass(frozen=True)
-class SnowflakeColumnId:
+class SnowflakeColumnId(NamedTuple):
     columnName: str
     objectName: str
     objectDomain: Optional[str] = None
 
 
-@dataclass(frozen=True)
-class SnowflakeColumnFineGrainedLineage:
-    """
-    Fie grained upstream of column,
-    which represents a transformation applied on input columns"""
+@dataclass
+class SnowflakeTableLineage:
+    __slots__ = ("upstreamTables", "columnLineages")
 
-    inputColumns: FrozenSet[SnowflakeColumnId]
-    # Transform function, query etc can be added here
+    # upstream table names
+    upstreamTables: Set[str]
 
+    # key: downstream column name, value: the sets of input columns of each of the
+    # transformations that populated the column
+    columnLineages: Dict[str, Set[FrozenSet[SnowflakeColumnId]]]
 
-@dataclass
-class SnowflakeColumnUpstreams:
-    """All upstreams of a column"""
+    @classmethod
+    def create(cls) -> "SnowflakeTableLineage":
+        return cls(set(), {})
 
-    upstreams: Set[SnowflakeColumnFineGrainedLineage] = field(
-        default_factory=set, init=False
-    )
+    def update_lineage(self, other: "SnowflakeTableLineage") -> "SnowflakeTableLineage":
+        self.upstreamTables |= other.upstreamTables
+        for column, upstreams in other.columnLineages.items():
+            self.columnLineages.setdefault(column, set()).update(upstreams)
+        return self
 
     def update_column_lineage(
-        self, directSourceColumns: List[SnowflakeColumnReference]
+        self,
+        column_name: Optional[str],
+        direct_source_columns: List[Dict[str, Any]],
     ) -> None:
         input_columns = frozenset(
-            [
-                SnowflakeColumnId(
-                    upstream_col.columnName,
-                    upstream_col.objectName,
-                    upstream_col.objectDomain,
-                )
-                for upstream_col in directSourceColumns
-                if upstream_col.objectName
-            ]
+            SnowflakeColumnId(
+                upstream_col["columnName"],
+                sys.intern(upstream_col["objectName"]),
+                sys.intern(upstream_col["objectDomain"])
+                if upstream_col.get("objectDomain")
+                else None,
+            )
+            for upstream_col in direct_source_columns
+            # Earlier versions of column lineage did not include columnName, only columnId
+            if upstream_col.get("objectName") and upstream_col.get("columnName")
         )
-        if not input_columns:
-            return
-        upstream = SnowflakeColumnFineGrainedLineage(inputColumns=input_columns)
-        if upstream not in self.upstreams:
-            self.upstreams.add(upstream)
+        if column_name and input_columns:
+            self.columnLineages.setdefault(column_name, set()).add(input_columns)
 
 
-@dataclass
-class SnowflakeUpstreamTable:
-    upstreamDataset: str
-    upstreamColumns: List[SnowflakeColumnReference]
-    downstreamColumns: List[SnowflakeColumnWithLineage]
+def _lineage_sort_key(dataset_name: str) -> str:
+    # Same order as snowflake_query.lineage_sort_key
+    return dataset_name.lower()
 
-    @classmethod
-    def from_dict(cls, dataset, upstreams_columns_dict, downstream_columns_dict):
-        try:
-            table_with_upstreams = cls(
-                dataset,
-                [
-                    SnowflakeColumnReference.parse_obj(col)
-                    for col in upstreams_columns_dict
-                ],
-                [
-                    SnowflakeColumnWithLineage.parse_obj(col)
-                    for col in downstream_columns_dict
-                ],
-            )
-        except ValidationError:
-            # Earlier versions of column lineage did not include columnName, only columnId
-            table_with_upstreams = cls(dataset, [], [])
-        return table_with_upstreams
 
+class SnowflakeLineageStream(Generic[T]):
+    """
+    The lineage of datasets from a query whose rows are ordered by downstream dataset.
+    Rows are only read up to the dataset whose lineage is asked for, so while the
+    datasets are processed in about the same order, only the lineage of the few
+    datasets read ahead is kept in memory, instead of the lineage of the account.
 
-@dataclass
-class SnowflakeTableLineage:
-    # key: upstream table name
-    upstreamTables: Dict[str, SnowflakeUpstreamTable] = field(
-        default_factory=dict, init=False
-    )
-
-    # key: downstream column name
-    columnLineages: Dict[str, SnowflakeColumnUpstreams] = field(
-        default_factory=lambda: defaultdict(SnowflakeColumnUpstreams), init=False
-    )
-
-    def update_lineage(self, table: SnowflakeUpstreamTable) -> None:
-        if table.upstreamDataset not in self.upstreamTables.keys():
-            self.upstreamTables[table.upstreamDataset] = table
-
-        if table.downstreamColumns:
-            for col in table.downstreamColumns:
-                if col.directSourceColumns:
-                    self.columnLineages[col.columnName].update_column_lineage(
-                        col.directSourceColumns
-                    )
+    Rows of a dataset whose lineage was already returned are dropped, and reported
+    through warn once all rows are read.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        entries: Iterator[Tuple[str, T]],
+        merge: Callable[[T, T], T],
+        warn: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        self.name = name
+        self._entries: Optional[Iterator[Tuple[str, T]]] = entries
+        self._merge = merge
+        self._warn = warn
+        self._buffer: Dict[str, T] = {}
+        self._last_sort_key: Optional[str] = None
+        self._ordered = True
+        # Only the names of the datasets are kept, not their lineage.
+        self._popped: Set[str] = set()
+        self.num_dropped_rows = 0
+        self.dropped_datasets: Set[str] = set()
+
+    def pop(self, dataset_name: str) -> Optional[T]:
+        """Returns the lineage of a dataset, which is only returned once."""
+        sort_key = _lineage_sort_key(dataset_name)
+        while self._entries is not None and (
+            not self._ordered
+            or self._last_sort_key is None
+            or self._last_sort_key <= sort_key
+        ):
+            entry = next(self._entries, None)
+            if entry is None:
+                self._entries = None
+                self._report_dropped_rows()
+                break
+            key, lineage = entry
+            entry_sort_key = _lineage_sort_key(key)
+            if self._last_sort_key is not None and entry_sort_key < self._last_sort_key:
+                # Not ordered as expected, e.g. because of unusual identifiers. The
+                # lineage of datasets that were already looked up might be missed.
+                logger.warning(
+                    f"{self.name} lineage of {key} is not in the expected order, reading all remaining lineage."
+                )
+                self._ordered = False
+            else:
+                self._last_sort_key = entry_sort_key
+            if key in self._popped:
+                # The lineage of the dataset was already emitted without this row.
+                self.num_dropped_rows += 1
+                self.dropped_datasets.add(key)
+            elif key in self._buffer:
+                self._buffer[key] = self._merge(self._buffer[key], lineage)
+            else:
+                self._buffer[key] = lineage
+        self._popped.add(dataset_name)
+        return self._buffer.pop(dataset_name, None)
+
+    def _report_dropped_rows(self) -> None:
+        if self.num_dropped_rows and self._warn:
+            self._warn(
+                f"{self.name} lineage",
+                f"Dropped {self.num_dropped_rows} lineage rows of {len(self.dropped_datasets)} datasets, "
+                f"because they were read after the lineage of their dataset was emitted: "
+                f"{', '.join(sorted(self.dropped_datasets)[:10])}",
+            )
 
 
 class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
     def __init__(self, config: SnowflakeV2Config, report: SnowflakeV2Report) -> None:
-        self._lineage_map: Optional[Dict[str, SnowflakeTableLineage]] = None
-        self._external_lineage_map: Optional[Dict[str, Set[str]]] = None
+        self._lineage: Optional[
+            List[SnowflakeLineageStream[SnowflakeTableLineage]]
+        ] = None
+        self._external_lineage: Optional[SnowflakeLineageStream[Set[str]]] = None
+        self._external_tables: Dict[str, Set[str]] = {}
         self.config = config
         self.platform = "snowflake"
         self.report = report
@@ -145,31 +188,33 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
         self, dataset_name: str
     ) -> Optional[Tuple[UpstreamLineage, Dict[str, str]]]:
 
-        if self._lineage_map is None or self._external_lineage_map is None:
+        if self._lineage is None or self._external_lineage is None:
             conn = self.config.get_connection()
-        if self._lineage_map is None:
+        if self._lineage is None:
             with PerfTimer() as timer:
-                self._populate_lineage(conn)
+                self._lineage = [self._populate_lineage(conn)]
                 self.report.table_lineage_query_secs = timer.elapsed_seconds()
             if self.config.include_view_lineage:
-                self._populate_view_lineage(conn)
+                self._lineage.extend(self._populate_view_lineage(conn))
 
-        if self._external_lineage_map is None:
+        if self._external_lineage is None:
             with PerfTimer() as timer:
-                self._populate_external_lineage(conn)
+                self._external_lineage = self._populate_external_lineage(conn)
                 self.report.external_lineage_queries_secs = timer.elapsed_seconds()
 
-        assert self._lineage_map is not None
-        assert self._external_lineage_map is not None
+        lineage = SnowflakeTableLineage.create()
+        for lineage_stream in self._lineage:
+            stream_lineage = lineage_stream.pop(dataset_name)
+            if stream_lineage is not None:
+                lineage.update_lineage(stream_lineage)
+        external_lineage = self._external_lineage.pop(dataset_name) or set()
+        external_lineage |= self._external_tables.pop(dataset_name, set())
 
-        lineage = self._lineage_map[dataset_name]
-        external_lineage = self._external_lineage_map[dataset_name]
         if not (lineage.upstreamTables or lineage.columnLineages or external_lineage):
             logger.debug(f"No lineage found for {dataset_name}")
             return None
         upstream_tables: List[UpstreamClass] = []
         finegrained_lineages: List[FineGrainedLineage] = []
-        fieldset_finegrained_lineages: List[FineGrainedLineage] = []
         column_lineage: Dict[str, str] = {}
         dataset_urn = builder.make_dataset_urn_with_platform_instance(
             self.platform,
@@ -177,11 +222,8 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             self.config.platform_instance,
             self.config.env,
         )
-        for lineage_entry in sorted(
-            lineage.upstreamTables.values(), key=lambda x: x.upstreamDataset
-        ):
+        for upstream_table_name in sorted(lineage.upstreamTables):
             # Update the table-lineage
-            upstream_table_name = lineage_entry.upstreamDataset
             upstream_table_urn = builder.make_dataset_urn_with_platform_instance(
                 self.platform,
                 upstream_table_name,
@@ -194,36 +236,8 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             )
             upstream_tables.append(upstream_table)
 
-            if lineage_entry.upstreamColumns and lineage_entry.downstreamColumns:
-                # This is not used currently. This indicates same column lineage as was set
-                # in customProperties earlier - not accurate.
-                fieldset_finegrained_lineage = FineGrainedLineage(
-                    upstreamType=FineGrainedLineageUpstreamType.FIELD_SET,
-                    downstreamType=FineGrainedLineageDownstreamType.FIELD_SET
-                    if len(lineage_entry.downstreamColumns) > 1
-                    else FineGrainedLineageDownstreamType.FIELD,
-                    upstreams=sorted(
-                        [
-                            builder.make_schema_field_urn(
-                                upstream_table_urn,
-                                self.snowflake_identifier(d.columnName),
-                            )
-                            for d in lineage_entry.upstreamColumns
-                        ]
-                    ),
-                    downstreams=sorted(
-                        [
-                            builder.make_schema_field_urn(
-                                dataset_urn, self.snowflake_identifier(d.columnName)
-                            )
-                            for d in lineage_entry.downstreamColumns
-                        ]
-                    ),
-                )
-                fieldset_finegrained_lineages.append(fieldset_finegrained_lineage)
-
         for col, col_upstreams in lineage.columnLineages.items():
-            for fine_upstream in col_upstreams.upstreams:
+            for input_columns in col_upstreams:
                 fieldPath = col
                 finegrained_lineage_entry = FineGrainedLineage(
                     upstreamType=FineGrainedLineageUpstreamType.FIELD_SET,
@@ -240,10 +254,8 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
                                 ),
                                 self.snowflake_identifier(upstream_col.columnName),
                             )
-                            for upstream_col in fine_upstream.inputColumns  # type:ignore
-                            if upstream_col.objectName
-                            and upstream_col.columnName
-                            and self._is_dataset_pattern_allowed(
+                            for upstream_col in input_columns
+                            if self._is_dataset_pattern_allowed(
                                 upstream_col.objectName, upstream_col.objectDomain
                             )
                         ]
@@ -289,15 +301,58 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             )
         return None
 
-    def _populate_view_lineage(self, conn: SnowflakeConnection) -> None:
+    def _read_lineage(
+        self,
+        conn: SnowflakeConnection,
+        query: str,
+        key: str,
+        description: str,
+        parse_row: Callable[[Dict[str, Any]], Optional[Tuple[str, T]]],
+    ) -> Iterator[Tuple[str, T]]:
+        """
+        Runs a lineage query, and returns the lineage of each of its rows that is not
+        filtered out by parse_row, as it is read.
+        """
+        try:
+            db_rows: Iterable[Dict[str, Any]] = self.query(conn, query)
+        except Exception as e:
+            self.warn(
+                key,
+                f"Extracting {description} from Snowflake failed."
+                f"Please check your permissions. Continuing...\nError was {e}.",
+            )
+            db_rows = []
+
+        def read_rows() -> Iterator[Tuple[str, T]]:
+            try:
+                for db_row in db_rows:
+                    entry = parse_row(db_row)
+                    if entry is not None:
+                        yield entry
+            except Exception as e:
+                logger.error(e, exc_info=e)
+                self.warn(
+                    key,
+                    f"Extracting {description} from Snowflake failed."
+                    f"Please check your permissions. Continuing...\nError was {e}.",
+                )
+
+        return read_rows()
+
+    def _populate_view_lineage(
+        self, conn: SnowflakeConnection
+    ) -> List[SnowflakeLineageStream[SnowflakeTableLineage]]:
         with PerfTimer() as timer:
-            self._populate_view_upstream_lineage(conn)
+            view_upstream_lineage = self._populate_view_upstream_lineage(conn)
             self.report.view_upstream_lineage_query_secs = timer.elapsed_seconds()
         with PerfTimer() as timer:
-            self._populate_view_downstream_lineage(conn)
+            view_downstream_lineage = self._populate_view_downstream_lineage(conn)
             self.report.view_downstream_lineage_query_secs = timer.elapsed_seconds()
+        return [view_upstream_lineage, view_downstream_lineage]
 
-    def _populate_external_lineage(self, conn: SnowflakeConnection) -> None:
+    def _populate_external_lineage(
+        self, conn: SnowflakeConnection
+    ) -> SnowflakeLineageStream[Set[str]]:
         # Handles the case where a table is populated from an external location via copy.
         # Eg: copy into category_english from 's3://acryl-snow-demo-olist/olist_raw_data/category_english'credentials=(aws_key_id='...' aws_secret_key='...')  pattern='.*.csv';
         query: str = SnowflakeQuery.external_table_lineage_history(
@@ -307,30 +362,33 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             end_time_millis=int(self.config.end_time.timestamp() * 1000),
         )
 
-        num_edges: int = 0
-        self._external_lineage_map = defaultdict(set)
-        try:
-            for db_row in self.query(conn, query):
-                # key is the down-stream table name
-                key: str = self.get_dataset_identifier_from_qualified_name(
-                    db_row["DOWNSTREAM_TABLE_NAME"]
-                )
-                if not self._is_dataset_pattern_allowed(key, "table"):
-                    continue
-                self._external_lineage_map[key] |= {
-                    *json.loads(db_row["UPSTREAM_LOCATIONS"])
-                }
-                logger.debug(
-                    f"ExternalLineage[Table(Down)={key}]:External(Up)={self._external_lineage_map[key]} via access_history"
-                )
-        except Exception as e:
-            self.warn(
-                "external_lineage",
-                f"Populating table external lineage from Snowflake failed."
-                f"Please check your premissions. Continuing...\nError was {e}.",
+        def parse_row(db_row: Dict[str, Any]) -> Optional[Tuple[str, Set[str]]]:
+            # key is the down-stream table name
+            key: str = self.get_dataset_identifier_from_qualified_name(
+                db_row["DOWNSTREAM_TABLE_NAME"]
             )
+            if not self._is_dataset_pattern_allowed(key, "table"):
+                return None
+            upstream_locations = set(json.loads(db_row["UPSTREAM_LOCATIONS"]))
+            logger.debug(
+                f"ExternalLineage[Table(Down)={key}]:External(Up)={upstream_locations} via access_history"
+            )
+            return key, upstream_locations
+
+        external_lineage = SnowflakeLineageStream(
+            "External table",
+            self._read_lineage(
+                conn, query, "external_lineage", "table external lineage", parse_row
+            ),
+            lambda a, b: a | b,
+            warn=self.warn,
+        )
+
         # Handles the case for explicitly created external tables.
         # NOTE: Snowflake does not log this information to the access_history table.
+        # These can't be ordered, so they are all read here.
+        num_edges: int = 0
+        self._external_tables = {}
         external_tables_query: str = SnowflakeQuery.show_external_tables()
         try:
             for db_row in self.query(conn, external_tables_query):
@@ -340,9 +398,9 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
 
                 if not self._is_dataset_pattern_allowed(key, "table"):
                     continue
-                self._external_lineage_map[key].add(db_row["location"])
+                self._external_tables.setdefault(key, set()).add(db_row["location"])
                 logger.debug(
-                    f"ExternalLineage[Table(Down)={key}]:External(Up)={self._external_lineage_map[key]} via show external tables"
+                    f"ExternalLineage[Table(Down)={key}]:External(Up)={self._external_tables[key]} via show external tables"
                 )
                 num_edges += 1
         except Exception as e:
@@ -353,102 +411,106 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             )
         logger.info(f"Found {num_edges} external lineage edges.")
         self.report.num_external_table_edges_scanned = num_edges
+        return external_lineage
 
-    def _populate_lineage(self, conn: SnowflakeConnection) -> None:
+    def _populate_lineage(
+        self, conn: SnowflakeConnection
+    ) -> SnowflakeLineageStream[SnowflakeTableLineage]:
+        # Each row has either an upstream table of a table, or the input columns of
+        # one of the transformations that populated one of its columns.
         query: str = SnowflakeQuery.table_to_table_lineage_history(
             start_time_millis=int(self.config.start_time.timestamp() * 1000)
             if not self.config.ignore_start_time_lineage
             else 0,
             end_time_millis=int(self.config.end_time.timestamp() * 1000),
         )
-        num_edges: int = 0
-        self._lineage_map = defaultdict(SnowflakeTableLineage)
-        try:
-            for db_row in self.query(conn, query):
-                # key is the down-stream table name
-                key: str = self.get_dataset_identifier_from_qualified_name(
-                    db_row["DOWNSTREAM_TABLE_NAME"]
-                )
+        self.report.num_table_to_table_edges_scanned = 0
+
+        def parse_row(
+            db_row: Dict[str, Any]
+        ) -> Optional[Tuple[str, SnowflakeTableLineage]]:
+            # key is the down-stream table name
+            key: str = self.get_dataset_identifier_from_qualified_name(
+                db_row["DOWNSTREAM_TABLE_NAME"]
+            )
+            # The lineage of tables that are not ingested is never looked up.
+            if not self._is_dataset_pattern_allowed(key, "table"):
+                return None
+
+            lineage = SnowflakeTableLineage.create()
+            if db_row["UPSTREAM_TABLE_NAME"] is not None:
                 upstream_table_name = self.get_dataset_identifier_from_qualified_name(
                     db_row["UPSTREAM_TABLE_NAME"]
                 )
-                if not (
-                    self._is_dataset_pattern_allowed(key, "table")
-                    or self._is_dataset_pattern_allowed(upstream_table_name, "table")
-                ):
-                    continue
-
-                self._lineage_map[key].update_lineage(
-                    # (<upstream_table_name>, <json_list_of_upstream_columns>, <json_list_of_downstream_columns>)
-                    SnowflakeUpstreamTable.from_dict(
-                        upstream_table_name,
-                        json.loads(db_row["UPSTREAM_TABLE_COLUMNS"]),
-                        json.loads(db_row["DOWNSTREAM_TABLE_COLUMNS"]),
-                    ),
-                )
-                num_edges += 1
+                lineage.upstreamTables.add(upstream_table_name)
+                self.report.num_table_to_table_edges_scanned += 1
                 logger.debug(
-                    f"Lineage[Table(Down)={key}]:Table(Up)={self._lineage_map[key]}"
+                    f"Lineage[Table(Down)={key}]:Table(Up)={upstream_table_name}"
                 )
-        except Exception as e:
-            logger.error(e, exc_info=e)
-            self.warn(
-                "lineage",
-                f"Extracting lineage from Snowflake failed."
-                f"Please check your premissions. Continuing...\nError was {e}.",
-            )
-        logger.info(
-            f"A total of {num_edges} Table->Table edges found"
-            f" for {len(self._lineage_map)} downstream tables.",
+            else:
+                lineage.update_column_lineage(
+                    db_row["COLUMN_NAME"], json.loads(db_row["DIRECT_SOURCE_COLUMNS"])
+                )
+            return key, lineage
+
+        return SnowflakeLineageStream(
+            "Table",
+            self._read_lineage(conn, query, "lineage", "lineage", parse_row),
+            SnowflakeTableLineage.update_lineage,
+            warn=self.warn,
         )
-        self.report.num_table_to_table_edges_scanned = num_edges
 
-    def _populate_view_upstream_lineage(self, conn: SnowflakeConnection) -> None:
+    def _populate_view_upstream_lineage(
+        self, conn: SnowflakeConnection
+    ) -> SnowflakeLineageStream[SnowflakeTableLineage]:
         # NOTE: This query captures only the upstream lineage of a view (with no column lineage).
         # For more details see: https://docs.snowflake.com/en/user-guide/object-dependencies.html#object-dependencies
         # and also https://docs.snowflake.com/en/sql-reference/account-usage/access_history.html#usage-notes for current limitations on capturing the lineage for views.
         view_upstream_lineage_query: str = SnowflakeQuery.view_dependencies()
+        self.report.num_table_to_view_edges_scanned = 0
+
+        def parse_row(
+            db_row: Dict[str, Any]
+        ) -> Optional[Tuple[str, SnowflakeTableLineage]]:
+            # Process UpstreamTable/View/ExternalTable/Materialized View->View edge.
+            view_upstream: str = self.get_dataset_identifier_from_qualified_name(
+                db_row["VIEW_UPSTREAM"]
+            )
+            view_name: str = self.get_dataset_identifier_from_qualified_name(
+                db_row["DOWNSTREAM_VIEW"]
+            )
 
-        assert self._lineage_map is not None
-        num_edges: int = 0
-
-        try:
-            for db_row in self.query(conn, view_upstream_lineage_query):
-                # Process UpstreamTable/View/ExternalTable/Materialized View->View edge.
-                view_upstream: str = self.get_dataset_identifier_from_qualified_name(
-                    db_row["VIEW_UPSTREAM"]
-                )
-                view_name: str = self.get_dataset_identifier_from_qualified_name(
-                    db_row["DOWNSTREAM_VIEW"]
-                )
+            if not self._is_dataset_pattern_allowed(
+                dataset_name=view_name,
+                dataset_type=db_row["REFERENCING_OBJECT_DOMAIN"],
+            ) or not self._is_dataset_pattern_allowed(
+                view_upstream, db_row["REFERENCED_OBJECT_DOMAIN"]
+            ):
+                return None
 
-                if not self._is_dataset_pattern_allowed(
-                    dataset_name=view_name,
-                    dataset_type=db_row["REFERENCING_OBJECT_DOMAIN"],
-                ) or not self._is_dataset_pattern_allowed(
-                    view_upstream, db_row["REFERENCED_OBJECT_DOMAIN"]
-                ):
-                    continue
-
-                # key is the downstream view name
-                self._lineage_map[view_name].update_lineage(
-                    # (<upstream_table_name>, <empty_json_list_of_upstream_table_columns>, <empty_json_list_of_downstream_view_columns>)
-                    SnowflakeUpstreamTable.from_dict(view_upstream, [], [])
-                )
-                num_edges += 1
-                logger.debug(
-                    f"Upstream->View: Lineage[View(Down)={view_name}]:Upstream={view_upstream}"
-                )
-        except Exception as e:
-            self.warn(
-                "view_upstream_lineage",
-                "Extracting the upstream view lineage from Snowflake failed."
-                + f"Please check your permissions. Continuing...\nError was {e}.",
+            self.report.num_table_to_view_edges_scanned += 1
+            logger.debug(
+                f"Upstream->View: Lineage[View(Down)={view_name}]:Upstream={view_upstream}"
             )
-        logger.info(f"A total of {num_edges} View upstream edges found.")
-        self.report.num_table_to_view_edges_scanned = num_edges
+            # key is the downstream view name
+            return view_name, SnowflakeTableLineage({view_upstream}, {})
+
+        return SnowflakeLineageStream(
+            "View",
+            self._read_lineage(
+                conn,
+                view_upstream_lineage_query,
+                "view_upstream_lineage",
+                "the upstream view lineage",
+                parse_row,
+            ),
+            SnowflakeTableLineage.update_lineage,
+            warn=self.warn,
+        )
 
-    def _populate_view_downstream_lineage(self, conn: SnowflakeConnection) -> None:
+    def _populate_view_downstream_lineage(
+        self, conn: SnowflakeConnection
+    ) -> SnowflakeLineageStream[SnowflakeTableLineage]:
 
         # This query captures the downstream table lineage for views.
         # See https://docs.snowflake.com/en/sql-reference/account-usage/access_history.html#usage-notes for current limitations on capturing the lineage for views.
@@ -459,50 +521,53 @@ class SnowflakeLineageExtractor(SnowflakeQueryMixin, SnowflakeCommonMixin):
             else 0,
             end_time_millis=int(self.config.end_time.timestamp() * 1000),
         )
-
-        assert self._lineage_map is not None
         self.report.num_view_to_table_edges_scanned = 0
 
-        try:
-            db_rows = self.query(conn, view_lineage_query)
-        except Exception as e:
-            self.warn(
-                "view_downstream_lineage",
-                f"Extracting the view lineage from Snowflake failed."
-                f"Please check your permissions. Continuing...\nError was {e}.",
+        def parse_row(
+            db_row: Dict[str, Any]
+        ) -> Optional[Tuple[str, SnowflakeTableLineage]]:
+            downstream_table: str = self.get_dataset_identifier_from_qualified_name(
+                db_row["DOWNSTREAM_TABLE_NAME"]
             )
-        else:
-            for db_row in db_rows:
+            if not self._is_dataset_pattern_allowed(
+                downstream_table, db_row["DOWNSTREAM_TABLE_DOMAIN"]
+            ):
+                return None
+
+            lineage = SnowflakeTableLineage.create()
+            if db_row["VIEW_NAME"] is not None:
+                # Capture view->downstream table lineage.
                 view_name: str = self.get_dataset_identifier_from_qualified_name(
                     db_row["VIEW_NAME"]
                 )
-                downstream_table: str = self.get_dataset_identifier_from_qualified_name(
-                    db_row["DOWNSTREAM_TABLE_NAME"]
-                )
                 if not self._is_dataset_pattern_allowed(
                     view_name, db_row["VIEW_DOMAIN"]
-                ) or not self._is_dataset_pattern_allowed(
-                    downstream_table, db_row["DOWNSTREAM_TABLE_DOMAIN"]
                 ):
-                    continue
-
-                # Capture view->downstream table lineage.
-                self._lineage_map[downstream_table].update_lineage(
-                    # (<upstream_view_name>, <json_list_of_upstream_view_columns>, <json_list_of_downstream_columns>)
-                    SnowflakeUpstreamTable.from_dict(
-                        view_name,
-                        json.loads(db_row["VIEW_COLUMNS"]),
-                        json.loads(db_row["DOWNSTREAM_TABLE_COLUMNS"]),
-                    )
-                )
+                    return None
+                lineage.upstreamTables.add(view_name)
                 self.report.num_view_to_table_edges_scanned += 1
-
                 logger.debug(
-                    f"View->Table: Lineage[Table(Down)={downstream_table}]:View(Up)={self._lineage_map[downstream_table]}"
+                    f"View->Table: Lineage[Table(Down)={downstream_table}]:View(Up)={view_name}"
+                )
+            else:
+                # Input columns of views that are not allowed are filtered out when
+                # the fine-grained lineage is built.
+                lineage.update_column_lineage(
+                    db_row["COLUMN_NAME"], json.loads(db_row["DIRECT_SOURCE_COLUMNS"])
                 )
+            return downstream_table, lineage
 
-        logger.info(
-            f"Found {self.report.num_view_to_table_edges_scanned} View->Table edges."
+        return SnowflakeLineageStream(
+            "View->Table",
+            self._read_lineage(
+                conn,
+                view_lineage_query,
+                "view_downstream_lineage",
+                "the view lineage",
+                parse_row,
+            ),
+            SnowflakeTableLineage.update_lineage,
+            warn=self.warn,
         )
 
     def warn(self, key: str, reason: str) -> None:
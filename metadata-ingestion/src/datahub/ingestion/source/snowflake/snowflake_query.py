@@ -1,11 +1,21 @@
 from typing import Optional
 
 
+def lineage_sort_key(qualified_name: str) -> str:
+    # Lineage is ordered like the lowercase dataset identifiers it is looked up by,
+    # so that SnowflakeLineageExtractor can read it while the schemas are processed.
+    return f"LOWER(REPLACE({qualified_name}, '\"', ''))"
+
+
 class SnowflakeQuery:
     @staticmethod
     def current_version() -> str:
         return "select CURRENT_VERSION()"
 
+    @staticmethod
+    def current_timestamp() -> str:
+        return "select CURRENT_TIMESTAMP()"
+
     @staticmethod
     def current_role() -> str:
         return "select CURRENT_ROLE()"
@@ -242,24 +252,46 @@ class SnowflakeQuery:
             AND w.value:"objectName" NOT LIKE '%.GE_TMP_%'
             AND w.value:"objectName" NOT LIKE '%.GE_TEMP_%'
             AND t.query_start_time >= to_timestamp_ltz({start_time_millis}, 3)
-            AND t.query_start_time < to_timestamp_ltz({end_time_millis}, 3))
-        SELECT
-        upstream_table_name AS "UPSTREAM_TABLE_NAME",
-        downstream_table_name AS "DOWNSTREAM_TABLE_NAME",
-        upstream_table_columns AS "UPSTREAM_TABLE_COLUMNS",
-        downstream_table_columns AS "DOWNSTREAM_TABLE_COLUMNS"
-        FROM table_lineage_history
-        WHERE upstream_table_domain in ('Table', 'External table') and downstream_table_domain = 'Table'
-        QUALIFY ROW_NUMBER() OVER (
-            PARTITION BY downstream_table_name,
-            upstream_table_name,
-            downstream_table_columns
-            ORDER BY query_start_time DESC
-        ) = 1"""
+            AND t.query_start_time < to_timestamp_ltz({end_time_millis}, 3)),
+        latest_table_lineage AS (
+            SELECT
+                upstream_table_name,
+                downstream_table_name,
+                downstream_table_columns
+            FROM table_lineage_history
+            WHERE upstream_table_domain in ('Table', 'External table') and downstream_table_domain = 'Table'
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY downstream_table_name,
+                upstream_table_name,
+                downstream_table_columns
+                ORDER BY query_start_time DESC
+            ) = 1),
+        upstream_tables AS (
+            SELECT DISTINCT downstream_table_name, upstream_table_name
+            FROM latest_table_lineage),
+        column_lineage AS (
+            SELECT DISTINCT
+                downstream_table_name,
+                c.value:"columnName"::varchar AS column_name,
+                c.value:"directSourceColumns" AS direct_source_columns
+            FROM latest_table_lineage l,
+                lateral flatten(input => l.downstream_table_columns) c
+            WHERE c.value:"directSourceColumns" IS NOT NULL)
+        SELECT * FROM (
+            SELECT
+            downstream_table_name AS "DOWNSTREAM_TABLE_NAME",
+            upstream_table_name AS "UPSTREAM_TABLE_NAME",
+            NULL::varchar AS "COLUMN_NAME",
+            NULL::variant AS "DIRECT_SOURCE_COLUMNS"
+            FROM upstream_tables
+            UNION ALL
+            SELECT downstream_table_name, NULL, column_name, direct_source_columns
+            FROM column_lineage)
+        ORDER BY {lineage_sort_key('"DOWNSTREAM_TABLE_NAME"')}"""
 
     @staticmethod
     def view_dependencies() -> str:
-        return """
+        return f"""
         SELECT
           concat(
             referenced_database, '.', referenced_schema,
@@ -275,6 +307,8 @@ class SnowflakeQuery:
           snowflake.account_usage.object_dependencies
         WHERE
           referencing_object_domain in ('VIEW', 'MATERIALIZED VIEW')
+        ORDER BY
+          {lineage_sort_key("concat(referencing_database, '.', referencing_schema, '.', referencing_object_name)")}
         """
 
     @staticmethod
@@ -305,25 +339,73 @@ class SnowflakeQuery:
             AND w.value : "objectName" NOT LIKE '%.GE_TEMP_%'
             AND t.query_start_time >= to_timestamp_ltz({start_time_millis}, 3)
             AND t.query_start_time < to_timestamp_ltz({end_time_millis}, 3)
+        ),
+        latest_view_lineage AS (
+          SELECT
+            view_name,
+            view_domain,
+            downstream_table_name,
+            downstream_table_domain,
+            downstream_table_columns
+          FROM
+            view_lineage_history
+          WHERE
+            view_domain in ('View', 'Materialized view')
+            QUALIFY ROW_NUMBER() OVER (
+              PARTITION BY view_name,
+              downstream_table_name,
+              downstream_table_columns
+              ORDER BY
+                query_start_time DESC
+            ) = 1
+        ),
+        upstream_views AS (
+          SELECT DISTINCT
+            downstream_table_name,
+            downstream_table_domain,
+            view_name,
+            view_domain
+          FROM
+            latest_view_lineage
+        ),
+        column_lineage AS (
+          SELECT DISTINCT
+            downstream_table_name,
+            downstream_table_domain,
+            c.value : "columnName"::varchar AS column_name,
+            c.value : "directSourceColumns" AS direct_source_columns
+          FROM
+            latest_view_lineage l,
+            lateral flatten(input => l.downstream_table_columns) c
+          WHERE
+            c.value : "directSourceColumns" IS NOT NULL
         )
         SELECT
-          view_name AS "VIEW_NAME",
-          view_domain AS "VIEW_DOMAIN",
-          view_columns AS "VIEW_COLUMNS",
-          downstream_table_name AS "DOWNSTREAM_TABLE_NAME",
-          downstream_table_domain AS "DOWNSTREAM_TABLE_DOMAIN",
-          downstream_table_columns AS "DOWNSTREAM_TABLE_COLUMNS"
+          *
         FROM
-          view_lineage_history
-        WHERE
-          view_domain in ('View', 'Materialized view')
-          QUALIFY ROW_NUMBER() OVER (
-            PARTITION BY view_name,
-            downstream_table_name,
-            downstream_table_columns
-            ORDER BY
-              query_start_time DESC
-          ) = 1
+          (
+            SELECT
+              downstream_table_name AS "DOWNSTREAM_TABLE_NAME",
+              downstream_table_domain AS "DOWNSTREAM_TABLE_DOMAIN",
+              view_name AS "VIEW_NAME",
+              view_domain AS "VIEW_DOMAIN",
+              NULL::varchar AS "COLUMN_NAME",
+              NULL::variant AS "DIRECT_SOURCE_COLUMNS"
+            FROM
+              upstream_views
+            UNION ALL
+            SELECT
+              downstream_table_name,
+              downstream_table_domain,
+              NULL,
+              NULL,
+              column_name,
+              direct_source_columns
+            FROM
+              column_lineage
+          )
+        ORDER BY
+          {lineage_sort_key('"DOWNSTREAM_TABLE_NAME"')}
         """
 
     @staticmethod
@@ -356,7 +438,8 @@ class SnowflakeQuery:
         downstream_table_columns AS "DOWNSTREAM_TABLE_COLUMNS"
         FROM external_table_lineage_history
         WHERE downstream_table_domain = 'Table'
-        QUALIFY ROW_NUMBER() OVER (PARTITION BY downstream_table_name ORDER BY query_start_time DESC) = 1"""
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY downstream_table_name ORDER BY query_start_time DESC) = 1
+        ORDER BY {lineage_sort_key("downstream_table_name")}"""
 
     @staticmethod
     def get_access_history_date_range() -> str:
@@ -26,6 +26,10 @@ class SnowflakeV2Report(SnowflakeReport, SnowflakeUsageReport):
 
     rows_zero_objects_modified: int = 0
 
+    # Tables whose schema metadata was not emitted again in an incremental run,
+    # because they weren't altered since the last successful run.
+    num_tables_unchanged_since_last_run: int = 0
+
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
         Entity could be a view or a table or a schema or a database
@@ -82,6 +82,11 @@ class SnowflakeDataDictionary(SnowflakeQueryMixin):
     def __init__(self) -> None:
         self.logger = logger
 
+    def get_current_timestamp(self, conn: SnowflakeConnection) -> Optional[datetime]:
+        for row in self.query(conn, SnowflakeQuery.current_timestamp()):
+            return row["CURRENT_TIMESTAMP()"]
+        return None
+
     def get_databases(self, conn: SnowflakeConnection) -> List[SnowflakeDatabase]:
 
         databases: List[SnowflakeDatabase] = []
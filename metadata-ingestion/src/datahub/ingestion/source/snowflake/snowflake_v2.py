@@ -1,11 +1,17 @@
+import collections
+import hashlib
 import json
 import logging
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import pydantic
 from snowflake.connector import SnowflakeConnection
 
+from datahub import __version__
 from datahub.emitter.mce_builder import (
     make_data_platform_urn,
     make_dataplatform_instance_urn,
@@ -65,6 +71,9 @@ from datahub.ingestion.source.snowflake.snowflake_utils import (
     SnowflakeQueryMixin,
 )
 from datahub.ingestion.source.sql.sql_common import SqlContainerSubTypes
+from datahub.ingestion.source.state.incremental_schema_handler import (
+    IncrementalSchemaHandler,
+)
 from datahub.ingestion.source.state.redundant_run_skip_handler import (
     RedundantRunSkipHandler,
 )
@@ -105,6 +114,26 @@ from datahub.utilities.time import datetime_to_ts_millis
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The config that affects which schema metadata is emitted. If any of it, or the
+# version of datahub, changed since the last successful run, an incremental run
+# extracts all schemas again.
+_INCREMENTAL_SCHEMA_CONFIG_FIELDS = {
+    "database_pattern",
+    "schema_pattern",
+    "table_pattern",
+    "view_pattern",
+    "include_tables",
+    "include_views",
+    "include_table_lineage",
+    "include_view_lineage",
+    "platform_instance",
+    "env",
+    "convert_urns_to_lowercase",
+    "domain",
+    "profiling",
+    "profile_pattern",
+}
+
 # https://docs.snowflake.com/en/sql-reference/intro-summary-data-types.html
 SNOWFLAKE_FIELD_TYPE_MAPPINGS = {
     "DATE": DateType,
@@ -144,6 +173,14 @@ SNOWFLAKE_FIELD_TYPE_MAPPINGS = {
 }
 
 
+@dataclass
+class _FetchedSchema:
+    columns: Optional[Dict[str, List[SnowflakeColumn]]] = None
+    fetched_columns: bool = False
+    pk_constraints: Optional[Dict[str, SnowflakePK]] = None
+    fk_constraints: Optional[Dict[str, List[SnowflakeFK]]] = None
+
+
 @platform_name("Snowflake", doc_order=1)
 @config_class(SnowflakeV2Config)
 @support_status(SupportStatus.CERTIFIED)
@@ -200,6 +237,30 @@ class SnowflakeV2Source(
             run_id=self.ctx.run_id,
         )
 
+        incremental_schema_extraction = self.config.incremental_schema_extraction
+        if (
+            incremental_schema_extraction
+            and self.ctx.pipeline_config
+            and self.ctx.pipeline_config.transformers
+        ):
+            # Transformers only see the aspects that are emitted, so they would
+            # silently stop applying to the tables that are not emitted again.
+            self.warn(
+                self.logger,
+                "incremental-schema-extraction",
+                "incremental_schema_extraction is not supported together with transformers, extracting all schemas",
+            )
+            incremental_schema_extraction = False
+        self.incremental_schema_handler = IncrementalSchemaHandler(
+            source=self,
+            config=self.config,
+            pipeline_name=self.ctx.pipeline_name,
+            run_id=self.ctx.run_id,
+            enabled=incremental_schema_extraction,
+        )
+        # Tables that were not altered since this time are not emitted again.
+        self.last_schema_extraction_time: Optional[datetime] = None
+
         if self.config.domain:
             self.domain_registry = DomainRegistry(
                 cached_domains=[k for k in self.config.domain], graph=self.ctx.graph
@@ -236,6 +297,9 @@ class SnowflakeV2Source(
             Tuple[str, str], Dict[str, List[SnowflakeFK]]
         ] = {}
 
+        # The connections of the worker threads that get the metadata of schemas.
+        self.connection_pool: "queue.Queue[SnowflakeConnection]" = queue.Queue()
+
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Source":
         config = SnowflakeV2Config.parse_obj(config_dict)
@@ -431,6 +495,17 @@ class SnowflakeV2Source(
 
         self.report.include_technical_schema = self.config.include_technical_schema
         if self.config.include_technical_schema:
+            extraction_start_time = self.get_schema_extraction_start_time(conn)
+            config_fingerprint = self.get_incremental_schema_config_fingerprint()
+            self.last_schema_extraction_time = (
+                self.incremental_schema_handler.get_last_extraction_time(
+                    config_fingerprint
+                )
+            )
+            # Set to False if some schema metadata couldn't be extracted, in which
+            # case the next run can't skip unchanged tables.
+            self.schema_extraction_complete = True
+
             databases: List[SnowflakeDatabase] = self.data_dictionary.get_databases(
                 conn
             )
@@ -444,6 +519,14 @@ class SnowflakeV2Source(
                 yield from self._process_database(conn, snowflake_db)
 
             conn.close()
+            while not self.connection_pool.empty():
+                self.connection_pool.get().close()
+
+            if self.schema_extraction_complete and extraction_start_time is not None:
+                self.incremental_schema_handler.update_state(
+                    extraction_time_millis=datetime_to_ts_millis(extraction_start_time),
+                    config_fingerprint=config_fingerprint,
+                )
             # Emit Stale entity workunits
             yield from self.stale_entity_removal_handler.gen_removed_entity_workunits()
 
@@ -479,14 +562,14 @@ class SnowflakeV2Source(
                 conn, db_name
             )
         except Exception as e:
-            self.warn(
-                self.logger,
+            self.warn_schema_extraction_failure(
                 db_name,
                 f"unable to get metadata information for database {db_name} due to an error -> {e}",
             )
             self.report.report_dropped(f"{db_name}.*")
             return
 
+        schemas: List[SnowflakeSchema] = []
         for snowflake_schema in snowflake_db.schemas:
 
             self.report.report_entity_scanned(snowflake_schema.name, "schema")
@@ -495,7 +578,179 @@ class SnowflakeV2Source(
                 self.report.report_dropped(f"{db_name}.{snowflake_schema.name}.*")
                 continue
 
-            yield from self._process_schema(conn, snowflake_schema, db_name)
+            schemas.append(snowflake_schema)
+
+        if self.config.max_metadata_extraction_workers == 1:
+            for snowflake_schema in schemas:
+                yield from self._process_schema(conn, snowflake_schema, db_name)
+        else:
+            yield from self._process_schemas_concurrently(conn, schemas, db_name)
+
+    def _process_schemas_concurrently(
+        self,
+        conn: SnowflakeConnection,
+        schemas: List[SnowflakeSchema],
+        db_name: str,
+    ) -> Iterable[MetadataWorkUnit]:
+        # The columns and constraints of the next few schemas are queried by the
+        # worker threads, while the workunits of the schemas are generated here in
+        # order. Only this thread updates the state of the source and the report.
+        max_workers = self.config.max_metadata_extraction_workers
+        while self.connection_pool.qsize() < max_workers:
+            self.connection_pool.put(self.config.get_connection())
+
+        futures: Deque[
+            Tuple[SnowflakeSchema, "Future[_FetchedSchema]"]
+        ] = collections.deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for snowflake_schema in schemas:
+                self._get_tables_and_views(conn, snowflake_schema, db_name)
+                fetch_columns, fetch_constraints = self._get_metadata_to_fetch(
+                    snowflake_schema, db_name
+                )
+                futures.append(
+                    (
+                        snowflake_schema,
+                        executor.submit(
+                            self._fetch_schema_metadata,
+                            snowflake_schema.name,
+                            db_name,
+                            fetch_columns,
+                            fetch_constraints,
+                        ),
+                    )
+                )
+                if len(futures) >= 2 * max_workers:
+                    yield from self._process_fetched_schema(
+                        conn, db_name, *futures.popleft()
+                    )
+
+            while futures:
+                yield from self._process_fetched_schema(
+                    conn, db_name, *futures.popleft()
+                )
+
+    def _process_fetched_schema(
+        self,
+        conn: SnowflakeConnection,
+        db_name: str,
+        snowflake_schema: SnowflakeSchema,
+        future: "Future[_FetchedSchema]",
+    ) -> Iterable[MetadataWorkUnit]:
+        schema_name = snowflake_schema.name
+        try:
+            fetched = future.result()
+        except Exception as e:
+            # The metadata is queried again on the main connection when needed.
+            self.warn_schema_extraction_failure(
+                f"{db_name}.{schema_name}",
+                f"unable to get columns and constraints for schema {db_name}.{schema_name} concurrently, retrying -> {e}",
+            )
+        else:
+            if fetched.fetched_columns:
+                self.schema_columns[(db_name, schema_name)] = fetched.columns
+                if fetched.columns is None:
+                    self.report.num_get_columns_for_table_queries += 1
+            if fetched.pk_constraints is not None:
+                self.schema_pk_constraints[
+                    (db_name, schema_name)
+                ] = fetched.pk_constraints
+            if fetched.fk_constraints is not None:
+                self.schema_fk_constraints[
+                    (db_name, schema_name)
+                ] = fetched.fk_constraints
+
+        yield from self._process_schema(conn, snowflake_schema, db_name)
+
+    def _fetch_schema_metadata(
+        self,
+        schema_name: str,
+        db_name: str,
+        fetch_columns: bool,
+        fetch_constraints: bool,
+    ) -> _FetchedSchema:
+        """
+        Gets the columns and constraints of a schema on a connection of the pool. This
+        runs on the worker threads, so it must not modify the state of the source or
+        the report.
+        """
+        fetched = _FetchedSchema()
+        conn = self.connection_pool.get()
+        try:
+            if fetch_columns:
+                fetched.columns = self.data_dictionary.get_columns_for_schema(
+                    conn, schema_name, db_name
+                )
+                fetched.fetched_columns = True
+            if fetch_constraints:
+                fetched.pk_constraints = (
+                    self.data_dictionary.get_pk_constraints_for_schema(
+                        conn, schema_name, db_name
+                    )
+                )
+                fetched.fk_constraints = (
+                    self.data_dictionary.get_fk_constraints_for_schema(
+                        conn, schema_name, db_name
+                    )
+                )
+        finally:
+            self.connection_pool.put(conn)
+        return fetched
+
+    def _get_metadata_to_fetch(
+        self, snowflake_schema: SnowflakeSchema, db_name: str
+    ) -> Tuple[bool, bool]:
+        """
+        Returns whether the columns and the constraints of a schema are needed, which
+        is only the case if any of its tables or views will be emitted or profiled.
+        """
+        schema_name = snowflake_schema.name
+        allowed_tables = (
+            [
+                table
+                for table in snowflake_schema.tables
+                if self.config.table_pattern.allowed(
+                    self.get_dataset_identifier(table.name, schema_name, db_name)
+                )
+            ]
+            if self.config.include_tables
+            else []
+        )
+        tables_to_emit = any(
+            not self.is_table_unchanged(table) for table in allowed_tables
+        )
+        tables_to_profile = any(
+            self.may_be_profiled(table, schema_name, db_name)
+            for table in allowed_tables
+        )
+        views_to_emit = self.config.include_views and any(
+            self.config.view_pattern.allowed(
+                self.get_dataset_identifier(view.name, schema_name, db_name)
+            )
+            for view in snowflake_schema.views
+        )
+        return tables_to_emit or tables_to_profile or views_to_emit, tables_to_emit
+
+    def _get_tables_and_views(
+        self, conn: SnowflakeConnection, snowflake_schema: SnowflakeSchema, db_name: str
+    ) -> None:
+        try:
+            if self.config.include_tables:
+                snowflake_schema.tables = self.get_tables_for_schema(
+                    conn, snowflake_schema.name, db_name
+                )
+            if self.config.include_views:
+                snowflake_schema.views = self.get_views_for_schema(
+                    conn, snowflake_schema.name, db_name
+                )
+        except Exception as e:
+            self.warn_schema_extraction_failure(
+                f"{db_name}.{snowflake_schema.name}",
+                f"unable to get tables and views for schema {db_name}.{snowflake_schema.name} due to an error -> {e}",
+            )
+            self.report.report_dropped(f"{db_name}.{snowflake_schema.name}.*")
+            snowflake_schema.tables = []
+            snowflake_schema.views = []
 
     def _process_schema(
         self, conn: SnowflakeConnection, snowflake_schema: SnowflakeSchema, db_name: str
@@ -503,22 +758,23 @@ class SnowflakeV2Source(
         schema_name = snowflake_schema.name
         yield from self.gen_schema_containers(snowflake_schema, db_name)
 
-        if self.config.include_tables:
-            snowflake_schema.tables = self.get_tables_for_schema(
-                conn, schema_name, db_name
-            )
+        if self.config.max_metadata_extraction_workers == 1:
+            self._get_tables_and_views(conn, snowflake_schema, db_name)
 
+        if self.config.include_tables:
             for table in snowflake_schema.tables:
                 yield from self._process_table(conn, table, schema_name, db_name)
 
         if self.config.include_views:
-            snowflake_schema.views = self.get_views_for_schema(
-                conn, schema_name, db_name
-            )
-
             for view in snowflake_schema.views:
                 yield from self._process_view(conn, view, schema_name, db_name)
 
+        # The columns and constraints are only needed for the schema metadata of
+        # this schema's tables and views.
+        self.schema_columns.pop((db_name, schema_name), None)
+        self.schema_pk_constraints.pop((db_name, schema_name), None)
+        self.schema_fk_constraints.pop((db_name, schema_name), None)
+
     def _process_table(
         self,
         conn: SnowflakeConnection,
@@ -534,15 +790,36 @@ class SnowflakeV2Source(
             self.report.report_dropped(table_identifier)
             return
 
-        table.columns = self.get_columns_for_table(
-            conn, table.name, schema_name, db_name
-        )
-        table.pk = self.get_pk_constraints_for_table(
-            conn, table.name, schema_name, db_name
-        )
-        table.foreign_keys = self.get_fk_constraints_for_table(
-            conn, table.name, schema_name, db_name
-        )
+        try:
+            if self.is_table_unchanged(table):
+                # The profiler skips tables without columns.
+                if self.may_be_profiled(table, schema_name, db_name):
+                    table.columns = self.get_columns_for_table(
+                        conn, table.name, schema_name, db_name
+                    )
+            else:
+                table.columns = self.get_columns_for_table(
+                    conn, table.name, schema_name, db_name
+                )
+                table.pk = self.get_pk_constraints_for_table(
+                    conn, table.name, schema_name, db_name
+                )
+                table.foreign_keys = self.get_fk_constraints_for_table(
+                    conn, table.name, schema_name, db_name
+                )
+        except Exception as e:
+            self.warn_schema_extraction_failure(
+                table_identifier,
+                f"unable to get columns and constraints for table {table_identifier} due to an error -> {e}",
+            )
+            self.report.report_dropped(table_identifier)
+            return
+
+        if self.is_table_unchanged(table):
+            self.report.num_tables_unchanged_since_last_run += 1
+            yield from self.gen_unchanged_table_workunits(table, schema_name, db_name)
+            return
+
         dataset_name = self.get_dataset_identifier(table.name, schema_name, db_name)
 
         lineage_info = None
@@ -568,12 +845,99 @@ class SnowflakeV2Source(
             self.report.report_dropped(view_name)
             return
 
-        view.columns = self.get_columns_for_table(conn, view.name, schema_name, db_name)
+        try:
+            view.columns = self.get_columns_for_table(
+                conn, view.name, schema_name, db_name
+            )
+        except Exception as e:
+            self.warn_schema_extraction_failure(
+                view_name,
+                f"unable to get columns for view {view_name} due to an error -> {e}",
+            )
+            self.report.report_dropped(view_name)
+            return
         lineage_info = None
         if self.config.include_view_lineage:
             lineage_info = self.lineage_extractor._get_upstream_lineage_info(view_name)
         yield from self.gen_dataset_workunits(view, schema_name, db_name, lineage_info)
 
+    def get_schema_extraction_start_time(
+        self, conn: SnowflakeConnection
+    ) -> Optional[datetime]:
+        # Tables are compared by LAST_ALTERED, so the time is taken from the
+        # Snowflake clock rather than from the local one, which may be ahead of it.
+        if not self.incremental_schema_handler.is_checkpointing_enabled():
+            return None
+        try:
+            current_timestamp = self.data_dictionary.get_current_timestamp(conn)
+        except Exception as e:
+            self.warn(
+                self.logger,
+                "incremental-schema-extraction",
+                f"unable to get the current time from Snowflake, the next run will extract all schemas -> {e}",
+            )
+            return None
+        if current_timestamp is not None and current_timestamp.tzinfo is None:
+            current_timestamp = current_timestamp.replace(tzinfo=timezone.utc)
+        return current_timestamp
+
+    def warn_schema_extraction_failure(self, key: str, reason: str) -> None:
+        # The tables whose metadata couldn't be extracted must not be skipped as
+        # unchanged by the next run.
+        self.warn(self.logger, key, reason)
+        self.schema_extraction_complete = False
+
+    def may_be_profiled(
+        self, table: SnowflakeTable, schema_name: str, db_name: str
+    ) -> bool:
+        return self.config.profiling.enabled and self.config.profile_pattern.allowed(
+            self.get_dataset_identifier(table.name, schema_name, db_name)
+        )
+
+    def is_table_unchanged(self, table: SnowflakeTable) -> bool:
+        if self.last_schema_extraction_time is None or table.last_altered is None:
+            return False
+        last_altered = table.last_altered
+        if last_altered.tzinfo is None:
+            last_altered = last_altered.replace(tzinfo=timezone.utc)
+        return last_altered < self.last_schema_extraction_time
+
+    def gen_unchanged_table_workunits(
+        self, table: SnowflakeTable, schema_name: str, db_name: str
+    ) -> Iterable[MetadataWorkUnit]:
+        dataset_name = self.get_dataset_identifier(table.name, schema_name, db_name)
+        dataset_urn = make_dataset_urn_with_platform_instance(
+            self.platform,
+            dataset_name,
+            self.config.platform_instance,
+            self.config.env,
+        )
+        # The table is still part of this run, so it must not be removed as stale.
+        self.stale_entity_removal_handler.add_entity_to_state(
+            type="table", urn=dataset_urn
+        )
+
+        # Lineage can change without the table being altered.
+        if self.config.include_table_lineage:
+            lineage_info = self.lineage_extractor._get_upstream_lineage_info(
+                dataset_name
+            )
+            if lineage_info is not None:
+                yield self.wrap_aspect_as_workunit(
+                    "dataset", dataset_urn, "upstreamLineage", lineage_info[0]
+                )
+
+    def get_incremental_schema_config_fingerprint(self) -> str:
+        # Newer versions may emit the schema metadata differently.
+        return hashlib.sha256(
+            (
+                self.config.json(
+                    include=_INCREMENTAL_SCHEMA_CONFIG_FIELDS, sort_keys=True
+                )
+                + __version__
+            ).encode()
+        ).hexdigest()
+
     def gen_dataset_workunits(
         self,
         table: Union[SnowflakeTable, SnowflakeView],
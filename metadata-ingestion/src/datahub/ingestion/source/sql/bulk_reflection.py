@@ -0,0 +1,673 @@
+import inspect
+import logging
+import re
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import exc, text
+from sqlalchemy.dialects.mysql.reflection import ReflectedState
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.sql import sqltypes as types
+
+logger = logging.getLogger(__name__)
+
+# Maps each table to its columns, in the format of Inspector.get_columns. Tables
+# with columns whose types could not be resolved map to None.
+SchemaColumns = Dict[str, Optional[List[dict]]]
+
+
+def _accepted_kwargs(func: Callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the keyword arguments that func accepts, which differ between types
+    and between SQLAlchemy versions."""
+    parameters = inspect.signature(func).parameters
+    if any(p.kind == p.VAR_KEYWORD for p in parameters.values()):
+        return kwargs
+    return {key: value for key, value in kwargs.items() if key in parameters}
+
+
+def _to_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+class BulkReflector:
+    """
+    Loads the metadata of all the tables and views in a schema with a few set-based
+    catalog queries, instead of the per-table queries of the Inspector methods.
+
+    Each method returns a dict keyed by table name, in the format of the
+    corresponding Inspector method, or None if the dialect does not support loading
+    that kind of metadata in bulk.
+    """
+
+    def __init__(self, inspector: Inspector):
+        self.inspector = inspector
+        self.dialect = inspector.dialect
+
+    def _execute(self, query: str, **params: Any) -> List["_Row"]:
+        # Use a separate connection, so that a failing query cannot affect the
+        # transaction of the inspector's connection.
+        with self.inspector.engine.connect() as conn:
+            return [_Row(row) for row in conn.execute(text(query), **params)]
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        # Builds the type from the information_schema columns like the MSSQL
+        # inspector does. Dialects whose inspector parses the full type of the
+        # column override this, so that the types match those of the inspector.
+        type_class = self.dialect.ischema_names.get(row.data_type)
+        if type_class is None:
+            return None
+        kwargs: Dict[str, Any] = {}
+        if issubclass(type_class, types.String) and row.column_length:
+            kwargs["length"] = int(row.column_length)
+        elif issubclass(type_class, types.Numeric):
+            kwargs["precision"] = _to_int(row.column_precision)
+            # Floats do not have a scale.
+            if not issubclass(type_class, types.Float):
+                kwargs["scale"] = _to_int(row.column_scale)
+        return type_class(**_accepted_kwargs(type_class, kwargs))
+
+    def _make_column(self, row: "_Row") -> Optional[dict]:
+        column_type = self._resolve_type(row)
+        if column_type is None:
+            return None
+        return {
+            "name": row.column_name,
+            "type": column_type,
+            "nullable": row.is_nullable in ("YES", "Y"),
+            "default": row.column_default,
+            "comment": row.column_comment,
+        }
+
+    def _group_columns(self, rows: List["_Row"]) -> SchemaColumns:
+        columns: SchemaColumns = {}
+        for row in rows:
+            table_columns = columns.setdefault(row.table_name, [])
+            if table_columns is None:
+                continue
+            try:
+                column = self._make_column(row)
+            except Exception as e:
+                logger.debug(
+                    f"Unable to resolve type {row.data_type} of {row.table_name}.{row.column_name}: {e}"
+                )
+                columns[row.table_name] = None
+                continue
+            if column is None:
+                logger.debug(
+                    f"Unable to resolve type {row.data_type} of {row.table_name}.{row.column_name}"
+                )
+                columns[row.table_name] = None
+            else:
+                table_columns.append(column)
+        return columns
+
+    def get_columns(self, schema: str) -> Optional[SchemaColumns]:
+        return None
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        return None
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        return None
+
+    def get_table_comments(self, schema: str) -> Optional[Dict[str, dict]]:
+        return None
+
+    @staticmethod
+    def _group_pk_constraints(rows: List["_Row"]) -> Dict[str, dict]:
+        pk_constraints: Dict[str, dict] = {}
+        for row in rows:
+            pk_constraint = pk_constraints.setdefault(
+                row.table_name,
+                {"constrained_columns": [], "name": row.constraint_name},
+            )
+            pk_constraint["constrained_columns"].append(row.column_name)
+        return pk_constraints
+
+    @staticmethod
+    def _group_foreign_keys(rows: List["_Row"]) -> Dict[str, List[dict]]:
+        foreign_keys: Dict[str, Dict[str, dict]] = {}
+        for row in rows:
+            foreign_key = foreign_keys.setdefault(row.table_name, {}).setdefault(
+                row.constraint_name,
+                {
+                    "name": row.constraint_name,
+                    "constrained_columns": [],
+                    "referred_schema": row.referred_schema,
+                    "referred_table": row.referred_table,
+                    "referred_columns": [],
+                    "options": {},
+                },
+            )
+            foreign_key["constrained_columns"].append(row.column_name)
+            foreign_key["referred_columns"].append(row.referred_column)
+        return {table: list(fks.values()) for table, fks in foreign_keys.items()}
+
+    @staticmethod
+    def _group_table_comments(rows: List["_Row"]) -> Dict[str, dict]:
+        return {row.table_name: {"text": row.table_comment} for row in rows}
+
+
+class _InformationSchemaReflector(BulkReflector):
+    # The column comment, which is not part of the standard information_schema.
+    column_comment = "NULL"
+    # The full type of the column, including its parameters, for dialects whose
+    # inspector parses it.
+    column_type = "NULL"
+
+    def get_columns(self, schema: str) -> Optional[SchemaColumns]:
+        return self._group_columns(
+            self._execute(
+                f"""
+                SELECT c.table_name, c.column_name, c.data_type, c.is_nullable,
+                    c.column_default, c.character_maximum_length AS column_length,
+                    c.numeric_precision AS column_precision,
+                    c.numeric_scale AS column_scale,
+                    {self.column_type} AS column_type,
+                    {self.column_comment} AS column_comment
+                FROM information_schema.columns c
+                WHERE c.table_schema = :schema
+                ORDER BY c.table_name, c.ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        return self._group_pk_constraints(
+            self._execute(
+                """
+                SELECT tc.table_name, tc.constraint_name, kcu.column_name
+                FROM information_schema.table_constraints tc
+                JOIN information_schema.key_column_usage kcu
+                    ON kcu.constraint_schema = tc.constraint_schema
+                    AND kcu.constraint_name = tc.constraint_name
+                    AND kcu.table_name = tc.table_name
+                WHERE tc.constraint_type = 'PRIMARY KEY' AND tc.table_schema = :schema
+                ORDER BY tc.table_name, kcu.ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+
+# The oid of the table of an information_schema.columns row in Postgres.
+_PG_TABLE_OID = (
+    "(quote_ident(c.table_schema) || '.' || quote_ident(c.table_name))::regclass"
+)
+
+
+class PostgresBulkReflector(_InformationSchemaReflector):
+    # Note that ordinal_position is the attnum of the column in Postgres.
+    column_comment = f"pg_catalog.col_description({_PG_TABLE_OID}, c.ordinal_position)"
+    column_type = (
+        "(SELECT pg_catalog.format_type(a.atttypid, a.atttypmod)"
+        " FROM pg_catalog.pg_attribute a"
+        f" WHERE a.attrelid = {_PG_TABLE_OID} AND a.attnum = c.ordinal_position)"
+    )
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        # Parse the type like the inspector does. Enums and domains are not loaded,
+        # so those resolve to NullType and fall back to the inspector.
+        kwargs = dict(
+            name=row.column_name,
+            format_type=row.column_type,
+            default=row.column_default,
+            notnull=row.is_nullable == "NO",
+            domains={},
+            enums={},
+            schema=None,
+            comment=row.column_comment,
+            generated="",
+            identity=None,
+        )
+        get_column_info = self.dialect._get_column_info
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", exc.SAWarning)
+            column_type = get_column_info(**_accepted_kwargs(get_column_info, kwargs))[
+                "type"
+            ]
+        return None if isinstance(column_type, types.NullType) else column_type
+
+    # The constraints are read from pg_catalog, since information_schema only shows
+    # them to the owner of the table and to roles with privileges beyond SELECT.
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        return self._group_pk_constraints(
+            self._execute(
+                """
+                SELECT c.relname AS table_name, con.conname AS constraint_name,
+                    a.attname AS column_name
+                FROM pg_catalog.pg_constraint con
+                JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                CROSS JOIN LATERAL unnest(con.conkey)
+                    WITH ORDINALITY AS k(attnum, position)
+                JOIN pg_catalog.pg_attribute a
+                    ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                WHERE con.contype = 'p' AND n.nspname = :schema
+                ORDER BY c.relname, k.position
+                """,
+                schema=schema,
+            )
+        )
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        return self._group_foreign_keys(
+            self._execute(
+                """
+                SELECT c.relname AS table_name, con.conname AS constraint_name,
+                    a.attname AS column_name, rn.nspname AS referred_schema,
+                    rc.relname AS referred_table, ra.attname AS referred_column
+                FROM pg_catalog.pg_constraint con
+                JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+                JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+                CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+                    WITH ORDINALITY AS k(attnum, referred_attnum, position)
+                JOIN pg_catalog.pg_attribute a
+                    ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+                JOIN pg_catalog.pg_attribute ra
+                    ON ra.attrelid = con.confrelid AND ra.attnum = k.referred_attnum
+                WHERE con.contype = 'f' AND n.nspname = :schema
+                ORDER BY c.relname, con.conname, k.position
+                """,
+                schema=schema,
+            )
+        )
+
+    def get_table_comments(self, schema: str) -> Optional[Dict[str, dict]]:
+        return self._group_table_comments(
+            self._execute(
+                """
+                SELECT c.relname AS table_name,
+                    pg_catalog.obj_description(c.oid, 'pg_class') AS table_comment
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+                """,
+                schema=schema,
+            )
+        )
+
+
+class MySQLBulkReflector(_InformationSchemaReflector):
+    column_comment = "NULLIF(c.column_comment, '')"
+    column_type = "c.column_type"
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        # Parse the type like the inspector parses the column definitions of SHOW
+        # CREATE TABLE, which keeps options like the display width and unsigned.
+        line = "  {} {}".format(
+            self.dialect.identifier_preparer.quote_identifier(row.column_name),
+            row.column_type,
+        )
+        state = ReflectedState()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", exc.SAWarning)
+            self.dialect._tabledef_parser._parse_column(line, state)
+        if not state.columns:
+            return None
+        column_type = state.columns[0]["type"]
+        return None if isinstance(column_type, types.NullType) else column_type
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        # The inspector does not name primary keys, which are all named PRIMARY.
+        return self._group_pk_constraints(
+            self._execute(
+                """
+                SELECT table_name, NULL AS constraint_name, column_name
+                FROM information_schema.key_column_usage
+                WHERE constraint_name = 'PRIMARY' AND table_schema = :schema
+                ORDER BY table_name, ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        return self._group_foreign_keys(
+            self._execute(
+                """
+                SELECT table_name, constraint_name, column_name,
+                    referenced_table_schema AS referred_schema,
+                    referenced_table_name AS referred_table,
+                    referenced_column_name AS referred_column
+                FROM information_schema.key_column_usage
+                WHERE referenced_table_name IS NOT NULL AND table_schema = :schema
+                ORDER BY table_name, constraint_name, ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+    def get_table_comments(self, schema: str) -> Optional[Dict[str, dict]]:
+        return self._group_table_comments(
+            self._execute(
+                """
+                SELECT table_name,
+                    CASE WHEN table_type = 'VIEW' THEN NULL
+                        ELSE NULLIF(table_comment, '') END AS table_comment
+                FROM information_schema.tables
+                WHERE table_schema = :schema
+                """,
+                schema=schema,
+            )
+        )
+
+
+class MSSQLBulkReflector(_InformationSchemaReflector):
+    # Column and table descriptions are extended properties, which the mssql source
+    # already fetches separately.
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        if row.column_length == -1:
+            # Columns like varchar(max) have no length.
+            row = row._replace(column_length=None)
+        return super()._resolve_type(row)
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        return self._group_foreign_keys(
+            self._execute(
+                """
+                SELECT kcu.table_name, kcu.constraint_name, kcu.column_name,
+                    ref.table_schema AS referred_schema,
+                    ref.table_name AS referred_table,
+                    ref.column_name AS referred_column
+                FROM information_schema.referential_constraints rc
+                JOIN information_schema.key_column_usage kcu
+                    ON kcu.constraint_schema = rc.constraint_schema
+                    AND kcu.constraint_name = rc.constraint_name
+                JOIN information_schema.key_column_usage ref
+                    ON ref.constraint_schema = rc.unique_constraint_schema
+                    AND ref.constraint_name = rc.unique_constraint_name
+                    AND ref.ordinal_position = kcu.ordinal_position
+                WHERE kcu.table_schema = :schema
+                ORDER BY kcu.table_name, kcu.constraint_name, kcu.ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+
+class OracleBulkReflector(BulkReflector):
+    def _denormalize(self, schema: str) -> str:
+        return self.dialect.denormalize_name(schema)
+
+    def _normalize_rows(self, rows: List["_Row"], *fields: str) -> List["_Row"]:
+        return [
+            row._replace(
+                **{
+                    field: self.dialect.normalize_name(getattr(row, field))
+                    for field in fields
+                }
+            )
+            for row in rows
+        ]
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        # Resolve the type like the inspector does, which returns the type class
+        # rather than an instance for types without parameters.
+        data_type = row.data_type
+        if data_type == "NUMBER":
+            if row.column_precision is None and row.column_scale == 0:
+                return types.INTEGER()
+            return self.dialect.ischema_names["NUMBER"](
+                row.column_precision, row.column_scale
+            )
+        if data_type == "FLOAT":
+            return types.FLOAT()
+        if data_type in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+            return self.dialect.ischema_names[data_type](row.column_length)
+        if "WITH TIME ZONE" in data_type:
+            return types.TIMESTAMP(timezone=True)
+        # Strip the fractional seconds precision, as in TIMESTAMP(6).
+        return self.dialect.ischema_names.get(re.sub(r"\(\d+\)", "", data_type))
+
+    def get_columns(self, schema: str) -> Optional[SchemaColumns]:
+        rows = self._execute(
+            """
+            SELECT c.table_name, c.column_name, c.data_type, c.nullable AS is_nullable,
+                NULL AS column_default, c.char_length AS column_length,
+                c.data_precision AS column_precision, c.data_scale AS column_scale,
+                cc.comments AS column_comment
+            FROM all_tab_columns c
+            LEFT JOIN all_col_comments cc
+                ON cc.owner = c.owner
+                AND cc.table_name = c.table_name
+                AND cc.column_name = c.column_name
+            WHERE c.owner = :owner
+            ORDER BY c.table_name, c.column_id
+            """,
+            owner=self._denormalize(schema),
+        )
+        return self._group_columns(
+            self._normalize_rows(rows, "table_name", "column_name")
+        )
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        rows = self._execute(
+            """
+            SELECT c.table_name, c.constraint_name, cc.column_name
+            FROM all_constraints c
+            JOIN all_cons_columns cc
+                ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+            WHERE c.owner = :owner AND c.constraint_type = 'P'
+            ORDER BY c.table_name, cc.position
+            """,
+            owner=self._denormalize(schema),
+        )
+        return self._group_pk_constraints(
+            self._normalize_rows(
+                rows,
+                "table_name",
+                "constraint_name",
+                "column_name",
+            )
+        )
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        rows = self._execute(
+            """
+            SELECT c.table_name, c.constraint_name, cc.column_name,
+                r.owner AS referred_schema, r.table_name AS referred_table,
+                rc.column_name AS referred_column
+            FROM all_constraints c
+            JOIN all_cons_columns cc
+                ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+            JOIN all_constraints r
+                ON r.owner = c.r_owner AND r.constraint_name = c.r_constraint_name
+            JOIN all_cons_columns rc
+                ON rc.owner = r.owner
+                AND rc.constraint_name = r.constraint_name
+                AND rc.position = cc.position
+            WHERE c.owner = :owner AND c.constraint_type = 'R'
+            ORDER BY c.table_name, c.constraint_name, cc.position
+            """,
+            owner=self._denormalize(schema),
+        )
+        return self._group_foreign_keys(
+            self._normalize_rows(
+                rows,
+                "table_name",
+                "constraint_name",
+                "column_name",
+                "referred_schema",
+                "referred_table",
+                "referred_column",
+            )
+        )
+
+    def get_table_comments(self, schema: str) -> Optional[Dict[str, dict]]:
+        rows = self._execute(
+            """
+            SELECT table_name, comments AS table_comment
+            FROM all_tab_comments
+            WHERE owner = :owner
+            """,
+            owner=self._denormalize(schema),
+        )
+        return self._group_table_comments(self._normalize_rows(rows, "table_name"))
+
+
+class TrinoBulkReflector(_InformationSchemaReflector):
+    # Trino and Presto have no constraints, and the full type, including its
+    # parameters, is in data_type.
+
+    def get_columns(self, schema: str) -> Optional[SchemaColumns]:
+        # The information_schema.columns of Trino and Presto lacks the length,
+        # precision and scale columns, and has the column comment.
+        return self._group_columns(
+            self._execute(
+                """
+                SELECT c.table_name, c.column_name, c.data_type,
+                    UPPER(c.is_nullable) AS is_nullable, c.column_default,
+                    c."comment" AS column_comment
+                FROM information_schema.columns c
+                WHERE c.table_schema = :schema
+                ORDER BY c.table_name, c.ordinal_position
+                """,
+                schema=schema,
+            )
+        )
+
+    def _parse_type(self, data_type: str) -> Optional[types.TypeEngine]:
+        from trino.sqlalchemy.datatype import parse_sqltype
+
+        return parse_sqltype(data_type)
+
+    def _resolve_type(self, row: "_Row") -> Optional[types.TypeEngine]:
+        try:
+            return self._parse_type(row.data_type)
+        except Exception:
+            return None
+
+    def get_pk_constraints(self, schema: str) -> Optional[Dict[str, dict]]:
+        return {}
+
+    def get_foreign_keys(self, schema: str) -> Optional[Dict[str, List[dict]]]:
+        return {}
+
+
+class PrestoBulkReflector(TrinoBulkReflector):
+    def _parse_type(self, data_type: str) -> Optional[types.TypeEngine]:
+        from pyhive.sqlalchemy_presto import _type_map
+
+        match = re.match(r"^(\w+)", data_type)
+        type_class = _type_map.get(match.group(1)) if match else None
+        return type_class() if type_class else None
+
+
+class _Row:
+    """A copy of a result row, with lower-cased keys, since Oracle upper-cases them."""
+
+    def __init__(self, row: Any):
+        self.__dict__.update({key.lower(): value for key, value in row.items()})
+
+    def __getattr__(self, item: str) -> Any:
+        # Only called for missing attributes, and keeps mypy happy about the others.
+        raise AttributeError(item)
+
+    def _replace(self, **kwargs: Any) -> "_Row":
+        return _Row({**self.__dict__, **kwargs})
+
+
+_BULK_REFLECTORS: Dict[str, Type[BulkReflector]] = {
+    "postgresql": PostgresBulkReflector,
+    "mysql": MySQLBulkReflector,
+    "mariadb": MySQLBulkReflector,
+    "mssql": MSSQLBulkReflector,
+    "oracle": OracleBulkReflector,
+    "trino": TrinoBulkReflector,
+    "presto": PrestoBulkReflector,
+}
+
+
+# Maps each Inspector method to the BulkReflector method that loads the same kind of
+# metadata, and to a factory of the value for tables that do not have any.
+_BULK_METHODS: Dict[str, Tuple[str, Callable[[], Any]]] = {
+    "get_columns": ("get_columns", lambda: None),
+    "get_pk_constraint": (
+        "get_pk_constraints",
+        lambda: {"constrained_columns": [], "name": None},
+    ),
+    "get_foreign_keys": ("get_foreign_keys", lambda: []),
+    "get_table_comment": ("get_table_comments", lambda: {"text": None}),
+}
+
+
+def get_bulk_reflector(inspector: Inspector) -> Optional[BulkReflector]:
+    reflector_class = _BULK_REFLECTORS.get(inspector.dialect.name)
+    return reflector_class(inspector) if reflector_class else None
+
+
+class BulkReflectingInspector:
+    """
+    Wraps an Inspector, and answers the per-table reflection calls from metadata that
+    a BulkReflector loads for the whole schema at once.
+
+    Only the metadata of the most recently requested schema is kept. Tables that the
+    bulk queries did not cover, metadata that the reflector cannot load and calls with
+    unusual arguments are passed through to the wrapped inspector, as is any other
+    attribute access.
+    """
+
+    def __init__(self, inspector: Inspector, reflector: BulkReflector):
+        self.inspector = inspector
+        self.reflector = reflector
+        self._schema: Optional[str] = None
+        self._cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def _load(self, method: str, schema: str) -> Optional[Dict[str, Any]]:
+        if schema != self._schema:
+            self._schema = schema
+            self._cache = {}
+        if method not in self._cache:
+            loader, _ = _BULK_METHODS[method]
+            try:
+                self._cache[method] = getattr(self.reflector, loader)(schema)
+            except Exception as e:
+                logger.warning(
+                    f"Unable to load {method} for schema {schema} in bulk, falling back to per-table reflection: {e}"
+                )
+                self._cache[method] = None
+        return self._cache[method]
+
+    def _call(self, method: str, name: str, schema: Optional[str], **kw: Any) -> Any:
+        if schema is not None and not kw:
+            columns = self._load("get_columns", schema)
+            results = self._load(method, schema)
+            # Only tables that the columns query found are known not to have any
+            # of the other kinds of metadata.
+            if results is not None and name in results:
+                value = results[name]
+                if value is not None:
+                    return value
+            elif results is not None and columns and name in columns:
+                _, make_default = _BULK_METHODS[method]
+                return make_default()
+        return getattr(self.inspector, method)(name, schema, **kw)
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_columns", table_name, schema, **kw)
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_pk_constraint", table_name, schema, **kw)
+
+    def get_foreign_keys(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_foreign_keys", table_name, schema, **kw)
+
+    def get_table_comment(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_table_comment", table_name, schema, **kw)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.inspector, item)
@@ -1,8 +1,10 @@
+import contextlib
 import datetime
 import logging
 import traceback
 from abc import abstractmethod
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
@@ -17,6 +19,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 from urllib.parse import quote_plus
 
@@ -48,6 +51,15 @@ from datahub.emitter.mcp_builder import (
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.sql.bulk_reflection import (
+    BulkReflectingInspector,
+    get_bulk_reflector,
+)
+from datahub.ingestion.source.sql.sql_reflection import (
+    TABLE_REFLECTION_METHODS,
+    VIEW_REFLECTION_METHODS,
+    PrefetchingInspector,
+)
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -101,7 +113,9 @@ if TYPE_CHECKING:
     from datahub.ingestion.source.ge_data_profiler import (
         DatahubGEProfiler,
         GEProfilerRequest,
+        ProfilingSession,
     )
+    from datahub.metadata.schema_classes import DatasetProfileClass
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -264,6 +278,15 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase):
     include_tables: Optional[bool] = Field(
         default=True, description="Whether tables should be ingested."
     )
+    max_reflection_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker threads that run the reflection queries for the columns, constraints and comments of tables and views concurrently. Each worker uses its own connection from the connection pool. Workunits are emitted in the same order regardless of this setting.",
+    )
+    bulk_reflection: bool = Field(
+        default=False,
+        description="Whether to load the columns, primary keys, foreign keys and comments of all tables in a schema with a few catalog queries, instead of a few queries per table. Supported for Postgres, MySQL, MSSQL, Oracle, Trino and Presto. Tables whose metadata cannot be loaded this way, such as ones with column types that cannot be resolved, fall back to per-table reflection. Takes precedence over `max_reflection_workers`.",
+    )
 
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
@@ -633,40 +656,102 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
 
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
+        # Profiling runs concurrently with the metadata extraction.
+        max_overflow = 0
         if sql_config.profiling.enabled:
-            sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
+            max_overflow += sql_config.profiling.max_workers
+        if sql_config.max_reflection_workers > 1:
+            max_overflow += sql_config.max_reflection_workers
+        if max_overflow:
+            sql_config.options.setdefault("max_overflow", max_overflow)
+
+        reflection_executor: Optional[ThreadPoolExecutor] = None
+        if sql_config.max_reflection_workers > 1:
+            reflection_executor = ThreadPoolExecutor(
+                max_workers=sql_config.max_reflection_workers
             )
 
-        for inspector in self.get_inspectors():
-            profiler = None
-            profile_requests: List["GEProfilerRequest"] = []
-            if sql_config.profiling.enabled:
-                profiler = self.get_profiler_instance(inspector)
-
-            db_name = self.get_db_name(inspector)
-            yield from self.gen_database_containers(db_name)
-
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
-
-                yield from self.gen_schema_containers(schema, db_name)
-
-                if sql_config.include_tables:
-                    yield from self.loop_tables(inspector, schema, sql_config)
-
-                if sql_config.include_views:
-                    yield from self.loop_views(inspector, schema, sql_config)
-
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
+        try:
+            for inspector in self.get_inspectors():
+                with contextlib.ExitStack() as profiling_stack:
+                    # Tables are profiled in the background while the metadata of
+                    # the following schemas is extracted.
+                    profiling_session: Optional["ProfilingSession"] = None
+                    if sql_config.profiling.enabled:
+                        profiler = self.get_profiler_instance(inspector)
+                        profiling_session = profiling_stack.enter_context(
+                            profiler.profiling_session(
+                                sql_config.profiling.max_workers,
+                                platform=self.platform,
+                                profiler_args=self.get_profile_args(),
+                            )
+                        )
+
+                    metadata_inspector = inspector
+                    bulk_reflector = (
+                        get_bulk_reflector(inspector)
+                        if sql_config.bulk_reflection
+                        else None
                     )
-
-            if profiler and profile_requests:
-                yield from self.loop_profiler(
-                    profile_requests, profiler, platform=self.platform
-                )
+                    if bulk_reflector:
+                        metadata_inspector = cast(
+                            Inspector,
+                            BulkReflectingInspector(inspector, bulk_reflector),
+                        )
+                    elif sql_config.bulk_reflection:
+                        self.report.report_warning(
+                            "bulk_reflection",
+                            f"Bulk reflection is not supported for dialect {inspector.dialect.name}",
+                        )
+                    if reflection_executor and not bulk_reflector:
+                        metadata_inspector = cast(
+                            Inspector,
+                            PrefetchingInspector(
+                                inspector,
+                                reflection_executor,
+                                lookahead=4 * sql_config.max_reflection_workers,
+                            ),
+                        )
+
+                    db_name = self.get_db_name(inspector)
+                    yield from self.gen_database_containers(db_name)
+
+                    for schema in self.get_allowed_schemas(inspector, db_name):
+                        self.add_information_for_schema(inspector, schema)
+
+                        yield from self.gen_schema_containers(schema, db_name)
+
+                        if isinstance(metadata_inspector, PrefetchingInspector):
+                            self.prefetch_schema_metadata(
+                                metadata_inspector, schema, sql_config
+                            )
+
+                        if sql_config.include_tables:
+                            yield from self.loop_tables(
+                                metadata_inspector, schema, sql_config
+                            )
+
+                        if sql_config.include_views:
+                            yield from self.loop_views(
+                                metadata_inspector, schema, sql_config
+                            )
+
+                        if profiling_session:
+                            for request in self.loop_profiler_requests(
+                                inspector, schema, sql_config
+                            ):
+                                profiling_session.submit(request)
+                            yield from self.gen_profile_workunits(
+                                profiling_session.get_completed_profiles()
+                            )
+
+                    if profiling_session:
+                        yield from self.gen_profile_workunits(
+                            profiling_session.get_completed_profiles(wait=True)
+                        )
+        finally:
+            if reflection_executor:
+                reflection_executor.shutdown(wait=True)
 
         # Clean up stale entities.
         yield from self.stale_entity_removal_handler.gen_removed_entity_workunits()
@@ -678,6 +763,58 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         # and table names. See BigQuery for an example of when this is useful.
         return schema, entity
 
+    def prefetch_schema_metadata(
+        self,
+        inspector: PrefetchingInspector,
+        schema: str,
+        sql_config: SQLAlchemyConfig,
+    ) -> None:
+        # Starts reflecting the tables and views that loop_tables and loop_views will
+        # process, in the same order. Errors are left for those methods to report.
+        try:
+            if sql_config.include_tables:
+                schema_name, tables = self._get_allowed_entities(
+                    inspector,
+                    schema,
+                    inspector.get_table_names(schema),
+                    sql_config.table_pattern,
+                )
+                inspector.prefetch(schema_name, tables, TABLE_REFLECTION_METHODS)
+            if sql_config.include_views:
+                schema_name, views = self._get_allowed_entities(
+                    inspector,
+                    schema,
+                    inspector.get_view_names(schema),
+                    sql_config.view_pattern,
+                )
+                inspector.prefetch(schema_name, views, VIEW_REFLECTION_METHODS)
+        except Exception as e:
+            logger.debug(f"Unable to prefetch the metadata of schema {schema}: {e}")
+
+    def _get_allowed_entities(
+        self,
+        inspector: PrefetchingInspector,
+        schema: str,
+        entities: List[str],
+        pattern: AllowDenyPattern,
+    ) -> Tuple[str, List[str]]:
+        # Mirrors the filtering in loop_tables and loop_views.
+        allowed: List[str] = []
+        seen: Set[str] = set()
+        for entity in entities:
+            schema, entity = self.standardize_schema_table_names(
+                schema=schema, entity=entity
+            )
+            dataset_name = self.normalise_dataset_name(
+                self.get_identifier(
+                    schema=schema, entity=entity, inspector=cast(Inspector, inspector)
+                )
+            )
+            if dataset_name not in seen and pattern.allowed(dataset_name):
+                allowed.append(entity)
+            seen.add(dataset_name)
+        return schema, allowed
+
     def get_identifier(
         self, *, schema: str, entity: str, inspector: Inspector, **kwargs: Any
     ) -> str:
@@ -1356,12 +1493,20 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         profiler: "DatahubGEProfiler",
         platform: Optional[str] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        for request, profile in profiler.generate_profiles(
-            profile_requests,
-            self.config.profiling.max_workers,
-            platform=platform,
-            profiler_args=self.get_profile_args(),
-        ):
+        yield from self.gen_profile_workunits(
+            profiler.generate_profiles(
+                profile_requests,
+                self.config.profiling.max_workers,
+                platform=platform,
+                profiler_args=self.get_profile_args(),
+            )
+        )
+
+    def gen_profile_workunits(
+        self,
+        profiles: Iterable[Tuple["GEProfilerRequest", Optional["DatasetProfileClass"]]],
+    ) -> Iterable[MetadataWorkUnit]:
+        for request, profile in profiles:
             if profile is None:
                 continue
             dataset_name = request.pretty_name
@@ -0,0 +1,158 @@
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.engine.reflection import Inspector
+
+# The per-entity Inspector methods that SQLAlchemySource calls while processing
+# tables and views.
+TABLE_REFLECTION_METHODS = [
+    "get_columns",
+    "get_pk_constraint",
+    "get_foreign_keys",
+    "get_table_comment",
+]
+VIEW_REFLECTION_METHODS = ["get_columns", "get_table_comment", "get_view_definition"]
+
+# Maps each method to either its result or the exception it raised.
+_ReflectionResults = Dict[str, Tuple[Any, Optional[Exception]]]
+
+
+class PrefetchingInspector:
+    """
+    Wraps an Inspector, and runs the reflection queries for upcoming tables and views
+    in a thread pool, ahead of the point where they are requested.
+
+    Entities must be requested in the order in which they were passed to prefetch().
+    Each prefetched result is handed out once, and any call that was not prefetched is
+    passed through to the wrapped inspector, as is any other attribute access. The
+    table and view names of the most recent schema are cached, since they are needed
+    both to decide what to prefetch and to process the schema. Every
+    task uses its own connection from the engine's pool, so the prefetching uses at
+    most as many connections as the executor has workers.
+    """
+
+    def __init__(
+        self, inspector: Inspector, executor: ThreadPoolExecutor, lookahead: int
+    ):
+        self.inspector = inspector
+        self._executor = executor
+        self._lookahead = lookahead
+        self._queue: Deque[Tuple[str, str, List[str]]] = collections.deque()
+        self._queued: Set[Tuple[str, str]] = set()
+        self._pending: "collections.OrderedDict[Tuple[str, str], Future[_ReflectionResults]]" = (
+            collections.OrderedDict()
+        )
+        self._results: Dict[Tuple[str, str], _ReflectionResults] = {}
+        # The table and view names of the current schema.
+        self._names_schema: Optional[str] = None
+        self._names: Dict[str, List[str]] = {}
+
+    def prefetch(self, schema: str, names: Iterable[str], methods: List[str]) -> None:
+        for name in names:
+            self._queue.append((schema, name, methods))
+            self._queued.add((schema, name))
+        self._submit()
+
+    def _submit(self) -> None:
+        while self._queue and len(self._pending) < self._lookahead:
+            schema, name, methods = self._queue.popleft()
+            self._queued.discard((schema, name))
+            self._pending[(schema, name)] = self._executor.submit(
+                self._reflect, schema, name, methods
+            )
+
+    def _reflect(
+        self, schema: str, name: str, methods: List[str]
+    ) -> _ReflectionResults:
+        results: _ReflectionResults = {}
+        with self.inspector.engine.connect() as conn:
+            inspector = inspect(conn)
+            for method in methods:
+                try:
+                    results[method] = (getattr(inspector, method)(name, schema), None)
+                except Exception as e:
+                    results[method] = (None, e)
+        return results
+
+    def _get_results(self, schema: str, name: str) -> Optional[_ReflectionResults]:
+        key = (schema, name)
+        if key not in self._results:
+            # Entities that were prefetched before this one were skipped, so their
+            # results are dropped.
+            if key in self._queued:
+                for future in self._pending.values():
+                    future.cancel()
+                self._pending.clear()
+                while (self._queue[0][0], self._queue[0][1]) != key:
+                    skipped_schema, skipped_name, _ = self._queue.popleft()
+                    self._queued.discard((skipped_schema, skipped_name))
+                self._submit()
+            if key not in self._pending:
+                return None
+
+            while True:
+                pending_key, future = self._pending.popitem(last=False)
+                if pending_key == key:
+                    break
+                future.cancel()
+            self._results = {key: future.result()}
+            self._submit()
+        return self._results[key]
+
+    def _call(self, method: str, name: str, schema: Optional[str], **kw: Any) -> Any:
+        results = None
+        if schema is not None and not kw:
+            results = self._get_results(schema, name)
+        if results is None or method not in results:
+            return getattr(self.inspector, method)(name, schema, **kw)
+
+        result, error = results.pop(method)
+        if error is not None:
+            raise error
+        return result
+
+    def _get_names(self, method: str, schema: Optional[str], **kw: Any) -> List[str]:
+        if schema is None or kw:
+            return getattr(self.inspector, method)(schema, **kw)
+        if schema != self._names_schema:
+            self._names_schema = schema
+            self._names = {}
+        if method not in self._names:
+            self._names[method] = getattr(self.inspector, method)(schema)
+        return self._names[method]
+
+    def get_table_names(self, schema: Optional[str] = None, **kw: Any) -> List[str]:
+        return self._get_names("get_table_names", schema, **kw)
+
+    def get_view_names(self, schema: Optional[str] = None, **kw: Any) -> List[str]:
+        return self._get_names("get_view_names", schema, **kw)
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_columns", table_name, schema, **kw)
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_pk_constraint", table_name, schema, **kw)
+
+    def get_foreign_keys(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_foreign_keys", table_name, schema, **kw)
+
+    def get_table_comment(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_table_comment", table_name, schema, **kw)
+
+    def get_view_definition(
+        self, view_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> Any:
+        return self._call("get_view_definition", view_name, schema, **kw)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.inspector, item)
@@ -4,6 +4,7 @@ import functools
 import json
 import logging
 import pickle
+import zlib
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable, Generic, Optional, Type, TypeVar
@@ -28,7 +29,7 @@ class CheckpointStateBase(ConfigModel):
     """
 
     version: str = pydantic.Field(default="1.0")
-    serde: str = pydantic.Field(default="base85")
+    serde: str = pydantic.Field(default="base85-zlib-json")
 
     def to_bytes(
         self,
@@ -51,6 +52,8 @@ class CheckpointStateBase(ConfigModel):
             encoded_bytes = CheckpointStateBase._to_bytes_utf8(self)
         elif self.serde == "base85":
             encoded_bytes = CheckpointStateBase._to_bytes_base85(self, compressor)
+        elif self.serde == "base85-zlib-json":
+            encoded_bytes = CheckpointStateBase._to_bytes_base85_zlib_json(self)
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -71,6 +74,17 @@ class CheckpointStateBase(ConfigModel):
     ) -> bytes:
         return base64.b85encode(compressor(pickle.dumps(model)))
 
+    @staticmethod
+    def _to_bytes_base85_zlib_json(model: "CheckpointStateBase") -> bytes:
+        return base64.b85encode(zlib.compress(model.to_compact_json().encode("utf-8")))
+
+    def to_compact_json(self) -> str:
+        """
+        Serializes the state, excluding the version and serde, for the base85-zlib-json serde.
+        Subclasses can override this to use a more compact representation that parse_obj understands.
+        """
+        return self.json(exclude={"version", "serde"})
+
     def prepare_for_commit(self) -> None:
         """
         Perform any pre-commit steps, such as deduplication, custom-compression across data etc.
@@ -125,6 +139,10 @@ class Checkpoint(Generic[StateType]):
                     state_obj = Checkpoint._from_base85_bytes(
                         checkpoint_aspect, functools.partial(bz2.decompress)
                     )
+                elif checkpoint_aspect.state.serde == "base85-zlib-json":
+                    state_obj = Checkpoint._from_base85_zlib_json_bytes(
+                        checkpoint_aspect, state_class
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
@@ -162,6 +180,19 @@ class Checkpoint(Generic[StateType]):
         state_as_dict["serde"] = checkpoint_aspect.state.serde
         return state_class.parse_obj(state_as_dict)
 
+    @staticmethod
+    def _from_base85_zlib_json_bytes(
+        checkpoint_aspect: DatahubIngestionCheckpointClass,
+        state_class: Type[StateType],
+    ) -> StateType:
+        assert checkpoint_aspect.state.payload is not None
+        state_as_dict = json.loads(
+            zlib.decompress(base64.b85decode(checkpoint_aspect.state.payload))
+        )
+        state_as_dict["version"] = checkpoint_aspect.state.formatVersion
+        state_as_dict["serde"] = checkpoint_aspect.state.serde
+        return state_class.parse_obj(state_as_dict)
+
     @staticmethod
     def _from_base85_bytes(
         checkpoint_aspect: DatahubIngestionCheckpointClass,
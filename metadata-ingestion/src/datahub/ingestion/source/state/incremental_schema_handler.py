@@ -0,0 +1,141 @@
+import logging
+from datetime import datetime
+from typing import Optional, cast
+
+import pydantic
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.api.ingestion_job_state_provider import JobId
+from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionConfigBase,
+    StatefulIngestionSourceBase,
+)
+from datahub.ingestion.source.state.use_case_handler import (
+    StatefulIngestionUsecaseHandlerBase,
+)
+from datahub.utilities.time import get_datetime_from_ts_millis_in_utc
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class IncrementalSchemaCheckpointState(CheckpointStateBase):
+    """
+    Checkpoint state for sources that only emit the schema metadata of tables that
+    changed since the last successful run. Stores when that run started extracting
+    schemas, and a fingerprint of the config that affects which schemas it emitted.
+    """
+
+    last_extraction_time_millis: Optional[pydantic.PositiveInt] = None
+    config_fingerprint: Optional[str] = None
+
+
+class IncrementalSchemaHandler(
+    StatefulIngestionUsecaseHandlerBase[IncrementalSchemaCheckpointState]
+):
+    """
+    The stateful ingestion helper class that keeps track of the last successful schema
+    extraction, for sources that support incremental schema extraction.
+    """
+
+    def __init__(
+        self,
+        source: StatefulIngestionSourceBase,
+        config: Optional[StatefulIngestionConfigBase],
+        pipeline_name: Optional[str],
+        run_id: str,
+        enabled: bool,
+    ):
+        self.source = source
+        self.config = config
+        self.stateful_ingestion_config = (
+            self.config.stateful_ingestion if self.config else None
+        )
+        self.pipeline_name = pipeline_name
+        self.run_id = run_id
+        self.checkpointing_enabled: bool = (
+            enabled and source.is_stateful_ingestion_configured()
+        )
+        self._job_id = self._init_job_id()
+        self.source.register_stateful_ingestion_usecase_handler(self)
+
+    def _init_job_id(self) -> JobId:
+        platform: Optional[str] = getattr(self.source, "platform", None)
+        job_name_suffix = "incremental_schema"
+        return JobId(f"{platform}_{job_name_suffix}" if platform else job_name_suffix)
+
+    def _ignore_old_state(self) -> bool:
+        if (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_old_state
+        ):
+            return True
+        return False
+
+    def _ignore_new_state(self) -> bool:
+        if (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_new_state
+        ):
+            return True
+        return False
+
+    @property
+    def job_id(self) -> JobId:
+        return self._job_id
+
+    def is_checkpointing_enabled(self) -> bool:
+        return self.checkpointing_enabled
+
+    def create_checkpoint(
+        self,
+    ) -> Optional[Checkpoint[IncrementalSchemaCheckpointState]]:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return None
+
+        assert self.config is not None
+        assert self.pipeline_name is not None
+        return Checkpoint(
+            job_name=self.job_id,
+            pipeline_name=self.pipeline_name,
+            platform_instance_id=self.source.get_platform_instance_id(),
+            run_id=self.run_id,
+            config=cast(ConfigModel, self.config),
+            state=IncrementalSchemaCheckpointState(),
+        )
+
+    def get_last_extraction_time(self, config_fingerprint: str) -> Optional[datetime]:
+        """
+        Returns when the last successful run started extracting schemas, or None if
+        everything needs to be extracted again, because there was no such run or it
+        ran with a different config.
+        """
+        if not self.is_checkpointing_enabled() or self._ignore_old_state():
+            return None
+
+        last_checkpoint = self.source.get_last_checkpoint(
+            self.job_id, IncrementalSchemaCheckpointState
+        )
+        if not last_checkpoint or not last_checkpoint.state:
+            return None
+
+        state = cast(IncrementalSchemaCheckpointState, last_checkpoint.state)
+        if state.last_extraction_time_millis is None:
+            return None
+        if state.config_fingerprint != config_fingerprint:
+            logger.info(
+                "The config changed since the last successful run, extracting all schemas."
+            )
+            return None
+        return get_datetime_from_ts_millis_in_utc(state.last_extraction_time_millis)
+
+    def update_state(
+        self, extraction_time_millis: pydantic.PositiveInt, config_fingerprint: str
+    ) -> None:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return
+        cur_checkpoint = self.source.get_current_checkpoint(self.job_id)
+        assert cur_checkpoint is not None
+        cur_state = cast(IncrementalSchemaCheckpointState, cur_checkpoint.state)
+        cur_state.last_extraction_time_millis = extraction_time_millis
+        cur_state.config_fingerprint = config_fingerprint
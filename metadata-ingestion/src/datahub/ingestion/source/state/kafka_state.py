@@ -37,7 +37,7 @@ class KafkaCheckpointState(StaleEntityCheckpointStateBase["KafkaCheckpointState"
     def _get_urns_not_in(
         encoded_urns_1: List[str], encoded_urns_2: List[str]
     ) -> Iterable[str]:
-        difference = set(encoded_urns_1) - set(encoded_urns_2)
+        difference = set(encoded_urns_1).difference(encoded_urns_2)
         for encoded_urn in difference:
             platform, name, env = encoded_urn.split(
                 KafkaCheckpointState._get_separator()
@@ -1,7 +1,19 @@
+import json
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, cast
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 import pydantic
 
@@ -20,6 +32,7 @@ from datahub.ingestion.source.state.use_case_handler import (
     StatefulIngestionUsecaseHandlerBase,
 )
 from datahub.metadata.schema_classes import ChangeTypeClass, StatusClass
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -58,8 +71,37 @@ class StaleEntityCheckpointStateBase(CheckpointStateBase, ABC, Generic[Derived])
     Defines the abstract interface for the checkpoint states that are used for stale entity removal.
     Examples include sql_common state for tracking table and & view urns,
     dbt that tracks node & assertion urns, kafka state tracking topic urns.
+
+    All List[str] fields of these states are treated as sets of encoded urns. Their order
+    and duplicates are not preserved when the state is serialized.
     """
 
+    def _get_urn_set_fields(self) -> List[str]:
+        return [
+            name
+            for name, model_field in self.__fields__.items()
+            if model_field.outer_type_ == List[str]
+        ]
+
+    def to_compact_json(self) -> str:
+        urn_set_fields = self._get_urn_set_fields()
+        state_as_dict = self.dict(exclude={"version", "serde", *urn_set_fields})
+        for name in urn_set_fields:
+            prefix_lengths, suffixes = CheckpointStateUtil.front_code(
+                getattr(self, name)
+            )
+            state_as_dict[name] = {
+                "prefix_lengths": prefix_lengths,
+                "suffixes": suffixes,
+            }
+        return json.dumps(state_as_dict, separators=(",", ":"))
+
+    @pydantic.validator("*", pre=True)
+    def decode_front_coded_urns(cls, v: Any) -> Any:
+        if isinstance(v, dict) and v.keys() == {"prefix_lengths", "suffixes"}:
+            return CheckpointStateUtil.front_decode(v["prefix_lengths"], v["suffixes"])
+        return v
+
     @classmethod
     @abstractmethod
     def get_supported_types(cls) -> List[str]:
@@ -1,5 +1,4 @@
 import atexit
-import collections
 import heapq
 import json
 import logging
@@ -30,7 +29,10 @@ from datahub.ingestion.api.decorators import (
 )
 from datahub.ingestion.api.source import Source
 from datahub.ingestion.api.workunit import MetadataWorkUnit
-from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
+from datahub.ingestion.source.usage.usage_common import (
+    GenericAggregatedDataset,
+    UsageAggregator,
+)
 from datahub.ingestion.source_config.usage.bigquery_usage import BigQueryUsageConfig
 from datahub.ingestion.source_report.usage.bigquery_usage import (
     BigQueryUsageSourceReport,
@@ -779,9 +781,9 @@ class BigQueryUsageSource(Source):
 
         hydrated_read_events = self._join_events_by_job_id(parsed_events)
         # storing it all in one big object.
-        aggregated_info: Dict[
-            datetime, Dict[BigQueryTableRef, AggregatedDataset]
-        ] = collections.defaultdict(dict)
+        aggregator: UsageAggregator[BigQueryTableRef] = UsageAggregator(
+            self.config, user_email_pattern=self.config.user_email_pattern
+        )
 
         # TODO: handle partitioned tables
 
@@ -796,28 +798,20 @@ class BigQueryUsageSource(Source):
                     yield operational_wu
                     self.report.num_operational_stats_workunits_emitted += 1
             if event.read_event:
-                aggregated_info = self._aggregate_enriched_read_events(
-                    aggregated_info, event
-                )
+                self._aggregate_enriched_read_events(aggregator, event)
                 num_aggregated += 1
         logger.info(f"Total number of events aggregated = {num_aggregated}.")
-        bucket_level_stats: str = "\n\t" + "\n\t".join(
-            [
-                f'bucket:{db.strftime("%m-%d-%Y:%H:%M:%S")}, size={len(ads)}'
-                for db, ads in aggregated_info.items()
-            ]
-        )
-        logger.debug(
-            f"Number of buckets created = {len(aggregated_info)}. Per-bucket details:{bucket_level_stats}"
-        )
+        logger.debug(f"Number of aggregates created = {len(aggregator)}.")
 
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_info.values():
-            for aggregate in time_bucket.values():
+        try:
+            for aggregate in aggregator.get_aggregated_datasets():
                 wu = self._make_usage_stat(aggregate)
                 self.report.report_workunit(wu)
                 yield wu
                 self.report.num_usage_workunits_emitted += 1
+        finally:
+            aggregator.close()
 
     def _make_bigquery_clients(self) -> List[BigQueryClient]:
         if self.config.projects is None:
@@ -1335,11 +1329,11 @@ class BigQueryUsageSource(Source):
 
     def _aggregate_enriched_read_events(
         self,
-        datasets: Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]],
+        aggregator: UsageAggregator[BigQueryTableRef],
         event: AuditEvent,
-    ) -> Dict[datetime, Dict[BigQueryTableRef, AggregatedDataset]]:
+    ) -> None:
         if not event.read_event:
-            return datasets
+            return
 
         floored_ts = get_time_bucket(
             event.read_event.timestamp, self.config.bucket_duration
@@ -1356,30 +1350,21 @@ class BigQueryUsageSource(Source):
             logger.warning(
                 f"Failed to process event {str(event.read_event.resource)}", e
             )
-            return datasets
+            return
 
         if resource.is_temporary_table(self.config.temp_table_dataset_prefix):
             logger.debug(f"Dropping temporary table {resource}")
             self.report.report_dropped(str(resource))
-            return datasets
+            return
 
-        agg_bucket = datasets[floored_ts].setdefault(
+        aggregator.aggregate_event(
+            floored_ts,
             resource,
-            AggregatedDataset(
-                bucket_start_time=floored_ts,
-                resource=resource,
-                user_email_pattern=self.config.user_email_pattern,
-            ),
-        )
-
-        agg_bucket.add_read_entry(
             event.read_event.actor_email,
             event.query_event.query if event.query_event else None,
             event.read_event.fieldsRead,
         )
 
-        return datasets
-
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
             self.config.bucket_duration,
@@ -1,4 +1,3 @@
-import collections
 import dataclasses
 import logging
 import time
@@ -30,6 +29,7 @@ from datahub.ingestion.source.sql.redshift import RedshiftConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
@@ -126,7 +126,7 @@ ORDER BY
 
 RedshiftTableRef = str
 AggregatedDataset = GenericAggregatedDataset[RedshiftTableRef]
-AggregatedAccessEvents = Dict[datetime, Dict[RedshiftTableRef, AggregatedDataset]]
+AggregatedAccessEvents = UsageAggregator[RedshiftTableRef]
 
 
 class RedshiftAccessEvent(BaseModel):
@@ -238,12 +238,14 @@ class RedshiftUsageSource(Source):
         )
         # Generate usage workunits from aggregated events.
         self.report.num_usage_workunits_emitted = 0
-        for time_bucket in aggregated_events.values():
-            for aggregate in time_bucket.values():
+        try:
+            for aggregate in aggregated_events.get_aggregated_datasets():
                 wu: MetadataWorkUnit = self._make_usage_stat(aggregate)
                 self.report.report_workunit(wu)
                 self.report.num_usage_workunits_emitted += 1
                 yield wu
+        finally:
+            aggregated_events.close()
 
     def _gen_operation_aspect_workunits(
         self, engine: Engine
@@ -360,32 +362,27 @@ class RedshiftUsageSource(Source):
     def _aggregate_access_events(
         self, events_iterable: Iterable[RedshiftAccessEvent]
     ) -> AggregatedAccessEvents:
-        datasets: AggregatedAccessEvents = collections.defaultdict(dict)
+        aggregator: AggregatedAccessEvents = UsageAggregator(
+            self.config, user_email_pattern=self.config.user_email_pattern
+        )
         for event in events_iterable:
             floored_ts: datetime = get_time_bucket(
                 event.starttime, self.config.bucket_duration
             )
             resource: str = f"{event.database}.{event.schema_}.{event.table}"
-            # Get a reference to the bucket value(or initialize not yet in dict) and update it.
-            agg_bucket: AggregatedDataset = datasets[floored_ts].setdefault(
-                resource,
-                AggregatedDataset(
-                    bucket_start_time=floored_ts,
-                    resource=resource,
-                    user_email_pattern=self.config.user_email_pattern,
-                ),
-            )
             # current limitation in user stats UI, we need to provide email to show users
             user_email: str = f"{event.username if event.username else 'unknown'}"
             if "@" not in user_email:
                 user_email += f"@{self.config.email_domain}"
             logger.info(f"user_email: {user_email}")
-            agg_bucket.add_read_entry(
+            aggregator.aggregate_event(
+                floored_ts,
+                resource,
                 user_email,
                 event.text,
                 [],  # TODO: not currently supported by redshift; find column level changes
             )
-        return datasets
+        return aggregator
 
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
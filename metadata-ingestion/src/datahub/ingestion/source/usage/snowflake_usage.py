@@ -1,4 +1,3 @@
-import collections
 import json
 import logging
 import time
@@ -28,7 +27,10 @@ from datahub.ingestion.source.state.redundant_run_skip_handler import (
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionSourceBase,
 )
-from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
+from datahub.ingestion.source.usage.usage_common import (
+    GenericAggregatedDataset,
+    UsageAggregator,
+)
 from datahub.ingestion.source_config.usage.snowflake_usage import SnowflakeUsageConfig
 from datahub.ingestion.source_report.usage.snowflake_usage import SnowflakeUsageReport
 from datahub.metadata.schema_classes import (
@@ -43,7 +45,7 @@ logger = logging.getLogger(__name__)
 
 SnowflakeTableRef = str
 AggregatedDataset = GenericAggregatedDataset[SnowflakeTableRef]
-AggregatedAccessEvents = Dict[datetime, Dict[SnowflakeTableRef, AggregatedDataset]]
+AggregatedAccessEvents = UsageAggregator[SnowflakeTableRef]
 
 SNOWFLAKE_USAGE_SQL_TEMPLATE = """
 SELECT
@@ -182,13 +184,14 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
             aggregated_info_items = list(aggregated_info_items_raw)
             assert len(aggregated_info_items) == 1
 
-            for time_bucket in cast(
-                AggregatedAccessEvents, aggregated_info_items[0]
-            ).values():
-                for aggregate in time_bucket.values():
+            aggregator = cast(AggregatedAccessEvents, aggregated_info_items[0])
+            try:
+                for aggregate in aggregator.get_aggregated_datasets():
                     wu = self._make_usage_stat(aggregate)
                     self.report.report_workunit(wu)
                     yield wu
+            finally:
+                aggregator.close()
             # Update checkpoint state for this run.
             self.redundant_run_skip_handler.update_state(
                 start_time_millis=datetime_to_ts_millis(self.config.start_time),
@@ -412,7 +415,9 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
         """
         Emits aggregated access events combined with operational workunits from the events.
         """
-        datasets: AggregatedAccessEvents = collections.defaultdict(dict)
+        aggregator: AggregatedAccessEvents = UsageAggregator(
+            self.config, user_email_pattern=self.config.user_email_pattern
+        )
 
         for event in events:
             floored_ts = get_time_bucket(
@@ -426,15 +431,9 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
             )
             for object in accessed_data:
                 resource = object.objectName
-                agg_bucket = datasets[floored_ts].setdefault(
+                aggregator.aggregate_event(
+                    floored_ts,
                     resource,
-                    AggregatedDataset(
-                        bucket_start_time=floored_ts,
-                        resource=resource,
-                        user_email_pattern=self.config.user_email_pattern,
-                    ),
-                )
-                agg_bucket.add_read_entry(
                     event.email,
                     event.query_text,
                     [colRef.columnName.lower() for colRef in object.columns]
@@ -444,7 +443,7 @@ class SnowflakeUsageSource(StatefulIngestionSourceBase):
             if self.config.include_operational_stats:
                 yield from self._get_operation_aspect_work_unit(event)
 
-        yield datasets
+        yield aggregator
 
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
@@ -1,8 +1,19 @@
 import collections
 import dataclasses
+import hashlib
 import logging
 from datetime import datetime
-from typing import Callable, Counter, Generic, List, Optional, TypeVar
+from typing import (
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import pydantic
 from pydantic.fields import Field
@@ -22,6 +33,8 @@ from datahub.metadata.schema_classes import (
     DatasetUserUsageCountsClass,
     TimeWindowSizeClass,
 )
+from datahub.utilities.file_backed_dict import FileBackedDict
+from datahub.utilities.space_saving_counter import SpaceSavingCounter
 from datahub.utilities.sql_formatter import format_sql_query
 
 logger = logging.getLogger(__name__)
@@ -38,14 +51,25 @@ class GenericAggregatedDataset(Generic[ResourceType]):
     readCount: int = 0
     queryCount: int = 0
 
-    queryFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    queryFreq: Union[Counter[str], SpaceSavingCounter[bytes]] = dataclasses.field(
+        default_factory=collections.Counter
+    )
     userFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
     columnFreq: Counter[str] = dataclasses.field(default_factory=collections.Counter)
 
+    # If set, queries are counted approximately by a hash of their text, and only the
+    # text of the max_tracked_queries most frequent queries is kept in memory.
+    max_tracked_queries: Optional[int] = None
+    queryText: Dict[bytes, str] = dataclasses.field(default_factory=dict)
+
     total_budget_for_query_list: int = 24000
     query_trimmer_string_space: int = 10
     query_trimmer_string: str = " ..."
 
+    def __post_init__(self) -> None:
+        if self.max_tracked_queries is not None:
+            self.queryFreq = SpaceSavingCounter(self.max_tracked_queries)
+
     def add_read_entry(
         self,
         user_email: str,
@@ -61,10 +85,26 @@ class GenericAggregatedDataset(Generic[ResourceType]):
 
         if query:
             self.queryCount += 1
-            self.queryFreq[query] += 1
+            if isinstance(self.queryFreq, SpaceSavingCounter):
+                query_hash = hashlib.sha1(query.encode()).digest()
+                if query_hash not in self.queryFreq:
+                    self.queryText[query_hash] = query
+                evicted = self.queryFreq.add(query_hash)
+                if evicted is not None:
+                    del self.queryText[evicted]
+            else:
+                self.queryFreq[query] += 1
         for column in fields:
             self.columnFreq[column] += 1
 
+    def get_top_queries(self, top_n_queries: int) -> List[str]:
+        if isinstance(self.queryFreq, SpaceSavingCounter):
+            return [
+                self.queryText[query_hash]
+                for query_hash, _ in self.queryFreq.most_common(top_n_queries)
+            ]
+        return [query for query, _ in self.queryFreq.most_common(top_n_queries)]
+
     def trim_query(self, query: str, budget_per_query: int) -> str:
         trimmed_query = query
         if len(query) > budget_per_query:
@@ -98,7 +138,7 @@ class GenericAggregatedDataset(Generic[ResourceType]):
                     else query,
                     budget_per_query,
                 )
-                for query, _ in self.queryFreq.most_common(top_n_queries)
+                for query in self.get_top_queries(top_n_queries)
             ]
 
         usageStats = DatasetUsageStatisticsClass(
@@ -160,6 +200,18 @@ class BaseUsageConfig(BaseTimeWindowConfig):
     include_top_n_queries: bool = Field(
         default=True, description="Whether to ingest the top_n_queries."
     )
+    max_tracked_queries: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="If set, the top queries of each table and time bucket are approximated by tracking at most this many distinct queries, rather than counting every distinct query exactly. This bounds the memory used for busy tables, at the cost of slightly overestimating the counts of rare queries. It must be at least top_n_queries, and several times larger gives accurate results.",
+    )
+    spill_usage_to_disk: bool = Field(
+        default=False,
+        description="Whether to keep the aggregated usage of each table and time bucket in a temporary file on disk rather than in memory, so that memory use does not grow with the number of tables and buckets.",
+    )
+    usage_cache_size: pydantic.PositiveInt = Field(
+        default=10000,
+        description="Number of table and time bucket aggregates that are kept in memory when spill_usage_to_disk is enabled.",
+    )
 
     @pydantic.validator("top_n_queries")
     def ensure_top_n_queries_is_not_too_big(cls, v: int) -> int:
@@ -176,3 +228,92 @@ class BaseUsageConfig(BaseTimeWindowConfig):
                 f"top_n_queries is set to {v} but it can be maximum {max_queries}"
             )
         return v
+
+    @pydantic.validator("max_tracked_queries")
+    def ensure_max_tracked_queries_is_not_too_small(
+        cls, v: Optional[int], values: dict
+    ) -> Optional[int]:
+        top_n_queries = values.get("top_n_queries")
+        if v is not None and top_n_queries is not None and v < top_n_queries:
+            raise ValueError(
+                f"max_tracked_queries is set to {v} but it must be at least top_n_queries ({top_n_queries})"
+            )
+        return v
+
+
+class UsageAggregator(Generic[ResourceType]):
+    """
+    Aggregates read events into a GenericAggregatedDataset per time bucket and resource.
+
+    Depending on the config, the aggregates are kept in memory or spilled to disk, and
+    count their queries exactly or approximately.
+    """
+
+    def __init__(
+        self,
+        config: BaseUsageConfig,
+        user_email_pattern: AllowDenyPattern = AllowDenyPattern.allow_all(),
+    ):
+        self.config = config
+        self.user_email_pattern = user_email_pattern
+        self._datasets: Dict[
+            datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]
+        ] = collections.defaultdict(dict)
+        self._spilled_datasets: Optional[
+            FileBackedDict[GenericAggregatedDataset[ResourceType]]
+        ] = (
+            FileBackedDict(cache_max_size=config.usage_cache_size)
+            if config.spill_usage_to_disk
+            else None
+        )
+
+    def _make_aggregated_dataset(
+        self, bucket_start_time: datetime, resource: ResourceType
+    ) -> GenericAggregatedDataset[ResourceType]:
+        return GenericAggregatedDataset(
+            bucket_start_time=bucket_start_time,
+            resource=resource,
+            user_email_pattern=self.user_email_pattern,
+            max_tracked_queries=self.config.max_tracked_queries,
+        )
+
+    def aggregate_event(
+        self,
+        bucket_start_time: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: List[str],
+    ) -> None:
+        if self._spilled_datasets is not None:
+            key = f"{bucket_start_time.isoformat()}-{resource}"
+            agg = self._spilled_datasets.get(key)
+            if agg is None:
+                agg = self._make_aggregated_dataset(bucket_start_time, resource)
+            agg.add_read_entry(user_email, query, fields)
+            self._spilled_datasets[key] = agg
+        else:
+            agg = self._datasets[bucket_start_time].get(resource)
+            if agg is None:
+                agg = self._make_aggregated_dataset(bucket_start_time, resource)
+                self._datasets[bucket_start_time][resource] = agg
+            agg.add_read_entry(user_email, query, fields)
+
+    def get_aggregated_datasets(
+        self,
+    ) -> Iterator[GenericAggregatedDataset[ResourceType]]:
+        if self._spilled_datasets is not None:
+            yield from self._spilled_datasets.values()
+        else:
+            for time_bucket in self._datasets.values():
+                yield from time_bucket.values()
+
+    def __len__(self) -> int:
+        if self._spilled_datasets is not None:
+            return len(self._spilled_datasets)
+        return sum(len(time_bucket) for time_bucket in self._datasets.values())
+
+    def close(self) -> None:
+        self._datasets.clear()
+        if self._spilled_datasets is not None:
+            self._spilled_datasets.close()
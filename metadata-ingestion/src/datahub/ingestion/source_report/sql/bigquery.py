@@ -5,6 +5,10 @@ from typing import Dict, List, Optional
 import pydantic
 
 from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.utilities.sql_parser_cache import (
+    SQLParseCacheReport,
+    get_sql_parse_cache_report,
+)
 
 
 @dataclass
@@ -37,3 +41,8 @@ class BigQueryReport(SQLSourceReport):
     profile_table_selection_criteria: Dict[str, str] = field(default_factory=dict)
     selected_profile_tables: Dict[str, List[str]] = field(default_factory=dict)
     invalid_partition_ids: Dict[str, str] = field(default_factory=dict)
+    sql_parser_cache: Optional[SQLParseCacheReport] = None
+
+    def compute_stats(self) -> None:
+        self.sql_parser_cache = get_sql_parse_cache_report()
+        return super().compute_stats()
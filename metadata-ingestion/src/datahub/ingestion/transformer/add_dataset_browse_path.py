@@ -58,6 +58,15 @@ class AddDatasetBrowsePathTransformer(DatasetBrowsePathsTransformer):
 
         return mce_browse_paths
 
+    def reads_server_aspect(self, entity_urn: str, aspect: Optional[Aspect]) -> bool:
+        # The server is only consulted when there are browse paths to set.
+        in_browse_paths: Optional[BrowsePathsClass] = cast(BrowsePathsClass, aspect)
+        return bool(self.config.path_templates) or bool(
+            in_browse_paths is not None
+            and in_browse_paths.paths
+            and self.config.replace_existing is False
+        )
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
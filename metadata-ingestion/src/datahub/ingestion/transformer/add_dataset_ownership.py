@@ -88,6 +88,15 @@ class AddDatasetOwnership(DatasetOwnershipTransformer):
         else:
             return mce_ownership
 
+    def reads_server_aspect(self, entity_urn: str, aspect: Optional[Aspect]) -> bool:
+        # The server is only consulted when there are owners to set.
+        in_ownership_aspect: Optional[OwnershipClass] = cast(OwnershipClass, aspect)
+        return bool(
+            in_ownership_aspect is not None
+            and in_ownership_aspect.owners
+            and self.config.replace_existing is False
+        ) or bool(self.config.get_owners_to_add(entity_urn))
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
@@ -65,6 +65,15 @@ class AddDatasetTags(DatasetTagsTransformer):
 
         return patch_global_tags_aspect
 
+    def reads_server_aspect(self, entity_urn: str, aspect: Optional[Aspect]) -> bool:
+        # The server is only consulted when there are tags to set.
+        in_global_tags_aspect: Optional[GlobalTagsClass] = cast(GlobalTagsClass, aspect)
+        return bool(
+            in_global_tags_aspect is not None
+            and in_global_tags_aspect.tags
+            and self.config.replace_existing is False
+        ) or bool(self.config.get_tags_to_add(entity_urn))
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
@@ -76,6 +76,17 @@ class AddDatasetTerms(DatasetTermsTransformer):
 
         return patch_glossary_terms_aspect
 
+    def reads_server_aspect(self, entity_urn: str, aspect: Optional[Aspect]) -> bool:
+        # The server is only consulted when there are terms to set.
+        in_glossary_terms: Optional[GlossaryTermsClass] = cast(
+            Optional[GlossaryTermsClass], aspect
+        )
+        return bool(
+            in_glossary_terms is not None
+            and in_glossary_terms.terms
+            and self.config.replace_existing is False
+        ) or bool(self.config.get_terms_to_add(entity_urn))
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
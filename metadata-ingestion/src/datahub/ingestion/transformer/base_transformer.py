@@ -1,9 +1,20 @@
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import datahub.emitter.mce_builder
-from datahub.emitter.aspect import ASPECT_MAP
+from datahub.emitter.aspect import get_aspect_map
 from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
@@ -15,10 +26,19 @@ from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
 )
+from datahub.utilities.chunked_iter import chunked_iter
 from datahub.utilities.urns.urn import Urn
 
+if TYPE_CHECKING:
+    from datahub.ingestion.graph.client import DataHubGraph
+
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Number of upcoming records whose server-side aspects are prefetched at once.
+SERVER_ASPECT_PREFETCH_SIZE = 400
+
 
 class LegacyMCETransformer(Transformer, metaclass=ABCMeta):
     @abstractmethod
@@ -115,6 +135,75 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def _mark_processed(self, entity_urn: str) -> None:
         self.entity_map[entity_urn] = {"processed": True}
+        self._discard_prefetched_server_aspect(entity_urn)
+
+    def get_server_aspect_graph(self) -> Optional["DataHubGraph"]:
+        """Override this method to return the graph that transform_aspect reads the current server-side version of the aspect from, if any. The aspects are then fetched from it in batches ahead of time."""
+        return None
+
+    def reads_server_aspect(self, entity_urn: str, aspect: Optional[Aspect]) -> bool:
+        """Override this method to tell whether transform_aspect reads the server-side aspect when called with this entity and aspect. Only those aspects are fetched ahead of time."""
+        return True
+
+    def _get_urn_to_prefetch(self, record: Any) -> Optional[str]:
+        """Returns the urn of the entity that transform_aspect will be called for when processing this record, if it reads the server-side aspect of it."""
+        if not isinstance(self, SingleAspectTransformer) or not self._should_process(
+            record
+        ):
+            return None
+        entity_urn: Optional[str] = None
+        aspect: Optional[Aspect] = None
+        if isinstance(record, MetadataChangeEventClass):
+            aspect_type = get_aspect_map().get(self.aspect_name())
+            if record.proposedSnapshot and aspect_type:
+                aspect = datahub.emitter.mce_builder.get_aspect_if_available(
+                    record, aspect_type
+                )
+                entity_urn = record.proposedSnapshot.urn
+        elif isinstance(record, MetadataChangeProposalWrapper):
+            if record.aspectName == self.aspect_name():
+                aspect = record.aspect
+                entity_urn = record.entityUrn
+        if entity_urn and aspect and self.reads_server_aspect(entity_urn, aspect):
+            return entity_urn
+        return None
+
+    def prefetch_server_aspects(self, records: Iterable[Any]) -> None:
+        """Fetches the server-side aspects that transforming these records will need in bulk, if the transformer reads any."""
+        self._prefetch_server_aspects_for_urns(
+            self._get_urn_to_prefetch(record) for record in records
+        )
+
+    def _prefetch_server_aspects_for_urns(self, urns: Iterable[Optional[str]]) -> None:
+        graph = self.get_server_aspect_graph()
+        if graph is None or not isinstance(self, SingleAspectTransformer):
+            return
+        aspect_type = get_aspect_map().get(self.aspect_name())
+        urns_to_prefetch = [urn for urn in urns if urn]
+        if aspect_type and urns_to_prefetch:
+            graph.prefetch_aspects(urns_to_prefetch, aspect_type)
+
+    def _discard_prefetched_server_aspect(self, entity_urn: str) -> None:
+        # transform_aspect may not have read the prefetched aspect, and it must not be
+        # handed out later, once it might have been overwritten.
+        graph = self.get_server_aspect_graph()
+        if graph is None or not isinstance(self, SingleAspectTransformer):
+            return
+        aspect_type = get_aspect_map().get(self.aspect_name())
+        if aspect_type:
+            graph.discard_prefetched_aspect(entity_urn, aspect_type)
+
+    def _with_prefetched_server_aspects(
+        self, items: Iterable[T], get_urn: Callable[[T], Optional[str]]
+    ) -> Iterable[T]:
+        """Yields the items, after prefetching the server-side aspects of each batch of them."""
+        if self.get_server_aspect_graph() is None:
+            yield from items
+            return
+
+        for batch in chunked_iter(items, SERVER_ASPECT_PREFETCH_SIZE):
+            self._prefetch_server_aspects_for_urns(map(get_urn, batch))
+            yield from batch
 
     def _transform_or_record_mce(
         self,
@@ -124,7 +213,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         if mce.proposedSnapshot:
             self._record_mce(mce)
         if isinstance(self, SingleAspectTransformer):
-            aspect_type = ASPECT_MAP.get(self.aspect_name())
+            aspect_type = get_aspect_map().get(self.aspect_name())
             if aspect_type:
                 # if we find a type corresponding to the aspect name we look for it in the mce
                 old_aspect = datahub.emitter.mce_builder.get_aspect_if_available(
@@ -187,7 +276,10 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
     def transform(
         self, record_envelopes: Iterable[RecordEnvelope]
     ) -> Iterable[RecordEnvelope]:
-        for envelope in record_envelopes:
+        for envelope in self._with_prefetched_server_aspects(
+            record_envelopes,
+            lambda envelope: self._get_urn_to_prefetch(envelope.record),
+        ):
             if not self._should_process(envelope.record):
                 # early exit
                 pass
@@ -205,7 +297,12 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 self, SingleAspectTransformer
             ):
                 # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
+                for urn, state in self._with_prefetched_server_aspects(
+                    list(self.entity_map.items()),
+                    lambda item: item[0]
+                    if "seen" in item[1] and self.reads_server_aspect(item[0], None)
+                    else None,
+                ):
                     if "seen" in state:
                         # call transform on this entity_urn
                         last_seen_mcp = state["seen"].get("mcp")
@@ -1,12 +1,19 @@
 import logging
 from abc import ABCMeta
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
+from datahub.configuration.common import (
+    TransformerSemantics,
+    TransformerSemanticsConfigModel,
+)
 from datahub.ingestion.transformer.base_transformer import (
     BaseTransformer,
     SingleAspectTransformer,
 )
 
+if TYPE_CHECKING:
+    from datahub.ingestion.graph.client import DataHubGraph
+
 log = logging.getLogger(__name__)
 
 
@@ -19,6 +26,19 @@ class DatasetTransformer(BaseTransformer, SingleAspectTransformer, metaclass=ABC
     def entity_types(self) -> List[str]:
         return ["dataset"]
 
+    def get_server_aspect_graph(self) -> Optional["DataHubGraph"]:
+        # With PATCH semantics, transform_aspect merges the aspect with the one that is
+        # already on the server, so fetch those in batches instead of one at a time.
+        config = getattr(self, "config", None)
+        ctx = getattr(self, "ctx", None)
+        if (
+            isinstance(config, TransformerSemanticsConfigModel)
+            and config.semantics == TransformerSemantics.PATCH
+            and ctx is not None
+        ):
+            return ctx.graph
+        return None
+
 
 class DatasetOwnershipTransformer(DatasetTransformer, metaclass=ABCMeta):
     def aspect_name(self) -> str:
@@ -6,13 +6,15 @@ import platform
 import uuid
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
 
 from mixpanel import Consumer, Mixpanel
 
 import datahub as datahub_package
 from datahub.cli.cli_utils import DATAHUB_ROOT_FOLDER
-from datahub.ingestion.graph.client import DataHubGraph
+
+if TYPE_CHECKING:
+    from datahub.ingestion.graph.client import DataHubGraph
 
 logger = logging.getLogger(__name__)
 
@@ -225,7 +227,7 @@ class Telemetry:
         self,
         event_name: str,
         properties: Dict[str, Any] = {},
-        server: Optional[DataHubGraph] = None,
+        server: Optional["DataHubGraph"] = None,
     ) -> None:
         """
         Send a single telemetry event.
@@ -247,7 +249,7 @@ class Telemetry:
         except Exception as e:
             logger.debug(f"Error reporting telemetry: {e}")
 
-    def _server_props(self, server: Optional[DataHubGraph]) -> Dict[str, str]:
+    def _server_props(self, server: Optional["DataHubGraph"]) -> Dict[str, str]:
         if not server:
             return {
                 "server_type": "n/a",
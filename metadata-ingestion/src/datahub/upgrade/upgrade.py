@@ -4,7 +4,7 @@ import functools
 import logging
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from typing import Any, Callable, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, TypeVar
 
 import aiohttp
 import humanfriendly
@@ -14,7 +14,9 @@ from termcolor import colored
 
 from datahub import __version__
 from datahub.cli import cli_utils
-from datahub.ingestion.graph.client import DataHubGraph
+
+if TYPE_CHECKING:
+    from datahub.ingestion.graph.client import DataHubGraph
 
 log = logging.getLogger(__name__)
 
@@ -113,7 +115,7 @@ async def get_server_config(gms_url: str, token: str) -> dict:
 
 
 async def get_server_version_stats(
-    server: Optional[DataHubGraph] = None,
+    server: Optional["DataHubGraph"] = None,
 ) -> Tuple[Optional[str], Optional[Version], Optional[datetime]]:
     server_config = None
     if not server:
@@ -157,7 +159,7 @@ async def get_server_version_stats(
 
 
 async def retrieve_version_stats(
-    server: Optional[DataHubGraph] = None,
+    server: Optional["DataHubGraph"] = None,
 ) -> Optional[DataHubVersionStats]:
 
     try:
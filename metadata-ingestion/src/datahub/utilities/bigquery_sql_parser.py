@@ -4,16 +4,32 @@ from typing import List
 import sqlparse
 
 from datahub.utilities.sql_parser import SqlLineageSQLParser, SQLParser
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache
 
 
 class BigQuerySQLParser(SQLParser):
-    parser: SQLParser
+    tables: List[str]
+    columns: List[str]
 
     def __init__(self, sql_query: str) -> None:
         super().__init__(sql_query)
 
+        # Cached results skip both the query rewriting and the parsing.
+        cache = get_sql_parse_cache()
+        cached_results = cache.get(type(self), sql_query) if cache else {}
+        if "tables" in cached_results and "columns" in cached_results:
+            self.tables = cached_results["tables"]
+            self.columns = cached_results["columns"]
+            return
+
         self._parsed_sql_query = self.parse_sql_query(sql_query)
-        self.parser = SqlLineageSQLParser(self._parsed_sql_query)
+        parser = SqlLineageSQLParser(self._parsed_sql_query, use_cache=False)
+        self.tables = parser.get_tables()
+        self.columns = parser.get_columns()
+        if cache:
+            cache.put(
+                type(self), sql_query, {"tables": self.tables, "columns": self.columns}
+            )
 
     def parse_sql_query(self, sql_query: str) -> str:
         sql_query = BigQuerySQLParser._parse_bigquery_comment_sign(sql_query)
@@ -79,7 +95,7 @@ class BigQuerySQLParser(SQLParser):
         )
 
     def get_tables(self) -> List[str]:
-        return self.parser.get_tables()
+        return self.tables
 
     def get_columns(self) -> List[str]:
-        return self.parser.get_columns()
+        return self.columns
@@ -1,4 +1,4 @@
-from typing import Iterable, List, Set
+from typing import Iterable, List, Set, Tuple
 
 from datahub.emitter.mce_builder import dataset_urn_to_key, make_dataset_urn
 
@@ -15,9 +15,51 @@ class CheckpointStateUtil:
 
     @staticmethod
     def get_encoded_urns_not_in(
-        encoded_urns_1: List[str], encoded_urns_2: List[str]
+        encoded_urns_1: Iterable[str], encoded_urns_2: Iterable[str]
     ) -> Set[str]:
-        return set(encoded_urns_1) - set(encoded_urns_2)
+        # set.difference accepts any iterable, so we avoid building a second set.
+        return set(encoded_urns_1).difference(encoded_urns_2)
+
+    @staticmethod
+    def _get_shared_prefix_length(a: str, b: str) -> int:
+        # Binary search over slice comparisons, which is much faster than comparing
+        # character by character in python.
+        low, high = 0, min(len(a), len(b))
+        while low < high:
+            mid = (low + high + 1) // 2
+            if a[:mid] == b[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    @staticmethod
+    def front_code(encoded_urns: Iterable[str]) -> Tuple[List[int], List[str]]:
+        """
+        Sorts and deduplicates the urns, and replaces the prefix that each urn shares with the
+        previous one by the length of that prefix. Urns of the same platform and database share
+        most of their text, so this shrinks the state considerably before it is compressed.
+        """
+        prefix_lengths: List[int] = []
+        suffixes: List[str] = []
+        previous = ""
+        for encoded_urn in sorted(set(encoded_urns)):
+            prefix_length = CheckpointStateUtil._get_shared_prefix_length(
+                previous, encoded_urn
+            )
+            prefix_lengths.append(prefix_length)
+            suffixes.append(encoded_urn[prefix_length:])
+            previous = encoded_urn
+        return prefix_lengths, suffixes
+
+    @staticmethod
+    def front_decode(prefix_lengths: List[int], suffixes: List[str]) -> List[str]:
+        encoded_urns: List[str] = []
+        previous = ""
+        for prefix_length, suffix in zip(prefix_lengths, suffixes):
+            previous = previous[:prefix_length] + suffix
+            encoded_urns.append(previous)
+        return encoded_urns
 
     @staticmethod
     def get_dataset_lightweight_repr(dataset_urn: str) -> str:
@@ -0,0 +1,18 @@
+import itertools
+from typing import Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked_iter(iterable: Iterable[T], size: int) -> Iterable[List[T]]:
+    """Splits the iterable into lists of up to size elements, materializing only one
+    list at a time.
+    """
+
+    assert size > 0
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
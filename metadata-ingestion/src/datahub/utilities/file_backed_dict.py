@@ -0,0 +1,136 @@
+import collections
+import os
+import pickle
+import shutil
+import sqlite3
+import tempfile
+from typing import (
+    Any,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    OrderedDict,
+    Tuple,
+    TypeVar,
+)
+
+_VT = TypeVar("_VT")
+
+# Number of rows that are read from disk at a time while iterating.
+_ITERATION_BATCH_SIZE = 1000
+
+
+class FileBackedDict(MutableMapping[str, _VT]):
+    """
+    A dictionary that keeps its values in a temporary SQLite database on disk.
+
+    The most recently used values are cached in memory, and are written to disk when
+    they are evicted from the cache. Values that are read from the dictionary are
+    always written back on eviction, so they can safely be mutated in place as long as
+    they are not retained beyond cache_max_size further accesses.
+
+    Values must be picklable. The database is deleted when the dictionary is closed.
+    """
+
+    def __init__(self, cache_max_size: int = 10000, directory: Optional[str] = None):
+        if cache_max_size <= 0:
+            raise ValueError("cache_max_size must be positive")
+        self.cache_max_size = cache_max_size
+        self._directory = tempfile.mkdtemp(prefix="datahub-", dir=directory)
+        self._conn = sqlite3.connect(
+            os.path.join(self._directory, "data.sqlite"), isolation_level=None
+        )
+        # The database is temporary, so durability is irrelevant.
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute(
+            "CREATE TABLE data (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._cache: OrderedDict[str, _VT] = collections.OrderedDict()
+
+    def __getitem__(self, key: str) -> _VT:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        row = self._conn.execute(
+            "SELECT value FROM data WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        value: _VT = pickle.loads(row[0])
+        self._add_to_cache(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: _VT) -> None:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self._cache[key] = value
+        else:
+            self._add_to_cache(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        in_cache = key in self._cache
+        self._cache.pop(key, None)
+        cursor = self._conn.execute("DELETE FROM data WHERE key = ?", (key,))
+        if not in_cache and cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def _add_to_cache(self, key: str, value: _VT) -> None:
+        self._cache[key] = value
+        if len(self._cache) > self.cache_max_size:
+            # Evict a batch at a time, so that writes are batched as well.
+            num_to_evict = max(1, self.cache_max_size // 10)
+            self._write([self._cache.popitem(last=False) for _ in range(num_to_evict)])
+
+    def _write(self, items: List[Tuple[str, _VT]]) -> None:
+        self._conn.execute("BEGIN")
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO data (key, value) VALUES (?, ?)",
+            [(key, pickle.dumps(value)) for key, value in items],
+        )
+        self._conn.execute("COMMIT")
+
+    def flush(self) -> None:
+        """Writes all cached values to disk, without evicting them from the cache."""
+        if self._cache:
+            self._write(list(self._cache.items()))
+
+    def __len__(self) -> int:
+        self.flush()
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM data").fetchone()
+        return int(count)
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._iter_rows("SELECT key, NULL FROM data ORDER BY key"):
+            yield key
+
+    def items(self) -> Iterator[Tuple[str, _VT]]:  # type: ignore[override]
+        """Iterates over the items in key order. The dict must not be modified meanwhile."""
+        for key, pickled_value in self._iter_rows(
+            "SELECT key, value FROM data ORDER BY key"
+        ):
+            # Cached values are yielded as is, so that in-place changes are not lost.
+            if key in self._cache:
+                yield key, self._cache[key]
+            else:
+                yield key, pickle.loads(pickled_value)
+
+    def values(self) -> Iterator[_VT]:  # type: ignore[override]
+        for _, value in self.items():
+            yield value
+
+    def _iter_rows(self, query: str) -> Iterator[Tuple[str, Any]]:
+        self.flush()
+        cursor = self._conn.execute(query)
+        while True:
+            rows = cursor.fetchmany(_ITERATION_BATCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def close(self) -> None:
+        self._cache.clear()
+        self._conn.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
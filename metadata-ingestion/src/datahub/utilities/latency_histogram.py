@@ -0,0 +1,63 @@
+import bisect
+import threading
+from typing import Dict, List, Optional
+
+# Upper bounds of the histogram buckets, in milliseconds.
+_BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 60000]
+
+
+class LatencyHistogram:
+    """
+    A thread safe histogram of latencies, with fixed buckets on a roughly logarithmic scale.
+
+    Percentiles are approximated by the upper bound of the bucket that contains them,
+    so they are never lower than the actual value.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: List[int] = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_sec: float) -> None:
+        latency_ms = latency_sec * 1000
+        bucket = bisect.bisect_left(_BUCKET_BOUNDS_MS, latency_ms)
+        with self._lock:
+            self._counts[bucket] += 1
+            self.count += 1
+            self.total_ms += latency_ms
+            self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile_ms(self, percentile: float) -> Optional[float]:
+        with self._lock:
+            if self.count == 0:
+                return None
+            rank = percentile / 100 * self.count
+            seen = 0
+            for bucket, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank and bucket_count > 0:
+                    if bucket == len(_BUCKET_BOUNDS_MS):
+                        return self.max_ms
+                    return min(float(_BUCKET_BOUNDS_MS[bucket]), self.max_ms)
+            return self.max_ms
+
+    def as_obj(self) -> dict:
+        buckets: Dict[str, int] = {}
+        for bucket, bucket_count in enumerate(self._counts):
+            if bucket_count:
+                if bucket < len(_BUCKET_BOUNDS_MS):
+                    buckets[f"<={_BUCKET_BOUNDS_MS[bucket]}ms"] = bucket_count
+                else:
+                    buckets[f">{_BUCKET_BOUNDS_MS[-1]}ms"] = bucket_count
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "p99_ms": self.percentile_ms(99),
+            "buckets": buckets,
+        }
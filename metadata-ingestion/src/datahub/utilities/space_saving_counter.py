@@ -0,0 +1,65 @@
+import heapq
+import itertools
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+_KT = TypeVar("_KT", bound=Hashable)
+
+
+class SpaceSavingCounter(Generic[_KT]):
+    """
+    An approximate counter that tracks at most max_size distinct keys, using the
+    Space-Saving heavy-hitter algorithm.
+
+    When a new key arrives and the counter is full, the key with the lowest count is
+    evicted and the new key inherits its count. Counts are therefore overestimated by
+    at most the lowest tracked count, and any key that occurs more than
+    total / max_size times is guaranteed to be tracked.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.total = 0
+        self._counts: Dict[_KT, int] = {}
+        # Contains exactly one entry per tracked key, but the count of an entry may be
+        # stale, since entries are only refreshed lazily when they reach the top.
+        self._heap: List[Tuple[int, int, _KT]] = []
+        self._sequence = itertools.count()
+
+    def add(self, key: _KT, count: int = 1) -> Optional[_KT]:
+        """Increments the count of the key, and returns the key that was evicted, if any."""
+        self.total += count
+        if key in self._counts:
+            self._counts[key] += count
+            return None
+
+        evicted: Optional[_KT] = None
+        base_count = 0
+        if len(self._counts) >= self.max_size:
+            evicted, base_count = self._pop_min()
+        self._counts[key] = base_count + count
+        heapq.heappush(self._heap, (base_count + count, next(self._sequence), key))
+        return evicted
+
+    def _pop_min(self) -> Tuple[_KT, int]:
+        while True:
+            heap_count, _, key = heapq.heappop(self._heap)
+            count = self._counts[key]
+            if count == heap_count:
+                del self._counts[key]
+                return key, count
+            heapq.heappush(self._heap, (count, next(self._sequence), key))
+
+    def __getitem__(self, key: _KT) -> int:
+        return self._counts.get(key, 0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[_KT, int]]:
+        items = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return items if n is None else items[:n]
@@ -1,19 +1,36 @@
+import atexit
 import contextlib
 import logging
 import multiprocessing
+import os
 import re
 import sys
+import threading
 import traceback
-from multiprocessing import Process, Queue
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
 from typing import List, Optional, Tuple, Type
 
+import psutil
+
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
-from datahub.utilities.sql_parser_base import SQLParser
+from datahub.utilities.sql_parser_base import SQLParser, SqlParserException
+from datahub.utilities.sql_parser_cache import get_sql_parse_cache
 
 with contextlib.suppress(ImportError):
     from sql_metadata import Parser as MetadataSQLParser
 logger = logging.getLogger(__name__)
 
+SQL_PARSER_POOL_MAX_WORKERS = int(os.getenv("DATAHUB_SQL_PARSER_POOL_MAX_WORKERS", "4"))
+SQL_PARSER_MAX_QUERIES_PER_WORKER = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_QUERIES_PER_WORKER", "500")
+)
+SQL_PARSER_MAX_WORKER_MEMORY_MB = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_WORKER_MEMORY_MB", "1024")
+)
+SQL_PARSER_TIMEOUT_SEC = float(os.getenv("DATAHUB_SQL_PARSER_TIMEOUT_SEC", "300"))
+
 
 class MetadataSQLSQLParser(SQLParser):
     _DATE_SWAP_TOKEN = "__d_a_t_e"
@@ -38,13 +55,32 @@ class MetadataSQLSQLParser(SQLParser):
 
         self._parser = MetadataSQLParser(sql_query)
 
+        self._cache = get_sql_parse_cache()
+        self._cached_results = (
+            self._cache.get(type(self), original_sql_query) if self._cache else {}
+        )
+
     def get_tables(self) -> List[str]:
+        if "tables" in self._cached_results:
+            return list(self._cached_results["tables"])
+
         result = self._parser.tables
         # Sort tables to make the list deterministic
         result.sort()
+        if self._cache:
+            self._cache.put(type(self), self._sql_query, {"tables": result})
         return result
 
     def get_columns(self) -> List[str]:
+        if "columns" in self._cached_results:
+            return list(self._cached_results["columns"])
+
+        columns = self._get_columns()
+        if self._cache:
+            self._cache.put(type(self), self._sql_query, {"columns": columns})
+        return columns
+
+    def _get_columns(self) -> List[str]:
         columns_dict = self._parser.columns_dict
         # don't attempt to parse columns if there are joins involved
         if columns_dict.get("join", {}) != {}:
@@ -67,19 +103,9 @@ class MetadataSQLSQLParser(SQLParser):
         return ["date" if c == self._DATE_SWAP_TOKEN else c for c in filtered_cols]
 
 
-def sql_lineage_parser_impl_func_wrapper(
-    queue: multiprocessing.Queue,
+def _get_tables_columns(
     sql_query: str,
-) -> None:
-    """
-    The wrapper function that computes the tables and columns using the SqlLineageSQLParserImpl
-    and puts the results on the shared IPC queue. This is used to isolate SqlLineageSQLParserImpl
-    functionality in a separate process, and hence protect our sources from memory leaks originating in
-    the sqllineage module.
-    :param queue: The shared IPC queue on to which the results will be put.
-    :param sql_query: The SQL query to extract the tables & columns from.
-    :return: None.
-    """
+) -> Tuple[List[str], List[str], Optional[Tuple[Optional[Type[BaseException]], str]]]:
     exception_details: Optional[Tuple[Optional[Type[BaseException]], str]] = None
     tables: List[str] = []
     columns: List[str] = []
@@ -92,37 +118,184 @@ def sql_lineage_parser_impl_func_wrapper(
         exc_msg: str = str(exc_info[1]) + "".join(traceback.format_tb(exc_info[2]))
         exception_details = (exc_info[0], exc_msg)
         logger.debug(exc_msg)
-    finally:
-        queue.put((tables, columns, exception_details))
+    return tables, columns, exception_details
 
 
-class SqlLineageSQLParser(SQLParser):
-    def __init__(self, sql_query: str) -> None:
-        super().__init__(sql_query)
-        self.tables, self.columns = self._get_tables_columns_process_wrapped(sql_query)
+def sql_lineage_parser_worker(
+    conn: Connection,
+    max_queries: int,
+    max_memory_bytes: int,
+) -> None:
+    """
+    The main loop of a SqlLineageParserPool worker process. It parses the queries received over conn
+    and sends back the tables, columns and exception details of each of them, along with a flag that
+    tells the pool whether the worker is retiring. A worker retires after max_queries queries or once
+    its memory usage exceeds max_memory_bytes, which bounds the memory leaked by the sqllineage module.
+    :param conn: The worker's end of the pipe to the pool.
+    :param max_queries: The number of queries after which the worker exits.
+    :param max_memory_bytes: The resident set size after which the worker exits.
+    :return: None.
+    """
+    process = psutil.Process()
+    for num_queries in range(1, max_queries + 1):
+        try:
+            sql_query = conn.recv()
+        except EOFError:
+            # The pool has been closed.
+            return
+        tables, columns, exception_details = _get_tables_columns(sql_query)
+        retiring = (
+            num_queries >= max_queries or process.memory_info().rss > max_memory_bytes
+        )
+        conn.send((tables, columns, exception_details, retiring))
+        if retiring:
+            return
 
-    @staticmethod
-    def _get_tables_columns_process_wrapped(
-        sql_query: str,
-    ) -> Tuple[List[str], List[str]]:
-        # Invoke sql_lineage_parser_impl_func_wrapper in a separate process to avoid
-        # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
-        # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
-        # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
+
+@dataclass
+class _SqlLineageParserWorker:
+    process: BaseProcess
+    conn: Connection
+
+
+class SqlLineageParserPool:
+    """
+    A pool of long-lived worker processes that run SqlLineageSQLParserImpl.
+
+    Parsing happens outside of the main process to shield it from the memory leaks of the
+    sqllineage module. Instead of forking a process per query, workers are reused and recycled
+    after max_queries_per_worker queries or once their memory exceeds max_worker_memory_mb.
+    Workers are started lazily, so a single-threaded caller only ever uses one of them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queries_per_worker: int,
+        max_worker_memory_mb: int,
+        timeout_sec: float,
+    ) -> None:
+        self.max_queries_per_worker = max_queries_per_worker
+        self.max_worker_memory_bytes = max_worker_memory_mb * 1024 * 1024
+        self.timeout_sec = timeout_sec
+
+        self._lock = threading.Lock()
+        self._available = threading.BoundedSemaphore(max_workers)
+        self._idle_workers: List[_SqlLineageParserWorker] = []
+        self._all_workers: List[_SqlLineageParserWorker] = []
+
+    def _start_worker(self) -> _SqlLineageParserWorker:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=sql_lineage_parser_worker,
             args=(
-                queue,
-                sql_query,
+                child_conn,
+                self.max_queries_per_worker,
+                self.max_worker_memory_bytes,
             ),
+            daemon=True,
         )
         process.start()
-        tables, columns, exception_details = queue.get(block=True)
+        # The parent does not need the child's end of the pipe. Closing it ensures
+        # that recv() fails instead of hanging if the worker dies.
+        child_conn.close()
+        return _SqlLineageParserWorker(process=process, conn=parent_conn)
+
+    def _stop_worker(self, worker: _SqlLineageParserWorker, kill: bool) -> None:
+        worker.conn.close()
+        if kill and worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join()
+        with self._lock:
+            self._all_workers.remove(worker)
+
+    def get_tables_columns(self, sql_query: str) -> Tuple[List[str], List[str]]:
+        with self._available:
+            with self._lock:
+                if self._idle_workers:
+                    worker = self._idle_workers.pop()
+                else:
+                    worker = self._start_worker()
+                    self._all_workers.append(worker)
+
+            try:
+                worker.conn.send(sql_query)
+                if not worker.conn.poll(self.timeout_sec):
+                    self._stop_worker(worker, kill=True)
+                    raise SqlParserException(
+                        f"Timed out after {self.timeout_sec} seconds parsing query"
+                    )
+                tables, columns, exception_details, retiring = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                self._stop_worker(worker, kill=True)
+                raise SqlParserException(f"Sql parser worker died: {e}") from e
+
+            if retiring:
+                self._stop_worker(worker, kill=False)
+            else:
+                with self._lock:
+                    self._idle_workers.append(worker)
+
         if exception_details is not None:
             raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
         return tables, columns
 
+    def close(self) -> None:
+        with self._lock:
+            workers, self._idle_workers = self._all_workers[:], []
+        for worker in workers:
+            self._stop_worker(worker, kill=True)
+
+
+_default_pool: Optional[SqlLineageParserPool] = None
+_default_pool_pid: Optional[int] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_sql_lineage_parser_pool() -> SqlLineageParserPool:
+    global _default_pool, _default_pool_pid
+    with _default_pool_lock:
+        # Workers belong to the process that started them, so a forked child
+        # must not reuse the pool it inherited from its parent.
+        if _default_pool is None or _default_pool_pid != os.getpid():
+            _default_pool = SqlLineageParserPool(
+                max_workers=SQL_PARSER_POOL_MAX_WORKERS,
+                max_queries_per_worker=SQL_PARSER_MAX_QUERIES_PER_WORKER,
+                max_worker_memory_mb=SQL_PARSER_MAX_WORKER_MEMORY_MB,
+                timeout_sec=SQL_PARSER_TIMEOUT_SEC,
+            )
+            _default_pool_pid = os.getpid()
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+class SqlLineageSQLParser(SQLParser):
+    def __init__(self, sql_query: str, use_cache: bool = True) -> None:
+        super().__init__(sql_query)
+
+        cache = get_sql_parse_cache() if use_cache else None
+        cached_results = cache.get(type(self), sql_query) if cache else {}
+        if "tables" in cached_results and "columns" in cached_results:
+            self.tables = cached_results["tables"]
+            self.columns = cached_results["columns"]
+            return
+
+        self.tables, self.columns = self._get_tables_columns_process_wrapped(sql_query)
+        if cache:
+            cache.put(
+                type(self), sql_query, {"tables": self.tables, "columns": self.columns}
+            )
+
+    @staticmethod
+    def _get_tables_columns_process_wrapped(
+        sql_query: str,
+    ) -> Tuple[List[str], List[str]]:
+        # Invoke SqlLineageSQLParserImpl in a separate worker process to avoid memory leaks
+        # from the sqllineage module. This will help shield our sources like lookml & redash,
+        # that need to parse a large number of SQL statements, from causing significant memory
+        # leaks in the datahub cli during ingestion.
+        return get_sql_lineage_parser_pool().get_tables_columns(sql_query)
+
     def get_tables(self) -> List[str]:
         return self.tables
 
@@ -0,0 +1,183 @@
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import datahub as datahub_package
+from datahub.ingestion.api.report import Report
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # Python 3.7
+    from importlib_metadata import PackageNotFoundError, version  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+SQL_PARSER_CACHE_DIR = os.getenv("DATAHUB_SQL_PARSER_CACHE_DIR")
+SQL_PARSER_CACHE_MAX_ENTRIES = int(
+    os.getenv("DATAHUB_SQL_PARSER_CACHE_MAX_ENTRIES", "100000")
+)
+SQL_PARSER_CACHE_FILE_NAME = "sql_parser_cache.sqlite"
+
+# The libraries whose versions determine the results of the SQL parsers.
+SQL_PARSER_LIBRARIES = ["sqllineage", "sql-metadata", "sqlparse"]
+
+
+@dataclass
+class SQLParseCacheReport(Report):
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser_library_versions() -> str:
+    versions = []
+    for library in SQL_PARSER_LIBRARIES:
+        try:
+            versions.append(f"{library}=={version(library)}")
+        except PackageNotFoundError:
+            versions.append(f"{library} not installed")
+    return ",".join(versions)
+
+
+def _normalize_sql(sql_query: str) -> str:
+    # Only whitespace that can never change the meaning of a query is normalized.
+    # Line breaks are kept, since they terminate single-line comments.
+    return "\n".join(line.rstrip() for line in sql_query.strip().splitlines())
+
+
+class SQLParseCache:
+    """
+    An on-disk cache of the tables and columns that a SQLParser extracted from a query.
+
+    Entries are keyed by a hash of the normalized query, the parser class, the datahub
+    version and the versions of the parser libraries, so that changes to a parser never
+    serve stale results. The cache
+    is stored in SQLite, which makes it safe to share between concurrent ingestion runs,
+    and is bounded to max_entries by evicting the least recently used entries.
+    """
+
+    def __init__(self, path: str, max_entries: int) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.report = SQLParseCacheReport()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        # This is a cache, so durability is less important than write latency.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parse_results ("
+            "key TEXT PRIMARY KEY, results TEXT NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS parse_results_last_used "
+            "ON parse_results (last_used)"
+        )
+        (self._num_entries,) = self._conn.execute(
+            "SELECT COUNT(*) FROM parse_results"
+        ).fetchone()
+
+    @staticmethod
+    def _make_key(parser_cls: type, sql_query: str) -> str:
+        key = hashlib.sha256()
+        key.update(
+            f"{parser_cls.__module__}.{parser_cls.__qualname__}:{datahub_package.__version__}\n".encode()
+        )
+        key.update(f"{_get_parser_library_versions()}\n".encode())
+        key.update(_normalize_sql(sql_query).encode())
+        return key.hexdigest()
+
+    def get(self, parser_cls: type, sql_query: str) -> Dict[str, List[str]]:
+        """Returns the cached results of the parser for the query, which may be empty."""
+        key = self._make_key(parser_cls, sql_query)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results FROM parse_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.report.misses += 1
+                return {}
+            self.report.hits += 1
+            self._conn.execute(
+                "UPDATE parse_results SET last_used = ? WHERE key = ?",
+                (int(time.time()), key),
+            )
+        return json.loads(row[0])
+
+    def put(
+        self, parser_cls: type, sql_query: str, results: Dict[str, List[str]]
+    ) -> None:
+        """Merges the results into the cached results of the parser for the query."""
+        key = self._make_key(parser_cls, sql_query)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results FROM parse_results WHERE key = ?", (key,)
+            ).fetchone()
+            merged = {**json.loads(row[0]), **results} if row else results
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_results (key, results, last_used) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(merged), int(time.time())),
+            )
+            if row is None:
+                self._num_entries += 1
+                if self._num_entries > self.max_entries:
+                    self._evict()
+
+    def _evict(self) -> None:
+        # Evict a little more than necessary, so that we don't evict on every put.
+        num_to_evict = self._num_entries - int(self.max_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM parse_results WHERE key IN "
+            "(SELECT key FROM parse_results ORDER BY last_used LIMIT ?)",
+            (num_to_evict,),
+        )
+        (self._num_entries,) = self._conn.execute(
+            "SELECT COUNT(*) FROM parse_results"
+        ).fetchone()
+        self.report.evictions += num_to_evict
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[SQLParseCache] = None
+_default_cache_pid: Optional[int] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_sql_parse_cache() -> Optional[SQLParseCache]:
+    """Returns the process-wide cache, or None if DATAHUB_SQL_PARSER_CACHE_DIR is not set."""
+    global _default_cache, _default_cache_pid
+    if not SQL_PARSER_CACHE_DIR:
+        return None
+    with _default_cache_lock:
+        # SQLite connections must not be shared with forked child processes.
+        if _default_cache is None or _default_cache_pid != os.getpid():
+            os.makedirs(SQL_PARSER_CACHE_DIR, exist_ok=True)
+            path = os.path.join(SQL_PARSER_CACHE_DIR, SQL_PARSER_CACHE_FILE_NAME)
+            logger.info(f"Using SQL parser cache at {path}")
+            _default_cache = SQLParseCache(
+                path, max_entries=SQL_PARSER_CACHE_MAX_ENTRIES
+            )
+            _default_cache_pid = os.getpid()
+            atexit.register(_default_cache.close)
+        return _default_cache
+
+
+def get_sql_parse_cache_report() -> Optional[SQLParseCacheReport]:
+    cache = get_sql_parse_cache()
+    return cache.report if cache else None
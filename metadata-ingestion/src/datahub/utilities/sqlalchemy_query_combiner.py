@@ -6,6 +6,7 @@ import logging
 import random
 import string
 import threading
+import time
 import unittest.mock
 from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
@@ -17,10 +18,17 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.orm.exc import MultipleResultsFound, NoResultFound
 
 from datahub.ingestion.api.report import Report
+from datahub.utilities.latency_histogram import LatencyHistogram
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-MAX_QUERIES_TO_COMBINE_AT_ONCE = 40
+# The number of queries that are combined at once adapts to the database: it starts
+# out at INITIAL_QUERIES_TO_COMBINE_AT_ONCE, grows while combined queries are fast,
+# and shrinks when they are slow or fail.
+INITIAL_QUERIES_TO_COMBINE_AT_ONCE = 40
+MIN_QUERIES_TO_COMBINE_AT_ONCE = 2
+MAX_QUERIES_TO_COMBINE_AT_ONCE = 200
+TARGET_COMBINED_QUERY_LATENCY_SECONDS = 10.0
 
 
 # We need to make sure that only one query combiner attempts to patch
@@ -123,6 +131,25 @@ class SQLAlchemyQueryCombinerReport(Report):
 
     query_exceptions: int = 0
 
+    # Combined queries that failed and were split in half to isolate the failure.
+    combined_queries_split: int = 0
+    queries_to_combine_at_once: int = INITIAL_QUERIES_TO_COMBINE_AT_ONCE
+    # The latency of combined queries, by the number of queries they combined.
+    combined_query_latency: Dict[str, LatencyHistogram] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def report_combined_query_latency(
+        self, num_queries: int, latency_sec: float
+    ) -> None:
+        # Group the batch sizes into powers of two.
+        low = 1 << (num_queries.bit_length() - 1)
+        key = f"{low}-{2 * low - 1} queries"
+        histogram = self.combined_query_latency.get(key)
+        if histogram is None:
+            histogram = self.combined_query_latency.setdefault(key, LatencyHistogram())
+        histogram.record(latency_sec)
+
 
 @dataclasses.dataclass
 class SQLAlchemyQueryCombiner:
@@ -130,6 +157,11 @@ class SQLAlchemyQueryCombiner:
     This class adds support for dynamically combining multiple SQL queries into
     a single query. Specifically, it can combine queries which each return a
     single row. It uses greenlets to manage the execution lifecycle of the queries.
+
+    The number of queries that are combined at once adapts to how long the combined
+    queries take and to whether they fail. If a combined query fails, it is split in
+    half and each half is retried, so that only the queries that actually fail are
+    executed on their own.
     """
 
     enabled: bool
@@ -159,6 +191,9 @@ class SQLAlchemyQueryCombiner:
         greenlet.greenlet, Set[greenlet.greenlet]
     ] = dataclasses.field(default_factory=lambda: collections.defaultdict(set))
 
+    # Shared between threads, since they all query the same database.
+    _queries_to_combine_at_once: int = INITIAL_QUERIES_TO_COMBINE_AT_ONCE
+
     @staticmethod
     def _generate_sql_safe_identifier() -> str:
         # The value of k=16 should be more than enough to ensure uniqueness.
@@ -289,85 +324,128 @@ class SQLAlchemyQueryCombiner:
     def _execute_queue(self, main_greenlet: greenlet.greenlet) -> None:
         full_queue = self._get_queue(main_greenlet)
 
-        pending_queue = {k: v for k, v in full_queue.items() if not v.done}
+        pending_queue = [v for v in full_queue.values() if not v.done]
+        batch = pending_queue[: self._queries_to_combine_at_once]
+        if batch:
+            self._execute_batch(batch)
 
-        pending_queue = dict(
-            itertools.islice(pending_queue.items(), MAX_QUERIES_TO_COMBINE_AT_ONCE)
-        )
+    def _execute_batch(self, batch: List[_QueryFuture], is_split: bool = False) -> None:
+        if len(batch) == 1:
+            # There is nothing to combine.
+            self._execute_query_fallback(batch[0])
+            return
 
-        if pending_queue:
-            queue_item = next(iter(pending_queue.values()))
-
-            # Actually combine these queries together. We do this by (1) putting
-            # each query into its own CTE, (2) selecting all the columns we need
-            # and (3) extracting the results once the query finishes.
-
-            ctes = {
-                k: query_future.query.cte(k)
-                for k, query_future in pending_queue.items()
-            }
-
-            combined_cols = itertools.chain(
-                *[
-                    [
-                        col  # .label(self._generate_sql_safe_identifier())
-                        for col in get_query_columns(cte)
-                    ]
-                    for _, cte in ctes.items()
+        try:
+            self._execute_combined_query(batch)
+        except Exception as e:
+            if not self.serial_execution_fallback_enabled:
+                raise e
+            logger.debug(
+                f"Failed to execute {len(batch)} queries using combiner, splitting them up: {str(e)}"
+            )
+            self.report.query_exceptions += 1
+            self.report.combined_queries_split += 1
+            if not is_split:
+                # Failures of the halves only isolate the failing queries, so they
+                # should not shrink the batches any further.
+                self._set_queries_to_combine_at_once(len(batch) // 2)
+
+            middle = len(batch) // 2
+            self._execute_batch(batch[:middle], is_split=True)
+            self._execute_batch(batch[middle:], is_split=True)
+
+    def _set_queries_to_combine_at_once(self, num_queries: int) -> None:
+        self._queries_to_combine_at_once = max(
+            MIN_QUERIES_TO_COMBINE_AT_ONCE,
+            min(num_queries, MAX_QUERIES_TO_COMBINE_AT_ONCE),
+        )
+        self.report.queries_to_combine_at_once = self._queries_to_combine_at_once
+
+    def _adapt_to_latency(self, num_queries: int, latency_sec: float) -> None:
+        if latency_sec > TARGET_COMBINED_QUERY_LATENCY_SECONDS:
+            self._set_queries_to_combine_at_once(num_queries // 2)
+        elif (
+            latency_sec < TARGET_COMBINED_QUERY_LATENCY_SECONDS / 2
+            and num_queries >= self._queries_to_combine_at_once
+        ):
+            # Only full batches tell us that larger ones might be fine.
+            self._set_queries_to_combine_at_once(num_queries + max(1, num_queries // 4))
+
+    def _execute_combined_query(self, batch: List[_QueryFuture]) -> None:
+        queue_item = batch[0]
+
+        # Actually combine these queries together. We do this by (1) putting
+        # each query into its own CTE, (2) selecting all the columns we need
+        # and (3) extracting the results once the query finishes.
+
+        ctes = [
+            query_future.query.cte(self._generate_sql_safe_identifier())
+            for query_future in batch
+        ]
+
+        combined_cols = itertools.chain(
+            *[
+                [
+                    col  # .label(self._generate_sql_safe_identifier())
+                    for col in get_query_columns(cte)
                 ]
+                for cte in ctes
+            ]
+        )
+        combined_query = sqlalchemy.select(combined_cols)
+        for cte in ctes:
+            combined_query.append_from(cte)
+
+        logger.debug(f"Executing combined query: {str(combined_query)}")
+        self.report.combined_queries_issued += 1
+        start_time = time.perf_counter()
+        sa_res = _sa_execute_underlying_method(queue_item.conn, combined_query)
+
+        # Fetch the results and ensure that exactly one row is returned.
+        results = sa_res.fetchall()
+        latency_sec = time.perf_counter() - start_time
+        self.report.report_combined_query_latency(len(batch), latency_sec)
+        assert len(results) == 1
+        row = results[0]
+
+        # Extract the results into a result for each query. Nothing is stored until
+        # all the columns are accounted for, so that a failure leaves the batch as is.
+        index = 0
+        batch_results = []
+        for query_future in batch:
+            cols = query_future.query.columns
+
+            data = {}
+            for col in cols:
+                data[col.name] = row[index]
+                index += 1
+
+            batch_results.append(_ResultProxyFake([_RowProxyFake(data)]))
+
+        # Verify that we consumed all the columns.
+        assert index == len(row)
+
+        for query_future, res in zip(batch, batch_results):
+            query_future.res = res
+            query_future.done = True
+
+        self._adapt_to_latency(len(batch), latency_sec)
+
+    def _execute_query_fallback(self, query_future: _QueryFuture) -> None:
+        logger.debug(f"Executing query via fallback: {str(query_future.query)}")
+        self.report.uncombined_queries_issued += 1
+        try:
+            res = _sa_execute_underlying_method(
+                query_future.conn,
+                query_future.query,
+                *query_future.multiparams,
+                **query_future.params,
             )
-            combined_query = sqlalchemy.select(combined_cols)
-            for cte in ctes.values():
-                combined_query.append_from(cte)
-
-            logger.debug(f"Executing combined query: {str(combined_query)}")
-            self.report.combined_queries_issued += 1
-            sa_res = _sa_execute_underlying_method(queue_item.conn, combined_query)
-
-            # Fetch the results and ensure that exactly one row is returned.
-            results = sa_res.fetchall()
-            assert len(results) == 1
-            row = results[0]
-
-            # Extract the results into a result for each query.
-            index = 0
-            for _, query_future in pending_queue.items():
-                cols = query_future.query.columns
-
-                data = {}
-                for col in cols:
-                    data[col.name] = row[index]
-                    index += 1
-
-                res = _ResultProxyFake([_RowProxyFake(data)])
-
-                query_future.res = res
-                query_future.done = True
-
-            # Verify that we consumed all the columns.
-            assert index == len(row)
-
-    def _execute_queue_fallback(self, main_greenlet: greenlet.greenlet) -> None:
-        full_queue = self._get_queue(main_greenlet)
-
-        for _, query_future in full_queue.items():
-            if query_future.done:
-                continue
-
-            logger.debug(f"Executing query via fallback: {str(query_future.query)}")
-            self.report.uncombined_queries_issued += 1
-            try:
-                res = _sa_execute_underlying_method(
-                    query_future.conn,
-                    query_future.query,
-                    *query_future.multiparams,
-                    **query_future.params,
-                )
-                query_future.res = res
-            except Exception as e:
-                query_future.exc = e
-            finally:
-                query_future.done = True
+            query_future.res = res
+        except Exception as e:
+            query_future.exc = e
+        finally:
+            query_future.done = True
 
     def flush(self) -> None:
         """Executes until the queue and pool are empty."""
@@ -379,14 +457,7 @@ class SQLAlchemyQueryCombiner:
         pool = self._get_greenlet_pool(main_greenlet)
 
         while pool:
-            try:
-                self._execute_queue(main_greenlet)
-            except Exception as e:
-                if not self.serial_execution_fallback_enabled:
-                    raise e
-                logger.exception(f"Failed to execute queue using combiner: {str(e)}")
-                self.report.query_exceptions += 1
-                self._execute_queue_fallback(main_greenlet)
+            self._execute_queue(main_greenlet)
 
             for let in list(pool):
                 if let.dead:
@@ -0,0 +1,170 @@
+"""
+Cold-start benchmark for the datahub CLI.
+
+Runs a few cheap CLI commands, each in a fresh interpreter, and reports the median
+wall-clock time of each, along with the packages that take longest to import as
+measured by `python -X importtime`. It also checks that importing the CLI entrypoint does not
+import any of the heavy modules that only some commands need, like the generated
+schema classes or the plugin registries.
+
+Run it from the metadata-ingestion directory, for instance:
+
+    python -m tests.performance.cli_startup_benchmark
+    python -m tests.performance.cli_startup_benchmark --command version --runs 10 \
+        --max-seconds 1.5
+
+The exit code is non-zero if a heavy module is imported by the entrypoint, or if any
+command takes longer than --max-seconds.
+"""
+import collections
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+COMMANDS: Dict[str, List[str]] = {
+    "version": ["version"],
+    "help": ["--help"],
+    "get --help": ["get", "--help"],
+}
+
+# Modules that must only be imported by the commands that use them.
+HEAVY_MODULES = [
+    "datahub.metadata.schema_classes",
+    "datahub.ingestion.graph.client",
+    "datahub.ingestion.run.pipeline",
+    "datahub.ingestion.source.source_registry",
+    "datahub.cli.docker_cli",
+    "datahub.cli.ingest_cli",
+]
+
+NUM_SLOWEST_IMPORTS = 10
+
+
+def _env() -> Dict[str, str]:
+    # Never send telemetry from the benchmark.
+    return {**os.environ, "DATAHUB_TELEMETRY_ENABLED": "false"}
+
+
+def get_heavy_imports(module: str = "datahub.entrypoints") -> List[str]:
+    """Returns the heavy modules that are imported by importing the given module."""
+
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env=_env(),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    imported = set(json.loads(output))
+    return [heavy for heavy in HEAVY_MODULES if heavy in imported]
+
+
+def _parse_import_times(stderr: str) -> List[Tuple[str, float]]:
+    # Lines look like "import time:       self [us] |  cumulative | imported package".
+    # The self times are summed up by top-level package, which attributes the import
+    # time to the packages that actually spend it.
+    package_times: Dict[str, float] = collections.defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, module = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            continue
+        package = module.strip().split(".")[0]
+        package_times[package] += int(self_time) / 1_000_000
+    return sorted(package_times.items(), key=lambda item: item[1], reverse=True)
+
+
+def run_benchmark(command: str, runs: int = 5) -> dict:
+    args = [sys.executable, "-X", "importtime", "-m", "datahub", *COMMANDS[command]]
+
+    durations = []
+    import_times: List[Tuple[str, float]] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            args,
+            env=_env(),
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        durations.append(time.perf_counter() - start)
+        import_times = _parse_import_times(result.stderr)
+
+    return {
+        "command": command,
+        "runs": runs,
+        "median_sec": statistics.median(durations),
+        "min_sec": min(durations),
+        "num_imported_packages": len(import_times),
+        "slowest_imports": [
+            {"package": package, "import_sec": round(seconds, 4)}
+            for package, seconds in import_times[:NUM_SLOWEST_IMPORTS]
+        ],
+    }
+
+
+def _format_result(result: dict) -> str:
+    lines = [
+        f"datahub {result['command']}: median {result['median_sec']:.3f}s, "
+        f"min {result['min_sec']:.3f}s over {result['runs']} runs"
+    ]
+    for item in result["slowest_imports"]:
+        lines.append(f"    {item['import_sec']:8.4f}s  {item['package']}")
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option(
+    "--command",
+    "commands",
+    type=click.Choice(list(COMMANDS)),
+    multiple=True,
+    help="Commands to benchmark. Defaults to all of them.",
+)
+@click.option("--runs", type=int, default=5, show_default=True)
+@click.option(
+    "--max-seconds",
+    type=float,
+    default=None,
+    help="Largest allowed median time of any command.",
+)
+@click.option("--output", type=click.Path(), help="Write the results to a JSON file.")
+def main(
+    commands: List[str], runs: int, max_seconds: Optional[float], output: Optional[str]
+) -> None:
+    failures = [
+        f"importing datahub.entrypoints imports {heavy}"
+        for heavy in get_heavy_imports()
+    ]
+
+    results = []
+    for command in commands or COMMANDS:
+        result = run_benchmark(command, runs=runs)
+        click.echo(_format_result(result))
+        results.append(result)
+        if max_seconds is not None and result["median_sec"] > max_seconds:
+            failures.append(
+                f"datahub {command} took {result['median_sec']:.3f}s, more than {max_seconds}s"
+            )
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if failures:
+        click.echo("CLI startup regressions:\n" + "\n".join(failures), err=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,531 @@
+"""
+Throughput benchmark for the ingestion framework.
+
+Drives a Pipeline with a synthetic source through the file, console and datahub-rest
+sinks, where the REST sink talks to a local stub of GMS that accepts every request.
+For each scenario and sink, it reports records/sec, the p50/p99 latency and CPU time
+of each pipeline stage, and the peak RSS of the run. Every benchmark runs in a fresh
+process, so that peak RSS is not carried over between benchmarks.
+
+Run it from the metadata-ingestion directory, for instance:
+
+    python -m tests.performance.ingestion_benchmark --output results.json
+    python -m tests.performance.ingestion_benchmark --scenario wide_schema --sink file \
+        --num-entities 200 --baseline results.json
+
+With --baseline, the exit code is non-zero if the throughput of any benchmark dropped
+by more than --max-regression compared to the baseline results.
+"""
+import contextlib
+import dataclasses
+import functools
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+# Must be set before datahub is imported, so that benchmarks never send telemetry.
+os.environ.setdefault("DATAHUB_TELEMETRY_ENABLED", "false")
+
+import click  # noqa: E402
+
+import datahub.emitter.mce_builder as builder  # noqa: E402
+from datahub.configuration.common import ConfigModel  # noqa: E402
+from datahub.configuration.time_window_config import (  # noqa: E402
+    BucketDuration,
+    get_time_bucket,
+)
+from datahub.emitter.mcp import MetadataChangeProposalWrapper  # noqa: E402
+from datahub.ingestion.api.common import PipelineContext  # noqa: E402
+from datahub.ingestion.api.source import Source, SourceReport  # noqa: E402
+from datahub.ingestion.api.workunit import MetadataWorkUnit  # noqa: E402
+from datahub.ingestion.run.pipeline import Pipeline  # noqa: E402
+from datahub.ingestion.source.usage.usage_common import (  # noqa: E402
+    BaseUsageConfig,
+    UsageAggregator,
+)
+from datahub.metadata.schema_classes import (  # noqa: E402
+    DatasetPropertiesClass,
+    DatasetSnapshotClass,
+    GlobalTagsClass,
+    MetadataChangeEventClass,
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StatusClass,
+    StringTypeClass,
+    SubTypesClass,
+    TagAssociationClass,
+    UpstreamClass,
+    UpstreamLineageClass,
+)
+
+SCENARIOS = ["wide_schema", "many_entities", "usage"]
+SINKS = ["file", "console", "datahub-rest"]
+
+DEFAULT_TRANSFORMERS: List[dict] = [
+    {
+        "type": "simple_add_dataset_tags",
+        "config": {"tag_urns": ["urn:li:tag:benchmark"]},
+    },
+    {
+        "type": "simple_add_dataset_ownership",
+        "config": {"owner_urns": ["urn:li:corpuser:benchmark"]},
+    },
+]
+
+T = TypeVar("T")
+
+
+class SyntheticSourceConfig(ConfigModel):
+    scenario: str = "many_entities"
+    # Number of datasets that metadata is generated for.
+    num_entities: int = 1000
+    # Number of schema fields per dataset in the wide_schema scenario.
+    num_fields: int = 500
+    # Number of daily usage buckets per dataset in the usage scenario.
+    num_usage_buckets: int = 30
+    # Number of read events per dataset and bucket in the usage scenario.
+    num_reads_per_bucket: int = 20
+
+
+class SyntheticSource(Source):
+    """
+    Generates deterministic metadata for a benchmark scenario.
+
+    - wide_schema: a few datasets with very wide schemas.
+    - many_entities: many datasets with small aspects, as both MCEs and MCPs.
+    - usage: read events that are aggregated into usage statistics.
+    """
+
+    def __init__(self, config: SyntheticSourceConfig, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.config = config
+        self.report = SourceReport()
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "SyntheticSource":
+        config = SyntheticSourceConfig.parse_obj(config_dict)
+        return cls(config, ctx)
+
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        generators: Dict[str, Callable[[], Iterable[MetadataWorkUnit]]] = {
+            "wide_schema": self._get_wide_schema_workunits,
+            "many_entities": self._get_many_entities_workunits,
+            "usage": self._get_usage_workunits,
+        }
+        for wu in generators[self.config.scenario]():
+            self.report.report_workunit(wu)
+            yield wu
+
+    def _dataset_urn(self, i: int) -> str:
+        return builder.make_dataset_urn("benchmark", f"db.schema.table_{i}")
+
+    def _get_wide_schema_workunits(self) -> Iterable[MetadataWorkUnit]:
+        for i in range(self.config.num_entities):
+            urn = self._dataset_urn(i)
+            schema = SchemaMetadataClass(
+                schemaName=f"table_{i}",
+                platform=builder.make_data_platform_urn("benchmark"),
+                version=0,
+                hash="",
+                platformSchema=OtherSchemaClass(rawSchema=""),
+                fields=[
+                    SchemaFieldClass(
+                        fieldPath=f"column_{j}",
+                        type=SchemaFieldDataTypeClass(type=StringTypeClass()),
+                        nativeDataType="VARCHAR(16777216)",
+                        description=f"Description of column {j}",
+                        globalTags=GlobalTagsClass(
+                            tags=[TagAssociationClass(tag="urn:li:tag:pii")]
+                        ),
+                    )
+                    for j in range(self.config.num_fields)
+                ],
+            )
+            yield MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=schema
+            ).as_workunit()
+
+    def _get_many_entities_workunits(self) -> Iterable[MetadataWorkUnit]:
+        for i in range(self.config.num_entities):
+            urn = self._dataset_urn(i)
+            mce = MetadataChangeEventClass(
+                proposedSnapshot=DatasetSnapshotClass(
+                    urn=urn,
+                    aspects=[
+                        StatusClass(removed=False),
+                        DatasetPropertiesClass(
+                            description=f"Table number {i}",
+                            customProperties={"index": str(i), "scenario": "many"},
+                        ),
+                    ],
+                )
+            )
+            yield MetadataWorkUnit(id=f"{urn}-mce", mce=mce)
+            yield MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=SubTypesClass(typeNames=["table"])
+            ).as_workunit()
+            if i > 0:
+                yield MetadataChangeProposalWrapper(
+                    entityUrn=urn,
+                    aspect=UpstreamLineageClass(
+                        upstreams=[
+                            UpstreamClass(
+                                dataset=self._dataset_urn(i - 1), type="TRANSFORMED"
+                            )
+                        ]
+                    ),
+                ).as_workunit()
+
+    def _get_usage_workunits(self) -> Iterable[MetadataWorkUnit]:
+        usage_config = BaseUsageConfig()
+        aggregator: UsageAggregator[str] = UsageAggregator(usage_config)
+        start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        for bucket in range(self.config.num_usage_buckets):
+            bucket_start_time = get_time_bucket(
+                start + timedelta(days=bucket), BucketDuration.DAY
+            )
+            for i in range(self.config.num_entities):
+                for read in range(self.config.num_reads_per_bucket):
+                    aggregator.aggregate_event(
+                        bucket_start_time,
+                        f"db.schema.table_{i}",
+                        f"user_{read % 7}@example.com",
+                        f"SELECT column_{read % 3} FROM db.schema.table_{i} WHERE id = {read % 11}",
+                        [f"column_{read % 3}"],
+                    )
+        try:
+            for agg in aggregator.get_aggregated_datasets():
+                yield agg.make_usage_workunit(
+                    BucketDuration.DAY,
+                    lambda resource: builder.make_dataset_urn("benchmark", resource),
+                    usage_config.top_n_queries,
+                    usage_config.format_sql_queries,
+                    usage_config.include_top_n_queries,
+                )
+        finally:
+            aggregator.close()
+
+    def get_report(self) -> SourceReport:
+        return self.report
+
+    def close(self) -> None:
+        pass
+
+
+class _StubGMSHandler(BaseHTTPRequestHandler):
+    num_requests = 0
+    num_bytes = 0
+    _lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        self._respond({"noCode": "true", "versions": {}})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self._lock:
+            _StubGMSHandler.num_requests += 1
+            _StubGMSHandler.num_bytes += len(body)
+        self._respond({})
+
+    def _respond(self, obj: dict) -> None:
+        payload = json.dumps(obj).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def stub_gms_server() -> Iterator[str]:
+    """Runs a local HTTP server that accepts every GMS request, and yields its url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGMSHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _percentile_ms(sorted_latencies: List[float], percentile: float) -> float:
+    index = min(
+        len(sorted_latencies) - 1,
+        int(round(percentile / 100 * (len(sorted_latencies) - 1))),
+    )
+    return round(sorted_latencies[index] * 1000, 4)
+
+
+@dataclasses.dataclass
+class StageStats:
+    latencies_sec: List[float] = dataclasses.field(default_factory=list)
+    cpu_sec: float = 0.0
+
+    def record(self, latency_sec: float, cpu_sec: float) -> None:
+        self.latencies_sec.append(latency_sec)
+        self.cpu_sec += cpu_sec
+
+    def as_obj(self) -> dict:
+        if not self.latencies_sec:
+            return {"count": 0}
+        latencies = sorted(self.latencies_sec)
+        return {
+            "count": len(latencies),
+            "total_sec": round(sum(latencies), 4),
+            "cpu_sec": round(self.cpu_sec, 4),
+            "p50_ms": _percentile_ms(latencies, 50),
+            "p99_ms": _percentile_ms(latencies, 99),
+            "max_ms": round(latencies[-1] * 1000, 4),
+        }
+
+
+def _timed_iter(iterable: Iterable[T], stats: StageStats) -> Iterator[T]:
+    """Records the time spent producing each item of the iterable."""
+    iterator = iter(iterable)
+    while True:
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        stats.record(time.perf_counter() - start, time.thread_time() - cpu_start)
+        yield item
+
+
+def _timed_call(fn: Callable[..., T], stats: StageStats) -> Callable[..., T]:
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            stats.record(time.perf_counter() - start, time.thread_time() - cpu_start)
+
+    return wrapper
+
+
+def _get_peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Not available on Windows.
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return round(max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_benchmark(
+    scenario: str,
+    sink: str,
+    source_config: Optional[dict] = None,
+    transformers: Optional[List[dict]] = None,
+) -> dict:
+    """Runs one benchmark in the current process and returns its results."""
+    stages: Dict[str, StageStats] = {
+        "source": StageStats(),
+        "transform": StageStats(),
+        "sink_write": StageStats(),
+        "sink_close": StageStats(),
+    }
+    with contextlib.ExitStack() as stack:
+        tmp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        sink_config: dict = {"type": sink}
+        if sink == "file":
+            sink_config["config"] = {
+                "filename": str(pathlib.Path(tmp_dir) / "output.json")
+            }
+        elif sink == "datahub-rest":
+            sink_config["config"] = {"server": stack.enter_context(stub_gms_server())}
+        elif sink == "console":
+            # Measure formatting the records, not how fast the terminal is.
+            devnull = stack.enter_context(open(os.devnull, "w"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+
+        pipeline = Pipeline.create(
+            {
+                "run_id": f"benchmark-{scenario}-{sink}",
+                "source": {
+                    "type": f"{__name__}.SyntheticSource",
+                    "config": {"scenario": scenario, **(source_config or {})},
+                },
+                "transformers": DEFAULT_TRANSFORMERS
+                if transformers is None
+                else transformers,
+                "sink": sink_config,
+            },
+            no_default_report=True,
+        )
+
+        get_workunits = pipeline.source.get_workunits
+        pipeline.source.get_workunits = lambda: _timed_iter(  # type: ignore
+            get_workunits(), stages["source"]
+        )
+        transform = pipeline.transform
+        pipeline.transform = lambda records: _timed_iter(  # type: ignore
+            transform(records), stages["transform"]
+        )
+        pipeline.sink.write_record_async = _timed_call(  # type: ignore
+            pipeline.sink.write_record_async, stages["sink_write"]
+        )
+        pipeline.sink.close = _timed_call(  # type: ignore
+            pipeline.sink.close, stages["sink_close"]
+        )
+
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        pipeline.run()
+        elapsed_sec = time.perf_counter() - start
+        cpu_sec = time.process_time() - cpu_start
+        pipeline.raise_from_status()
+
+    num_records = pipeline.sink.get_report().total_records_written
+    return {
+        "scenario": scenario,
+        "sink": sink,
+        "num_workunits": pipeline.source.get_report().events_produced,
+        "num_records": num_records,
+        "elapsed_sec": round(elapsed_sec, 3),
+        "records_per_sec": round(num_records / elapsed_sec, 1),
+        "process_cpu_sec": round(cpu_sec, 3),
+        "peak_rss_mb": _get_peak_rss_mb(),
+        "stages": {name: stats.as_obj() for name, stats in stages.items()},
+    }
+
+
+def run_benchmark_in_subprocess(*args: Any, **kwargs: Any) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(run_benchmark, *args, **kwargs).result()
+
+
+def find_regressions(
+    results: List[dict], baseline: List[dict], max_regression: float
+) -> List[str]:
+    """Returns a message for every benchmark that is slower than its baseline."""
+    baseline_by_key = {(r["scenario"], r["sink"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_by_key.get((result["scenario"], result["sink"]))
+        if not previous:
+            continue
+        min_records_per_sec = previous["records_per_sec"] * (1 - max_regression)
+        if result["records_per_sec"] < min_records_per_sec:
+            regressions.append(
+                f"{result['scenario']} -> {result['sink']}: "
+                f"{result['records_per_sec']} records/sec, "
+                f"baseline {previous['records_per_sec']} records/sec"
+            )
+    return regressions
+
+
+def _format_result(result: dict) -> str:
+    lines = [
+        f"{result['scenario']} -> {result['sink']}: "
+        f"{result['num_records']} records in {result['elapsed_sec']}s, "
+        f"{result['records_per_sec']} records/sec, "
+        f"{result['process_cpu_sec']}s CPU, peak RSS {result['peak_rss_mb']} MB"
+    ]
+    for name, stage in result["stages"].items():
+        if stage["count"]:
+            lines.append(
+                f"    {name:<11} count={stage['count']:<8} "
+                f"total={stage['total_sec']:<9} cpu={stage['cpu_sec']:<9} "
+                f"p50={stage['p50_ms']}ms p99={stage['p99_ms']}ms"
+            )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(SCENARIOS),
+    multiple=True,
+    help="Scenarios to run. Defaults to all of them.",
+)
+@click.option(
+    "--sink",
+    "sinks",
+    type=click.Choice(SINKS),
+    multiple=True,
+    help="Sinks to run. Defaults to all of them.",
+)
+@click.option("--num-entities", type=int, help="Overrides the number of datasets.")
+@click.option("--num-fields", type=int, help="Overrides the width of wide schemas.")
+@click.option(
+    "--num-usage-buckets", type=int, help="Overrides the number of usage buckets."
+)
+@click.option("--no-transformers", is_flag=True, help="Do not run any transformers.")
+@click.option("--output", type=click.Path(), help="Write the results to this file.")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True),
+    help="Results of a previous run to compare against.",
+)
+@click.option(
+    "--max-regression",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Largest allowed drop in records/sec compared to the baseline.",
+)
+def main(
+    scenarios: List[str],
+    sinks: List[str],
+    num_entities: Optional[int],
+    num_fields: Optional[int],
+    num_usage_buckets: Optional[int],
+    no_transformers: bool,
+    output: Optional[str],
+    baseline: Optional[str],
+    max_regression: float,
+) -> None:
+    source_config = {
+        key: value
+        for key, value in {
+            "num_entities": num_entities,
+            "num_fields": num_fields,
+            "num_usage_buckets": num_usage_buckets,
+        }.items()
+        if value is not None
+    }
+    results = []
+    for scenario in scenarios or SCENARIOS:
+        for sink in sinks or SINKS:
+            result = run_benchmark_in_subprocess(
+                scenario,
+                sink,
+                source_config=source_config,
+                transformers=[] if no_transformers else None,
+            )
+            click.echo(_format_result(result))
+            results.append(result)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = find_regressions(results, json.load(f), max_regression)
+        if regressions:
+            click.echo("Throughput regressions:\n" + "\n".join(regressions), err=True)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Import benchmark for the generated schema classes.
+
+Codegen splits the generated classes into one module per namespace, behind the lazy
+datahub.metadata.schema_classes facade. This benchmark measures what a few typical
+ways of using the classes cost: the import time, the growth of the peak RSS and the
+number of namespace modules that get loaded. Each scenario runs in a fresh process.
+
+Run it from the metadata-ingestion directory, after running codegen:
+
+    python -m tests.performance.schema_classes_benchmark
+    python -m tests.performance.schema_classes_benchmark --scenario single_aspect \
+        --runs 10 --output results.json
+"""
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+import click
+
+SCENARIOS: Dict[str, str] = {
+    "facade": "import datahub.metadata.schema_classes",
+    "single_aspect": "from datahub.metadata.schema_classes import StatusClass",
+    "mce": "from datahub.metadata.schema_classes import MetadataChangeEventClass",
+    "all_aspects": "from datahub.metadata.schema_classes import ASPECT_CLASSES",
+    "mce_builder": "import datahub.emitter.mce_builder",
+}
+
+_SPLIT_PACKAGE = "datahub.metadata._schema_classes"
+
+# Runs in the child process, and prints the measurements as JSON.
+_MEASURE_TEMPLATE = """
+import json, resource, sys, time
+
+def peak_rss_mb():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+rss_before = peak_rss_mb()
+start = time.perf_counter()
+{statement}
+import_sec = time.perf_counter() - start
+print(json.dumps({{
+    "import_sec": import_sec,
+    "rss_growth_mb": peak_rss_mb() - rss_before,
+    "namespace_modules": len([
+        m for m in sys.modules if m.startswith("{split_package}.") and not m.endswith("._base")
+    ]),
+}}))
+"""
+
+
+def run_benchmark(scenario: str, runs: int = 5) -> dict:
+    code = _MEASURE_TEMPLATE.format(
+        statement=SCENARIOS[scenario], split_package=_SPLIT_PACKAGE
+    )
+    measurements: List[dict] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        measurements.append(json.loads(output))
+
+    return {
+        "scenario": scenario,
+        "runs": runs,
+        "median_import_sec": statistics.median(m["import_sec"] for m in measurements),
+        "median_rss_growth_mb": round(
+            statistics.median(m["rss_growth_mb"] for m in measurements), 1
+        ),
+        "namespace_modules": measurements[-1]["namespace_modules"],
+    }
+
+
+def _format_result(result: dict) -> str:
+    return (
+        f"{result['scenario']:>14}: {result['median_import_sec']:.3f}s, "
+        f"+{result['median_rss_growth_mb']} MB peak RSS, "
+        f"{result['namespace_modules']} namespace modules"
+    )
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(list(SCENARIOS)),
+    multiple=True,
+    help="Scenarios to benchmark. Defaults to all of them.",
+)
+@click.option("--runs", type=int, default=5, show_default=True)
+@click.option("--output", type=click.Path(), help="Write the results to a JSON file.")
+def main(scenarios: List[str], runs: int, output: Optional[str]) -> None:
+    results = []
+    for scenario in scenarios or SCENARIOS:
+        result = run_benchmark(scenario, runs=runs)
+        click.echo(_format_result(result))
+        results.append(result)
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
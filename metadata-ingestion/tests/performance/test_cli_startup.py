@@ -0,0 +1,22 @@
+"""
+Guards the cold-start latency of the datahub CLI.
+
+Like the other performance tests, these are not part of the default test run. Run
+them with `pytest tests/performance/test_cli_startup.py`.
+"""
+from tests.performance.cli_startup_benchmark import get_heavy_imports, run_benchmark
+
+# Generous, so that the test is not flaky on slow CI machines. Most of the startup
+# time is spent importing click, requests and the telemetry client.
+MAX_VERSION_SECONDS = 3.0
+
+
+def test_entrypoint_does_not_import_heavy_modules() -> None:
+    assert get_heavy_imports() == []
+
+
+def test_version_command_cold_start() -> None:
+    result = run_benchmark("version", runs=3)
+
+    assert result["median_sec"] < MAX_VERSION_SECONDS
+    assert result["num_imported_packages"] > 0
@@ -0,0 +1,51 @@
+"""
+Smoke tests for the ingestion benchmark harness, with tiny synthetic sources.
+
+Like the other performance tests, these are not part of the default test run. Run
+them with `pytest tests/performance/test_ingestion_benchmark.py`.
+"""
+import pytest
+
+from tests.performance.ingestion_benchmark import (
+    SCENARIOS,
+    SINKS,
+    find_regressions,
+    run_benchmark,
+)
+
+
+@pytest.mark.parametrize("sink", SINKS)
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_run_benchmark(scenario: str, sink: str) -> None:
+    result = run_benchmark(
+        scenario,
+        sink,
+        source_config={"num_entities": 5, "num_fields": 10, "num_usage_buckets": 2},
+    )
+
+    assert result["num_workunits"] > 0
+    assert result["num_records"] >= result["num_workunits"]
+    assert result["records_per_sec"] > 0
+    stages = result["stages"]
+    assert stages["source"]["count"] == result["num_workunits"]
+    assert stages["sink_write"]["count"] == result["num_records"]
+    assert stages["sink_close"]["count"] == 1
+    for stage in stages.values():
+        assert stage["p50_ms"] <= stage["p99_ms"] <= stage["max_ms"]
+
+
+def test_find_regressions() -> None:
+    baseline = [
+        {"scenario": "usage", "sink": "file", "records_per_sec": 1000.0},
+        {"scenario": "usage", "sink": "console", "records_per_sec": 1000.0},
+    ]
+    results = [
+        {"scenario": "usage", "sink": "file", "records_per_sec": 850.0},
+        {"scenario": "usage", "sink": "console", "records_per_sec": 700.0},
+        {"scenario": "wide_schema", "sink": "file", "records_per_sec": 1.0},
+    ]
+
+    regressions = find_regressions(results, baseline, max_regression=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("usage -> console: 700.0 records/sec")
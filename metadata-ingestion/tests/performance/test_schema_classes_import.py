@@ -0,0 +1,18 @@
+"""
+Checks that the generated schema classes are loaded lazily.
+
+Like the other performance tests, these are not part of the default test run. Run
+them with `pytest tests/performance/test_schema_classes_import.py`.
+"""
+from tests.performance.schema_classes_benchmark import run_benchmark
+
+
+def test_facade_does_not_load_namespace_modules() -> None:
+    assert run_benchmark("facade", runs=1)["namespace_modules"] == 0
+
+
+def test_single_aspect_loads_fewer_modules_than_all_aspects() -> None:
+    single_aspect = run_benchmark("single_aspect", runs=1)
+    all_aspects = run_benchmark("all_aspects", runs=1)
+
+    assert 0 < single_aspect["namespace_modules"] < all_aspects["namespace_modules"]
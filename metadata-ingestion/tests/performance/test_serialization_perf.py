@@ -0,0 +1,108 @@
+"""
+Microbenchmark for the payload serialization path of the REST emitter.
+
+These tests are not part of the default test run. Run them with
+`pytest tests/performance/test_serialization_perf.py -s` to see the throughput
+of each serialization strategy for a few typical aspects.
+"""
+import gzip
+import json
+from typing import Callable, Dict
+
+import pytest
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.serialization_helper import pre_json_dumps, pre_json_transform
+from datahub.utilities.perf_timer import PerfTimer
+
+ITERATIONS = 20
+
+
+def _make_schema_metadata(num_fields: int) -> models.SchemaMetadataClass:
+    return models.SchemaMetadataClass(
+        schemaName="wide_table",
+        platform="urn:li:dataPlatform:snowflake",
+        version=0,
+        hash="",
+        platformSchema=models.OtherSchemaClass(rawSchema=""),
+        fields=[
+            models.SchemaFieldClass(
+                fieldPath=f"column_{i}",
+                type=models.SchemaFieldDataTypeClass(type=models.StringTypeClass()),
+                nativeDataType="VARCHAR(16777216)",
+                description=f"Description of column {i}",
+                nullable=True,
+                globalTags=models.GlobalTagsClass(
+                    tags=[models.TagAssociationClass(tag="urn:li:tag:pii")]
+                ),
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+TYPICAL_ASPECTS: Dict[str, models._Aspect] = {
+    "schemaMetadata-5000-columns": _make_schema_metadata(5000),
+    "schemaMetadata-50-columns": _make_schema_metadata(50),
+    "datasetProperties": models.DatasetPropertiesClass(
+        description="A typical table",
+        customProperties={f"property_{i}": f"value_{i}" for i in range(20)},
+    ),
+    "ownership": models.OwnershipClass(
+        owners=[
+            models.OwnerClass(
+                owner=f"urn:li:corpuser:user_{i}",
+                type=models.OwnershipTypeClass.DATAOWNER,
+            )
+            for i in range(5)
+        ]
+    ),
+}
+
+SERIALIZERS: Dict[str, Callable[[dict], bytes]] = {
+    "default": lambda obj: json.dumps(pre_json_transform(obj)).encode(),
+    "fast": lambda obj: pre_json_dumps(obj).encode(),
+    "fast+gzip": lambda obj: gzip.compress(
+        pre_json_dumps(obj).encode(),
+        compresslevel=DatahubRestEmitter.GZIP_COMPRESS_LEVEL,
+    ),
+}
+
+
+@pytest.mark.parametrize("serializer_name", SERIALIZERS.keys())
+@pytest.mark.parametrize("aspect_name", TYPICAL_ASPECTS.keys())
+def test_serialization_throughput(aspect_name: str, serializer_name: str) -> None:
+    mcp = MetadataChangeProposalWrapper(
+        entityUrn=make_dataset_urn("snowflake", "db.schema.wide_table"),
+        aspect=TYPICAL_ASPECTS[aspect_name],
+    )
+    serializer = SERIALIZERS[serializer_name]
+    raw_size = len(json.dumps(pre_json_transform(mcp.to_obj())))
+
+    wire_size = 0
+    with PerfTimer() as timer:
+        for _ in range(ITERATIONS):
+            # to_obj is part of the measurement, since every emit pays for it.
+            wire_size = len(serializer(mcp.to_obj()))
+    elapsed = timer.elapsed_seconds()
+
+    input_bytes_per_sec = raw_size * ITERATIONS / elapsed
+    print(
+        f"{aspect_name:<28} {serializer_name:<10} "
+        f"{input_bytes_per_sec / 1024 / 1024:8.2f} MiB/s of JSON, "
+        f"{wire_size:>9} bytes on the wire ({wire_size / raw_size:.0%} of default)"
+    )
+    assert wire_size > 0
+
+
+@pytest.mark.parametrize("aspect_name", TYPICAL_ASPECTS.keys())
+def test_fast_serialization_is_equivalent(aspect_name: str) -> None:
+    obj = MetadataChangeProposalWrapper(
+        entityUrn=make_dataset_urn("snowflake", "db.schema.wide_table"),
+        aspect=TYPICAL_ASPECTS[aspect_name],
+    ).to_obj()
+
+    assert json.loads(pre_json_dumps(obj)) == pre_json_transform(obj)
@@ -88,6 +88,57 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+def test_infer_schema_jsonl():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(test_table.to_json(orient="records", lines=True), encoding="utf-8")
+        )
+        file.write(b"not json\n")
+        file.seek(0)
+
+        fields = json.JsonInferrer().infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+
+
+def test_infer_schema_json_samples_rows():
+    records = [{"id": i} for i in range(10)] + [{"id": 10, "extra": "x"}]
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(bytes(ujson.dumps(records), encoding="utf-8"))
+        file.seek(0)
+
+        fields = json.JsonInferrer(max_rows=10).infer_schema(file)
+
+        assert_field_paths_match(fields, ["id"])
+
+
+def test_infer_schema_json_reads_at_most_max_bytes():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(
+                ujson.dumps(
+                    {
+                        "boolean_field": True,
+                        "integer_field": 1,
+                        "string_field": "a",
+                        "large_field": ["x" * 100] * 10000,
+                        "missing_field": 1,
+                    }
+                ),
+                encoding="utf-8",
+            )
+        )
+        file.seek(0)
+
+        fields = json.JsonInferrer(max_bytes=1000).infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        assert file.tell() <= 1000
+        assert_field_paths_match(fields, sorted(["large_field", *expected_field_paths]))
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
@@ -145,3 +145,56 @@ def test_supported_encodings():
     # 2. Test Base85 encoding
     test_state.serde = "base85"
     test_serde_idempotence(test_state)
+
+    # 3. Test Base85 encoding of zlib compressed json
+    test_state.serde = "base85-zlib-json"
+    test_serde_idempotence(test_state)
+
+
+def test_compact_encoding_of_many_urns():
+    state = BaseSQLAlchemyCheckpointState()
+    for i in range(100000):
+        state.add_checkpoint_urn(
+            type="table",
+            urn=make_dataset_urn(
+                "mysql", f"db_{i % 10}.schema_{i % 100}.table_{i}", "prod"
+            ),
+        )
+    # Duplicates are dropped when the state is serialized.
+    state.add_checkpoint_urn(
+        type="table", urn=make_dataset_urn("mysql", "db_0.schema_0.table_0", "prod")
+    )
+    state.add_checkpoint_urn(
+        type="view", urn=make_dataset_urn("mysql", "db1.v1", "prod")
+    )
+    assert state.serde == "base85-zlib-json"
+
+    payload = state.to_bytes()
+    assert len(payload) < len(state.copy(update={"serde": "base85"}).to_bytes()) / 5
+
+    checkpoint_aspect = DatahubIngestionCheckpointClass(
+        timestampMillis=int(datetime.utcnow().timestamp() * 1000),
+        pipelineName=test_pipeline_name,
+        platformInstanceId=test_platform_instance_id,
+        config=test_source_config.json(),
+        state=IngestionCheckpointStateClass(
+            formatVersion=state.version, serde=state.serde, payload=payload
+        ),
+        runId=test_run_id,
+    )
+    checkpoint_obj = Checkpoint.create_from_checkpoint_aspect(
+        job_name=test_job_name,
+        checkpoint_aspect=checkpoint_aspect,
+        state_class=BaseSQLAlchemyCheckpointState,
+        config_class=PostgresConfig,
+    )
+    assert checkpoint_obj is not None
+    deserialized_state = checkpoint_obj.state
+    assert deserialized_state.encoded_table_urns == sorted(
+        set(state.encoded_table_urns)
+    )
+    assert deserialized_state.encoded_view_urns == state.encoded_view_urns
+    assert deserialized_state.encoded_container_urns == []
+    assert not list(
+        deserialized_state.get_urns_not_in(type="table", other_checkpoint_state=state)
+    )
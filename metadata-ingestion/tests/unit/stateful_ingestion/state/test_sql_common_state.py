@@ -2,6 +2,7 @@ from datahub.emitter.mce_builder import make_container_urn, make_dataset_urn
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
+from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
 
 
 def test_sql_common_state() -> None:
@@ -32,3 +33,27 @@ def test_sql_common_state() -> None:
     assert (
         len(container_urns_diff) == 1 and container_urns_diff[0] == test_container_urn
     )
+
+
+def test_front_coding_roundtrip() -> None:
+    encoded_urns = [
+        "mysql||db1.t2||PROD",
+        "mysql||db1.t1||PROD",
+        "mysql||db1.t10||PROD",
+        "mysql||db1.t1||PROD",
+        "postgres||db1.t1||PROD",
+        "",
+    ]
+    prefix_lengths, suffixes = CheckpointStateUtil.front_code(encoded_urns)
+    # Urns are sorted and deduplicated, and "|" sorts after digits.
+    assert prefix_lengths == [0, 0, 13, 12, 0]
+    assert suffixes == [
+        "",
+        "mysql||db1.t10||PROD",
+        "||PROD",
+        "2||PROD",
+        "postgres||db1.t1||PROD",
+    ]
+    assert CheckpointStateUtil.front_decode(prefix_lengths, suffixes) == sorted(
+        set(encoded_urns)
+    )
@@ -0,0 +1,139 @@
+import importlib
+import importlib.util
+import json
+import pathlib
+import sys
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from avrogen import write_schema_files
+
+# The codegen script is not part of the package, so it is loaded from its path.
+_spec = importlib.util.spec_from_file_location(
+    "avro_codegen",
+    pathlib.Path(__file__).parents[2] / "scripts" / "avro_codegen.py",
+)
+assert _spec and _spec.loader
+avro_codegen: Any = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(avro_codegen)
+
+PACKAGE = "synthetic_schema"
+
+AUDIT_STAMP_SCHEMA = {
+    "type": "record",
+    "name": "AuditStamp",
+    "namespace": "com.linkedin.pegasus2avro.common",
+    "fields": [
+        {"name": "time", "type": "long"},
+        {"name": "actor", "type": "string"},
+    ],
+}
+STATUS_SCHEMA = {
+    "type": "record",
+    "name": "Status",
+    "namespace": "com.linkedin.pegasus2avro.common",
+    "fields": [{"name": "removed", "type": "boolean", "default": False}],
+    "Aspect": {"name": "status"},
+}
+# Refers to a class of another namespace.
+DATASET_PROPERTIES_SCHEMA = {
+    "type": "record",
+    "name": "DatasetProperties",
+    "namespace": "com.linkedin.pegasus2avro.dataset",
+    "fields": [
+        {"name": "name", "type": ["null", "string"], "default": None},
+        {"name": "created", "type": "com.linkedin.pegasus2avro.common.AuditStamp"},
+    ],
+    "Aspect": {"name": "datasetProperties"},
+}
+
+
+@pytest.fixture
+def schema_classes(tmp_path: pathlib.Path) -> Iterator[Any]:
+    outdir = tmp_path / PACKAGE
+    schemas = [AUDIT_STAMP_SCHEMA, STATUS_SCHEMA, DATASET_PROPERTIES_SCHEMA]
+    write_schema_files(avro_codegen.merge_schemas(schemas), str(outdir))
+    (outdir / "__init__.py").write_text("")
+    avro_codegen.annotate_aspects(
+        [STATUS_SCHEMA, DATASET_PROPERTIES_SCHEMA], outdir / "schema_classes.py"
+    )
+    avro_codegen.split_schema_classes(outdir / "schema_classes.py")
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module(f"{PACKAGE}.schema_classes")
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module in list(sys.modules):
+            if module == PACKAGE or module.startswith(f"{PACKAGE}."):
+                del sys.modules[module]
+
+
+def _loaded_namespace_modules() -> List[str]:
+    prefix = f"{PACKAGE}._schema_classes."
+    return sorted(
+        module[len(prefix) :] for module in sys.modules if module.startswith(prefix)
+    )
+
+
+def test_namespace_modules_are_loaded_on_first_access(schema_classes: Any) -> None:
+    assert _loaded_namespace_modules() == []
+
+    assert schema_classes.StatusClass().removed is False
+    assert _loaded_namespace_modules() == ["_base", "common"]
+
+    # The module of the referenced class is imported along with the class.
+    schema_classes.DatasetPropertiesClass
+    assert _loaded_namespace_modules() == ["_base", "common", "dataset"]
+
+
+def test_classes_refer_to_other_modules(schema_classes: Any) -> None:
+    properties = schema_classes.DatasetPropertiesClass(
+        name="orders",
+        created=schema_classes.AuditStampClass(time=1, actor="urn:li:corpuser:a"),
+    )
+    obj: Dict[str, Any] = properties.to_obj()
+
+    assert obj == {
+        "name": "orders",
+        "created": {"time": 1, "actor": "urn:li:corpuser:a"},
+    }
+    restored = schema_classes.DatasetPropertiesClass.from_obj(
+        json.loads(json.dumps(obj))
+    )
+    assert isinstance(restored.created, schema_classes.AuditStampClass)
+    assert restored.created.actor == "urn:li:corpuser:a"
+    assert restored.ASPECT_NAME == "datasetProperties"
+
+
+def test_namespace_packages_reexport_the_classes(schema_classes: Any) -> None:
+    common = importlib.import_module(f"{PACKAGE}.com.linkedin.pegasus2avro.common")
+    dataset = importlib.import_module(f"{PACKAGE}.com.linkedin.pegasus2avro.dataset")
+
+    assert common.AuditStamp is schema_classes.AuditStampClass
+    assert common.Status is schema_classes.StatusClass
+    assert dataset.DatasetProperties is schema_classes.DatasetPropertiesClass
+
+
+def test_facade_exports_every_class(schema_classes: Any) -> None:
+    assert schema_classes.__all__ == [
+        "ASPECT_CLASSES",
+        "AuditStampClass",
+        "DatasetPropertiesClass",
+        "StatusClass",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec(f"from {PACKAGE}.schema_classes import *", namespace)
+    assert set(schema_classes.__all__) <= set(namespace)
+
+    assert schema_classes.ASPECT_CLASSES == [
+        schema_classes.StatusClass,
+        schema_classes.DatasetPropertiesClass,
+    ]
+    assert issubclass(schema_classes.StatusClass, schema_classes._Aspect)
+    assert (
+        schema_classes.get_schema_type("com.linkedin.pegasus2avro.common.Status")
+        is schema_classes.StatusClass.RECORD_SCHEMA
+    )
+    with pytest.raises(AttributeError):
+        schema_classes.MissingClass
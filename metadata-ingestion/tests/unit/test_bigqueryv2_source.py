@@ -0,0 +1,459 @@
+import re
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterator, List, Optional
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import TooManyRequests
+
+from datahub.configuration.common import AllowDenyPattern
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.bigquery_v2 import bigquery
+from datahub.ingestion.source.bigquery_v2.bigquery import BigqueryV2Source
+from datahub.ingestion.source.bigquery_v2.bigquery_audit import BigqueryTableIdentifier
+from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
+    BigqueryColumn,
+    BigQueryDataDictionary,
+    BigqueryDataset,
+    BigqueryProject,
+    BigqueryRegionMetadata,
+    BigqueryTable,
+    BigqueryTableSummary,
+    BigqueryView,
+    _get_dataset_prefixes,
+)
+
+PROJECTS = ["project-1", "project-2", "project-3"]
+DATASETS = ["dataset_a", "dataset_b", "dataset_c"]
+PARTITION_COLUMN = BigqueryColumn(
+    name="dt",
+    ordinal_position=1,
+    field_path="dt",
+    is_nullable=False,
+    is_partition_column=True,
+    data_type="DATE",
+    comment="",
+)
+
+
+def make_table(name: str) -> BigqueryTable:
+    return BigqueryTable(
+        name=name,
+        created=datetime(2022, 1, 1),
+        last_altered=None,
+        size_in_bytes=0,
+        rows_count=0,
+        expires=None,
+        clustering_fields=None,
+        labels=None,
+        num_partitions=None,
+        max_partition_id=None,
+        max_shard_id=None,
+        active_billable_bytes=None,
+        long_term_billable_bytes=None,
+        comment="",
+        ddl="",
+        time_partitioning=None,
+    )
+
+
+def run_source(
+    config: dict,
+    fail_views_once: Optional[str] = None,
+    fail_views: Optional[str] = None,
+    fail_columns: Optional[str] = None,
+    quota_retry_delay_sec: float = 0,
+) -> BigqueryV2Source:
+    source = BigqueryV2Source.create(
+        {
+            "include_table_lineage": False,
+            "include_usage_statistics": True,
+            **config,
+        },
+        PipelineContext(run_id="test_bigqueryv2_source"),
+    )
+    failed: List[str] = []
+
+    def get_views_for_dataset(
+        conn: mock.MagicMock, project_id: str, dataset_name: str
+    ) -> List[BigqueryView]:
+        if dataset_name == fail_views_once and not failed:
+            failed.append(dataset_name)
+            raise TooManyRequests("Exceeded rate limits")
+        if dataset_name == fail_views:
+            raise Exception("Access Denied")
+        return [
+            BigqueryView(
+                name="view",
+                created=datetime(2022, 1, 1),
+                last_altered=datetime(2022, 1, 1),
+                comment="",
+                ddl="select 1",
+            )
+        ]
+
+    def get_columns_for_dataset(
+        conn: mock.MagicMock, project_id: str, dataset_name: str
+    ) -> Optional[Dict[str, List[BigqueryColumn]]]:
+        if dataset_name == fail_columns:
+            return None
+        return {"table": [PARTITION_COLUMN]}
+
+    def get_columns_for_table(
+        conn: mock.MagicMock, table_identifier: BigqueryTableIdentifier
+    ) -> List[BigqueryColumn]:
+        if table_identifier.dataset == fail_columns:
+            raise Exception("Access Denied")
+        return []
+
+    conn = mock.MagicMock()
+    conn.list_tables.side_effect = lambda dataset_ref: [
+        mock.MagicMock(table_id="table")
+    ]
+    with mock.patch.object(
+        source, "get_bigquery_client", return_value=conn
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_projects",
+        return_value=[BigqueryProject(id=p, name=p) for p in PROJECTS],
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_datasets_for_project_id",
+        side_effect=lambda conn, project_id: [
+            BigqueryDataset(name=d) for d in DATASETS
+        ],
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_tables_for_dataset",
+        side_effect=lambda conn, project_id, dataset_name, tables: [
+            make_table(name) for name in tables
+        ],
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_views_for_dataset",
+        side_effect=get_views_for_dataset,
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_columns_for_dataset",
+        side_effect=get_columns_for_dataset,
+    ), mock.patch.object(
+        BigQueryDataDictionary,
+        "get_columns_for_table",
+        side_effect=get_columns_for_table,
+    ), mock.patch.object(
+        source.usage_extractor, "generate_usage_for_project", return_value=[]
+    ) as generate_usage, mock.patch.object(
+        source.profiler, "get_workunits", return_value=[]
+    ), mock.patch.object(
+        bigquery, "_QUOTA_RETRY_DELAY_SEC", quota_retry_delay_sec
+    ):
+        workunit_ids = [wu.id for wu in source.get_workunits()]
+
+    # The usage of each project is generated once, after all its datasets.
+    assert sorted(call.args[0] for call in generate_usage.call_args_list) == PROJECTS
+    for call in generate_usage.call_args_list:
+        assert call.args[1] == {
+            dataset: ["table", "view"] for dataset in DATASETS if dataset != fail_views
+        }
+
+    for project_id in PROJECTS:
+        for dataset in DATASETS:
+            if dataset in (fail_columns, fail_views):
+                continue
+            assert any(
+                f"{project_id}.{dataset}.table" in wu_id for wu_id in workunit_ids
+            )
+            assert any(
+                f"{project_id}.{dataset}.view" in wu_id for wu_id in workunit_ids
+            )
+    return source
+
+
+def test_bigqueryv2_projects_and_datasets_are_processed_concurrently() -> None:
+    source = run_source(
+        {"max_metadata_extraction_workers": 4, "profiling": {"enabled": True}}
+    )
+
+    tables: Dict[str, Dict[str, List[str]]] = {
+        project_id: {
+            dataset: [table.name for table in dataset_tables]
+            for dataset, dataset_tables in datasets.items()
+        }
+        for project_id, datasets in source.db_tables.items()
+    }
+    assert tables == {
+        project_id: {dataset: ["table"] for dataset in DATASETS}
+        for project_id in PROJECTS
+    }
+
+
+def test_bigqueryv2_single_worker_keeps_order() -> None:
+    source = run_source({})
+
+    assert list(source.report.metadata_extraction_sec) == [
+        f"{project_id}.{dataset}" for project_id in PROJECTS for dataset in DATASETS
+    ]
+
+
+def test_bigqueryv2_dataset_is_retried_when_quota_is_exceeded() -> None:
+    source = run_source(
+        {
+            "max_metadata_extraction_workers": 2,
+            "max_concurrent_datasets_per_project": 2,
+        },
+        fail_views_once="dataset_b",
+    )
+
+    assert source.report.num_metadata_extraction_quota_retries == 1
+
+
+def test_bigqueryv2_quota_retry_does_not_block_a_worker() -> None:
+    sleeping_threads: List[str] = []
+    sleep = time.sleep
+
+    def record_sleep(seconds: float) -> None:
+        sleeping_threads.append(threading.current_thread().name)
+        sleep(seconds)
+
+    with mock.patch.object(bigquery.time, "sleep", side_effect=record_sleep):
+        source = run_source(
+            {"max_metadata_extraction_workers": 1},
+            fail_views_once="dataset_a",
+            quota_retry_delay_sec=0.1,
+        )
+
+    assert source.report.num_metadata_extraction_quota_retries == 1
+    # Only the main thread waits for the retry, once nothing else can be fetched.
+    assert sleeping_threads == [threading.main_thread().name]
+
+
+def test_bigqueryv2_dataset_is_reported_when_fetching_fails() -> None:
+    source = run_source({"max_metadata_extraction_workers": 2}, fail_views="dataset_b")
+
+    assert sorted(source.report.failures) == [
+        f"{project_id}.dataset_b" for project_id in PROJECTS
+    ]
+    assert source.report.num_metadata_extraction_quota_retries == 0
+
+
+def test_bigqueryv2_dataset_is_skipped_when_getting_columns_fails() -> None:
+    source = run_source(
+        {"max_metadata_extraction_workers": 2}, fail_columns="dataset_b"
+    )
+
+    assert sorted(source.report.failures) == [
+        f"{project_id}.dataset_b" for project_id in PROJECTS
+    ]
+
+
+def region_query(
+    rows_read: List[str], fail: Optional[str] = None
+) -> Callable[[mock.MagicMock, str], Iterator[SimpleNamespace]]:
+    def table(dataset: str, name: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            table_schema=dataset,
+            table_name=name,
+            created=datetime(2022, 1, 1),
+            last_altered=None,
+            bytes=100,
+            row_count=10,
+            comment="region",
+            ddl="",
+            max_partition_id=None,
+            num_partitions=2,
+            active_billable_bytes=100,
+            long_term_billable_bytes=0,
+        )
+
+    def view(dataset: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            table_schema=dataset,
+            table_name="view",
+            created=datetime(2022, 1, 1),
+            last_altered=datetime(2022, 1, 2),
+            comment="region",
+            view_definition="select 1",
+        )
+
+    def column(dataset: str, table: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            table_schema=dataset,
+            table_name=table,
+            column_name="dt",
+            ordinal_position=1,
+            field_path="dt",
+            is_nullable="NO",
+            data_type="DATE",
+            comment="",
+            is_partitioning_column="YES",
+        )
+
+    # The datasets of the region; dataset_c is in another region.
+    datasets = ["dataset_a", "dataset_b"]
+
+    def query(conn: mock.MagicMock, sql: str) -> Iterator[SimpleNamespace]:
+        assert "`region-us`" in sql
+        if "INFORMATION_SCHEMA.SCHEMATA" in sql:
+            kind = "schemata"
+            rows = [SimpleNamespace(schema_name=d) for d in datasets]
+        elif "table_type in ('BASE TABLE'" in sql:
+            kind = "tables"
+            rows = [table(d, "table") for d in datasets]
+        elif "table_type in ('VIEW MATERIALIZED'" in sql:
+            kind = "views"
+            rows = [view(d) for d in datasets]
+        else:
+            kind = "columns"
+            rows = [column(d, t) for d in datasets for t in ["table", "view"]]
+        if kind == fail:
+            raise Exception("Access Denied")
+        for row in rows:
+            rows_read.append(f"{kind}.{getattr(row, 'table_schema', '')}")
+            yield row
+
+    return query
+
+
+def test_bigqueryv2_region_metadata_is_read_per_dataset() -> None:
+    rows_read: List[str] = []
+    with mock.patch.object(
+        BigQueryDataDictionary,
+        "get_query_result",
+        side_effect=region_query(rows_read),
+    ) as get_query_result:
+        region_metadata = BigqueryRegionMetadata(
+            mock.MagicMock(),
+            "project-1",
+            "us",
+            AllowDenyPattern(allow=["^dataset_.*"], deny=["dataset_b"]),
+        )
+
+        assert region_metadata.datasets == {"dataset_a"}
+        assert region_metadata.get("dataset_b") is None
+        assert region_metadata.get("dataset_c") is None
+        metadata = region_metadata.get("dataset_a")
+
+    # The prefix of the allowed datasets is pushed down into the queries.
+    assert all(
+        re.search(r"starts_with\(lower\(\w\.\w+\), 'dataset_'\)", call.args[1])
+        for call in get_query_result.call_args_list
+    )
+    # The rows are only read up to the first row of the next dataset.
+    assert rows_read == [
+        "schemata.",
+        "schemata.",
+        "tables.dataset_a",
+        "tables.dataset_b",
+        "views.dataset_a",
+        "views.dataset_b",
+        "columns.dataset_a",
+        "columns.dataset_a",
+        "columns.dataset_b",
+    ]
+    assert metadata is not None
+    assert list(metadata.tables) == ["table"]
+    assert [(view.name, view.last_altered) for view in metadata.views] == [
+        ("view", datetime(2022, 1, 2))
+    ]
+    assert metadata.columns is not None
+    assert {
+        table: [column.name for column in columns]
+        for table, columns in metadata.columns.items()
+    } == {"table": ["dt"], "view": ["dt"]}
+
+    # The metadata is kept until it is released, e.g. for retries.
+    assert region_metadata.get("dataset_a") is metadata
+    region_metadata.release("dataset_a")
+    assert region_metadata.get("dataset_a") is None
+
+
+def test_bigqueryv2_region_metadata_without_columns() -> None:
+    with mock.patch.object(
+        BigQueryDataDictionary,
+        "get_query_result",
+        side_effect=region_query([], fail="columns"),
+    ):
+        region_metadata = BigqueryRegionMetadata(
+            mock.MagicMock(), "project-1", "us", AllowDenyPattern.allow_all()
+        )
+        metadata = region_metadata.get("dataset_b")
+
+    assert metadata is not None
+    assert list(metadata.tables) == ["table"]
+    assert metadata.columns is None
+
+
+@pytest.mark.parametrize(
+    "allow, prefixes",
+    [
+        ([".*"], None),
+        (["^prod_.*", "stage$"], ["prod_", "stage"]),
+        (["prod_?.*"], ["prod"]),
+        (["prod|stage"], None),
+    ],
+)
+def test_bigqueryv2_dataset_prefixes(
+    allow: List[str], prefixes: Optional[List[str]]
+) -> None:
+    assert _get_dataset_prefixes(AllowDenyPattern(allow=allow)) == prefixes
+
+
+def test_bigqueryv2_datasets_are_fetched_per_region() -> None:
+    with mock.patch.object(
+        BigQueryDataDictionary,
+        "get_query_result",
+        side_effect=region_query([]),
+    ) as get_query_result, mock.patch.object(
+        BigQueryDataDictionary,
+        "get_max_partition_ids",
+        side_effect=lambda conn, project_id, dataset_name, tables: {
+            table: "20220101" for table in tables
+        },
+    ):
+        source = run_source(
+            {"information_schema_regions": ["us"], "profiling": {"enabled": True}}
+        )
+
+    for project_id in PROJECTS:
+        assert any(
+            f"`{project_id}`.`region-us`.INFORMATION_SCHEMA.SCHEMATA" in call.args[1]
+            for call in get_query_result.call_args_list
+        )
+        tables = source.db_tables[project_id]
+        for dataset in ["dataset_a", "dataset_b"]:
+            assert [table.size_in_bytes for table in tables[dataset]] == [100]
+            assert [table.max_partition_id for table in tables[dataset]] == ["20220101"]
+        assert [table.size_in_bytes for table in tables["dataset_c"]] == [0]
+        assert [table.max_partition_id for table in tables["dataset_c"]] == [None]
+
+
+def test_bigqueryv2_only_keeps_table_summaries_for_profiling() -> None:
+    source = run_source({"profiling": {"enabled": True}})
+
+    assert source.schema_columns == {}
+    assert source.db_views == {}
+    for project_id in PROJECTS:
+        for dataset in DATASETS:
+            (table,) = source.db_tables[project_id][dataset]
+            assert table == BigqueryTableSummary(
+                name="table",
+                last_altered=None,
+                size_in_bytes=0,
+                rows_count=0,
+                time_partitioning=None,
+                max_partition_id=None,
+                max_shard_id=None,
+                partition_column="dt",
+                column_count=1,
+            )
+
+
+def test_bigqueryv2_releases_tables_without_profiling() -> None:
+    source = run_source({})
+
+    assert source.schema_columns == {}
+    assert source.db_tables == {}
+    assert source.db_views == {}
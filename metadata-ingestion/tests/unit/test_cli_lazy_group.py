@@ -0,0 +1,71 @@
+import click
+import pytest
+from click.testing import CliRunner
+
+from datahub.cli.lazy_group import LazyGroup
+
+
+@click.command()
+def hello() -> None:
+    click.echo("hello")
+
+
+not_a_command = "hello"
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "hello": f"{__name__}:hello",
+        "missing": "datahub.cli.nonexistent_module:missing",
+        "broken": f"{__name__}:not_a_command",
+    },
+)
+def cli() -> None:
+    pass
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "hello": f"{__name__}:hello",
+        "plugin": "datahub.cli.nonexistent_module:plugin",
+    },
+    optional_subcommands=["plugin"],
+)
+def cli_with_optional_command() -> None:
+    pass
+
+
+def test_lazy_group_only_imports_invoked_commands() -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["hello"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "hello\n"
+    # The other lazy commands were never imported.
+    assert cli.list_commands(click.Context(cli)) == ["broken", "hello", "missing"]
+
+    result = runner.invoke(cli, ["missing"])
+    assert isinstance(result.exception, ModuleNotFoundError)
+
+
+def test_lazy_group_rejects_non_commands() -> None:
+    with pytest.raises(ValueError, match="must be a click command"):
+        cli.get_command(click.Context(cli), "broken")
+
+
+def test_lazy_group_omits_optional_commands_that_fail_to_import() -> None:
+    runner = CliRunner()
+
+    result = runner.invoke(cli_with_optional_command, ["--help"])
+    assert result.exit_code == 0, result.output
+    assert "hello" in result.output
+    assert "plugin" not in result.output
+    assert "plugin" not in cli_with_optional_command.list_commands(
+        click.Context(cli_with_optional_command)
+    )
+
+    result = runner.invoke(cli_with_optional_command, ["plugin"])
+    assert result.exit_code == 2
+    assert "No such command" in result.output
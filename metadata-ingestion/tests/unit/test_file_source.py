@@ -0,0 +1,132 @@
+import json
+import pathlib
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from datahub.ingestion.source.file import (
+    FileReadMode,
+    FileSourceConfig,
+    GenericFileSource,
+)
+from tests.test_helpers.type_helpers import PytestConfig
+
+
+def _read_records(path: pathlib.Path, **config: object) -> List[dict]:
+    source = GenericFileSource(
+        ctx=MagicMock(), config=FileSourceConfig(path=str(path), **config)
+    )
+    try:
+        return [obj.to_obj() for _, obj in source.iterate_generic_file(str(path))]
+    finally:
+        source.close()
+
+
+def _write_jsonl(records: List[dict], path: pathlib.Path) -> None:
+    with path.open("w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+            # Blank lines are ignored.
+            f.write("\n")
+
+
+@pytest.fixture
+def golden_records(pytestconfig: PytestConfig) -> List[dict]:
+    records = []
+    for json_filename in [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_usage.json",
+        "tests/unit/serde/test_serde_profile.json",
+    ]:
+        with (pytestconfig.rootpath / json_filename).open() as f:
+            records.extend(json.load(f))
+    return records
+
+
+@pytest.mark.parametrize(
+    "read_mode", [FileReadMode.AUTO, FileReadMode.BATCH, FileReadMode.STREAM]
+)
+def test_file_source_read_modes(
+    tmp_path: pathlib.Path, golden_records: List[dict], read_mode: FileReadMode
+) -> None:
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps(golden_records))
+    expected = _read_records(path, read_mode=FileReadMode.BATCH)
+    assert len(expected) == len(golden_records)
+
+    assert _read_records(path, read_mode=read_mode) == expected
+
+
+def test_file_source_stream_mode_is_single_pass(
+    tmp_path: pathlib.Path, golden_records: List[dict]
+) -> None:
+    path = tmp_path / "records.json"
+    path.write_text(json.dumps(golden_records))
+    source = GenericFileSource(
+        ctx=MagicMock(),
+        config=FileSourceConfig(path=str(path), read_mode=FileReadMode.STREAM),
+    )
+
+    records = source.iterate_generic_file(str(path))
+    next(records)
+    # Progress is tracked by bytes read, since the elements are never counted.
+    assert source.report.current_file_num_elements is None
+    assert 0 < source.report.current_file_bytes_read <= path.stat().st_size
+    assert source.report.total_count_time_in_seconds == 0
+
+    assert len(list(records)) == len(golden_records) - 1
+    assert source.report.total_bytes_read_completed_files == path.stat().st_size
+    source.close()
+
+
+@pytest.mark.parametrize("file_name", ["records.jsonl", "records.ndjson"])
+def test_file_source_jsonl_mode(
+    tmp_path: pathlib.Path, golden_records: List[dict], file_name: str
+) -> None:
+    json_path = tmp_path / "records.json"
+    json_path.write_text(json.dumps(golden_records))
+    jsonl_path = tmp_path / file_name
+    _write_jsonl(golden_records, jsonl_path)
+
+    # AUTO mode picks JSONL based on the file extension.
+    assert _read_records(jsonl_path) == _read_records(json_path)
+
+
+def test_file_source_parallel_deserialization(
+    tmp_path: pathlib.Path, golden_records: List[dict]
+) -> None:
+    records = golden_records * 5
+    json_path = tmp_path / "records.json"
+    json_path.write_text(json.dumps(records))
+    jsonl_path = tmp_path / "records.jsonl"
+    _write_jsonl(records, jsonl_path)
+    expected = _read_records(json_path)
+
+    for path in [json_path, jsonl_path]:
+        assert (
+            _read_records(path, deserialize_workers=2, deserialize_chunk_size=3)
+            == expected
+        )
+
+
+def test_file_source_parallel_deserialization_reports_failures(
+    tmp_path: pathlib.Path, golden_records: List[dict]
+) -> None:
+    path = tmp_path / "records.jsonl"
+    _write_jsonl(golden_records, path)
+    with path.open("a") as f:
+        f.write("{not json\n")
+        f.write(json.dumps({"foo": "bar"}) + "\n")
+
+    source = GenericFileSource(
+        ctx=MagicMock(),
+        config=FileSourceConfig(
+            path=str(path), deserialize_workers=2, deserialize_chunk_size=2
+        ),
+    )
+    try:
+        assert len(list(source.iterate_generic_file(str(path)))) == len(golden_records)
+    finally:
+        source.close()
+    assert len(source.report.failures) == 2
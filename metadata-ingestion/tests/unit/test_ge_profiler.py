@@ -0,0 +1,309 @@
+import contextlib
+import pathlib
+import threading
+from decimal import Decimal
+from typing import Any, Iterator, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+import sqlalchemy as sa
+from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyDataset
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.engine import Engine
+
+from datahub.ingestion.source.ge_data_profiler import (
+    DatahubGEProfiler,
+    GEProfilerRequest,
+    _convert_single_scan_value,
+    _ProfileTimedOutError,
+    get_column_unique_count_patch,
+)
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.profiling.single_scan import (
+    ColumnMetric,
+    SingleScanProfiler,
+)
+from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+from datahub.metadata.schema_classes import PartitionTypeClass
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path: pathlib.Path) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.connect() as conn:
+        for i in range(3):
+            conn.execute(f"CREATE TABLE table_{i} (id INTEGER, value TEXT)")
+            conn.execute(
+                f"INSERT INTO table_{i} VALUES "
+                + ", ".join(f"({j}, 'value_{j}')" for j in range(i + 1))
+            )
+    return engine
+
+
+def _request(table: str) -> GEProfilerRequest:
+    return GEProfilerRequest(
+        pretty_name=f"main.{table}", batch_kwargs={"schema": "main", "table": table}
+    )
+
+
+def _profiler(engine: Engine, **config: Any) -> DatahubGEProfiler:
+    return DatahubGEProfiler(
+        conn=engine,
+        report=SQLSourceReport(),
+        config=GEProfilingConfig(enabled=True, **config),
+        platform="sqlite",
+    )
+
+
+def test_generate_profiles(sqlite_engine: Engine) -> None:
+    profiler = _profiler(sqlite_engine)
+    requests = [_request(f"table_{i}") for i in range(3)]
+
+    profiles = {
+        request.pretty_name: profile
+        for request, profile in profiler.generate_profiles(requests, max_workers=2)
+    }
+
+    assert {
+        name: profile.rowCount if profile else None
+        for name, profile in profiles.items()
+    } == {
+        "main.table_0": 1,
+        "main.table_1": 2,
+        "main.table_2": 3,
+    }
+    assert not profiler.report.failures
+
+
+def _fake_profiles(
+    release_slow_profile: threading.Event,
+    after_slow_profile: Optional[List[Any]] = None,
+) -> Any:
+    after_slow_profile = [] if after_slow_profile is None else after_slow_profile
+
+    def _generate_single_profile(
+        self: DatahubGEProfiler, pretty_name: str, **kwargs: Any
+    ) -> Optional[str]:
+        if pretty_name == "main.slow":
+            release_slow_profile.wait(timeout=10)
+            # Whether the session still patches GE, and what a query does now.
+            after_slow_profile.append(
+                SqlAlchemyDataset.get_column_unique_count
+                is get_column_unique_count_patch
+            )
+            try:
+                with self.base_engine.connect() as conn:
+                    conn.execute("select 1")
+            except Exception as e:
+                after_slow_profile.append(e)
+        return f"profile of {pretty_name}"
+
+    return patch.object(
+        DatahubGEProfiler, "_generate_single_profile", _generate_single_profile
+    )
+
+
+def test_profiling_session_yields_profiles_as_they_complete() -> None:
+    profiler = _profiler(create_engine("sqlite://"))
+    release_slow_profile = threading.Event()
+
+    with _fake_profiles(release_slow_profile), profiler.profiling_session(
+        max_workers=2
+    ) as session:
+        for table in ["slow", "fast_1", "fast_2"]:
+            session.submit(_request(table))
+
+        completed: List[str] = []
+        for request, _ in session.get_completed_profiles(wait=True):
+            completed.append(request.pretty_name)
+            if len(completed) == 2:
+                release_slow_profile.set()
+
+    assert completed == ["main.fast_1", "main.fast_2", "main.slow"]
+
+
+def test_profiling_session_times_out_slow_tables() -> None:
+    profiler = _profiler(create_engine("sqlite://"), profile_table_timeout_seconds=1)
+    release_slow_profile = threading.Event()
+    after_slow_profile: List[Any] = []
+
+    try:
+        with _fake_profiles(
+            release_slow_profile, after_slow_profile
+        ), profiler.profiling_session(max_workers=2) as session:
+            for table in ["slow", "fast"]:
+                session.submit(_request(table))
+            profiles = list(session.get_completed_profiles(wait=True))
+            release_slow_profile.set()
+    finally:
+        release_slow_profile.set()
+
+    assert profiles == [(_request("fast"), "profile of main.fast")]
+    assert "main.slow" in profiler.report.warnings
+    # The session waited for the slow profile, which could not run more queries.
+    [still_patched, error] = after_slow_profile
+    assert still_patched
+    assert isinstance(error, _ProfileTimedOutError)
+
+
+@pytest.fixture
+def sqlite_numbers_engine(tmp_path: pathlib.Path) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path / 'numbers.db'}")
+    with engine.connect() as conn:
+        conn.execute("CREATE TABLE numbers (id INTEGER, value INTEGER, label TEXT)")
+        conn.execute(
+            "INSERT INTO numbers VALUES "
+            + ", ".join(
+                f"({i}, {i % 5 if i % 7 else 'NULL'}, 'label_{i % 3}')"
+                for i in range(50)
+            )
+        )
+    return engine
+
+
+@contextlib.contextmanager
+def _record_queries(engine: Engine) -> Iterator[List[str]]:
+    queries: List[str] = []
+
+    def before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_single_scan_profile_matches_per_column_profile(
+    sqlite_numbers_engine: Engine,
+) -> None:
+    def generate_profile(**config: Any) -> Tuple[Any, int]:
+        profiler = _profiler(
+            sqlite_numbers_engine,
+            include_field_distinct_value_frequencies=True,
+            include_field_sample_values=False,
+            query_combiner_enabled=False,
+            **config,
+        )
+        with _record_queries(sqlite_numbers_engine) as queries:
+            [(_, profile)] = profiler.generate_profiles(
+                [_request("numbers")], max_workers=1
+            )
+        return profile, len(queries)
+
+    per_column_profile, per_column_queries = generate_profile()
+    single_scan_profile, single_scan_queries = generate_profile(
+        single_scan_enabled=True
+    )
+
+    assert single_scan_profile.rowCount == per_column_profile.rowCount == 50
+    assert [f.to_obj() for f in single_scan_profile.fieldProfiles] == [
+        f.to_obj() for f in per_column_profile.fieldProfiles
+    ]
+    assert single_scan_queries < per_column_queries
+
+
+def test_sampled_single_scan_profile_keeps_table_row_count(
+    sqlite_numbers_engine: Engine,
+) -> None:
+    def get_from_clause(self: SingleScanProfiler) -> Any:
+        # A "sample" of the first 20 of the 50 rows, as sqlite has no TABLESAMPLE.
+        return (
+            sa.select([sa.literal_column("*")])
+            .select_from(self.table)
+            .where(sa.column("id") < 20)
+            .alias("sample")
+        )
+
+    profiler = _profiler(
+        sqlite_numbers_engine,
+        include_field_sample_values=False,
+        single_scan_enabled=True,
+        sample_percentage=40,
+    )
+    with patch.object(
+        SingleScanProfiler, "is_sampling_supported", return_value=True
+    ), patch.object(SingleScanProfiler, "_get_from_clause", get_from_clause):
+        [(_, profile)] = profiler.generate_profiles(
+            [_request("numbers")], max_workers=1
+        )
+
+    assert profile
+    assert profile.rowCount == 50
+    assert profile.partitionSpec.type == PartitionTypeClass.QUERY
+    assert profile.partitionSpec.partition == "TABLESAMPLE SYSTEM (40.0)"
+    field_profiles = {f.fieldPath: f for f in profile.fieldProfiles}
+    assert field_profiles["id"].uniqueCount == 20
+    assert field_profiles["id"].nullCount == 0
+    # The values of 0, 7 and 14 are NULL.
+    assert field_profiles["value"].nullCount == 3
+    assert field_profiles["value"].nullProportion == 3 / 20
+
+
+def test_single_scan_profiler_samples_and_computes_quantiles() -> None:
+    conn = MagicMock()
+    conn.dialect = PGDialect()
+    conn.execute.return_value.fetchone.return_value = {
+        "row_count": 10,
+        "metric_0_0": 4,
+        "metric_1_0": 2,
+        "metric_1_1": 7,
+    }
+    table = sa.Table("orders", sa.MetaData(), schema="public")
+    profiler = SingleScanProfiler(conn, table, sample_percentage=10)
+
+    result = profiler.compute(
+        {"total": [ColumnMetric.NONNULL_COUNT, ColumnMetric.QUANTILES]},
+        quantiles=[0.25, 0.75],
+    )
+
+    assert result.row_count == 10
+    assert result.column_metrics == {
+        "total": {ColumnMetric.NONNULL_COUNT: 4, ColumnMetric.QUANTILES: [2, 7]}
+    }
+    [(query,), _] = conn.execute.call_args
+    sql = str(query.compile(dialect=PGDialect()))
+    assert "FROM public.orders AS orders_1 TABLESAMPLE system(10.0)" in sql
+    assert "percentile_disc(%(percentile_disc_1)s) WITHIN GROUP (ORDER BY total)" in sql
+    assert not SingleScanProfiler(conn, sa.text("orders")).is_sampling_supported()
+
+
+@pytest.mark.parametrize(
+    "nonnull_count, median",
+    [(5, 3), (4, 2.5), (0, None)],
+)
+def test_single_scan_median_matches_ge(nonnull_count: int, median: Any) -> None:
+    conn = MagicMock()
+    conn.dialect = PGDialect()
+    # The values of count, percentile_disc(0.5) and percentile_cont(0.5) on
+    # postgres, for the integers 1 to 5, 1 to 4 and no values.
+    percentile_disc = {5: 3, 4: 2, 0: None}[nonnull_count]
+    percentile_cont = {5: 3.0, 4: 2.5, 0: None}[nonnull_count]
+    conn.execute.return_value.fetchone.return_value = {
+        "row_count": 5,
+        "metric_0_0": nonnull_count,
+        "metric_0_1": percentile_disc,
+        "metric_0_2": percentile_cont,
+    }
+    profiler = SingleScanProfiler(conn, sa.Table("numbers", sa.MetaData()))
+
+    result = profiler.compute({"value": [ColumnMetric.MEDIAN]})
+
+    # GE returns the middle value itself for an odd number of values, so an
+    # integer median stays an integer.
+    assert str(result.column_metrics["value"][ColumnMetric.MEDIAN]) == str(median)
+    [(query,), _] = conn.execute.call_args
+    sql = str(query.compile(dialect=PGDialect()))
+    assert "count(value)" in sql
+    assert "percentile_disc(%(percentile_disc_1)s) WITHIN GROUP (ORDER BY value)" in sql
+    assert "percentile_cont(%(percentile_cont_1)s) WITHIN GROUP (ORDER BY value)" in sql
+
+
+def test_single_scan_leaves_undefined_stdev_out() -> None:
+    # The sample stdev of a single value is NULL.
+    assert _convert_single_scan_value(ColumnMetric.STDEV, None) is None
+    assert _convert_single_scan_value(ColumnMetric.STDEV, Decimal("1.5")) == 1.5
@@ -0,0 +1,171 @@
+from typing import Dict, List
+from unittest import mock
+from urllib.parse import unquote
+
+import datahub.emitter.mce_builder as builder
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
+from datahub.ingestion.transformer.add_dataset_ownership import (
+    PatternAddDatasetOwnership,
+    SimpleAddDatasetOwnership,
+)
+from datahub.metadata.schema_classes import (
+    OwnerClass,
+    OwnershipClass,
+    OwnershipTypeClass,
+    StatusClass,
+)
+from datahub.utilities.urns.urn import Urn
+
+SERVER_OWNER = builder.make_user_urn("server_owner")
+
+
+def make_graph(server_owned_urns: List[str]) -> DataHubGraph:
+    with mock.patch.object(DataHubGraph, "test_connection"), mock.patch(
+        "datahub.ingestion.graph.client.telemetry_enabled", False
+    ):
+        graph = DataHubGraph(DatahubClientConfig())
+
+    def fake_get(url: str) -> mock.MagicMock:
+        response = mock.MagicMock(status_code=200)
+        if "/entitiesV2?" in url:
+            ids = [
+                unquote(id)
+                for id in url.split("ids=List(")[1].split(")&")[0].split(",")
+            ]
+            results: Dict[str, dict] = {urn: {"urn": urn, "aspects": {}} for urn in ids}
+            for urn in ids:
+                if urn in server_owned_urns:
+                    results[urn]["aspects"]["ownership"] = {
+                        "name": "ownership",
+                        "value": OwnershipClass(
+                            owners=[
+                                OwnerClass(
+                                    owner=SERVER_OWNER,
+                                    type=OwnershipTypeClass.DATAOWNER,
+                                )
+                            ]
+                        ).to_obj(),
+                    }
+            response.json.return_value = {"results": results}
+        else:
+            response.status_code = 404
+        return response
+
+    graph._session = mock.MagicMock()
+    graph._session.get.side_effect = fake_get
+    return graph
+
+
+def test_prefetched_aspects_are_read_once() -> None:
+    urns = [builder.make_dataset_urn("hive", f"table_{i}") for i in range(250)]
+    graph = make_graph(server_owned_urns=urns[:1])
+
+    graph.prefetch_aspects(urns, OwnershipClass)
+    # 250 urns are fetched with 3 batch get requests.
+    assert graph._session.get.call_count == 3
+
+    ownership = graph.get_ownership(urns[0])
+    assert ownership is not None
+    assert [owner.owner for owner in ownership.owners] == [SERVER_OWNER]
+    assert graph.get_ownership(urns[1]) is None
+    assert graph._session.get.call_count == 3
+
+    # Prefetched aspects are only handed out once, later reads go to the server.
+    assert graph.get_ownership(urns[0]) is None
+    assert graph._session.get.call_count == 4
+
+
+def test_patch_ownership_transformer_prefetches_server_aspects() -> None:
+    urns = [builder.make_dataset_urn("hive", f"table_{i}") for i in range(10)]
+    graph = make_graph(server_owned_urns=urns)
+    ctx = PipelineContext(run_id="test_patch_ownership_prefetch")
+    ctx.graph = graph
+    transformer = SimpleAddDatasetOwnership.create(
+        {
+            "owner_urns": [builder.make_user_urn("person1")],
+            "semantics": "PATCH",
+        },
+        ctx,
+    )
+
+    outputs = list(
+        transformer.transform(
+            [
+                RecordEnvelope(
+                    MetadataChangeProposalWrapper(
+                        entityUrn=urn, aspect=StatusClass(removed=False)
+                    ),
+                    metadata={},
+                )
+                for urn in urns
+            ]
+            + [RecordEnvelope(EndOfStream(), metadata={})]
+        )
+    )
+
+    # The server-side ownership of all datasets was fetched with a single request.
+    assert graph._session.get.call_count == 1
+    ownership_records = [
+        output.record
+        for output in outputs
+        if isinstance(output.record, MetadataChangeProposalWrapper)
+        and isinstance(output.record.aspect, OwnershipClass)
+    ]
+    assert len(ownership_records) == len(urns)
+    for record in ownership_records:
+        assert isinstance(record.aspect, OwnershipClass)
+        assert {owner.owner for owner in record.aspect.owners} == {
+            SERVER_OWNER,
+            builder.make_user_urn("person1"),
+        }
+
+
+def test_discarded_prefetched_aspects_are_read_from_server() -> None:
+    urn = builder.make_dataset_urn("hive", "table")
+    graph = make_graph(server_owned_urns=[urn])
+
+    graph.prefetch_aspects([urn], OwnershipClass)
+    graph.discard_prefetched_aspect(urn, OwnershipClass)
+
+    assert graph.get_ownership(urn) is None
+    assert graph._session.get.call_count == 2
+
+
+def test_patch_transformer_only_prefetches_aspects_it_reads() -> None:
+    urns = [builder.make_dataset_urn("hive", f"table_{i}") for i in range(10)]
+    graph = make_graph(server_owned_urns=urns)
+    ctx = PipelineContext(run_id="test_patch_ownership_prefetch_pattern")
+    ctx.graph = graph
+    transformer = PatternAddDatasetOwnership.create(
+        {
+            "owner_pattern": {
+                "rules": {".*table_[0-4].*": [builder.make_user_urn("person1")]}
+            },
+            "semantics": "PATCH",
+        },
+        ctx,
+    )
+    outputs = list(
+        transformer.transform(
+            [
+                RecordEnvelope(
+                    MetadataChangeProposalWrapper(
+                        entityUrn=urn, aspect=OwnershipClass(owners=[])
+                    ),
+                    metadata={},
+                )
+                for urn in urns
+            ]
+        )
+    )
+
+    # Datasets without owners to add are neither fetched nor left in the cache.
+    assert graph._session.get.call_count == 1
+    fetched_url = graph._session.get.call_args[0][0]
+    assert [urn for urn in urns if Urn.url_encode(urn) in fetched_url] == urns[:5]
+    assert not graph._aspect_cache
+    assert [
+        {owner.owner for owner in output.record.aspect.owners} for output in outputs
+    ] == [{SERVER_OWNER, builder.make_user_urn("person1")}] * 5 + [set()] * 5
@@ -46,3 +46,44 @@ class KafkaEmitterTest(unittest.TestCase):
         assert (
             emitter_config.topic_routes[MCP_KEY] == DEFAULT_MCP_KAFKA_TOPIC
         )  # No change to MCP
+
+    def test_kafka_emitter_config_producer_tuning(self):
+        emitter_config = KafkaEmitterConfig.parse_obj(
+            {
+                "connection": {
+                    "bootstrap": "foobar:9092",
+                    "producer_config": {"acks": "all"},
+                },
+                "linger_ms": 50,
+                "compression_type": "ZSTD",
+            }
+        )
+        assert emitter_config.get_producer_tuning_config() == {
+            "linger.ms": 50,
+            "compression.type": "zstd",
+        }
+
+        with pytest.raises(pydantic.ValidationError):
+            KafkaEmitterConfig.parse_obj(
+                {"connection": {"bootstrap": "foobar:9092"}, "compression_type": "lzo"}
+            )
+        with pytest.raises(pydantic.ValidationError):
+            KafkaEmitterConfig.parse_obj(
+                {"connection": {"bootstrap": "foobar:9092"}, "batch_num_messages": 0}
+            )
+
+    """
+    Tuning options that are also set in the producer config should barf
+    """
+
+    def test_kafka_emitter_config_conflicting_producer_tuning(self):
+        with pytest.raises(pydantic.ValidationError, match="linger_ms"):
+            KafkaEmitterConfig.parse_obj(
+                {
+                    "connection": {
+                        "bootstrap": "foobar:9092",
+                        "producer_config": {"queue.buffering.max.ms": 10},
+                    },
+                    "linger_ms": 50,
+                }
+            )
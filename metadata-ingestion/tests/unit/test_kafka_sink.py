@@ -4,11 +4,19 @@ from unittest.mock import MagicMock, call, patch
 
 import datahub.emitter.mce_builder as builder
 import datahub.metadata.schema_classes as models
-from datahub.emitter.kafka_emitter import MCE_KEY
+from datahub.emitter.kafka_emitter import (
+    DEFAULT_MCE_KAFKA_TOPIC,
+    DEFAULT_MCP_KAFKA_TOPIC,
+    MCE_KEY,
+)
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
 from datahub.ingestion.api.sink import SinkReport, WriteCallback
-from datahub.ingestion.sink.datahub_kafka import DatahubKafkaSink, _KafkaCallback
+from datahub.ingestion.sink.datahub_kafka import (
+    DatahubKafkaSink,
+    KafkaSinkReport,
+    _KafkaCallback,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
@@ -125,3 +133,84 @@ class KafkaSinkTest(unittest.TestCase):
         callback.kafka_callback(None, mock_message)
         mock_w_callback.on_success.assert_called_once()
         assert mock_w_callback.on_success.call_args[0][0] == mock_re
+
+    @patch("datahub.ingestion.api.sink.PipelineContext", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.SerializingProducer", autospec=True)
+    def test_kafka_sink_high_throughput(self, mock_producer, mock_context):
+        kafka_sink = DatahubKafkaSink.create(
+            {
+                "connection": {
+                    "bootstrap": "foobar:9092",
+                    "producer_config": {"compression.codec": "gzip"},
+                },
+                "high_throughput": True,
+                "linger_ms": 20,
+            },
+            mock_context,
+        )
+        try:
+            producer_config = mock_producer.call_args[0][0]
+            assert producer_config["linger.ms"] == 20
+            assert producer_config["batch.num.messages"] == 10000
+            # Explicitly configured producer properties are never overridden.
+            assert producer_config["compression.codec"] == "gzip"
+            assert "compression.type" not in producer_config
+            assert kafka_sink.emitter._poll_thread is not None
+
+            # Messages are not flushed after every workunit.
+            kafka_sink.handle_work_unit_end(MagicMock())
+            mock_producer.return_value.flush.assert_not_called()
+        finally:
+            kafka_sink.close()
+        assert kafka_sink.emitter._poll_thread is None
+        mock_producer.return_value.flush.assert_has_calls([call(), call()])
+
+    @patch("datahub.ingestion.api.sink.PipelineContext", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.SerializingProducer", autospec=True)
+    def test_kafka_sink_samples_queue_depth_on_produce(
+        self, mock_producer, mock_context
+    ):
+        kafka_sink = DatahubKafkaSink.create(
+            {"connection": {"bootstrap": "foobar:9092"}}, mock_context
+        )
+        try:
+            # No background poll thread samples the queue depth by default.
+            assert kafka_sink.emitter._poll_thread is None
+            mock_producer.return_value.__len__.return_value = 3
+            kafka_sink.write_record_async(
+                RecordEnvelope(
+                    record=builder.make_lineage_mce(
+                        [builder.make_dataset_urn("bigquery", "upstream")],
+                        builder.make_dataset_urn("bigquery", "downstream"),
+                    ),
+                    metadata={},
+                ),
+                MagicMock(spec=WriteCallback),
+            )
+            mock_producer.return_value.__len__.return_value = 0
+
+            assert kafka_sink.get_report().max_producer_queue_depth == {
+                DEFAULT_MCE_KAFKA_TOPIC: 3,
+                DEFAULT_MCP_KAFKA_TOPIC: 0,
+            }
+        finally:
+            kafka_sink.close()
+
+    @patch("datahub.ingestion.sink.datahub_kafka.WriteCallback", autospec=True)
+    def test_kafka_callback_reports_delivery_latency(self, mock_w_callback):
+        report = KafkaSinkReport()
+        for _ in range(3):
+            callback = _KafkaCallback(
+                report,
+                record_envelope=MagicMock(),
+                write_callback=mock_w_callback,
+                topic=DEFAULT_MCE_KAFKA_TOPIC,
+            )
+            callback.kafka_callback(None, MagicMock())
+        callback.kafka_callback(MagicMock(), MagicMock())
+
+        histogram = report.delivery_latency[DEFAULT_MCE_KAFKA_TOPIC]
+        assert histogram.count == 3
+        latency_stats = report.as_obj()["delivery_latency"][DEFAULT_MCE_KAFKA_TOPIC]
+        assert latency_stats["count"] == 3
+        assert latency_stats["p99_ms"] is not None
@@ -0,0 +1,64 @@
+from typing import Any, Dict, Iterator, List
+
+from datahub.ingestion.source.schema_inference.object import (
+    PartialSchema,
+    construct_schema,
+    is_nullable_collection,
+)
+
+COLLECTION: List[Dict[str, Any]] = [
+    {
+        "name": "a",
+        "address": {"city": "x", "zip": 1},
+        "orders": [{"id": 1, "items": [{"sku": "s"}]}, {"id": 2, "items": []}],
+        "tags": ["t"],
+    },
+    {
+        "name": "b",
+        "address": {"city": None, "zip": 2.5},
+        "orders": [{"id": 3, "note": "n", "items": [{"sku": "s", "qty": 1}]}],
+        "tags": [],
+    },
+    {"name": None, "address": {"zip": 3}, "orders": [], "extra": True},
+    {
+        "name": "d",
+        "address": {"city": "y", "zip": 4},
+        "orders": [{"id": 4, "items": [{"sku": "s"}]}],
+    },
+]
+
+
+def test_construct_schema_nullability() -> None:
+    schema = construct_schema(COLLECTION, delimiter=".")
+
+    # Matches the nullability of a separate scan of the collection for each field.
+    for field_path, field in schema.items():
+        assert field["nullable"] == is_nullable_collection(COLLECTION, field_path)
+    assert not schema[("address",)]["nullable"]
+    assert not schema[("address", "zip")]["nullable"]
+    assert schema[("address", "city")]["nullable"]
+    assert schema[("orders", "items", "sku")]["nullable"]
+    assert schema[("address", "zip")]["type"] == float
+    assert schema[("orders", "id")]["count"] == 4
+
+
+def test_construct_schema_from_iterator() -> None:
+    def documents() -> Iterator[Dict[str, Any]]:
+        yield from COLLECTION
+
+    assert construct_schema(documents(), delimiter=".") == construct_schema(
+        COLLECTION, delimiter="."
+    )
+
+
+def test_merge_partial_schemas() -> None:
+    expected = construct_schema(COLLECTION, delimiter=".")
+
+    for split in range(len(COLLECTION) + 1):
+        merged = (
+            PartialSchema()
+            .add_documents(COLLECTION[:split])
+            .merge(PartialSchema().add_documents(COLLECTION[split:]))
+        )
+        assert merged.document_count == len(COLLECTION)
+        assert merged.to_schema(delimiter=".") == expected
@@ -1,12 +1,14 @@
-from typing import Iterable, List, cast
+import threading
+from typing import Dict, Iterable, List, Optional, Set, cast
 from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
 
 from datahub.configuration.common import DynamicTypedConfig
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.committable import CommitPolicy, Committable
-from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
+from datahub.ingestion.api.common import EndOfStream, RecordEnvelope, WorkUnit
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -306,6 +308,69 @@ class TestPipeline(object):
             else:
                 mock_commit.assert_not_called()
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_with_parallel_processing(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.RecordWorkerTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "parallel_processing": {
+                    "enabled": True,
+                    "max_workers": 4,
+                    "max_pending_workunits": 8,
+                },
+            }
+        )
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+        sink_report.received_records = []
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        records = [envelope.record for envelope in sink_report.received_records]
+        assert len(records) == FakeSourceWithManyEntities.NUM_WORKUNITS
+
+        # Workunits for the same entity are written in the order they were produced.
+        descriptions_by_urn: Dict[str, List[int]] = {}
+        for record in records:
+            descriptions_by_urn.setdefault(record.entityUrn, []).append(
+                int(record.aspect.description)
+            )
+        assert len(descriptions_by_urn) == FakeSourceWithManyEntities.NUM_ENTITIES
+        for descriptions in descriptions_by_urn.values():
+            assert descriptions == sorted(descriptions)
+
+        transformer = cast(RecordWorkerTransformer, pipeline.transformers[0])
+        # Every entity was processed by a single thread, and the end of the stream was
+        # seen only after all workunits were processed.
+        assert all(len(threads) == 1 for threads in transformer.threads.values())
+        assert transformer.num_records_at_end_of_stream == len(records)
+
+    @freeze_time(FROZEN_TIME)
+    def test_run_with_parallel_processing_propagates_fatal_errors(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.test_pipeline.FakeSourceWithManyEntities"
+                },
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.FailingTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "parallel_processing": {"enabled": True},
+            }
+        )
+        with pytest.raises(RuntimeError, match="fatal transformer error"):
+            pipeline.run()
+        assert pipeline.final_status == "cancelled"
+
 
 class AddStatusRemovedTransformer(Transformer):
     @classmethod
@@ -348,6 +413,62 @@ class FakeSource(Source):
         pass
 
 
+class RecordWorkerTransformer(Transformer):
+    def __init__(self):
+        self.threads: Dict[str, Set[str]] = {}
+        self.num_records = 0
+        self.num_records_at_end_of_stream: Optional[int] = None
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            if isinstance(record_envelope.record, EndOfStream):
+                self.num_records_at_end_of_stream = self.num_records
+            else:
+                self.threads.setdefault(record_envelope.record.entityUrn, set()).add(
+                    threading.current_thread().name
+                )
+                self.num_records += 1
+            yield record_envelope
+
+
+class FailingTransformer(Transformer):
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            raise RuntimeError("fatal transformer error")
+            yield record_envelope
+
+
+class FakeSourceWithManyEntities(FakeSource):
+    NUM_ENTITIES = 10
+    NUM_WORKUNITS = 200
+
+    def __init__(self):
+        super().__init__()
+        self.work_units = [
+            MetadataWorkUnit(
+                id=f"workunit-{i}",
+                mcp=MetadataChangeProposalWrapper(
+                    entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:test_platform,test_{i % self.NUM_ENTITIES},PROD)",
+                    aspectName="datasetProperties",
+                    aspect=DatasetPropertiesClass(description=str(i)),
+                ),
+            )
+            for i in range(self.NUM_WORKUNITS)
+        ]
+
+
 class FakeSourceWithWarnings(FakeSource):
     def __init__(self):
         super().__init__()
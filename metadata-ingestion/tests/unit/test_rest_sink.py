@@ -1,11 +1,16 @@
+import gzip
 import json
+from unittest import mock
 
 import pytest
 import requests
 
 import datahub.metadata.schema_classes as models
+from datahub.configuration.common import OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -298,3 +303,198 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+def _make_ownership_mcp(name: str) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityType="dataset",
+        entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,{name},PROD)",
+        changeType=models.ChangeTypeClass.UPSERT,
+        aspectName="ownership",
+        aspect=models.OwnershipClass(
+            owners=[
+                models.OwnerClass(
+                    owner="urn:li:corpuser:fbar",
+                    type=models.OwnershipTypeClass.DATAOWNER,
+                )
+            ],
+        ),
+    )
+
+
+def test_datahub_rest_emitter_batch(requests_mock):
+    proposals_adapter = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch"
+    )
+    usage_adapter = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/usageStats?action=batchIngest"
+    )
+
+    usage = models.UsageAggregationClass(
+        bucket=1623826800000,
+        duration="DAY",
+        resource="urn:li:dataset:(urn:li:dataPlatform:kafka,SampleKafkaDataset,PROD)",
+        metrics=models.UsageAggregationMetricsClass(totalSqlQueries=1),
+    )
+    records = [_make_ownership_mcp("a"), _make_ownership_mcp("b"), usage]
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    errors = emitter.emit_batch(records)
+
+    assert errors == [None, None, None]
+    assert proposals_adapter.call_count == 1
+    assert [
+        proposal["entityUrn"]
+        for proposal in proposals_adapter.last_request.json()["proposals"]
+    ] == [
+        "urn:li:dataset:(urn:li:dataPlatform:foo,a,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:foo,b,PROD)",
+    ]
+    assert usage_adapter.call_count == 1
+    assert len(usage_adapter.last_request.json()["buckets"]) == 1
+
+
+def test_datahub_rest_emitter_batch_split_and_failure(requests_mock):
+    responses = [
+        {"status_code": 200},
+        {"status_code": 422, "json": {"message": "invalid aspect"}},
+    ]
+    adapter = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch", responses
+    )
+
+    # A tiny payload limit forces every record into its own request.
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT, retry_status_codes=[])
+    errors = emitter.emit_batch(
+        [_make_ownership_mcp("a"), _make_ownership_mcp("b")], max_payload_bytes=1
+    )
+
+    assert adapter.call_count == 2
+    assert errors[0] is None
+    assert isinstance(errors[1], OperationalError)
+    assert errors[1].info == {"message": "invalid aspect"}
+
+
+def test_datahub_rest_emitter_batch_not_supported(requests_mock):
+    batch_adapter = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=404,
+        json={"message": "Action 'ingestProposalBatch' not found"},
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT, retry_status_codes=[])
+    first_errors = emitter.emit_batch([_make_ownership_mcp("a")])
+    # Later batches are not sent anymore, so that the items are emitted one by one.
+    second_errors = emitter.emit_batch(
+        [_make_ownership_mcp("b"), _make_ownership_mcp("c")]
+    )
+
+    assert batch_adapter.call_count == 1
+    assert all(isinstance(e, OperationalError) for e in first_errors + second_errors)
+
+
+def test_datahub_rest_sink_falls_back_to_single_writes(requests_mock):
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=404,
+        json={"message": "Action 'ingestProposalBatch' not found"},
+    )
+    single_adapter = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+    callback = mock.MagicMock()
+
+    with mock.patch.object(
+        DatahubRestEmitter, "test_connection", return_value={"noCode": "true"}
+    ):
+        sink = DatahubRestSink.create(
+            {
+                "server": MOCK_GMS_ENDPOINT,
+                "mode": "ASYNC_BATCH",
+                "max_batch_records": 2,
+                "retry_status_codes": [],
+            },
+            PipelineContext(run_id="test_rest_sink"),
+        )
+    for name in ["a", "b", "c", "d"]:
+        sink.write_record_async(
+            RecordEnvelope(_make_ownership_mcp(name), metadata={}), callback
+        )
+    sink.close()
+
+    assert callback.on_success.call_count == 4
+    assert single_adapter.call_count == 4
+    assert sink.report.records_retried_individually == 4
+    assert not sink.report.failures
+
+
+def test_datahub_rest_sink_reports_batch_failures_once(requests_mock):
+    requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch")
+    callback = mock.MagicMock()
+    # The callback of the first record raises, so the batch stops there.
+    callback.on_success.side_effect = [Exception("callback failed"), None]
+
+    with mock.patch.object(
+        DatahubRestEmitter, "test_connection", return_value={"noCode": "true"}
+    ):
+        sink = DatahubRestSink.create(
+            {
+                "server": MOCK_GMS_ENDPOINT,
+                "mode": "ASYNC_BATCH",
+                "max_batch_records": 2,
+            },
+            PipelineContext(run_id="test_rest_sink"),
+        )
+    envelopes = [
+        RecordEnvelope(_make_ownership_mcp(name), metadata={}) for name in ["a", "b"]
+    ]
+    for envelope in envelopes:
+        sink.write_record_async(envelope, callback)
+    sink.close()
+
+    assert [call.args[0] for call in callback.on_success.call_args_list] == [
+        envelopes[0]
+    ]
+    assert [call.args[0] for call in callback.on_failure.call_args_list] == [
+        envelopes[1]
+    ]
+    assert len(sink.report.failures) == 1
+    assert sink.report.pending_requests == 0
+
+
+def test_datahub_rest_emitter_fast_serialization_and_gzip(requests_mock):
+    adapter = requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal")
+    mcp = _make_ownership_mcp("a" * DatahubRestEmitter.GZIP_MIN_PAYLOAD_BYTES)
+
+    DatahubRestEmitter(MOCK_GMS_ENDPOINT).emit(mcp)
+    expected = adapter.last_request.json()
+
+    DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT, fast_serialization=True, gzip_payloads=True
+    ).emit(mcp)
+    request = adapter.last_request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.body)) == expected
+
+
+@pytest.mark.parametrize("gzip_payloads", [False, True])
+def test_datahub_rest_emitter_non_ascii_payload(requests_mock, gzip_payloads):
+    adapter = requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal")
+    description = "Ventes réalisées à Zürich, 東京"
+    mcp = MetadataChangeProposalWrapper(
+        entityType="dataset",
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+        changeType=models.ChangeTypeClass.UPSERT,
+        aspectName="datasetProperties",
+        aspect=models.DatasetPropertiesClass(description=description),
+    )
+
+    DatahubRestEmitter(
+        MOCK_GMS_ENDPOINT, fast_serialization=True, gzip_payloads=gzip_payloads
+    ).emit(mcp)
+    # The small payload is never compressed, and is sent as UTF-8 bytes.
+    body = adapter.last_request.body
+    assert isinstance(body, bytes)
+    assert "Content-Encoding" not in adapter.last_request.headers
+    proposal = json.loads(body.decode("utf-8"))["proposal"]
+    assert json.loads(proposal["aspect"]["value"])["description"] == description
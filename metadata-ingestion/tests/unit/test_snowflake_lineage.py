@@ -0,0 +1,239 @@
+import json
+from typing import Dict, Iterator, List, Tuple
+from unittest.mock import patch
+
+from datahub.ingestion.source.snowflake.snowflake_config import SnowflakeV2Config
+from datahub.ingestion.source.snowflake.snowflake_lineage import (
+    SnowflakeLineageExtractor,
+    SnowflakeLineageStream,
+)
+from datahub.ingestion.source.snowflake.snowflake_query import SnowflakeQuery
+from datahub.ingestion.source.snowflake.snowflake_report import SnowflakeV2Report
+
+
+def test_lineage_stream_reads_only_up_to_requested_dataset():
+    read: List[str] = []
+
+    def entries() -> Iterator[Tuple[str, set]]:
+        for key, value in [
+            ("db.s.a", {"x"}),
+            ("db.s.b", {"y"}),
+            ("db.s.b", {"z"}),
+            ("db.s.c", {"w"}),
+            ("db.s.d", {"v"}),
+        ]:
+            read.append(key)
+            yield key, value
+
+    stream = SnowflakeLineageStream("Test", entries(), lambda a, b: a | b)
+
+    assert stream.pop("db.s.b") == {"y", "z"}
+    assert read == ["db.s.a", "db.s.b", "db.s.b", "db.s.c"]
+    # Lineage is only returned once, and lineage read ahead is kept until needed.
+    assert stream.pop("db.s.b") is None
+    assert stream.pop("db.s.a") == {"x"}
+    assert stream.pop("DB.S.C") is None
+    assert stream.pop("db.s.c") == {"w"}
+    assert stream.pop("db.s.e") is None
+    assert stream.pop("db.s.d") == {"v"}
+
+
+def test_lineage_stream_reads_all_lineage_if_not_ordered():
+    stream = SnowflakeLineageStream(
+        "Test",
+        iter([("db.s.b", {"x"}), ("db.s.a", {"y"}), ("db.s.c", {"z"})]),
+        lambda a, b: a | b,
+    )
+
+    assert stream.pop("db.s.b") == {"x"}
+    assert stream.pop("db.s.a") == {"y"}
+    assert stream.pop("db.s.c") == {"z"}
+
+
+def test_lineage_stream_reports_rows_of_datasets_already_returned():
+    warnings: List[Tuple[str, str]] = []
+    stream = SnowflakeLineageStream(
+        "Test",
+        iter(
+            [
+                ("db.s.a", {"x"}),
+                ("db.s.b", {"y"}),
+                ("db.s.a", {"late"}),
+                ("db.s.c", {"z"}),
+                ("db.s.a", {"later"}),
+            ]
+        ),
+        lambda a, b: a | b,
+        warn=lambda key, reason: warnings.append((key, reason)),
+    )
+
+    assert stream.pop("db.s.a") == {"x"}
+    assert warnings == []
+    # The late rows of db.s.a are dropped instead of being kept in memory.
+    assert stream.pop("db.s.c") == {"z"}
+    assert stream.pop("db.s.a") is None
+    assert stream.pop("db.s.b") == {"y"}
+
+    assert stream.num_dropped_rows == 2
+    assert stream.dropped_datasets == {"db.s.a"}
+    assert warnings == [
+        (
+            "Test lineage",
+            "Dropped 2 lineage rows of 1 datasets, because they were read after "
+            "the lineage of their dataset was emitted: db.s.a",
+        )
+    ]
+
+
+def _upstream_table_row(downstream: str, upstream: str) -> Dict:
+    return {
+        "DOWNSTREAM_TABLE_NAME": downstream,
+        "UPSTREAM_TABLE_NAME": upstream,
+        "COLUMN_NAME": None,
+        "DIRECT_SOURCE_COLUMNS": None,
+    }
+
+
+def _column_lineage_row(
+    downstream: str, column: str, direct_source_columns: List[Dict]
+) -> Dict:
+    return {
+        "DOWNSTREAM_TABLE_NAME": downstream,
+        "UPSTREAM_TABLE_NAME": None,
+        "COLUMN_NAME": column,
+        "DIRECT_SOURCE_COLUMNS": json.dumps(direct_source_columns),
+    }
+
+
+def default_query_results(query: str) -> List[Dict]:
+    if query.startswith("\n        WITH table_lineage_history"):
+        return [
+            _upstream_table_row("DB.S.T1", "DB.S.T0"),
+            _upstream_table_row("DB.S.T1", "DB.OTHER.T0"),
+            _column_lineage_row(
+                "DB.S.T1",
+                "C1",
+                [
+                    {
+                        "columnName": "C0",
+                        "objectName": "DB.S.T0",
+                        "objectDomain": "Table",
+                    },
+                    {"columnId": 1, "objectName": "DB.S.T0"},
+                ],
+            ),
+            _column_lineage_row("DB.S.T1", "C2", []),
+            _upstream_table_row("DB.S.T2", "DB.S.T1"),
+        ]
+    elif query == SnowflakeQuery.view_dependencies():
+        return [
+            {
+                "VIEW_UPSTREAM": "DB.S.T1",
+                "REFERENCED_OBJECT_DOMAIN": "table",
+                "DOWNSTREAM_VIEW": 'DB.S."V1"',
+                "REFERENCING_OBJECT_DOMAIN": "view",
+            },
+            {
+                "VIEW_UPSTREAM": "DB.S.T2",
+                "REFERENCED_OBJECT_DOMAIN": "table",
+                "DOWNSTREAM_VIEW": 'DB.S."V1"',
+                "REFERENCING_OBJECT_DOMAIN": "view",
+            },
+        ]
+    elif query.startswith("\n        WITH view_lineage_history"):
+        return [
+            {
+                "DOWNSTREAM_TABLE_NAME": "DB.S.T1",
+                "DOWNSTREAM_TABLE_DOMAIN": "Table",
+                "VIEW_NAME": "DB.S.V0",
+                "VIEW_DOMAIN": "View",
+                "COLUMN_NAME": None,
+                "DIRECT_SOURCE_COLUMNS": None,
+            },
+            {
+                "DOWNSTREAM_TABLE_NAME": "DB.S.T1",
+                "DOWNSTREAM_TABLE_DOMAIN": "Table",
+                "VIEW_NAME": None,
+                "VIEW_DOMAIN": None,
+                "COLUMN_NAME": "C1",
+                "DIRECT_SOURCE_COLUMNS": json.dumps(
+                    [
+                        {
+                            "columnName": "C0",
+                            "objectName": "DB.S.V0",
+                            "objectDomain": "View",
+                        }
+                    ]
+                ),
+            },
+        ]
+    elif query.startswith("\n        WITH external_table_lineage_history"):
+        return [
+            {
+                "DOWNSTREAM_TABLE_NAME": "DB.S.T2",
+                "UPSTREAM_LOCATIONS": json.dumps(["s3://bucket/t2"]),
+            }
+        ]
+    elif query == SnowflakeQuery.show_external_tables():
+        return []
+    raise Exception(f"Unknown query {query}")
+
+
+def test_lineage_is_read_from_ordered_per_table_rows():
+    config = SnowflakeV2Config(
+        account_id="ABC12345.ap-south-1",
+        username="TST_USR",
+        password="TST_PWD",
+        schema_pattern={"deny": ["OTHER"]},
+    )
+    report = SnowflakeV2Report()
+    extractor = SnowflakeLineageExtractor(config, report)
+    with patch.object(SnowflakeV2Config, "get_connection") as mock_connection:
+        mock_connection.return_value.cursor.return_value.execute.side_effect = (
+            default_query_results
+        )
+        t1 = extractor._get_upstream_lineage_info("db.s.t1")
+        v1 = extractor._get_upstream_lineage_info("db.s.v1")
+        missing = extractor._get_upstream_lineage_info("db.s.t1")
+        t2 = extractor._get_upstream_lineage_info("db.s.t2")
+
+    assert mock_connection.call_count == 1
+    assert t1 is not None
+    assert [u.dataset for u in t1[0].upstreams] == [
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.other.t0,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t0,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.v0,PROD)",
+    ]
+    assert t1[0].fineGrainedLineages is not None
+    assert [(f.upstreams, f.downstreams) for f in t1[0].fineGrainedLineages] == [
+        (
+            [
+                "urn:li:schemaField:(urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t0,PROD),c0)"
+            ],
+            [
+                "urn:li:schemaField:(urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t1,PROD),c1)"
+            ],
+        ),
+        (
+            [
+                "urn:li:schemaField:(urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.v0,PROD),c0)"
+            ],
+            [
+                "urn:li:schemaField:(urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t1,PROD),c1)"
+            ],
+        ),
+    ]
+    assert v1 is not None
+    assert [u.dataset for u in v1[0].upstreams] == [
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t1,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t2,PROD)",
+    ]
+    assert missing is None
+    assert t2 is not None
+    assert [u.dataset for u in t2[0].upstreams] == [
+        "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.s.t1,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:s3,bucket/t2,PROD)",
+    ]
+    assert report.num_table_to_table_edges_scanned == 3
+    assert report.num_table_to_view_edges_scanned == 2
+    assert report.num_view_to_table_edges_scanned == 1
@@ -0,0 +1,276 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.snowflake.snowflake_schema import (
+    SnowflakeColumn,
+    SnowflakeDatabase,
+    SnowflakeSchema,
+    SnowflakeTable,
+    SnowflakeView,
+)
+from datahub.ingestion.source.snowflake.snowflake_profiler import SnowflakeProfiler
+from datahub.ingestion.source.snowflake.snowflake_v2 import SnowflakeV2Source
+from datahub.utilities.time import datetime_to_ts_millis
+
+NUM_SCHEMAS = 6
+LAST_RUN = datetime(2022, 10, 1, tzinfo=timezone.utc)
+# The current time of the Snowflake clock, which is behind the local one.
+SNOWFLAKE_NOW = datetime(2022, 10, 3, tzinfo=timezone.utc)
+
+
+class FakeDataDictionary:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.columns_queried_for: List[str] = []
+
+    def get_current_timestamp(self, conn):
+        return SNOWFLAKE_NOW
+
+    def get_databases(self, conn):
+        return [SnowflakeDatabase(name="DB", created=LAST_RUN, comment=None)]
+
+    def get_schemas_for_database(self, conn, db_name):
+        return [
+            SnowflakeSchema(
+                name=f"SCHEMA_{i}",
+                created=LAST_RUN,
+                last_altered=LAST_RUN,
+                comment=None,
+            )
+            for i in range(NUM_SCHEMAS)
+        ]
+
+    def get_tables_for_database(self, conn, db_name):
+        return {
+            f"SCHEMA_{i}": [
+                SnowflakeTable(
+                    name="OLD_TABLE",
+                    created=datetime(2022, 1, 1),
+                    last_altered=datetime(2022, 9, 1),
+                    size_in_bytes=100,
+                    rows_count=10,
+                    comment=None,
+                    clustering_key="",
+                ),
+                SnowflakeTable(
+                    name="NEW_TABLE",
+                    created=datetime(2022, 1, 1),
+                    last_altered=datetime(2022, 10, 2),
+                    size_in_bytes=100,
+                    rows_count=10,
+                    comment=None,
+                    clustering_key="",
+                ),
+            ]
+            for i in range(NUM_SCHEMAS)
+        }
+
+    def get_views_for_database(self, conn, db_name):
+        return {
+            f"SCHEMA_{i}": [
+                SnowflakeView(
+                    name="VIEW",
+                    created=datetime(2022, 1, 1),
+                    comment=None,
+                    view_definition="select * from OLD_TABLE",
+                )
+            ]
+            for i in range(NUM_SCHEMAS)
+        }
+
+    def get_columns_for_schema(
+        self, conn, schema_name, db_name
+    ) -> Dict[str, List[SnowflakeColumn]]:
+        with self.lock:
+            self.columns_queried_for.append(schema_name)
+        return {
+            name: [
+                SnowflakeColumn(
+                    name="COL",
+                    ordinal_position=1,
+                    is_nullable=False,
+                    data_type="NUMBER",
+                    comment=None,
+                )
+            ]
+            for name in ("OLD_TABLE", "NEW_TABLE", "VIEW")
+        }
+
+    def get_pk_constraints_for_schema(self, conn, schema_name, db_name):
+        return {}
+
+    def get_fk_constraints_for_schema(self, conn, schema_name, db_name):
+        return {}
+
+
+class FailingDataDictionary(FakeDataDictionary):
+    def get_columns_for_schema(
+        self, conn, schema_name, db_name
+    ) -> Dict[str, List[SnowflakeColumn]]:
+        if schema_name == "SCHEMA_1":
+            raise Exception("Columns are not accessible")
+        return super().get_columns_for_schema(conn, schema_name, db_name)
+
+
+def run_source(
+    config_overrides: Dict,
+    last_extraction_time=None,
+    data_dictionary: Optional[FakeDataDictionary] = None,
+    pipeline_config=None,
+):
+    config = {
+        "account_id": "ABC12345.ap-south-1",
+        "username": "TST_USR",
+        "password": "TST_PWD",
+        "include_table_lineage": False,
+        "include_view_lineage": False,
+        "include_usage_stats": False,
+        "include_operational_stats": False,
+        **config_overrides,
+    }
+    with patch(
+        "datahub.ingestion.source.snowflake.snowflake_config.SnowflakeV2Config.get_connection",
+        side_effect=lambda: MagicMock(),
+    ):
+        source = SnowflakeV2Source.create(
+            config, PipelineContext(run_id="test", pipeline_config=pipeline_config)
+        )
+        data_dictionary = data_dictionary or FakeDataDictionary()
+        source.data_dictionary = data_dictionary  # type: ignore
+        source.inspect_session_metadata = MagicMock()  # type: ignore
+        source.incremental_schema_handler.get_last_extraction_time = MagicMock(  # type: ignore
+            return_value=last_extraction_time
+        )
+        source.incremental_schema_handler.is_checkpointing_enabled = MagicMock(  # type: ignore
+            return_value=source.incremental_schema_handler.checkpointing_enabled
+            or (
+                config_overrides.get("incremental_schema_extraction", False)
+                and pipeline_config is None
+            )
+        )
+        source.incremental_schema_handler.update_state = MagicMock()  # type: ignore
+        workunit_ids = [wu.id for wu in source.get_workunits()]
+    return source, data_dictionary, workunit_ids
+
+
+def test_concurrent_schema_extraction_keeps_order():
+    _, _, serial_ids = run_source({})
+    source, data_dictionary, concurrent_ids = run_source(
+        {"max_metadata_extraction_workers": 4}
+    )
+
+    assert concurrent_ids == serial_ids
+    assert sorted(data_dictionary.columns_queried_for) == [
+        f"SCHEMA_{i}" for i in range(NUM_SCHEMAS)
+    ]
+    assert source.schema_columns == {}
+    assert source.connection_pool.empty()
+
+
+def test_incremental_schema_extraction_skips_unchanged_tables():
+    _, _, all_ids = run_source({})
+    source, _, incremental_ids = run_source(
+        {"incremental_schema_extraction": True}, last_extraction_time=LAST_RUN
+    )
+
+    assert source.report.num_tables_unchanged_since_last_run == NUM_SCHEMAS
+    assert incremental_ids
+    assert not any("old_table" in wu_id for wu_id in incremental_ids)
+    assert any("new_table" in wu_id for wu_id in incremental_ids)
+    assert any("view" in wu_id for wu_id in incremental_ids)
+    assert set(incremental_ids) < set(all_ids)
+
+
+def test_incremental_schema_extraction_uses_snowflake_clock():
+    source, _, _ = run_source(
+        {"incremental_schema_extraction": True}, last_extraction_time=LAST_RUN
+    )
+
+    source.incremental_schema_handler.update_state.assert_called_once_with(  # type: ignore
+        extraction_time_millis=datetime_to_ts_millis(SNOWFLAKE_NOW),
+        config_fingerprint=source.get_incremental_schema_config_fingerprint(),
+    )
+
+
+def test_tables_altered_at_the_last_run_start_are_extracted():
+    source, _, _ = run_source({})
+    source.last_schema_extraction_time = LAST_RUN
+
+    def table(last_altered: datetime) -> SnowflakeTable:
+        return SnowflakeTable(
+            name="TABLE",
+            created=datetime(2022, 1, 1),
+            last_altered=last_altered,
+            size_in_bytes=100,
+            rows_count=10,
+            comment=None,
+            clustering_key="",
+        )
+
+    # The watermark is in milliseconds, and a table altered at that instant may
+    # have been altered after the last run read its metadata.
+    assert source.is_table_unchanged(table(LAST_RUN - timedelta(microseconds=1)))
+    assert not source.is_table_unchanged(table(LAST_RUN))
+    assert not source.is_table_unchanged(table(LAST_RUN.replace(tzinfo=None)))
+    assert not source.is_table_unchanged(table(LAST_RUN + timedelta(milliseconds=1)))
+
+
+@pytest.mark.parametrize("max_metadata_extraction_workers", [1, 4])
+def test_unchanged_tables_are_still_profiled(max_metadata_extraction_workers):
+    with patch.object(SnowflakeProfiler, "get_workunits", return_value=[]) as profile:
+        source, _, _ = run_source(
+            {
+                "incremental_schema_extraction": True,
+                # The fake tables have naive LAST_ALTERED times.
+                "profiling": {"enabled": True, "profile_if_updated_since_days": None},
+                "max_metadata_extraction_workers": max_metadata_extraction_workers,
+            },
+            last_extraction_time=LAST_RUN,
+        )
+
+    assert source.report.num_tables_unchanged_since_last_run == NUM_SCHEMAS
+    [databases] = profile.call_args[0]
+    for schema in databases[0].schemas:
+        old_table = next(t for t in schema.tables if t.name == "OLD_TABLE")
+        assert old_table.columns
+        assert (
+            source.profiler.get_snowflake_profile_request(old_table, schema.name, "DB")
+            is not None
+        )
+
+
+def test_failed_schema_extraction_does_not_advance_watermark():
+    source, _, workunit_ids = run_source(
+        {"incremental_schema_extraction": True},
+        last_extraction_time=LAST_RUN,
+        data_dictionary=FailingDataDictionary(),
+    )
+
+    assert not any("schema_1.new_table" in wu_id for wu_id in workunit_ids)
+    assert any("schema_2.new_table" in wu_id for wu_id in workunit_ids)
+    assert "db.schema_1.new_table" in source.report.warnings
+    source.incremental_schema_handler.update_state.assert_not_called()  # type: ignore
+
+
+def test_incremental_schema_extraction_is_disabled_with_transformers():
+    source, _, workunit_ids = run_source(
+        {"incremental_schema_extraction": True},
+        last_extraction_time=LAST_RUN,
+        pipeline_config=MagicMock(transformers=[{"type": "simple_add_dataset_tags"}]),
+    )
+
+    assert not source.incremental_schema_handler.is_checkpointing_enabled()
+    assert "incremental-schema-extraction" in source.report.warnings
+
+
+def test_config_fingerprint_depends_on_datahub_version():
+    source, _, _ = run_source({})
+    fingerprint = source.get_incremental_schema_config_fingerprint()
+
+    with patch("datahub.ingestion.source.snowflake.snowflake_v2.__version__", "1.2.3"):
+        assert source.get_incremental_schema_config_fingerprint() != fingerprint
@@ -0,0 +1,508 @@
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects.mssql.base import MSDialect
+from sqlalchemy.dialects.mysql.base import MySQLDialect
+from sqlalchemy.dialects.mysql.reflection import ReflectedState
+from sqlalchemy.dialects.oracle.base import OracleDialect
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.sql import sqltypes as types
+
+from datahub.ingestion.source.sql.bulk_reflection import (
+    BulkReflectingInspector,
+    OracleBulkReflector,
+    PostgresBulkReflector,
+    _accepted_kwargs,
+    _Row,
+    get_bulk_reflector,
+)
+
+
+def _mock_inspector(dialect: object, results: Dict[str, List[dict]]) -> MagicMock:
+    def execute(query: object, **params: str) -> List[dict]:
+        for table, rows in results.items():
+            if table in str(query):
+                return rows
+        raise Exception(f"Unexpected query {query}")
+
+    inspector = MagicMock()
+    inspector.dialect = dialect
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    conn.execute.side_effect = execute
+    return inspector
+
+
+def _column(table: str, column: str, data_type: str, **kwargs: object) -> dict:
+    return {
+        "table_name": table,
+        "column_name": column,
+        "data_type": data_type,
+        "is_nullable": "YES",
+        "column_default": None,
+        "column_length": None,
+        "column_precision": None,
+        "column_scale": None,
+        "column_type": None,
+        "column_comment": None,
+        **kwargs,
+    }
+
+
+POSTGRES_RESULTS = {
+    "information_schema.columns": [
+        _column("orders", "id", "integer", is_nullable="NO", column_type="integer"),
+        _column(
+            "orders",
+            "customer_id",
+            "integer",
+            column_type="integer",
+            column_comment="The customer",
+        ),
+        _column(
+            "orders",
+            "note",
+            "character varying",
+            column_length=200,
+            column_type="character varying(200)",
+        ),
+        _column(
+            "orders",
+            "total",
+            "numeric",
+            column_precision=10,
+            column_scale=2,
+            column_type="numeric(10,2)",
+        ),
+        _column(
+            "orders",
+            "created",
+            "timestamp with time zone",
+            column_type="timestamp with time zone",
+        ),
+        _column("customers", "id", "integer", is_nullable="NO", column_type="integer"),
+        _column("tagged", "id", "integer", column_type="integer"),
+        _column("tagged", "mood", "USER-DEFINED", column_type="mood"),
+    ],
+    "contype = 'p'": [
+        {"table_name": "orders", "constraint_name": "orders_pk", "column_name": "id"},
+    ],
+    "contype = 'f'": [
+        {
+            "table_name": "orders",
+            "constraint_name": "orders_customer_fk",
+            "column_name": "customer_id",
+            "referred_schema": "public",
+            "referred_table": "customers",
+            "referred_column": "id",
+        }
+    ],
+    "pg_class": [{"table_name": "orders", "table_comment": "All orders"}],
+}
+
+
+def test_postgres_bulk_reflection() -> None:
+    inspector = _mock_inspector(PGDialect(), POSTGRES_RESULTS)
+    reflector = get_bulk_reflector(inspector)
+    assert isinstance(reflector, PostgresBulkReflector)
+
+    columns = reflector.get_columns("public")
+    assert columns is not None
+    assert [c["name"] for c in columns["orders"] or []] == [
+        "id",
+        "customer_id",
+        "note",
+        "total",
+        "created",
+    ]
+    orders = {c["name"]: c for c in columns["orders"] or []}
+    assert not orders["id"]["nullable"]
+    assert orders["customer_id"]["comment"] == "The customer"
+    assert isinstance(orders["note"]["type"], types.VARCHAR)
+    assert orders["note"]["type"].length == 200
+    assert orders["total"]["type"].precision == 10
+    assert orders["total"]["type"].scale == 2
+    assert orders["created"]["type"].timezone
+    # Enums are not loaded in bulk.
+    assert columns["tagged"] is None
+
+    assert reflector.get_pk_constraints("public") == {
+        "orders": {"constrained_columns": ["id"], "name": "orders_pk"}
+    }
+    assert reflector.get_foreign_keys("public") == {
+        "orders": [
+            {
+                "name": "orders_customer_fk",
+                "constrained_columns": ["customer_id"],
+                "referred_schema": "public",
+                "referred_table": "customers",
+                "referred_columns": ["id"],
+                "options": {},
+            }
+        ]
+    }
+    assert reflector.get_table_comments("public") == {"orders": {"text": "All orders"}}
+
+
+def test_postgres_constraints_are_visible_to_non_owner_roles() -> None:
+    # information_schema only shows the constraints of a table to its owner and to
+    # roles with privileges beyond SELECT, unlike pg_catalog.
+    inspector = _mock_inspector(
+        PGDialect(),
+        {
+            "information_schema.table_constraints": [],
+            "information_schema.key_column_usage": [],
+            "information_schema.referential_constraints": [],
+            **POSTGRES_RESULTS,
+        },
+    )
+    bulk_inspector = BulkReflectingInspector(
+        inspector, PostgresBulkReflector(inspector)
+    )
+
+    assert bulk_inspector.get_pk_constraint("orders", "public") == {
+        "constrained_columns": ["id"],
+        "name": "orders_pk",
+    }
+    assert [
+        fk["referred_table"]
+        for fk in bulk_inspector.get_foreign_keys("orders", "public")
+    ] == ["customers"]
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    assert not any(
+        "information_schema" in str(call[0][0])
+        for call in conn.execute.call_args_list
+        if "information_schema.columns" not in str(call[0][0])
+    )
+
+
+def test_mysql_primary_keys_are_not_named() -> None:
+    inspector = _mock_inspector(
+        MySQLDialect(),
+        {
+            "key_column_usage": [
+                {"table_name": "orders", "constraint_name": None, "column_name": "id"}
+            ]
+        },
+    )
+    reflector = get_bulk_reflector(inspector)
+    assert reflector is not None
+
+    # Like the inspector, which does not name primary keys.
+    assert reflector.get_pk_constraints("shop") == {
+        "orders": {"constrained_columns": ["id"], "name": None}
+    }
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    assert "NULL AS constraint_name" in str(conn.execute.call_args[0][0])
+
+
+@pytest.mark.parametrize(
+    "dialect_name, data_type, expected_type",
+    [
+        ("trino", "varchar(20)", "VARCHAR(length=20)"),
+        ("presto", "varchar(20)", "String()"),
+    ],
+)
+def test_trino_and_presto_bulk_reflection(
+    dialect_name: str, data_type: str, expected_type: str
+) -> None:
+    if dialect_name == "trino":
+        pytest.importorskip("trino.sqlalchemy")
+    else:
+        pytest.importorskip("pyhive.sqlalchemy_presto")
+    dialect = MagicMock()
+    dialect.name = dialect_name
+    inspector = _mock_inspector(
+        dialect,
+        {
+            "information_schema.columns": [
+                {
+                    "table_name": "orders",
+                    "column_name": "note",
+                    "data_type": data_type,
+                    "is_nullable": "YES",
+                    "column_default": None,
+                    "column_comment": "A note",
+                }
+            ]
+        },
+    )
+    reflector = get_bulk_reflector(inspector)
+    assert reflector is not None
+
+    columns = reflector.get_columns("sales")
+    assert columns is not None
+    assert [
+        (c["name"], repr(c["type"]), c["nullable"], c["comment"])
+        for c in columns["orders"] or []
+    ] == [("note", expected_type, True, "A note")]
+    # Trino and Presto do not have the length, precision and scale columns.
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    query = str(conn.execute.call_args[0][0])
+    assert "character_maximum_length" not in query
+    assert "numeric_precision" not in query
+    assert reflector.get_pk_constraints("sales") == {}
+    assert reflector.get_foreign_keys("sales") == {}
+
+
+def test_oracle_bulk_reflection_normalizes_names() -> None:
+    inspector = _mock_inspector(
+        OracleDialect(),
+        {
+            "all_tab_columns": [
+                {
+                    **_column("ORDERS", "ID", "NUMBER", column_scale=0),
+                    "is_nullable": "N",
+                },
+                _column("ORDERS", "CREATED", "TIMESTAMP(6)"),
+                _column("ORDERS", "TOTAL", "NUMBER", column_precision=10),
+            ]
+        },
+    )
+    reflector = get_bulk_reflector(inspector)
+    assert isinstance(reflector, OracleBulkReflector)
+
+    columns = reflector.get_columns("sales")
+    assert columns is not None
+    orders = {c["name"]: c for c in columns["orders"] or []}
+    assert isinstance(orders["id"]["type"], types.INTEGER)
+    assert not orders["id"]["nullable"]
+    assert orders["created"]["type"] is types.TIMESTAMP
+    assert orders["total"]["type"].precision == 10
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    assert conn.execute.call_args[1] == {"owner": "SALES"}
+
+
+def test_bulk_reflecting_inspector_falls_back() -> None:
+    inspector = _mock_inspector(PGDialect(), POSTGRES_RESULTS)
+    bulk_inspector = BulkReflectingInspector(
+        inspector, PostgresBulkReflector(inspector)
+    )
+
+    assert len(bulk_inspector.get_columns("orders", "public")) == 5
+    assert bulk_inspector.get_pk_constraint("orders", "public")["name"] == "orders_pk"
+    assert bulk_inspector.get_table_comment("orders", "public") == {
+        "text": "All orders"
+    }
+    # Known tables without any such metadata.
+    assert bulk_inspector.get_pk_constraint("customers", "public") == {
+        "constrained_columns": [],
+        "name": None,
+    }
+    assert bulk_inspector.get_foreign_keys("customers", "public") == []
+    assert bulk_inspector.get_table_comment("customers", "public") == {"text": None}
+    inspector.get_pk_constraint.assert_not_called()
+
+    # Each schema is only loaded once.
+    conn = inspector.engine.connect.return_value.__enter__.return_value
+    assert conn.execute.call_count == 4
+
+    # Tables with unresolved types, unknown tables and other arguments fall back to
+    # the wrapped inspector.
+    assert (
+        bulk_inspector.get_columns("tagged", "public")
+        is inspector.get_columns.return_value
+    )
+    assert (
+        bulk_inspector.get_pk_constraint("unknown", "public")
+        is inspector.get_pk_constraint.return_value
+    )
+    assert (
+        bulk_inspector.get_columns("orders", "public", info_cache={})
+        is inspector.get_columns.return_value
+    )
+    assert bulk_inspector.dialect is inspector.dialect
+
+
+def test_bulk_reflecting_inspector_falls_back_on_errors() -> None:
+    inspector = _mock_inspector(PGDialect(), {})
+    bulk_inspector = BulkReflectingInspector(
+        inspector, PostgresBulkReflector(inspector)
+    )
+
+    assert (
+        bulk_inspector.get_columns("orders", "public")
+        is inspector.get_columns.return_value
+    )
+    assert (
+        bulk_inspector.get_pk_constraint("orders", "public")
+        is inspector.get_pk_constraint.return_value
+    )
+
+
+def _resolve_types(dialect: object, rows: List[dict]) -> List[str]:
+    inspector = _mock_inspector(dialect, {})
+    reflector = get_bulk_reflector(inspector)
+    assert reflector is not None
+    columns = reflector._group_columns(
+        [_Row(_column("t", f"c{i}", **row)) for i, row in enumerate(rows)]
+    )
+    assert columns["t"] is not None
+    return [repr(c["type"]) for c in columns["t"]]
+
+
+def test_postgres_types_match_inspector() -> None:
+    format_types = ["real", "double precision", "integer", "numeric(10,2)", "integer[]"]
+    dialect = PGDialect()
+    # Inspector.get_columns parses the format_type of each column with this method.
+    expected = [
+        repr(
+            dialect._get_column_info(
+                **_accepted_kwargs(
+                    dialect._get_column_info,
+                    dict(
+                        name="c",
+                        format_type=format_type,
+                        default=None,
+                        notnull=False,
+                        domains={},
+                        enums={},
+                        schema=None,
+                        comment=None,
+                        generated="",
+                        identity=None,
+                    ),
+                )
+            )["type"]
+        )
+        for format_type in format_types
+    ]
+
+    assert (
+        _resolve_types(
+            dialect,
+            [
+                {"data_type": "real", "column_type": "real", "column_precision": 24},
+                {
+                    "data_type": "double precision",
+                    "column_type": "double precision",
+                    "column_precision": 53,
+                },
+                {
+                    "data_type": "integer",
+                    "column_type": "integer",
+                    "column_precision": 32,
+                },
+                {
+                    "data_type": "numeric",
+                    "column_type": "numeric(10,2)",
+                    "column_precision": 10,
+                    "column_scale": 2,
+                },
+                {"data_type": "ARRAY", "column_type": "integer[]"},
+            ],
+        )
+        == expected
+    )
+    assert expected[1] == "DOUBLE_PRECISION(precision=53)"
+
+
+def test_mysql_types_match_inspector() -> None:
+    column_types = [
+        "float",
+        "float(7,4)",
+        "double",
+        "double(10,2)",
+        "int(11) unsigned",
+        "decimal(10,2)",
+        "enum('a','b')",
+    ]
+    dialect = MySQLDialect()
+    dialect.server_version_info = (5, 7, 30)
+    # Inspector.get_columns parses the column definitions of SHOW CREATE TABLE.
+    state = ReflectedState()
+    for column_type in column_types:
+        dialect._tabledef_parser._parse_column(f"  `c` {column_type}", state)
+    expected = [repr(column["type"]) for column in state.columns]
+
+    assert (
+        _resolve_types(
+            dialect,
+            [
+                {"data_type": column_type.split("(")[0], "column_type": column_type}
+                for column_type in column_types
+            ],
+        )
+        == expected
+    )
+    assert expected[0] == "FLOAT()"
+    assert expected[4] == "INTEGER(display_width=11, unsigned=True)"
+
+
+def test_oracle_types_match_inspector() -> None:
+    # data_type, char_length, data_precision and data_scale of all_tab_columns.
+    catalog_rows = [
+        ("FLOAT", None, 126, None),
+        ("FLOAT", None, 63, None),
+        ("BINARY_DOUBLE", None, None, None),
+        ("NUMBER", None, None, 0),
+        ("NUMBER", None, 10, 2),
+        ("VARCHAR2", 20, None, None),
+    ]
+    dialect = OracleDialect()
+    dialect.server_version_info = (19,)
+    conn = MagicMock()
+    conn.execute.return_value = [
+        (f"C{i}", data_type, length, precision, scale, "Y")
+        + (None,) * 5  # The default, comment, virtual and identity columns.
+        for i, (data_type, length, precision, scale) in enumerate(catalog_rows)
+    ]
+    expected = [repr(c["type"]) for c in dialect.get_columns(conn, "t", "s")]
+
+    assert (
+        _resolve_types(
+            dialect,
+            [
+                {
+                    "data_type": data_type,
+                    "column_length": length,
+                    "column_precision": precision,
+                    "column_scale": scale,
+                }
+                for data_type, length, precision, scale in catalog_rows
+            ],
+        )
+        == expected
+    )
+
+
+def test_mssql_types_match_inspector() -> None:
+    assert _resolve_types(
+        MSDialect(),
+        [
+            {"data_type": "float", "column_precision": 53},
+            {"data_type": "real", "column_precision": 24},
+            {"data_type": "int", "column_precision": 10, "column_scale": 0},
+            {"data_type": "decimal", "column_precision": 10, "column_scale": 2},
+            {"data_type": "varchar", "column_length": -1},
+        ],
+    ) == [
+        "FLOAT(precision=53)",
+        "REAL()",
+        "INTEGER()",
+        "DECIMAL(precision=10, scale=2)",
+        "VARCHAR()",
+    ]
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        {"data_type": "decimal", "column_precision": "unknown"},
+        {"data_type": "hierarchyid"},
+    ],
+)
+def test_tables_with_unresolved_columns_fall_back(row: dict) -> None:
+    reflector = get_bulk_reflector(_mock_inspector(MSDialect(), {}))
+    assert reflector is not None
+    columns = reflector._group_columns(
+        [
+            _Row(_column("broken", "id", "int")),
+            _Row(_column("broken", "c", **row)),
+            _Row(_column("other", "id", "int")),
+        ]
+    )
+
+    assert columns["broken"] is None
+    assert columns["other"] is not None
+    assert len(columns["other"]) == 1
@@ -1,8 +1,12 @@
-from typing import Dict
-from unittest.mock import Mock
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.pool import QueuePool
 
 from datahub.ingestion.api.source import Source
 from datahub.ingestion.source.sql.sql_common import (
@@ -11,6 +15,7 @@ from datahub.ingestion.source.sql.sql_common import (
     SQLAlchemySource,
     get_platform_from_sqlalchemy_uri,
 )
+from datahub.ingestion.source.sql.sql_reflection import PrefetchingInspector
 
 
 class _TestSQLAlchemyConfig(SQLAlchemyConfig):
@@ -106,3 +111,85 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+class _SQLiteConfig(SQLAlchemyConfig):
+    url: str
+
+    def get_sql_alchemy_url(self):
+        return self.url
+
+
+@pytest.fixture
+def sqlite_url(tmp_path: pathlib.Path) -> str:
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        for i in range(20):
+            conn.execute(
+                f"CREATE TABLE table_{i:02} (id INTEGER PRIMARY KEY, value_{i} TEXT)"
+            )
+            conn.execute(
+                f"CREATE VIEW view_{i:02} AS SELECT value_{i} FROM table_{i:02}"
+            )
+    return url
+
+
+def _get_workunit_ids(url: str, **config: Any) -> List[str]:
+    source = _TestSQLAlchemySource(
+        config=_SQLiteConfig(
+            url=url,
+            options={
+                "poolclass": QueuePool,
+                "connect_args": {"check_same_thread": False},
+            },
+            **config,
+        ),
+        ctx=PipelineContext(run_id="test_ctx"),
+        platform="TEST",
+    )
+    return [wu.id for wu in source.get_workunits()]
+
+
+def test_concurrent_reflection_preserves_order(sqlite_url: str) -> None:
+    config = {"table_pattern": {"deny": ["main.*_03"]}}
+    expected = _get_workunit_ids(sqlite_url, **config)
+    assert "main.table_02" in expected
+    assert "main.table_03" not in expected
+    assert "main.view_03" not in expected
+
+    assert _get_workunit_ids(sqlite_url, max_reflection_workers=4, **config) == expected
+
+
+def test_prefetching_inspector_skips_and_passes_through() -> None:
+    inspector = MagicMock()
+    reflected = Mock(side_effect=lambda name, schema: [f"{schema}.{name}"])
+    with ThreadPoolExecutor(max_workers=2) as executor, patch(
+        "datahub.ingestion.source.sql.sql_reflection.inspect"
+    ) as mock_inspect:
+        mock_inspect.return_value.get_columns = reflected
+        prefetcher = PrefetchingInspector(inspector, executor, lookahead=2)
+        prefetcher.prefetch("s", ["a", "b", "c", "d"], ["get_columns"])
+
+        assert prefetcher.get_columns("a", "s") == ["s.a"]
+        # Entities can be skipped, even ones that have not been submitted yet.
+        assert prefetcher.get_columns("d", "s") == ["s.d"]
+        # Anything else goes to the wrapped inspector.
+        assert prefetcher.get_columns("d", "s") is inspector.get_columns.return_value
+        assert prefetcher.get_pk_constraint("e", "s") is (
+            inspector.get_pk_constraint.return_value
+        )
+        assert prefetcher.dialect is inspector.dialect
+
+    assert inspector.get_columns.call_count == 1
+
+
+def test_profiling_overlaps_with_metadata_extraction(sqlite_url: str) -> None:
+    workunit_ids = _get_workunit_ids(
+        sqlite_url, profiling={"enabled": True, "max_workers": 2}
+    )
+
+    profile_ids = [id for id in workunit_ids if id.startswith("profile-")]
+    assert sorted(profile_ids) == [f"profile-main.table_{i:02}" for i in range(20)]
+    # All profiles are emitted after the metadata of the tables.
+    assert workunit_ids.index(profile_ids[0]) > workunit_ids.index("main.table_19")
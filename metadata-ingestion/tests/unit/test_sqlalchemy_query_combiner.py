@@ -0,0 +1,80 @@
+from typing import Any, Dict
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+from datahub.utilities import sqlalchemy_query_combiner
+from datahub.utilities.sqlalchemy_query_combiner import SQLAlchemyQueryCombiner
+
+
+def _combiner() -> SQLAlchemyQueryCombiner:
+    return SQLAlchemyQueryCombiner(
+        enabled=True,
+        catch_exceptions=True,
+        is_single_row_query_method=lambda query: True,
+        serial_execution_fallback_enabled=True,
+    )
+
+
+def _run_queries(
+    combiner: SQLAlchemyQueryCombiner, conn: Connection, queries: Dict[str, Any]
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+
+    def run_query(name: str, query: Any) -> None:
+        try:
+            results[name] = conn.execute(query).scalar()
+        except Exception as e:
+            results[name] = e
+
+    with combiner.activate():
+        for name, query in queries.items():
+            combiner.run(lambda name=name, query=query: run_query(name, query))
+        combiner.flush()
+    return results
+
+
+def _value_query(i: int) -> Any:
+    return sa.select([sa.literal(i).label(f"value_{i}")])
+
+
+def test_failed_combined_queries_are_split() -> None:
+    conn = sa.create_engine("sqlite://").connect()
+    combiner = _combiner()
+    queries = {f"query_{i}": _value_query(i) for i in range(16)}
+    queries["query_5"] = sa.select([sa.column("missing")]).select_from(
+        sa.table("missing_table")
+    )
+
+    results = _run_queries(combiner, conn, queries)
+
+    assert isinstance(results.pop("query_5"), sa.exc.OperationalError)
+    assert results == {f"query_{i}": i for i in range(16) if i != 5}
+    # The failing query is isolated by splitting the batches that contain it in half,
+    # rather than by executing all the queries on their own.
+    assert combiner.report.combined_queries_split == 4
+    assert combiner.report.uncombined_queries_issued == 2
+    assert combiner.report.combined_queries_issued == 7
+
+
+def test_queries_to_combine_adapt_to_latency(monkeypatch: pytest.MonkeyPatch) -> None:
+    conn = sa.create_engine("sqlite://").connect()
+    combiner = _combiner()
+    queries = {f"query_{i}": _value_query(i) for i in range(200)}
+
+    results = _run_queries(combiner, conn, queries)
+
+    assert results == {f"query_{i}": i for i in range(200)}
+    # Full batches that are fast grow: 40, 50 and 62 queries, then the remaining 48.
+    assert combiner.report.combined_queries_issued == 4
+    assert combiner.report.queries_to_combine_at_once == 77
+    assert list(combiner.report.combined_query_latency) == ["32-63 queries"]
+    assert combiner.report.combined_query_latency["32-63 queries"].count == 4
+
+    # Slow batches shrink.
+    monkeypatch.setattr(
+        sqlalchemy_query_combiner, "TARGET_COMBINED_QUERY_LATENCY_SECONDS", 0.0
+    )
+    _run_queries(combiner, conn, queries)
+    assert combiner.report.queries_to_combine_at_once < 77
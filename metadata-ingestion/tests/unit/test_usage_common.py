@@ -12,6 +12,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
     GenericAggregatedDataset,
+    UsageAggregator,
 )
 from datahub.metadata.schema_classes import DatasetUsageStatisticsClass
 
@@ -273,3 +274,76 @@ def test_make_usage_workunit_include_top_n_queries():
     du: DatasetUsageStatisticsClass = wu.get_metadata()["metadata"].aspect
     assert du.totalSqlQueries == 1
     assert du.topSqlQueries is None
+
+
+def test_approximate_query_counts():
+    floored_ts = get_time_bucket(datetime(2020, 1, 1), BucketDuration.DAY)
+    resource = "test_db.test_schema.test_table"
+
+    ta = _TestAggregatedDataset(
+        bucket_start_time=floored_ts, resource=resource, max_tracked_queries=10
+    )
+    for i in range(5):
+        for _ in range(50 - 5 * i):
+            ta.add_read_entry("test_email@test.com", f"select {i} from test", [])
+    for i in range(100):
+        ta.add_read_entry("test_email@test.com", f"select * from rare_{i}", [])
+
+    assert ta.queryCount == 300
+    # Only the text of the tracked queries is kept.
+    assert len(ta.queryText) == 10
+    assert ta.get_top_queries(2) == ["select 0 from test", "select 1 from test"]
+
+
+def test_max_tracked_queries_validator_fails():
+    with pytest.raises(ValidationError) as excinfo:
+        BaseUsageConfig(top_n_queries=10, max_tracked_queries=5)
+    assert "max_tracked_queries is set to 5 but it must be at least" in str(
+        excinfo.value
+    )
+
+
+@pytest.mark.parametrize("spill_usage_to_disk", [False, True])
+def test_usage_aggregator(spill_usage_to_disk):
+    config = BaseUsageConfig(
+        spill_usage_to_disk=spill_usage_to_disk,
+        usage_cache_size=2,
+        max_tracked_queries=10,
+    )
+    aggregator: UsageAggregator[_TestTableRef] = UsageAggregator(
+        config, user_email_pattern=AllowDenyPattern(deny=["ignored@test.com"])
+    )
+    day_1 = get_time_bucket(datetime(2020, 1, 1), BucketDuration.DAY)
+    day_2 = get_time_bucket(datetime(2020, 1, 2), BucketDuration.DAY)
+    for day in [day_1, day_2]:
+        for i in range(5):
+            resource = f"test_db.test_schema.table_{i}"
+            aggregator.aggregate_event(
+                day, resource, "test_email@test.com", "select * from test", ["a"]
+            )
+            aggregator.aggregate_event(
+                day, resource, "test_email2@test.com", "select a from test", ["a"]
+            )
+            aggregator.aggregate_event(
+                day, resource, "ignored@test.com", "select b from test", ["b"]
+            )
+
+    try:
+        assert len(aggregator) == 10
+        datasets = list(aggregator.get_aggregated_datasets())
+        assert sorted((ta.bucket_start_time, ta.resource) for ta in datasets) == [
+            (day, f"test_db.test_schema.table_{i}")
+            for day in [day_1, day_2]
+            for i in range(5)
+        ]
+        for ta in datasets:
+            assert ta.readCount == 2
+            assert ta.queryCount == 2
+            assert ta.userFreq == {"test_email@test.com": 1, "test_email2@test.com": 1}
+            assert ta.columnFreq == {"a": 2}
+            assert sorted(ta.get_top_queries(10)) == [
+                "select * from test",
+                "select a from test",
+            ]
+    finally:
+        aggregator.close()
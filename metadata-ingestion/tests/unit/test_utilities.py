@@ -1,5 +1,11 @@
+import pytest
+
 from datahub.utilities.delayed_iter import delayed_iter
-from datahub.utilities.sql_parser import MetadataSQLSQLParser, SqlLineageSQLParser
+from datahub.utilities.sql_parser import (
+    MetadataSQLSQLParser,
+    SqlLineageParserPool,
+    SqlLineageSQLParser,
+)
 
 
 def test_delayed_iter():
@@ -349,3 +355,44 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sqllineage_parser_pool_reuses_and_recycles_workers():
+    pool = SqlLineageParserPool(
+        max_workers=1,
+        max_queries_per_worker=2,
+        max_worker_memory_mb=1024,
+        timeout_sec=60,
+    )
+    worker_pids = []
+    try:
+        for _ in range(3):
+            tables, _columns = pool.get_tables_columns("SELECT a, b FROM foo")
+            assert tables == ["foo"]
+            worker_pids.append([worker.process.pid for worker in pool._all_workers])
+    finally:
+        pool.close()
+
+    # The first worker serves two queries and then retires, so the third query
+    # is served by a new worker.
+    assert len(worker_pids[0]) == 1
+    assert worker_pids[1] == []
+    assert len(worker_pids[2]) == 1
+    assert worker_pids[2] != worker_pids[0]
+    assert pool._all_workers == []
+
+
+def test_sqllineage_parser_pool_propagates_parser_errors():
+    pool = SqlLineageParserPool(
+        max_workers=1,
+        max_queries_per_worker=10,
+        max_worker_memory_mb=1024,
+        timeout_sec=60,
+    )
+    try:
+        with pytest.raises(Exception, match="Sub-process exception"):
+            pool.get_tables_columns("SELECT FROM WHERE )(")
+        # The worker is still usable after a parser error.
+        assert pool.get_tables_columns("SELECT a FROM bar")[0] == ["bar"]
+    finally:
+        pool.close()
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from datahub.utilities.file_backed_dict import FileBackedDict
+
+
+def test_file_backed_dict(tmp_path):
+    cache: FileBackedDict[dict] = FileBackedDict(
+        cache_max_size=10, directory=str(tmp_path)
+    )
+    for i in range(100):
+        cache[f"key-{i:03d}"] = {"value": i}
+    assert len(cache._cache) <= 10
+
+    # Values that were evicted are read back from disk.
+    assert cache["key-000"] == {"value": 0}
+    assert cache.get("missing") is None
+    with pytest.raises(KeyError):
+        cache["missing"]
+
+    # Values can be mutated in place, including after being evicted and reloaded.
+    cache["key-001"]["value"] = -1
+    for i in range(100, 120):
+        cache[f"key-{i:03d}"] = {"value": i}
+    assert cache["key-001"] == {"value": -1}
+
+    del cache["key-002"]
+    assert "key-002" not in cache
+    with pytest.raises(KeyError):
+        del cache["key-002"]
+
+    assert len(cache) == 119
+    keys = list(cache)
+    assert keys == sorted(keys)
+    assert dict(cache.items())["key-119"] == {"value": 119}
+    assert sum(1 for _ in cache.values()) == 119
+
+    cache.close()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,54 @@
+import collections
+import random
+
+import pytest
+
+from datahub.utilities.space_saving_counter import SpaceSavingCounter
+
+
+def test_space_saving_counter_is_exact_below_max_size():
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(max_size=3)
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        assert counter.add(key) is None
+
+    assert counter.most_common() == [("a", 3), ("b", 2), ("c", 1)]
+    assert counter.most_common(1) == [("a", 3)]
+    assert counter["d"] == 0
+    assert "c" in counter and "d" not in counter
+    assert len(counter) == 3
+
+
+def test_space_saving_counter_evicts_least_frequent_key():
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(max_size=2)
+    counter.add("a", 5)
+    counter.add("b")
+    counter.add("b")
+    assert counter.add("c") == "b"
+
+    # The new key inherits the count of the evicted key.
+    assert counter.most_common() == [("a", 5), ("c", 3)]
+    assert counter.total == 8
+
+
+def test_space_saving_counter_finds_heavy_hitters():
+    random.seed(0)
+    stream = [f"heavy-{i}" for i in range(5) for _ in range(1000)]
+    stream += [f"rare-{i}" for i in range(10000)]
+    random.shuffle(stream)
+
+    counter: SpaceSavingCounter[str] = SpaceSavingCounter(max_size=50)
+    for key in stream:
+        counter.add(key)
+
+    assert len(counter) == 50
+    exact = collections.Counter(stream)
+    top_keys = [key for key, _ in counter.most_common(5)]
+    assert sorted(top_keys) == [f"heavy-{i}" for i in range(5)]
+    for key, count in counter.most_common():
+        # Counts are never underestimated, and overestimated by at most total / max_size.
+        assert exact[key] <= count <= exact[key] + len(stream) / 50
+
+
+def test_space_saving_counter_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        SpaceSavingCounter(max_size=0)
@@ -0,0 +1,117 @@
+from unittest import mock
+
+from datahub.utilities.sql_parser import SqlLineageSQLParser
+from datahub.utilities.sql_parser_cache import SQLParseCache
+
+
+class _ParserA:
+    pass
+
+
+class _ParserB:
+    pass
+
+
+def test_sql_parse_cache_hits_and_merges(tmp_path):
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    try:
+        assert cache.get(_ParserA, "SELECT a FROM foo") == {}
+        cache.put(_ParserA, "SELECT a FROM foo", {"tables": ["foo"]})
+        cache.put(_ParserA, "SELECT a FROM foo", {"columns": ["a"]})
+
+        # Whitespace around the query and at the end of lines is ignored.
+        assert cache.get(_ParserA, "  SELECT a FROM foo  \n") == {
+            "tables": ["foo"],
+            "columns": ["a"],
+        }
+        # Results are never shared between parsers.
+        assert cache.get(_ParserB, "SELECT a FROM foo") == {}
+
+        assert cache.report.hits == 1
+        assert cache.report.misses == 2
+    finally:
+        cache.close()
+
+    # The cache persists across instances.
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    try:
+        assert cache.get(_ParserA, "SELECT a FROM foo")["tables"] == ["foo"]
+    finally:
+        cache.close()
+
+
+def test_sql_parse_cache_keeps_line_breaks(tmp_path):
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    try:
+        cache.put(_ParserA, "SELECT a -- comment\nFROM foo", {"tables": ["foo"]})
+        assert cache.get(_ParserA, "SELECT a -- comment FROM foo") == {}
+    finally:
+        cache.close()
+
+
+def test_sql_parse_cache_is_keyed_by_parser_library_versions(tmp_path):
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    try:
+        with mock.patch(
+            "datahub.utilities.sql_parser_cache._get_parser_library_versions",
+            return_value="sqllineage==1.3.6",
+        ):
+            cache.put(_ParserA, "SELECT a FROM foo", {"tables": ["foo"]})
+            assert cache.get(_ParserA, "SELECT a FROM foo") == {"tables": ["foo"]}
+
+        # Upgrading a parser library never serves results of the old version.
+        with mock.patch(
+            "datahub.utilities.sql_parser_cache._get_parser_library_versions",
+            return_value="sqllineage==1.3.7",
+        ):
+            assert cache.get(_ParserA, "SELECT a FROM foo") == {}
+    finally:
+        cache.close()
+
+
+def test_sql_parse_cache_evicts_least_recently_used(tmp_path):
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=10)
+    try:
+        with mock.patch("time.time") as mock_time:
+            for i in range(10):
+                mock_time.return_value = i
+                cache.put(_ParserA, f"SELECT a FROM table_{i}", {"tables": []})
+
+            # Touch the oldest entry, so that it is not evicted.
+            mock_time.return_value = 100
+            assert cache.get(_ParserA, "SELECT a FROM table_0") == {"tables": []}
+
+            mock_time.return_value = 101
+            cache.put(_ParserA, "SELECT a FROM table_10", {"tables": []})
+
+        assert cache.report.evictions == 2
+        assert cache.get(_ParserA, "SELECT a FROM table_0") != {}
+        assert cache.get(_ParserA, "SELECT a FROM table_1") == {}
+        assert cache.get(_ParserA, "SELECT a FROM table_2") == {}
+        assert cache.get(_ParserA, "SELECT a FROM table_3") != {}
+        assert cache.get(_ParserA, "SELECT a FROM table_10") != {}
+    finally:
+        cache.close()
+
+
+def test_sqllineage_sql_parser_uses_cache(tmp_path):
+    cache = SQLParseCache(str(tmp_path / "cache.sqlite"), max_entries=100)
+    sql_query = "SELECT foo.a, bar.b FROM foo JOIN bar ON (foo.a == bar.b)"
+    try:
+        with mock.patch(
+            "datahub.utilities.sql_parser.get_sql_parse_cache", return_value=cache
+        ):
+            parser = SqlLineageSQLParser(sql_query)
+            assert sorted(parser.get_tables()) == ["bar", "foo"]
+            assert cache.report.misses == 1
+
+            with mock.patch(
+                "datahub.utilities.sql_parser.get_sql_lineage_parser_pool"
+            ) as mock_pool:
+                parser = SqlLineageSQLParser(sql_query)
+                assert sorted(parser.get_tables()) == ["bar", "foo"]
+                assert sorted(parser.get_columns()) == ["a", "b"]
+                mock_pool.assert_not_called()
+            assert cache.report.hits == 1
+    finally:
+        cache.close()
@@ -31,6 +31,7 @@ import com.linkedin.restli.server.resources.CollectionResourceTaskTemplate;
 import io.opentelemetry.extension.annotations.WithSpan;
 import java.net.URISyntaxException;
 import java.time.Clock;
+import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
@@ -53,12 +54,14 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
 
   private static final String ACTION_GET_TIMESERIES_ASPECT = "getTimeseriesAspectValues";
   private static final String ACTION_INGEST_PROPOSAL = "ingestProposal";
+  private static final String ACTION_INGEST_PROPOSAL_BATCH = "ingestProposalBatch";
   private static final String ACTION_GET_COUNT = "getCount";
   private static final String ACTION_RESTORE_INDICES = "restoreIndices";
 
   private static final String PARAM_ENTITY = "entity";
   private static final String PARAM_ASPECT = "aspect";
   private static final String PARAM_PROPOSAL = "proposal";
+  private static final String PARAM_PROPOSALS = "proposals";
   private static final String PARAM_START_TIME_MILLIS = "startTimeMillis";
   private static final String PARAM_END_TIME_MILLIS = "endTimeMillis";
   private static final String PARAM_LATEST_VALUE = "latestValue";
@@ -169,6 +172,45 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
     }, MetricRegistry.name(this.getClass(), "ingestProposal"));
   }
 
+  @Action(name = ACTION_INGEST_PROPOSAL_BATCH)
+  @Nonnull
+  @WithSpan
+  public Task<Void> ingestProposalBatch(
+      @ActionParam(PARAM_PROPOSALS) @Nonnull MetadataChangeProposal[] metadataChangeProposals,
+      @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
+    log.info("INGEST PROPOSAL BATCH proposals: {}", metadataChangeProposals.length);
+
+    boolean asyncBool;
+    if (UNSET.equals(async)) {
+      asyncBool = Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
+    } else {
+      asyncBool = Boolean.parseBoolean(async);
+    }
+
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    final List<List<MetadataChangeProposal>> additionalChanges = new ArrayList<>(metadataChangeProposals.length);
+    for (MetadataChangeProposal metadataChangeProposal : metadataChangeProposals) {
+      additionalChanges.add(AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService));
+    }
+
+    return RestliUtil.toTask(() -> {
+      try {
+        for (int i = 0; i < metadataChangeProposals.length; i++) {
+          MetadataChangeProposal metadataChangeProposal = metadataChangeProposals[i];
+          Urn urn = _entityService.ingestProposal(metadataChangeProposal, auditStamp, asyncBool).getUrn();
+          additionalChanges.get(i).forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp, asyncBool));
+          tryIndexRunId(urn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
+        }
+        return null;
+      } catch (ValidationException e) {
+        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+      }
+    }, MetricRegistry.name(this.getClass(), "ingestProposalBatch"));
+  }
+
   @Action(name = ACTION_GET_COUNT)
   @Nonnull
   @WithSpan